@@ -1,9 +1,10 @@
 //! Shared crashgen settings rule model and evaluator.
 
+use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, HashSet};
 
 /// Rule severity.
-#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum RuleSeverity {
     /// Informational message.
     Info,
@@ -26,7 +27,7 @@ impl RuleSeverity {
 }
 
 /// Config layout fact used by predicates.
-#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum ConfigLayout {
     /// Buffout 4 OG layout (`Buffout4/config.toml`).
     Og,
@@ -49,7 +50,7 @@ impl ConfigLayout {
 }
 
 /// Value type for a target setting.
-#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum TargetValueType {
     /// Boolean setting.
     Bool,
@@ -72,7 +73,7 @@ impl TargetValueType {
 }
 
 /// Value expected by a check rule.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub enum ExpectedValue {
     /// Expected bool.
     Bool(bool),
@@ -93,7 +94,7 @@ impl ExpectedValue {
 }
 
 /// Rule predicate tree.
-#[derive(Debug, Clone, PartialEq, Eq, Default)]
+#[derive(Debug, Clone, PartialEq, Eq, Default, Serialize, Deserialize)]
 pub enum Predicate {
     /// Always true.
     #[default]
@@ -113,7 +114,7 @@ pub enum Predicate {
 }
 
 /// Preflight rule action kind.
-#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Serialize, Deserialize)]
 pub enum PreflightActionKind {
     /// Emit message and skip remaining checks.
     NoticeAndSkipRemaining,
@@ -136,7 +137,7 @@ impl PreflightActionKind {
 }
 
 /// Autoscan Report placement used to place rendered rule outcomes in a final report.
-#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq, Serialize, Deserialize)]
 pub enum AutoscanReportPlacement {
     /// Default settings-related destination.
     #[default]
@@ -169,7 +170,7 @@ impl AutoscanReportPlacement {
 pub type RuleReportBucket = AutoscanReportPlacement;
 
 /// Preflight action payload.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct PreflightAction {
     /// Action kind.
     pub kind: PreflightActionKind,
@@ -186,7 +187,7 @@ pub struct PreflightAction {
 }
 
 /// Preflight rule.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct PreflightRule {
     /// Stable rule id.
     pub id: String,
@@ -197,7 +198,7 @@ pub struct PreflightRule {
 }
 
 /// Setting target.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct RuleTarget {
     /// TOML section.
     pub section: String,
@@ -208,7 +209,7 @@ pub struct RuleTarget {
 }
 
 /// Message templates for check rule outcomes.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct RuleMessages {
     /// Message for failed expectation.
     pub fail: String,
@@ -219,7 +220,7 @@ pub struct RuleMessages {
 }
 
 /// Check rule.
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub struct CheckRule {
     /// Stable rule id.
     pub id: String,
@@ -236,7 +237,7 @@ pub struct CheckRule {
 }
 
 /// Full settings rules block.
-#[derive(Debug, Clone, Default, PartialEq, Eq)]
+#[derive(Debug, Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
 pub struct CrashgenSettingsRules {
     /// Schema version.
     pub version: u32,
@@ -17,6 +17,7 @@ pub mod crashgen_rules;
 pub(crate) mod game_data;
 pub mod game_local;
 pub mod shippable;
+pub(crate) mod yaml_snapshot;
 pub mod yaml_source;
 pub mod yamldata;
 
@@ -0,0 +1,154 @@
+//! Versioned on-disk snapshots of built YAML Data
+//!
+//! Parsing and merging the three YAML Data files with yaml-rust2 and walking the
+//! resulting trees dominates Crash Log Scan Intake on short runs. After a successful
+//! build, [`YamlDataCore::load_from_yaml_files`](crate::YamlDataCore::load_from_yaml_files)
+//! stores the finished [`YamlDataCore`] in the per-user scan cache directory from
+//! `classic-path-core`, as `CLASSIC <Game>.yaml.<path hash>.snapshot`. The hash of
+//! the game YAML path keeps installs apart, and the YAML folder, which may be
+//! read-only, is never written. Later loads decode the snapshot directly when it
+//! still matches.
+//!
+//! A snapshot is keyed by the SHA-256 of the three YAML documents plus the game and
+//! selected game version, which feed Version Registry fallbacks. It also records the
+//! crate version, because the Version Registry is compiled in. The file is one header
+//! line followed by the payload, so a stale snapshot is rejected without decoding the
+//! payload. A missing, stale or undecodable snapshot, or no resolvable cache
+//! directory, just means the YAML is parsed as before, and a failed write is only
+//! logged.
+//!
+//! The `.sha256` sidecars that `classic-fallout4-hashgen.py` writes beside the bundled
+//! YAML are not used as the key. They cover only the bundled files, not
+//! `CLASSIC Ignore.yaml`, and go stale as soon as a user edits a file, while the load
+//! reads all three documents anyway.
+
+use crate::YamlDataCore;
+use classic_file_io_core::write_atomic_async;
+use serde::{Deserialize, Serialize};
+use sha2::{Digest, Sha256};
+use std::fmt::Write as _;
+use std::path::{Path, PathBuf};
+
+/// Bumped whenever the serialized shape of [`YamlDataCore`] changes.
+pub(crate) const SNAPSHOT_FORMAT_VERSION: u32 = 1;
+
+/// File name suffix appended to the game YAML file name and path hash.
+const SNAPSHOT_SUFFIX: &str = ".snapshot";
+
+#[derive(Debug, Serialize, Deserialize, PartialEq, Eq)]
+struct SnapshotHeader {
+    format: u32,
+    crate_version: String,
+    key: String,
+}
+
+impl SnapshotHeader {
+    fn current(key: &str) -> Self {
+        Self {
+            format: SNAPSHOT_FORMAT_VERSION,
+            crate_version: env!("CARGO_PKG_VERSION").to_string(),
+            key: key.to_string(),
+        }
+    }
+}
+
+/// Inputs that fully determine a built [`YamlDataCore`].
+pub(crate) struct SnapshotInputs<'a> {
+    pub main_content: &'a str,
+    pub game_content: &'a str,
+    pub ignore_content: &'a str,
+    pub game: &'a str,
+    pub selected_game_version: &'a str,
+}
+
+impl SnapshotInputs<'_> {
+    /// Returns the lowercase hex SHA-256 over all inputs, each length-prefixed.
+    pub(crate) fn key(&self) -> String {
+        let mut hasher = Sha256::new();
+        for part in [
+            self.main_content,
+            self.game_content,
+            self.ignore_content,
+            self.game,
+            self.selected_game_version,
+        ] {
+            hasher.update((part.len() as u64).to_le_bytes());
+            hasher.update(part.as_bytes());
+        }
+        let digest = hasher.finalize();
+        let mut hex = String::with_capacity(64);
+        for byte in digest.iter() {
+            let _ = write!(&mut hex, "{byte:02x}");
+        }
+        hex
+    }
+}
+
+/// Returns where the snapshot for `game_yaml` lives in the per-user scan cache directory.
+pub(crate) fn snapshot_path(game_yaml: &Path) -> Option<PathBuf> {
+    match classic_path_core::ensure_scan_cache_dir() {
+        Ok(cache_dir) => Some(snapshot_path_in(&cache_dir, game_yaml)),
+        Err(error) => {
+            log::debug!("No scan cache directory for the YAML Data snapshot: {error}");
+            None
+        }
+    }
+}
+
+/// Returns the snapshot file for `game_yaml` inside `cache_dir`.
+///
+/// The name keeps the game YAML file name and adds a hash of its absolute path.
+pub(crate) fn snapshot_path_in(cache_dir: &Path, game_yaml: &Path) -> PathBuf {
+    let absolute = std::path::absolute(game_yaml).unwrap_or_else(|_| game_yaml.to_path_buf());
+    let digest = Sha256::digest(absolute.as_os_str().as_encoded_bytes());
+    let mut name = game_yaml.file_name().unwrap_or_default().to_owned();
+    name.push(".");
+    for byte in &digest[..8] {
+        name.push(format!("{byte:02x}"));
+    }
+    name.push(SNAPSHOT_SUFFIX);
+    cache_dir.join(name)
+}
+
+/// Loads the snapshot at `path` if it was written for `key` by this build.
+pub(crate) async fn read_snapshot(path: &Path, key: &str) -> Option<YamlDataCore> {
+    let bytes = tokio::fs::read(path).await.ok()?;
+    decode_snapshot(&bytes, key)
+}
+
+fn decode_snapshot(bytes: &[u8], key: &str) -> Option<YamlDataCore> {
+    let split = bytes.iter().position(|&byte| byte == b'\n')?;
+    let header: SnapshotHeader = serde_json::from_slice(&bytes[..split]).ok()?;
+    if header != SnapshotHeader::current(key) {
+        return None;
+    }
+    match serde_json::from_slice(&bytes[split + 1..]) {
+        Ok(data) => Some(data),
+        Err(error) => {
+            log::debug!("Ignoring unreadable YAML Data snapshot: {error}");
+            None
+        }
+    }
+}
+
+/// Encodes `data` as a snapshot for `key`.
+pub(crate) fn encode_snapshot(data: &YamlDataCore, key: &str) -> serde_json::Result<Vec<u8>> {
+    let mut bytes = serde_json::to_vec(&SnapshotHeader::current(key))?;
+    bytes.push(b'\n');
+    serde_json::to_writer(&mut bytes, data)?;
+    Ok(bytes)
+}
+
+/// Writes the snapshot through a temporary file so readers never see a partial file.
+pub(crate) async fn write_snapshot(
+    path: &Path,
+    key: &str,
+    data: &YamlDataCore,
+) -> std::io::Result<()> {
+    let bytes = encode_snapshot(data, key).map_err(std::io::Error::other)?;
+    write_atomic_async(path.to_path_buf(), bytes).await
+}
+
+#[cfg(test)]
+#[path = "yaml_snapshot_tests.rs"]
+mod tests;
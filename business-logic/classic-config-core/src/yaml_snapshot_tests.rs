@@ -0,0 +1,80 @@
+use super::*;
+
+const MAIN_YAML: &str = "CLASSIC_Info:\n  version: \"7.31.0\"\n";
+const GAME_YAML: &str = "Game_Info:\n  XSE_Acronym: \"F4SE\"\n";
+const IGNORE_YAML: &str = "CLASSIC_Ignore_Fallout4: []\n";
+
+fn inputs<'a>(game_content: &'a str, selected_game_version: &'a str) -> SnapshotInputs<'a> {
+    SnapshotInputs {
+        main_content: MAIN_YAML,
+        game_content,
+        ignore_content: IGNORE_YAML,
+        game: "Fallout4",
+        selected_game_version,
+    }
+}
+
+fn build() -> YamlDataCore {
+    YamlDataCore::from_yaml_content(
+        MAIN_YAML,
+        GAME_YAML,
+        IGNORE_YAML,
+        "Fallout4".to_string(),
+        "auto".to_string(),
+    )
+    .unwrap()
+}
+
+#[test]
+fn key_changes_with_every_input() {
+    let base = inputs(GAME_YAML, "auto").key();
+    assert_eq!(base.len(), 64);
+    assert_eq!(base, inputs(GAME_YAML, "auto").key());
+    assert_ne!(base, inputs("Game_Info: {}\n", "auto").key());
+    assert_ne!(base, inputs(GAME_YAML, "VR").key());
+}
+
+#[test]
+fn snapshot_round_trips_only_for_its_key() {
+    let data = build();
+    let key = inputs(GAME_YAML, "auto").key();
+    let bytes = encode_snapshot(&data, &key).unwrap();
+
+    let decoded = decode_snapshot(&bytes, &key).expect("matching key should decode");
+    assert_eq!(
+        serde_json::to_value(&decoded).unwrap(),
+        serde_json::to_value(&data).unwrap()
+    );
+    assert!(decode_snapshot(&bytes, &inputs(GAME_YAML, "VR").key()).is_none());
+}
+
+#[test]
+fn truncated_or_foreign_snapshots_are_ignored() {
+    let key = inputs(GAME_YAML, "auto").key();
+    let mut bytes = encode_snapshot(&build(), &key).unwrap();
+    bytes.truncate(bytes.len() - 10);
+
+    assert!(decode_snapshot(&bytes, &key).is_none());
+    assert!(decode_snapshot(b"not a snapshot", &key).is_none());
+    assert!(decode_snapshot(b"{\"format\":0}\n{}", &key).is_none());
+}
+
+#[test]
+fn snapshot_path_is_named_by_game_yaml_and_path_hash() {
+    let cache_dir = Path::new("cache");
+    let path = snapshot_path_in(cache_dir, Path::new("a/databases/CLASSIC Fallout4.yaml"));
+    assert_eq!(path.parent(), Some(cache_dir));
+    let name = path.file_name().unwrap().to_string_lossy().into_owned();
+    let hash = name
+        .strip_prefix("CLASSIC Fallout4.yaml.")
+        .and_then(|rest| rest.strip_suffix(".snapshot"))
+        .unwrap();
+    assert_eq!(hash.len(), 16);
+
+    let other = snapshot_path_in(cache_dir, Path::new("b/databases/CLASSIC Fallout4.yaml"));
+    assert_ne!(path, other);
+    assert_eq!(
+        path,
+        snapshot_path_in(cache_dir, Path::new("a/databases/CLASSIC Fallout4.yaml"))
+    );
+}
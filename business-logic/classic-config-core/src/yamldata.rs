@@ -8,11 +8,13 @@
 
 use crate::CrashgenSettingsRules;
 use crate::crashgen_registry_yaml::parse_crashgen_registry;
+use crate::yaml_snapshot::{SnapshotInputs, read_snapshot, snapshot_path, write_snapshot};
 use classic_settings_core::YamlOperations;
 use classic_settings_core::{SettingsError, merge_yaml_documents, parse_yaml_content};
 use classic_version_registry_core::{
     GameVersion as RegistryGameVersion, VersionInfo, get_version_registry,
 };
+use serde::{Deserialize, Serialize};
 use std::collections::{HashMap, HashSet};
 use std::path::PathBuf;
 use yaml_rust2::Yaml;
@@ -26,7 +28,7 @@ use crate::game_data::canonical_game_data_name;
 /// matched case-insensitively as substrings against plugin file names
 /// in crash logs, while `name_a` / `name_b` are the human-readable
 /// display names used in reports.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct ModConflictEntry {
     /// Identifier matched against plugin filenames (case-insensitive substring)
     pub mod_a: String,
@@ -48,7 +50,7 @@ pub struct ModConflictEntry {
 ///
 /// Currently supports only plugin-presence checks. New variants can be added
 /// (e.g., `All`, `Any`, `Not` combinators) without breaking existing YAML.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum CoreModExclude {
     /// Exclude this entry when any of the listed plugins are present.
     PluginAny(Vec<String>),
@@ -60,7 +62,7 @@ pub enum CoreModExclude {
 /// checks for in the crash log plugin list. The structured format replaces
 /// the old flat `"detect_id | Display Name" -> description` mapping and
 /// supports declarative GPU affinity and exclusion conditions.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct CoreModEntry {
     /// Substring matched case-insensitively against plugin / XSE module names.
     pub detect: String,
@@ -81,7 +83,7 @@ pub struct CoreModEntry {
 }
 
 /// Grouped match criteria for a structured mod entry.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub enum ModSolutionCriteria {
     /// Match when any listed substring appears in installed plugin filenames.
     Any(Vec<String>),
@@ -99,7 +101,7 @@ impl ModSolutionCriteria {
 }
 
 /// A structured entry from a structured mod YAML section.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct ModSolutionEntry {
     /// Stable machine-readable identifier for the entry.
     pub id: String,
@@ -114,7 +116,7 @@ pub struct ModSolutionEntry {
 }
 
 /// A single entry from the `Crashlog_Error_Check` YAML section.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SuspectErrorRule {
     /// Stable machine-readable identifier for the rule.
     pub id: String,
@@ -127,7 +129,7 @@ pub struct SuspectErrorRule {
 }
 
 /// A minimum-occurrence stack-match requirement for a suspect rule.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SuspectStackCountRule {
     /// Substring that must appear in the call stack.
     pub substring: String,
@@ -136,7 +138,7 @@ pub struct SuspectStackCountRule {
 }
 
 /// A single entry from the `Crashlog_Stack_Check` YAML section.
-#[derive(Debug, Clone, PartialEq)]
+#[derive(Debug, Clone, PartialEq, Serialize, Deserialize)]
 pub struct SuspectStackRule {
     /// Stable machine-readable identifier for the rule.
     pub id: String,
@@ -161,7 +163,7 @@ pub struct SuspectStackRule {
 /// This is a simple transport type used to carry `Crashgen_Registry` data
 /// from `YamlDataCore` into the crash-log analysis layer (`classic-scanlog-core`),
 /// which converts it to the `CrashgenRegistry` / `CrashgenEntry` types.
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct CrashgenEntryRaw {
     /// Bracket header used by this crashgen (e.g., `"[Compatibility]"`), for display only.
     pub display_section: String,
@@ -931,7 +933,7 @@ fn parse_and_merge_yaml_content(
 /// This struct is typically used for storing and managing a large amount of configuration data required
 /// for game diagnostics, crash handling, plugin management, version tracking, and UI updates. Its design
 /// allows seamless integration with YAML configuration files, enabling structured data parsing and validation.
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct YamlDataCore {
     // Game configuration
     /// Hints or tips for the classic game configuration
@@ -1183,6 +1185,11 @@ impl YamlDataCore {
     /// # Performance
     /// This function loads multiple YAML files in parallel using Tokio,
     /// achieving 15-30x speedup over sequential Python loading.
+    ///
+    /// The built result is cached as a snapshot in the per-user scan cache directory.
+    /// While the three files, `game` and `selected_game_version` are unchanged,
+    /// later loads decode that snapshot instead of parsing YAML. Snapshot failures
+    /// are never reported; the YAML is parsed as usual.
     pub async fn load_from_yaml_files(
         yaml_dirs: Vec<PathBuf>,
         game: String,
@@ -1247,18 +1254,39 @@ impl YamlDataCore {
             source: e,
         })?;
 
-        let main_data = parse_and_merge_yaml_content("main YAML", "Main YAML", &main_content)?;
-        let game_data = parse_and_merge_yaml_content("game YAML", "Game YAML", &game_content)?;
-        let ignore_data =
-            parse_and_merge_yaml_content("ignore YAML", "Ignore YAML", &ignore_content)?;
+        let snapshot_key = SnapshotInputs {
+            main_content: &main_content,
+            game_content: &game_content,
+            ignore_content: &ignore_content,
+            game: &game,
+            selected_game_version: &selected_game_version,
+        }
+        .key();
+        let snapshot = snapshot_path(&game_yaml);
+        if let Some(snapshot) = &snapshot
+            && let Some(data) = read_snapshot(snapshot, &snapshot_key).await
+        {
+            return Ok(data);
+        }
 
-        Self::build_from_yaml_documents(
-            &main_data,
-            &game_data,
-            &ignore_data,
-            &game,
-            &selected_game_version,
-        )
+        let data = Self::from_yaml_content(
+            &main_content,
+            &game_content,
+            &ignore_content,
+            game,
+            selected_game_version,
+        )?;
+
+        if let Some(snapshot) = &snapshot
+            && let Err(error) = write_snapshot(snapshot, &snapshot_key, &data).await
+        {
+            log::debug!(
+                "Could not write YAML Data snapshot {}: {}",
+                snapshot.display(),
+                error
+            );
+        }
+        Ok(data)
     }
 
     /// Create YamlData from YAML content strings (for testing without file I/O).
@@ -1068,6 +1068,56 @@ async fn test_load_from_yaml_files_with_three_dirs() {
     assert_eq!(config.classic_version, "7.31.0");
 }
 
+#[tokio::test]
+async fn test_load_from_yaml_files_reuses_and_invalidates_snapshot() {
+    let temp_dir = tempdir().unwrap();
+    let databases_dir = temp_dir.path().join("databases");
+    std::fs::create_dir_all(&databases_dir).unwrap();
+    let game_path = databases_dir.join("CLASSIC Fallout4.yaml");
+    std::fs::write(databases_dir.join("CLASSIC Main.yaml"), minimal_main_yaml()).unwrap();
+    std::fs::write(&game_path, minimal_game_yaml()).unwrap();
+    std::fs::write(
+        temp_dir.path().join("CLASSIC Ignore.yaml"),
+        minimal_ignore_yaml(),
+    )
+    .unwrap();
+    let yaml_dirs = vec![temp_dir.path().to_path_buf(), temp_dir.path().to_path_buf()];
+    let load = || {
+        YamlDataCore::load_from_yaml_files(
+            yaml_dirs.clone(),
+            "Fallout4".to_string(),
+            "auto".to_string(),
+        )
+    };
+
+    let first = load().await.unwrap();
+    let snapshot = crate::yaml_snapshot::snapshot_path(&game_path).unwrap();
+    assert!(snapshot.exists(), "first load should write a snapshot");
+    assert!(
+        !databases_dir
+            .join("CLASSIC Fallout4.yaml.snapshot")
+            .exists()
+    );
+
+    // Rewrite the snapshot payload in place to prove the next load decodes it.
+    let bytes = std::fs::read(&snapshot).unwrap();
+    let split = bytes.iter().position(|&byte| byte == b'\n').unwrap();
+    let mut marked = first.clone();
+    marked.classic_version = "from-snapshot".to_string();
+    let mut rewritten = bytes[..=split].to_vec();
+    rewritten.extend(serde_json::to_vec(&marked).unwrap());
+    std::fs::write(&snapshot, rewritten).unwrap();
+    assert_eq!(load().await.unwrap().classic_version, "from-snapshot");
+
+    // Editing any YAML Data file invalidates the snapshot.
+    let edited = minimal_game_yaml().replace("F4SE", "F4SE-EDITED");
+    std::fs::write(&game_path, edited).unwrap();
+    let reloaded = load().await.unwrap();
+    assert_eq!(reloaded.classic_version, first.classic_version);
+    assert_eq!(reloaded.xse_acronym, "F4SE-EDITED");
+    let _ = std::fs::remove_file(&snapshot);
+}
+
 #[tokio::test]
 async fn fallout4_vr_loads_the_shared_fallout4_file_and_keyed_data() {
     let temp_dir = tempdir().unwrap();
@@ -0,0 +1,87 @@
+//! Compiles FormID databases into the memory-mapped index read by `FormIdIndex`.
+//!
+//! Usage: `build-formid-index --table <GAME> [--output <PATH>] <DATABASE>...`
+//!
+//! Databases are listed in priority order. Without `--output` the index is
+//! written beside the first database, where scans look for it.
+
+use classic_database_core::{build_formid_index, formid_index_path};
+use classic_shared_core::get_runtime;
+use std::path::PathBuf;
+
+/// Parsed developer-tool command line.
+struct Arguments {
+    table: String,
+    output: Option<PathBuf>,
+    databases: Vec<PathBuf>,
+}
+
+/// Parses the narrow developer-tool command line.
+fn arguments() -> Result<Arguments, String> {
+    let mut table = None;
+    let mut output = None;
+    let mut databases = Vec::new();
+    let mut args = std::env::args().skip(1);
+    while let Some(argument) = args.next() {
+        match argument.as_str() {
+            "--table" => {
+                table = Some(
+                    args.next()
+                        .ok_or_else(|| "--table requires a game table name".to_string())?,
+                );
+            }
+            "--output" => {
+                output = Some(
+                    args.next()
+                        .map(PathBuf::from)
+                        .ok_or_else(|| "--output requires a path".to_string())?,
+                );
+            }
+            _ if argument.starts_with("--") => {
+                return Err(format!("unknown argument: {argument}"));
+            }
+            _ => databases.push(PathBuf::from(argument)),
+        }
+    }
+    let table = table.ok_or_else(|| "--table is required".to_string())?;
+    if databases.is_empty() {
+        return Err("at least one database path is required".to_string());
+    }
+    Ok(Arguments {
+        table,
+        output,
+        databases,
+    })
+}
+
+/// Builds the index and reports where it was written.
+fn run(arguments: Arguments) -> Result<(), String> {
+    let output = match arguments.output {
+        Some(output) => output,
+        None => formid_index_path(&arguments.databases, &arguments.table)
+            .ok_or_else(|| "at least one database path is required".to_string())?,
+    };
+    let summary = get_runtime()
+        .block_on(build_formid_index(
+            &arguments.databases,
+            &arguments.table,
+            &output,
+        ))
+        .map_err(|error| format!("failed to build {}: {error}", output.display()))?;
+    println!(
+        "Indexed {} records from {} database(s) into {} ({} bytes)",
+        summary.record_count,
+        summary.source_count,
+        summary.path.display(),
+        summary.file_size
+    );
+    Ok(())
+}
+
+/// Reports a concise diagnostic and returns a non-zero status on failure.
+fn main() {
+    if let Err(error) = arguments().and_then(run) {
+        eprintln!("{error}");
+        std::process::exit(1);
+    }
+}
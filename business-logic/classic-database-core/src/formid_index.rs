@@ -0,0 +1,600 @@
+//! Prebuilt read-only FormID index (memory-mapped, no SQLite at lookup time)
+//!
+//! FormID databases are read-only during a scan and only ever queried by
+//! `(formid, plugin)`, so they can be compiled ahead of time into one flat file:
+//! - Fixed header with format version, game table, and a fingerprint of the
+//!   source database files the index was built from
+//! - Records sorted by a 64-bit key hash, searched with a binary search
+//! - A string arena holding FormIDs, interned plugin names, and entry values
+//!
+//! Opening an index maps the file instead of opening one connection pool per
+//! database file. Lookups borrow values straight from the mapping, so a hit
+//! performs no allocation and no async work.
+//!
+//! Matching follows [`DatabasePool`](crate::DatabasePool): FormIDs compare
+//! exactly, plugins prefer an exact-case match and otherwise fall back to an
+//! ASCII case-insensitive match (SQLite `COLLATE nocase`). When several source
+//! databases hold the same key, the first database in build order wins. Each record
+//! stores the rank of its source database, so when only case-insensitive matches
+//! exist the one from the highest-priority database is returned, as the SQL path does.
+
+use crate::pool_sqlx::{DatabaseError, DatabasePool};
+use classic_file_io_core::write_atomic_async;
+use futures::TryStreamExt;
+use log::{info, warn};
+use memmap2::{Mmap, MmapOptions};
+use sqlx::Row;
+use sqlx::sqlite::{SqliteConnectOptions, SqlitePoolOptions};
+use std::cmp::Ordering;
+use std::collections::HashMap;
+use std::fs::File;
+use std::path::{Path, PathBuf};
+use std::str::FromStr;
+use std::time::UNIX_EPOCH;
+
+/// File extension used for compiled FormID index files.
+pub const FORMID_INDEX_EXTENSION: &str = "fidx";
+
+const MAGIC: &[u8; 8] = b"CLFIDX\0\0";
+/// Bumped whenever the on-disk layout or lookup semantics change.
+const FORMAT_VERSION: u32 = 2;
+/// magic(8) + version(4) + record_count(4) + fingerprint(8) + table_len(4) + arena_len(4)
+const HEADER_LEN: usize = 32;
+/// hash(8) + formid/plugin/value offsets (3 x 4) + value_len(4) + formid_len(2) + plugin_len(2)
+/// + source_rank(2)
+const RECORD_LEN: usize = 30;
+
+const FNV_OFFSET_BASIS: u64 = 0xcbf2_9ce4_8422_2325;
+const FNV_PRIME: u64 = 0x0000_0100_0000_01b3;
+
+/// Hashes a lookup key as FNV-1a over the FormID, a separator, and the ASCII-lowercased plugin.
+///
+/// Lowercasing happens byte by byte so lookups never allocate a normalized key.
+fn key_hash(formid: &str, plugin: &str) -> u64 {
+    let mut hash = FNV_OFFSET_BASIS;
+    let bytes = formid
+        .bytes()
+        .chain(std::iter::once(0xFF))
+        .chain(plugin.bytes().map(|byte| byte.to_ascii_lowercase()));
+    for byte in bytes {
+        hash ^= u64::from(byte);
+        hash = hash.wrapping_mul(FNV_PRIME);
+    }
+    hash
+}
+
+/// Fingerprints source database files by name, size, and modification time.
+///
+/// Hashing database contents would cost more than the index saves, while a
+/// replaced or rebuilt database always changes its size or modification time.
+pub(crate) fn source_fingerprint(db_paths: &[PathBuf]) -> u64 {
+    let mut hash = FNV_OFFSET_BASIS;
+    let mut mix = |bytes: &[u8]| {
+        for &byte in bytes {
+            hash ^= u64::from(byte);
+            hash = hash.wrapping_mul(FNV_PRIME);
+        }
+    };
+    for path in db_paths {
+        mix(path.file_name().unwrap_or_default().as_encoded_bytes());
+        mix(&[0]);
+        match std::fs::metadata(path) {
+            Ok(metadata) => {
+                let modified = metadata
+                    .modified()
+                    .ok()
+                    .and_then(|time| time.duration_since(UNIX_EPOCH).ok())
+                    .map_or(0, |elapsed| elapsed.as_nanos());
+                mix(&metadata.len().to_le_bytes());
+                mix(&modified.to_le_bytes());
+            }
+            Err(_) => mix(b"<missing>"),
+        }
+    }
+    hash
+}
+
+/// Default index location for a set of FormID databases.
+///
+/// The index sits beside the first database as `"<table> FormIDs.fidx"`.
+/// Returns `None` when `db_paths` is empty.
+#[must_use]
+pub fn formid_index_path(db_paths: &[PathBuf], game_table: &str) -> Option<PathBuf> {
+    let first = db_paths.first()?;
+    let directory = first.parent().unwrap_or_else(|| Path::new(""));
+    Some(directory.join(format!("{game_table} FormIDs.{FORMID_INDEX_EXTENSION}")))
+}
+
+/// Summary of a compiled FormID index.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub struct FormIdIndexSummary {
+    /// Path the index was written to
+    pub path: PathBuf,
+    /// Number of source databases that contributed rows
+    pub source_count: usize,
+    /// Number of distinct `(formid, plugin)` records in the index
+    pub record_count: usize,
+    /// Size of the index file in bytes
+    pub file_size: u64,
+}
+
+/// One source row staged for sorting before the index is laid out.
+struct StagedRecord {
+    hash: u64,
+    formid: String,
+    plugin: String,
+    value: String,
+    /// Position of the source database in build order; lower ranks take priority.
+    source_rank: u16,
+}
+
+impl StagedRecord {
+    /// Orders records by hash, then key, so equal keys from later sources follow the first.
+    fn cmp_key(&self, other: &Self) -> Ordering {
+        self.hash
+            .cmp(&other.hash)
+            .then_with(|| self.formid.cmp(&other.formid))
+            .then_with(|| {
+                let lhs = self.plugin.bytes().map(|byte| byte.to_ascii_lowercase());
+                let rhs = other.plugin.bytes().map(|byte| byte.to_ascii_lowercase());
+                lhs.cmp(rhs)
+            })
+            .then_with(|| self.plugin.cmp(&other.plugin))
+    }
+}
+
+/// Appends `text` to the arena and returns its offset.
+fn push_arena(arena: &mut Vec<u8>, text: &str) -> Result<u32, DatabaseError> {
+    let offset = u32::try_from(arena.len())
+        .map_err(|_| DatabaseError::QueryError("FormID index exceeds 4 GiB".to_string()))?;
+    arena.extend_from_slice(text.as_bytes());
+    Ok(offset)
+}
+
+/// Converts a string length to the width stored in a record.
+fn field_len<T: TryFrom<usize>>(text: &str, field: &str) -> Result<T, DatabaseError> {
+    T::try_from(text.len()).map_err(|_| {
+        DatabaseError::QueryError(format!(
+            "FormID index {field} too long ({} bytes)",
+            text.len()
+        ))
+    })
+}
+
+/// Lays out header, records, and arena for a sorted, deduplicated record list.
+fn encode_index(
+    game_table: &str,
+    fingerprint: u64,
+    records: &[StagedRecord],
+) -> Result<Vec<u8>, DatabaseError> {
+    let mut arena = Vec::new();
+    let mut plugin_offsets: HashMap<&str, u32> = HashMap::new();
+    let mut encoded_records = Vec::with_capacity(records.len() * RECORD_LEN);
+
+    for record in records {
+        let formid_off = push_arena(&mut arena, &record.formid)?;
+        let plugin_off = match plugin_offsets.get(record.plugin.as_str()) {
+            Some(&offset) => offset,
+            None => {
+                let offset = push_arena(&mut arena, &record.plugin)?;
+                plugin_offsets.insert(&record.plugin, offset);
+                offset
+            }
+        };
+        let value_off = push_arena(&mut arena, &record.value)?;
+
+        let value_len: u32 = field_len(&record.value, "value")?;
+        let formid_len: u16 = field_len(&record.formid, "formid")?;
+        let plugin_len: u16 = field_len(&record.plugin, "plugin")?;
+
+        encoded_records.extend_from_slice(&record.hash.to_le_bytes());
+        encoded_records.extend_from_slice(&formid_off.to_le_bytes());
+        encoded_records.extend_from_slice(&plugin_off.to_le_bytes());
+        encoded_records.extend_from_slice(&value_off.to_le_bytes());
+        encoded_records.extend_from_slice(&value_len.to_le_bytes());
+        encoded_records.extend_from_slice(&formid_len.to_le_bytes());
+        encoded_records.extend_from_slice(&plugin_len.to_le_bytes());
+        encoded_records.extend_from_slice(&record.source_rank.to_le_bytes());
+    }
+
+    let record_count = u32::try_from(records.len())
+        .map_err(|_| DatabaseError::QueryError("FormID index has too many records".to_string()))?;
+    let table_len: u32 = field_len(game_table, "table name")?;
+    let arena_len = u32::try_from(arena.len())
+        .map_err(|_| DatabaseError::QueryError("FormID index exceeds 4 GiB".to_string()))?;
+
+    let mut bytes =
+        Vec::with_capacity(HEADER_LEN + game_table.len() + encoded_records.len() + arena.len());
+    bytes.extend_from_slice(MAGIC);
+    bytes.extend_from_slice(&FORMAT_VERSION.to_le_bytes());
+    bytes.extend_from_slice(&record_count.to_le_bytes());
+    bytes.extend_from_slice(&fingerprint.to_le_bytes());
+    bytes.extend_from_slice(&table_len.to_le_bytes());
+    bytes.extend_from_slice(&arena_len.to_le_bytes());
+    bytes.extend_from_slice(game_table.as_bytes());
+    bytes.extend_from_slice(&encoded_records);
+    bytes.extend_from_slice(&arena);
+    Ok(bytes)
+}
+
+/// Compiles FormID databases into a memory-mappable index file.
+///
+/// Every row of `game_table` in each existing database is read once. Databases
+/// are taken in the given order and the first row for a key wins, matching the
+/// configured database priority. The file is written beside `output` and then
+/// renamed into place, so readers that already mapped an older index keep a
+/// consistent view.
+///
+/// # Errors
+///
+/// Returns an error when the table name is not a safe identifier, no database
+/// exists, a database cannot be read, or the index cannot be written.
+pub async fn build_formid_index(
+    db_paths: &[PathBuf],
+    game_table: &str,
+    output: &Path,
+) -> Result<FormIdIndexSummary, DatabaseError> {
+    DatabasePool::validate_table_identifier(game_table)?;
+
+    let existing: Vec<PathBuf> = db_paths
+        .iter()
+        .filter(|path| path.exists())
+        .cloned()
+        .collect();
+    if existing.is_empty() {
+        return Err(DatabaseError::NotFound(format!(
+            "no FormID databases to index among {db_paths:?}"
+        )));
+    }
+
+    let query = format!("SELECT formid, plugin, entry FROM {game_table}");
+    let mut staged = Vec::new();
+    for (rank, path) in existing.iter().enumerate() {
+        let source_rank = u16::try_from(rank).map_err(|_| {
+            DatabaseError::QueryError("too many FormID databases to index".to_string())
+        })?;
+        let opts = SqliteConnectOptions::from_str(&format!("sqlite://{}", path.display()))
+            .map_err(|e| DatabaseError::OpenError(format!("{:?}: {}", path, e)))?
+            .read_only(true);
+        let pool = SqlitePoolOptions::new()
+            .max_connections(1)
+            .connect_with(opts)
+            .await
+            .map_err(|e| DatabaseError::OpenError(format!("{:?}: {}", path, e)))?;
+
+        let before = staged.len();
+        let mut rows = sqlx::query(sqlx::AssertSqlSafe(query.as_str())).fetch(&pool);
+        while let Some(row) = rows.try_next().await? {
+            let formid: String = row.try_get(0)?;
+            let plugin: String = row.try_get(1)?;
+            let value: String = row.try_get(2)?;
+            staged.push(StagedRecord {
+                hash: key_hash(&formid, &plugin),
+                formid,
+                plugin,
+                value,
+                source_rank,
+            });
+        }
+        drop(rows);
+        pool.close().await;
+        info!(
+            "Read {} FormID rows from {:?} for indexing",
+            staged.len() - before,
+            path
+        );
+    }
+
+    // Stable sort keeps source order among equal keys, so dedup keeps the first source's row.
+    staged.sort_by(StagedRecord::cmp_key);
+    staged.dedup_by(|later, earlier| {
+        later.hash == earlier.hash
+            && later.formid == earlier.formid
+            && later.plugin == earlier.plugin
+    });
+
+    let bytes = encode_index(game_table, source_fingerprint(&existing), &staged)?;
+    let file_size = bytes.len() as u64;
+    write_atomic_async(output.to_path_buf(), bytes).await?;
+
+    info!(
+        "Wrote FormID index {:?} with {} records ({} bytes)",
+        output,
+        staged.len(),
+        file_size
+    );
+    Ok(FormIdIndexSummary {
+        path: output.to_path_buf(),
+        source_count: existing.len(),
+        record_count: staged.len(),
+        file_size,
+    })
+}
+
+/// Memory-mapped reader for a compiled FormID index.
+///
+/// Offers the same lookups as [`DatabasePool`] without connections, caches, or
+/// async. [`Self::get`] borrows the value from the mapping; the
+/// `DatabasePool`-shaped methods copy it out.
+pub struct FormIdIndex {
+    path: PathBuf,
+    mmap: Mmap,
+    game_table: String,
+    fingerprint: u64,
+    record_count: usize,
+    records_start: usize,
+    arena_start: usize,
+}
+
+impl std::fmt::Debug for FormIdIndex {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_struct("FormIdIndex")
+            .field("path", &self.path)
+            .field("game_table", &self.game_table)
+            .field("record_count", &self.record_count)
+            .finish_non_exhaustive()
+    }
+}
+
+fn read_u16(bytes: &[u8], at: usize) -> u16 {
+    u16::from_le_bytes([bytes[at], bytes[at + 1]])
+}
+
+fn read_u32(bytes: &[u8], at: usize) -> u32 {
+    u32::from_le_bytes([bytes[at], bytes[at + 1], bytes[at + 2], bytes[at + 3]])
+}
+
+fn read_u64(bytes: &[u8], at: usize) -> u64 {
+    let mut word = [0u8; 8];
+    word.copy_from_slice(&bytes[at..at + 8]);
+    u64::from_le_bytes(word)
+}
+
+impl FormIdIndex {
+    /// Maps an index file and validates its header and section sizes.
+    ///
+    /// Only the layout is checked here so opening stays constant-time; record
+    /// offsets are bounds-checked per lookup and a corrupt record reads as a miss.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error when the file cannot be opened or mapped, or is not a
+    /// FormID index of the supported format version.
+    #[allow(unsafe_code)]
+    pub fn open(path: &Path) -> Result<Self, DatabaseError> {
+        let file = File::open(path).map_err(|e| match e.kind() {
+            std::io::ErrorKind::NotFound => DatabaseError::NotFound(path.display().to_string()),
+            _ => DatabaseError::IoError(e),
+        })?;
+
+        // Safety: the mapping is read-only and private, and the builder replaces
+        // index files by rename rather than rewriting them in place.
+        let mmap = unsafe { MmapOptions::new().map_copy_read_only(&file)? };
+
+        let invalid = |reason: &str| {
+            DatabaseError::OpenError(format!(
+                "{}: invalid FormID index ({reason})",
+                path.display()
+            ))
+        };
+        if mmap.len() < HEADER_LEN || &mmap[..MAGIC.len()] != MAGIC {
+            return Err(invalid("bad magic"));
+        }
+        let version = read_u32(&mmap, 8);
+        if version != FORMAT_VERSION {
+            return Err(invalid(&format!("format version {version}")));
+        }
+        let record_count = read_u32(&mmap, 12) as usize;
+        let fingerprint = read_u64(&mmap, 16);
+        let table_len = read_u32(&mmap, 24) as usize;
+        let arena_len = read_u32(&mmap, 28) as usize;
+
+        let records_start = HEADER_LEN + table_len;
+        let arena_start = records_start + record_count * RECORD_LEN;
+        if arena_start + arena_len != mmap.len() {
+            return Err(invalid("section sizes do not match file size"));
+        }
+        let game_table = std::str::from_utf8(&mmap[HEADER_LEN..records_start])
+            .map_err(|_| invalid("table name is not UTF-8"))?
+            .to_string();
+
+        Ok(Self {
+            path: path.to_path_buf(),
+            mmap,
+            game_table,
+            fingerprint,
+            record_count,
+            records_start,
+            arena_start,
+        })
+    }
+
+    /// Path of the mapped index file.
+    #[must_use]
+    pub fn path(&self) -> &Path {
+        &self.path
+    }
+
+    /// Game table the index was compiled from (e.g., "Fallout4").
+    #[must_use]
+    pub fn game_table(&self) -> &str {
+        &self.game_table
+    }
+
+    /// Number of `(formid, plugin)` records in the index.
+    #[must_use]
+    pub fn len(&self) -> usize {
+        self.record_count
+    }
+
+    /// Whether the index holds no records.
+    #[must_use]
+    pub fn is_empty(&self) -> bool {
+        self.record_count == 0
+    }
+
+    /// Whether the index was built from exactly these databases in their current state.
+    ///
+    /// A `false` result means a database was added, removed, reordered, or
+    /// changed since the build and the index should be rebuilt.
+    #[must_use]
+    pub fn is_current_for(&self, db_paths: &[PathBuf]) -> bool {
+        let existing: Vec<PathBuf> = db_paths
+            .iter()
+            .filter(|path| path.exists())
+            .cloned()
+            .collect();
+        !existing.is_empty() && source_fingerprint(&existing) == self.fingerprint
+    }
+
+    fn record_hash(&self, index: usize) -> u64 {
+        read_u64(&self.mmap, self.records_start + index * RECORD_LEN)
+    }
+
+    fn arena_str(&self, offset: u32, len: usize) -> Option<&str> {
+        let start = self.arena_start.checked_add(offset as usize)?;
+        let bytes = self.mmap.get(start..start.checked_add(len)?)?;
+        std::str::from_utf8(bytes).ok()
+    }
+
+    /// Looks up the entry for a FormID/plugin pair, borrowing it from the mapping.
+    ///
+    /// An exact-case plugin match wins; otherwise the ASCII case-insensitive
+    /// match from the highest-priority source database is returned.
+    #[must_use]
+    pub fn get(&self, formid: &str, plugin: &str) -> Option<&str> {
+        let hash = key_hash(formid, plugin);
+
+        // Lower bound of the run of records sharing this hash.
+        let (mut low, mut high) = (0, self.record_count);
+        while low < high {
+            let mid = low + (high - low) / 2;
+            if self.record_hash(mid) < hash {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+
+        let mut nocase_match: Option<(u16, Option<&str>)> = None;
+        for index in low..self.record_count {
+            if self.record_hash(index) != hash {
+                break;
+            }
+            let at = self.records_start + index * RECORD_LEN;
+            let record = &self.mmap[at..at + RECORD_LEN];
+            let formid_len = read_u16(record, 24) as usize;
+            if self.arena_str(read_u32(record, 8), formid_len) != Some(formid) {
+                continue;
+            }
+            let Some(candidate) =
+                self.arena_str(read_u32(record, 12), read_u16(record, 26) as usize)
+            else {
+                continue;
+            };
+            if !candidate.eq_ignore_ascii_case(plugin) {
+                continue;
+            }
+            let value = self.arena_str(read_u32(record, 16), read_u32(record, 20) as usize);
+            if candidate == plugin {
+                return value;
+            }
+            let rank = read_u16(record, 28);
+            if nocase_match.is_none_or(|(best, _)| rank < best) {
+                nocase_match = Some((rank, value));
+            }
+        }
+        nocase_match.and_then(|(_, value)| value)
+    }
+
+    /// Rejects lookups against a table other than the one the index was built from.
+    fn check_table(&self, table: Option<&str>) -> Result<(), DatabaseError> {
+        match table {
+            Some(table) if !table.eq_ignore_ascii_case(&self.game_table) => {
+                Err(DatabaseError::QueryError(format!(
+                    "FormID index {} holds table {}, not {}",
+                    self.path.display(),
+                    self.game_table,
+                    table
+                )))
+            }
+            _ => Ok(()),
+        }
+    }
+
+    /// Gets a FormID entry, mirroring [`DatabasePool::get_entry`].
+    ///
+    /// # Errors
+    ///
+    /// Returns an error when `table` names a different game table than the index holds.
+    pub fn get_entry(
+        &self,
+        formid: &str,
+        plugin: &str,
+        table: Option<&str>,
+    ) -> Result<Option<String>, DatabaseError> {
+        self.check_table(table)?;
+        Ok(self.get(formid, plugin).map(str::to_string))
+    }
+
+    /// Batch lookup, mirroring [`DatabasePool::get_entries_batch`].
+    ///
+    /// Results are keyed as `"formid:plugin"` using the caller's spelling, and
+    /// pairs without an entry are omitted.
+    ///
+    /// # Errors
+    ///
+    /// Returns an error when `table` names a different game table than the index holds.
+    pub fn get_entries_batch(
+        &self,
+        formid_plugin_pairs: &[(String, String)],
+        table: Option<&str>,
+    ) -> Result<HashMap<String, String>, DatabaseError> {
+        self.check_table(table)?;
+        Ok(formid_plugin_pairs
+            .iter()
+            .filter_map(|(formid, plugin)| {
+                self.get(formid, plugin)
+                    .map(|value| (format!("{}:{}", formid, plugin), value.to_string()))
+            })
+            .collect())
+    }
+}
+
+/// Opens the default index for `db_paths` when it exists and matches those databases.
+///
+/// Returns `None` (after logging why) when there is no index, it cannot be
+/// opened, it holds another table, or the databases changed since the build;
+/// callers then fall back to [`DatabasePool`].
+#[must_use]
+pub fn open_current_formid_index(db_paths: &[PathBuf], game_table: &str) -> Option<FormIdIndex> {
+    let path = formid_index_path(db_paths, game_table)?;
+    if !path.exists() {
+        return None;
+    }
+    match FormIdIndex::open(&path) {
+        Ok(index) if !index.game_table.eq_ignore_ascii_case(game_table) => {
+            warn!(
+                "FormID index {:?} holds table {}, ignoring",
+                path, index.game_table
+            );
+            None
+        }
+        Ok(index) if !index.is_current_for(db_paths) => {
+            info!(
+                "FormID index {:?} is stale; falling back to database lookups",
+                path
+            );
+            None
+        }
+        Ok(index) => Some(index),
+        Err(error) => {
+            warn!("Failed to open FormID index {:?}: {}", path, error);
+            None
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "formid_index_tests.rs"]
+mod tests;
@@ -0,0 +1,251 @@
+use super::*;
+use tempfile::{NamedTempFile, TempDir};
+
+/// Create a temporary SQLite FormID database holding `entries` as (formid, plugin, entry).
+async fn create_test_database(table_name: &str, entries: &[(&str, &str, &str)]) -> NamedTempFile {
+    let temp_file = NamedTempFile::with_suffix(".db").unwrap();
+    let conn_str = format!("sqlite://{}?mode=rwc", temp_file.path().display());
+    let pool = SqlitePoolOptions::new()
+        .max_connections(1)
+        .connect(&conn_str)
+        .await
+        .unwrap();
+
+    let create_table_sql = format!(
+        "CREATE TABLE {} (formid TEXT NOT NULL, plugin TEXT NOT NULL, entry TEXT NOT NULL)",
+        table_name
+    );
+    sqlx::query(sqlx::AssertSqlSafe(create_table_sql.as_str()))
+        .execute(&pool)
+        .await
+        .unwrap();
+
+    let insert_sql = format!(
+        "INSERT INTO {} (formid, plugin, entry) VALUES (?, ?, ?)",
+        table_name
+    );
+    for (formid, plugin, entry) in entries {
+        sqlx::query(sqlx::AssertSqlSafe(insert_sql.as_str()))
+            .bind(formid)
+            .bind(plugin)
+            .bind(entry)
+            .execute(&pool)
+            .await
+            .unwrap();
+    }
+    pool.close().await;
+    temp_file
+}
+
+/// Test that lookups match exact FormIDs and case-insensitive plugins.
+#[tokio::test]
+async fn test_index_lookup_semantics() {
+    let db = create_test_database(
+        "Fallout4",
+        &[
+            ("000001", "Fallout4.esm", "Player"),
+            ("000002", "Fallout4.esm", "Weapon"),
+            ("000002", "FALLOUT4.ESM", "Weapon (upper)"),
+            ("000003", "DLCRobot.esm", "Robot"),
+        ],
+    )
+    .await;
+    let dir = TempDir::new().unwrap();
+    let output = dir.path().join("Fallout4 FormIDs.fidx");
+    let db_paths = vec![db.path().to_path_buf()];
+
+    let summary = build_formid_index(&db_paths, "Fallout4", &output)
+        .await
+        .unwrap();
+    assert_eq!(summary.record_count, 4);
+    assert_eq!(summary.source_count, 1);
+    assert_eq!(summary.file_size, std::fs::metadata(&output).unwrap().len());
+
+    let index = FormIdIndex::open(&output).unwrap();
+    assert_eq!(index.game_table(), "Fallout4");
+    assert_eq!(index.len(), 4);
+    assert_eq!(index.get("000001", "Fallout4.esm"), Some("Player"));
+    assert_eq!(index.get("000001", "fallout4.ESM"), Some("Player"));
+    assert_eq!(index.get("000002", "FALLOUT4.ESM"), Some("Weapon (upper)"));
+    assert_eq!(index.get("000002", "Fallout4.esm"), Some("Weapon"));
+    assert_eq!(index.get("000003", "dlcrobot.esm"), Some("Robot"));
+    assert_eq!(index.get("000004", "Fallout4.esm"), None);
+    assert_eq!(index.get("000003", "Fallout4.esm"), None);
+}
+
+/// Test that the first database wins for keys present in several sources.
+#[tokio::test]
+async fn test_index_prefers_earlier_database() {
+    let main = create_test_database("Fallout4", &[("000001", "Fallout4.esm", "Main")]).await;
+    let local = create_test_database(
+        "Fallout4",
+        &[
+            ("000001", "Fallout4.esm", "Local"),
+            ("000009", "Local.esp", "Local only"),
+        ],
+    )
+    .await;
+    let dir = TempDir::new().unwrap();
+    let output = dir.path().join("index.fidx");
+    let db_paths = vec![main.path().to_path_buf(), local.path().to_path_buf()];
+
+    let summary = build_formid_index(&db_paths, "Fallout4", &output)
+        .await
+        .unwrap();
+    assert_eq!(summary.record_count, 2);
+
+    let index = FormIdIndex::open(&output).unwrap();
+    assert_eq!(index.get("000001", "Fallout4.esm"), Some("Main"));
+    assert_eq!(index.get("000009", "Local.esp"), Some("Local only"));
+}
+
+/// Test that case-insensitive matches resolve to the highest-priority database.
+#[tokio::test]
+async fn test_index_nocase_match_follows_database_priority() {
+    // "fallout4.esm" sorts after "FALLOUT4.ESM", so sort order alone would pick Local.
+    let main = create_test_database("Fallout4", &[("000001", "fallout4.esm", "Main")]).await;
+    let local = create_test_database("Fallout4", &[("000001", "FALLOUT4.ESM", "Local")]).await;
+    let dir = TempDir::new().unwrap();
+    let output = dir.path().join("index.fidx");
+    let db_paths = vec![main.path().to_path_buf(), local.path().to_path_buf()];
+
+    build_formid_index(&db_paths, "Fallout4", &output)
+        .await
+        .unwrap();
+
+    let index = FormIdIndex::open(&output).unwrap();
+    assert_eq!(index.len(), 2);
+    assert_eq!(index.get("000001", "Fallout4.esm"), Some("Main"));
+    assert_eq!(index.get("000001", "FALLOUT4.ESM"), Some("Local"));
+    assert_eq!(index.get("000001", "fallout4.esm"), Some("Main"));
+}
+
+/// Test the DatabasePool-shaped lookups and table checks.
+#[tokio::test]
+async fn test_index_pool_compatible_lookups() {
+    let db = create_test_database(
+        "Fallout4",
+        &[
+            ("000001", "Fallout4.esm", "Player"),
+            ("000002", "Fallout4.esm", "Weapon"),
+        ],
+    )
+    .await;
+    let dir = TempDir::new().unwrap();
+    let output = dir.path().join("index.fidx");
+    build_formid_index(&[db.path().to_path_buf()], "Fallout4", &output)
+        .await
+        .unwrap();
+    let index = FormIdIndex::open(&output).unwrap();
+
+    assert_eq!(
+        index.get_entry("000001", "Fallout4.esm", None).unwrap(),
+        Some("Player".to_string())
+    );
+    assert_eq!(
+        index
+            .get_entry("000001", "Fallout4.esm", Some("fallout4"))
+            .unwrap(),
+        Some("Player".to_string())
+    );
+    assert!(
+        index
+            .get_entry("000001", "Fallout4.esm", Some("Skyrim"))
+            .is_err()
+    );
+
+    let pairs = vec![
+        ("000001".to_string(), "fallout4.esm".to_string()),
+        ("000002".to_string(), "Fallout4.esm".to_string()),
+        ("000003".to_string(), "Fallout4.esm".to_string()),
+    ];
+    let results = index.get_entries_batch(&pairs, None).unwrap();
+    assert_eq!(results.len(), 2);
+    assert_eq!(
+        results.get("000001:fallout4.esm"),
+        Some(&"Player".to_string())
+    );
+    assert_eq!(
+        results.get("000002:Fallout4.esm"),
+        Some(&"Weapon".to_string())
+    );
+}
+
+/// Test that the default index is only used while it matches its source databases.
+#[tokio::test]
+async fn test_open_current_index_detects_stale_sources() {
+    let dir = TempDir::new().unwrap();
+    let db_path = dir.path().join("Fallout4 FormIDs Main.db");
+    let db = create_test_database("Fallout4", &[("000001", "Fallout4.esm", "Player")]).await;
+    std::fs::copy(db.path(), &db_path).unwrap();
+    let db_paths = vec![db_path.clone()];
+
+    assert!(open_current_formid_index(&db_paths, "Fallout4").is_none());
+
+    let output = formid_index_path(&db_paths, "Fallout4").unwrap();
+    assert_eq!(output, dir.path().join("Fallout4 FormIDs.fidx"));
+    build_formid_index(&db_paths, "Fallout4", &output)
+        .await
+        .unwrap();
+    let index = open_current_formid_index(&db_paths, "Fallout4").unwrap();
+    assert_eq!(index.get("000001", "Fallout4.esm"), Some("Player"));
+    assert!(open_current_formid_index(&db_paths, "Skyrim").is_none());
+
+    // Growing the database changes its fingerprint.
+    let mut bytes = std::fs::read(&db_path).unwrap();
+    bytes.extend_from_slice(&[0; 4096]);
+    std::fs::write(&db_path, bytes).unwrap();
+    assert!(!index.is_current_for(&db_paths));
+    assert!(open_current_formid_index(&db_paths, "Fallout4").is_none());
+}
+
+/// Test that malformed files are rejected at open time.
+#[test]
+fn test_open_rejects_invalid_files() {
+    let dir = TempDir::new().unwrap();
+
+    let missing = dir.path().join("missing.fidx");
+    assert!(matches!(
+        FormIdIndex::open(&missing),
+        Err(DatabaseError::NotFound(_))
+    ));
+
+    let garbage = dir.path().join("garbage.fidx");
+    std::fs::write(&garbage, b"not a formid index at all, just bytes").unwrap();
+    assert!(matches!(
+        FormIdIndex::open(&garbage),
+        Err(DatabaseError::OpenError(_))
+    ));
+
+    let truncated = dir.path().join("truncated.fidx");
+    let records = [StagedRecord {
+        hash: key_hash("000001", "Fallout4.esm"),
+        formid: "000001".to_string(),
+        plugin: "Fallout4.esm".to_string(),
+        value: "Player".to_string(),
+        source_rank: 0,
+    }];
+    let mut bytes = encode_index("Fallout4", 0, &records).unwrap();
+    bytes.pop();
+    std::fs::write(&truncated, bytes).unwrap();
+    assert!(matches!(
+        FormIdIndex::open(&truncated),
+        Err(DatabaseError::OpenError(_))
+    ));
+}
+
+/// Test that unsafe table names are rejected before any SQL is built.
+#[tokio::test]
+async fn test_build_rejects_unsafe_table_names() {
+    let dir = TempDir::new().unwrap();
+    let result = build_formid_index(
+        &[dir.path().join("x.db")],
+        "x; DROP TABLE y--",
+        &dir.path().join("x.fidx"),
+    )
+    .await;
+    assert!(matches!(
+        result,
+        Err(DatabaseError::InvalidTableIdentifier(_))
+    ));
+}
@@ -8,16 +8,30 @@
 //! - TRUE ASYNC connection pooling with sqlx
 //! - WAL mode for concurrent reads
 //! - TTL-based smart caching
-//! - Batch query optimization
+//! - Batch query optimization (stable-shape UNION ALL or single-parameter json_each)
 //! - FormID-specific operations
 //! - Multiple database file support
+//! - Prebuilt memory-mapped FormID index for connection-free lookups
+//! - Optional warm set that preloads frequently resolved FormIDs from previous runs
 
+mod formid_index;
 mod pool_sqlx;
+mod warm_set;
+
+pub use formid_index::{
+    FORMID_INDEX_EXTENSION, FormIdIndex, FormIdIndexSummary, build_formid_index, formid_index_path,
+    open_current_formid_index,
+};
 
 pub use pool_sqlx::{
-    BATCH_CACHE_TTL_SECS, CacheEntry, CacheKey, DEFAULT_CACHE_CLEANUP_INTERVAL_SECS,
-    DEFAULT_CACHE_CLEANUP_OP_THRESHOLD, DEFAULT_CACHE_TTL_SECS, DEFAULT_QUERY_CACHE_CAPACITY,
-    DatabaseError, DatabasePool, MAX_CACHE_CLEANUP_INTERVAL_SECS, MAX_CACHE_CLEANUP_OP_THRESHOLD,
-    MAX_CACHE_TTL_SECS, MAX_QUERY_CACHE_CAPACITY, MIN_CACHE_CLEANUP_INTERVAL_SECS,
-    MIN_CACHE_CLEANUP_OP_THRESHOLD, MIN_QUERY_CACHE_CAPACITY, PoolStatistics,
+    BATCH_CACHE_TTL_SECS, BatchLookupStrategy, CacheEntry, CacheKey,
+    DEFAULT_CACHE_CLEANUP_INTERVAL_SECS, DEFAULT_CACHE_CLEANUP_OP_THRESHOLD,
+    DEFAULT_CACHE_TTL_SECS, DEFAULT_NEGATIVE_CACHE_CAPACITY, DEFAULT_NEGATIVE_CACHE_TTL_SECS,
+    DEFAULT_QUERY_CACHE_CAPACITY, DEFAULT_WARM_SET_CAPACITY, DatabaseError, DatabasePool,
+    MAX_CACHE_CLEANUP_INTERVAL_SECS, MAX_CACHE_CLEANUP_OP_THRESHOLD, MAX_CACHE_TTL_SECS,
+    MAX_NEGATIVE_CACHE_CAPACITY, MAX_QUERY_CACHE_CAPACITY, MAX_WARM_SET_CAPACITY,
+    MIN_CACHE_CLEANUP_INTERVAL_SECS, MIN_CACHE_CLEANUP_OP_THRESHOLD, MIN_NEGATIVE_CACHE_CAPACITY,
+    MIN_QUERY_CACHE_CAPACITY, PoolStatistics,
 };
+
+pub use warm_set::{FORMID_WARM_SET_FILE_NAME, formid_warm_set_path};
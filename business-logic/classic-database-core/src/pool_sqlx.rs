@@ -24,6 +24,8 @@ use std::sync::{Arc, RwLock};
 use std::time::{Duration, Instant};
 use thiserror::Error;
 
+use crate::warm_set::{WarmRecord, formid_warm_set_path, read_warm_set, write_warm_set};
+
 /// Default cache TTL for single log scanning (5 minutes).
 /// Use this when scanning individual logs or when memory is constrained.
 pub const DEFAULT_CACHE_TTL_SECS: u64 = 300;
@@ -46,6 +48,21 @@ pub const MIN_QUERY_CACHE_CAPACITY: usize = 1;
 /// Maximum allowed query cache capacity.
 pub const MAX_QUERY_CACHE_CAPACITY: usize = 1_000_000;
 
+/// Default TTL for remembered lookup misses (5 minutes).
+///
+/// Shorter than [`BATCH_CACHE_TTL_SECS`] so a database rebuilt outside this
+/// process is picked up reasonably soon even without `initialize()`.
+pub const DEFAULT_NEGATIVE_CACHE_TTL_SECS: u64 = 300;
+
+/// Default maximum number of remembered lookup misses.
+pub const DEFAULT_NEGATIVE_CACHE_CAPACITY: usize = 50_000;
+
+/// Minimum allowed negative cache capacity.
+pub const MIN_NEGATIVE_CACHE_CAPACITY: usize = 1;
+
+/// Maximum allowed negative cache capacity.
+pub const MAX_NEGATIVE_CACHE_CAPACITY: usize = 1_000_000;
+
 /// Default number of lookup operations before proactive cleanup is considered.
 pub const DEFAULT_CACHE_CLEANUP_OP_THRESHOLD: u64 = 2048;
 
@@ -64,6 +81,58 @@ pub const MIN_CACHE_CLEANUP_INTERVAL_SECS: u64 = 1;
 /// Maximum allowed proactive cleanup interval in seconds.
 pub const MAX_CACHE_CLEANUP_INTERVAL_SECS: u64 = 300;
 
+/// Default number of entries persisted in the FormID warm set (0 disables it).
+pub const DEFAULT_WARM_SET_CAPACITY: usize = 0;
+
+/// Maximum number of entries persisted in the FormID warm set.
+pub const MAX_WARM_SET_CAPACITY: usize = 100_000;
+
+/// Hit counters are trimmed once they track this many times the warm set capacity.
+const WARM_SET_TRACKING_FACTOR: usize = 4;
+
+/// How `get_entries_batch` turns a chunk of uncached pairs into SQL.
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub enum BatchLookupStrategy {
+    /// One `UNION ALL` arm per pair, padded to a stable bucket size, queried
+    /// exact-case first with a `COLLATE nocase` fallback for unresolved pairs.
+    #[default]
+    StableUnion,
+    /// The whole chunk bound as one JSON array and joined through `json_each`
+    /// in a single case-insensitive query, preferring exact-case rows.
+    JsonEach,
+}
+
+impl BatchLookupStrategy {
+    /// Stable name used by the bindings.
+    #[must_use]
+    pub const fn as_str(self) -> &'static str {
+        match self {
+            Self::StableUnion => "stable_union",
+            Self::JsonEach => "json_each",
+        }
+    }
+
+    /// Parses a name produced by [`as_str`](Self::as_str).
+    #[must_use]
+    pub fn from_name(name: &str) -> Option<Self> {
+        match name {
+            "stable_union" => Some(Self::StableUnion),
+            "json_each" => Some(Self::JsonEach),
+            _ => None,
+        }
+    }
+}
+
+/// Shape of a cached batch query template.
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+enum QueryShape {
+    UnionAll {
+        bucket_len: usize,
+        case_insensitive: bool,
+    },
+    JsonEach,
+}
+
 const STABLE_BATCH_BUCKETS: [usize; 8] = [8, 16, 32, 64, 128, 256, 512, 1024];
 const MAX_STABLE_BATCH_BUCKET: usize = 1024;
 const BULK_EVICTION_MIN_CAPACITY: usize = 4_096;
@@ -196,6 +265,8 @@ pub struct PoolStatistics {
     pub total_queries: u64,
     /// Number of queries served from cache
     pub cache_hits: u64,
+    /// Number of cache hits answered by a remembered miss (included in `cache_hits`)
+    pub negative_hits: u64,
     /// Number of queries that required database access
     pub cache_misses: u64,
     /// Total number of connections created
@@ -248,6 +319,12 @@ pub struct PoolStatistics {
     pub stable_shape_bucket_512: u64,
     /// Number of times the 1024-slot bucket was selected
     pub stable_shape_bucket_1024: u64,
+    /// Number of batch chunks resolved with [`BatchLookupStrategy::StableUnion`]
+    pub stable_union_batches: u64,
+    /// Number of batch chunks resolved with [`BatchLookupStrategy::JsonEach`]
+    pub json_each_batches: u64,
+    /// Number of cache entries preloaded from the persisted warm set
+    pub warm_set_loaded: u64,
 }
 
 #[derive(Debug, Clone)]
@@ -308,6 +385,7 @@ impl ConnectionAllocator {
 struct PoolStats {
     total_queries: Arc<AtomicU64>,
     cache_hits: Arc<AtomicU64>,
+    negative_hits: Arc<AtomicU64>,
     cache_misses: Arc<AtomicU64>,
     total_connections: Arc<AtomicU64>,
     active_connections: Arc<AtomicU64>,
@@ -328,6 +406,9 @@ struct PoolStats {
     stable_shape_bucket_256: Arc<AtomicU64>,
     stable_shape_bucket_512: Arc<AtomicU64>,
     stable_shape_bucket_1024: Arc<AtomicU64>,
+    stable_union_batches: Arc<AtomicU64>,
+    json_each_batches: Arc<AtomicU64>,
+    warm_set_loaded: Arc<AtomicU64>,
 }
 
 impl PoolStats {
@@ -335,6 +416,7 @@ impl PoolStats {
         Self {
             total_queries: Arc::new(AtomicU64::new(0)),
             cache_hits: Arc::new(AtomicU64::new(0)),
+            negative_hits: Arc::new(AtomicU64::new(0)),
             cache_misses: Arc::new(AtomicU64::new(0)),
             total_connections: Arc::new(AtomicU64::new(0)),
             active_connections: Arc::new(AtomicU64::new(0)),
@@ -355,6 +437,9 @@ impl PoolStats {
             stable_shape_bucket_256: Arc::new(AtomicU64::new(0)),
             stable_shape_bucket_512: Arc::new(AtomicU64::new(0)),
             stable_shape_bucket_1024: Arc::new(AtomicU64::new(0)),
+            stable_union_batches: Arc::new(AtomicU64::new(0)),
+            json_each_batches: Arc::new(AtomicU64::new(0)),
+            warm_set_loaded: Arc::new(AtomicU64::new(0)),
         }
     }
 
@@ -366,10 +451,19 @@ impl PoolStats {
         self.cache_hits.fetch_add(count, Ordering::Relaxed);
     }
 
+    fn increment_negative_hits(&self, count: u64) {
+        self.cache_hits.fetch_add(count, Ordering::Relaxed);
+        self.negative_hits.fetch_add(count, Ordering::Relaxed);
+    }
+
     fn increment_cache_misses(&self, count: u64) {
         self.cache_misses.fetch_add(count, Ordering::Relaxed);
     }
 
+    fn record_warm_set_loaded(&self, count: u64) {
+        self.warm_set_loaded.fetch_add(count, Ordering::Relaxed);
+    }
+
     fn record_connection_created(&self) {
         self.total_connections.fetch_add(1, Ordering::Relaxed);
     }
@@ -435,6 +529,14 @@ impl PoolStats {
         bucket_counter.fetch_add(1, Ordering::Relaxed);
     }
 
+    fn record_batch_strategy(&self, strategy: BatchLookupStrategy) {
+        let counter = match strategy {
+            BatchLookupStrategy::StableUnion => &self.stable_union_batches,
+            BatchLookupStrategy::JsonEach => &self.json_each_batches,
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
+    }
+
     fn maintenance_snapshot(&self) -> (u64, u64, u64, u64, u64) {
         (
             self.cleanup_runs.load(Ordering::Relaxed),
@@ -471,6 +573,7 @@ impl PoolStats {
         PoolStatistics {
             total_queries: self.total_queries.load(Ordering::Relaxed),
             cache_hits: self.cache_hits.load(Ordering::Relaxed),
+            negative_hits: self.negative_hits.load(Ordering::Relaxed),
             cache_misses: self.cache_misses.load(Ordering::Relaxed),
             total_connections: self.total_connections.load(Ordering::Relaxed),
             active_connections: self.active_connections.load(Ordering::Relaxed),
@@ -497,6 +600,9 @@ impl PoolStats {
             stable_shape_bucket_256: self.stable_shape_bucket_256.load(Ordering::Relaxed),
             stable_shape_bucket_512: self.stable_shape_bucket_512.load(Ordering::Relaxed),
             stable_shape_bucket_1024: self.stable_shape_bucket_1024.load(Ordering::Relaxed),
+            stable_union_batches: self.stable_union_batches.load(Ordering::Relaxed),
+            json_each_batches: self.json_each_batches.load(Ordering::Relaxed),
+            warm_set_loaded: self.warm_set_loaded.load(Ordering::Relaxed),
         }
     }
 }
@@ -504,7 +610,8 @@ impl PoolStats {
 #[derive(Clone)]
 struct QueryCache {
     entries: Arc<DashMap<CacheKey, CacheEntry>>,
-    templates: Arc<DashMap<(String, usize, bool), String>>,
+    templates: Arc<DashMap<(String, QueryShape), String>>,
+    batch_strategy: Arc<RwLock<BatchLookupStrategy>>,
     capacity: Arc<AtomicUsize>,
     cleanup_threshold: Arc<AtomicU64>,
     cleanup_interval: Arc<RwLock<Duration>>,
@@ -518,6 +625,7 @@ impl QueryCache {
         Self {
             entries: Arc::new(DashMap::new()),
             templates: Arc::new(DashMap::new()),
+            batch_strategy: Arc::new(RwLock::new(BatchLookupStrategy::default())),
             capacity: Arc::new(AtomicUsize::new(DEFAULT_QUERY_CACHE_CAPACITY)),
             cleanup_threshold: Arc::new(AtomicU64::new(DEFAULT_CACHE_CLEANUP_OP_THRESHOLD)),
             cleanup_interval: Arc::new(RwLock::new(Duration::from_secs(
@@ -591,6 +699,19 @@ impl QueryCache {
         }
     }
 
+    fn batch_strategy(&self) -> BatchLookupStrategy {
+        *self.batch_strategy.read().unwrap_or_else(|poisoned| {
+            warn!("batch_strategy lock was poisoned - recovering");
+            poisoned.into_inner()
+        })
+    }
+
+    fn set_batch_strategy(&self, strategy: BatchLookupStrategy) {
+        if let Ok(mut s) = self.batch_strategy.write() {
+            *s = strategy;
+        }
+    }
+
     fn capacity(&self) -> usize {
         self.capacity.load(Ordering::Relaxed)
     }
@@ -783,25 +904,253 @@ impl QueryCache {
         initial_size - self.entries.len()
     }
 
-    fn get_or_build_template(
-        &self,
-        game_table: &str,
-        bucket_len: usize,
-        case_insensitive: bool,
-    ) -> String {
-        let template_key = (game_table.to_string(), bucket_len, case_insensitive);
+    fn get_or_build_template(&self, game_table: &str, shape: QueryShape) -> String {
+        let template_key = (game_table.to_string(), shape);
 
         if let Some(existing) = self.templates.get(&template_key) {
             return existing.clone();
         }
 
-        let template =
-            DatabasePool::build_union_all_query(game_table, bucket_len, case_insensitive);
+        let template = match shape {
+            QueryShape::UnionAll {
+                bucket_len,
+                case_insensitive,
+            } => DatabasePool::build_union_all_query(game_table, bucket_len, case_insensitive),
+            QueryShape::JsonEach => DatabasePool::build_json_each_query(game_table),
+        };
         self.templates.insert(template_key, template.clone());
         template
     }
 }
 
+/// Bounded cache of `(formid, plugin)` pairs that no attached database contains.
+///
+/// Kept apart from [`QueryCache`] so misses, which dominate when a FormID
+/// database is incomplete, cannot evict resolved entries and can use their
+/// own TTL and capacity.
+#[derive(Clone)]
+struct NegativeCache {
+    entries: Arc<DashMap<CacheKey, Instant>>,
+    capacity: Arc<AtomicUsize>,
+    ttl: Arc<RwLock<Duration>>,
+}
+
+impl NegativeCache {
+    fn new() -> Self {
+        Self {
+            entries: Arc::new(DashMap::new()),
+            capacity: Arc::new(AtomicUsize::new(DEFAULT_NEGATIVE_CACHE_CAPACITY)),
+            ttl: Arc::new(RwLock::new(Duration::from_secs(
+                DEFAULT_NEGATIVE_CACHE_TTL_SECS,
+            ))),
+        }
+    }
+
+    fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    /// Returns whether `cache_key` is a remembered miss, evicting it once expired.
+    fn contains(&self, cache_key: &CacheKey) -> bool {
+        let expired = match self.entries.get(cache_key) {
+            Some(expires_at) => Instant::now() > *expires_at,
+            None => return false,
+        };
+        if expired {
+            self.entries.remove(cache_key);
+        }
+        !expired
+    }
+
+    fn insert_many(&self, cache_keys: impl IntoIterator<Item = CacheKey>) {
+        let ttl = self.ttl();
+        if ttl.is_zero() {
+            return;
+        }
+        let expires_at = Instant::now() + ttl;
+        for cache_key in cache_keys {
+            self.entries.insert(cache_key, expires_at);
+        }
+
+        let capacity = self.capacity();
+        if self.entries.len() > capacity {
+            self.evict_to(QueryCache::preferred_eviction_target(capacity));
+        }
+    }
+
+    /// Drops expired misses first, then the misses closest to expiry.
+    fn evict_to(&self, target_size: usize) {
+        let now = Instant::now();
+        self.entries.retain(|_, expires_at| *expires_at >= now);
+        let overflow = self.entries.len().saturating_sub(target_size);
+        if overflow == 0 {
+            return;
+        }
+
+        let mut candidates: Vec<(Instant, CacheKey)> = self
+            .entries
+            .iter()
+            .map(|entry| (*entry.value(), entry.key().clone()))
+            .collect();
+        candidates.sort_unstable_by(|(left_at, left_key), (right_at, right_key)| {
+            left_at
+                .cmp(right_at)
+                .then_with(|| left_key.tie_break_key().cmp(&right_key.tie_break_key()))
+        });
+        for (_, cache_key) in candidates.into_iter().take(overflow) {
+            self.entries.remove(&cache_key);
+        }
+    }
+
+    fn clear(&self, expired_only: bool) -> usize {
+        let initial_size = self.entries.len();
+        if expired_only {
+            let now = Instant::now();
+            self.entries.retain(|_, expires_at| *expires_at >= now);
+        } else {
+            self.entries.clear();
+        }
+        initial_size - self.entries.len()
+    }
+
+    fn ttl(&self) -> Duration {
+        *self.ttl.read().unwrap_or_else(|poisoned| {
+            warn!("negative_cache_ttl lock was poisoned - recovering");
+            poisoned.into_inner()
+        })
+    }
+
+    fn set_ttl(&self, ttl: Duration) {
+        if let Ok(mut t) = self.ttl.write() {
+            *t = ttl;
+        }
+    }
+
+    fn capacity(&self) -> usize {
+        self.capacity.load(Ordering::Relaxed)
+    }
+
+    fn set_capacity(&self, capacity: usize) {
+        let capacity = capacity.clamp(MIN_NEGATIVE_CACHE_CAPACITY, MAX_NEGATIVE_CACHE_CAPACITY);
+        self.capacity.store(capacity, Ordering::Relaxed);
+        self.evict_to(capacity);
+    }
+}
+
+/// Ranks resolved lookups so the hottest can be persisted across runs.
+///
+/// Disabled (capacity 0) by default, in which case lookups skip it entirely.
+#[derive(Clone)]
+struct WarmSet {
+    hits: Arc<DashMap<CacheKey, u32>>,
+    capacity: Arc<AtomicUsize>,
+}
+
+impl WarmSet {
+    fn new() -> Self {
+        Self {
+            hits: Arc::new(DashMap::new()),
+            capacity: Arc::new(AtomicUsize::new(DEFAULT_WARM_SET_CAPACITY)),
+        }
+    }
+
+    fn capacity(&self) -> usize {
+        self.capacity.load(Ordering::Relaxed)
+    }
+
+    fn set_capacity(&self, capacity: usize) {
+        let capacity = capacity.min(MAX_WARM_SET_CAPACITY);
+        self.capacity.store(capacity, Ordering::Relaxed);
+        if capacity == 0 {
+            self.hits.clear();
+        } else {
+            self.trim(capacity);
+        }
+    }
+
+    /// Counts one resolution of `cache_key` from the cache or a database.
+    fn record(&self, cache_key: &CacheKey) {
+        let capacity = self.capacity();
+        if capacity == 0 {
+            return;
+        }
+        if let Some(mut hits) = self.hits.get_mut(cache_key) {
+            *hits = hits.saturating_add(1);
+            return;
+        }
+        self.hits.insert(cache_key.clone(), 1);
+        if self.hits.len() > capacity.saturating_mul(WARM_SET_TRACKING_FACTOR) {
+            self.trim(capacity);
+        }
+    }
+
+    /// Keeps the counters of roughly the `2 * capacity` most frequent keys.
+    fn trim(&self, capacity: usize) {
+        let keep = capacity.saturating_mul(2);
+        if self.hits.len() <= keep {
+            return;
+        }
+        let mut counts: Vec<u32> = self.hits.iter().map(|entry| *entry.value()).collect();
+        let (_, threshold, _) = counts.select_nth_unstable_by(keep - 1, |a, b| b.cmp(a));
+        let threshold = (*threshold).max(2);
+        self.hits.retain(|_, hits| *hits >= threshold);
+    }
+
+    /// Returns the most frequently resolved entries still present in `query_cache`.
+    fn snapshot(&self, query_cache: &QueryCache) -> Vec<WarmRecord> {
+        let capacity = self.capacity();
+        if capacity == 0 {
+            return Vec::new();
+        }
+        let mut ranked: Vec<(u32, CacheKey)> = self
+            .hits
+            .iter()
+            .map(|entry| (*entry.value(), entry.key().clone()))
+            .collect();
+        ranked.sort_unstable_by(|(left_hits, left_key), (right_hits, right_key)| {
+            right_hits
+                .cmp(left_hits)
+                .then_with(|| left_key.tie_break_key().cmp(&right_key.tie_break_key()))
+        });
+
+        ranked
+            .into_iter()
+            .filter_map(|(hits, cache_key)| {
+                let entry = query_cache.get_entry(&cache_key)?;
+                (!entry.is_expired()).then(|| WarmRecord {
+                    game_table: cache_key.game_table,
+                    formid: cache_key.formid,
+                    plugin: cache_key.plugin,
+                    entry: entry.value,
+                    hits,
+                })
+            })
+            .take(capacity)
+            .collect()
+    }
+
+    /// Restores counters from a persisted warm set, halved so stale entries fade out.
+    fn seed(&self, records: &[WarmRecord]) -> Vec<(CacheKey, String)> {
+        records
+            .iter()
+            .map(|record| {
+                let cache_key = CacheKey::from_normalized_plugin(
+                    &record.game_table,
+                    &record.formid,
+                    &record.plugin,
+                );
+                self.hits
+                    .insert(cache_key.clone(), (record.hits / 2).max(1));
+                (cache_key, record.entry.clone())
+            })
+            .collect()
+    }
+
+    fn clear(&self) {
+        self.hits.clear();
+    }
+}
+
 #[derive(Clone)]
 struct PoolRegistry {
     pools: Arc<DashMap<PathBuf, SqlitePool>>,
@@ -1027,6 +1376,10 @@ pub struct DatabasePool {
     registry: PoolRegistry,
     /// Query result cache, stable query templates, and cache policy.
     query_cache: QueryCache,
+    /// Remembered lookup misses with their own TTL and capacity.
+    negative_cache: NegativeCache,
+    /// Resolution counters for the warm set persisted beside the databases.
+    warm_set: WarmSet,
     /// Shared counters used for public pool statistics and close diagnostics.
     stats: PoolStats,
     /// Active game table name (e.g., "Fallout4", "Skyrim").
@@ -1110,6 +1463,8 @@ impl DatabasePool {
         Self {
             registry: PoolRegistry::new(max_conn),
             query_cache: QueryCache::new(cache_ttl),
+            negative_cache: NegativeCache::new(),
+            warm_set: WarmSet::new(),
             stats: PoolStats::new(),
             game_table: ActiveGameTable::new(game_table),
         }
@@ -1131,7 +1486,56 @@ impl DatabasePool {
             }
         }
 
-        self.rebuild_allocated_pools(valid_paths).await
+        // Misses are only valid for the databases they were observed against.
+        self.negative_cache.clear(false);
+        self.rebuild_allocated_pools(valid_paths).await?;
+        self.load_warm_set().await;
+        Ok(())
+    }
+
+    /// Preloads the query cache from the warm set written by a previous `close()`.
+    ///
+    /// The warm set is skipped when any database changed since it was written.
+    async fn load_warm_set(&self) {
+        self.warm_set.clear();
+        if self.warm_set.capacity() == 0 {
+            return;
+        }
+        let db_paths = self.registry.tracked_paths();
+        let Some(path) = formid_warm_set_path(&db_paths) else {
+            return;
+        };
+        let Some(mut records) = read_warm_set(&path, &db_paths).await else {
+            debug!("No current FormID warm set at {:?}", path);
+            return;
+        };
+
+        records.truncate(self.warm_set.capacity().min(self.query_cache.capacity()));
+        let entries = self.warm_set.seed(&records);
+        let loaded = entries.len() as u64;
+        self.insert_many_with_eviction(entries, self.query_cache.current_ttl());
+        self.stats.record_warm_set_loaded(loaded);
+        info!("Preloaded {} FormID cache entries from {:?}", loaded, path);
+    }
+
+    /// Writes the hottest cached entries for the next `initialize()` on these databases.
+    async fn persist_warm_set(&self) {
+        let records = self.warm_set.snapshot(&self.query_cache);
+        if records.is_empty() {
+            return;
+        }
+        let db_paths = self.registry.tracked_paths();
+        let Some(path) = formid_warm_set_path(&db_paths) else {
+            return;
+        };
+        match write_warm_set(&path, &db_paths, &records).await {
+            Ok(()) => debug!(
+                "Saved {} FormID warm set entries to {:?}",
+                records.len(),
+                path
+            ),
+            Err(e) => warn!("Failed to save FormID warm set {:?}: {}", path, e),
+        }
     }
 
     /// Get FormID entry from database
@@ -1153,6 +1557,7 @@ impl DatabasePool {
             if !entry.is_expired() {
                 self.stats.increment_cache_hits(1);
                 self.stats.increment_total_queries(1);
+                self.warm_set.record(&cache_key);
                 debug!("Cache hit for FormID: {} Plugin: {}", formid, plugin);
                 return Ok(Some(entry.value));
             } else {
@@ -1161,6 +1566,15 @@ impl DatabasePool {
                 debug!("Cache expired for FormID: {} Plugin: {}", formid, plugin);
             }
         }
+        if self.negative_cache.contains(&cache_key) {
+            self.stats.increment_negative_hits(1);
+            self.stats.increment_total_queries(1);
+            debug!(
+                "Negative cache hit for FormID: {} Plugin: {}",
+                formid, plugin
+            );
+            return Ok(None);
+        }
 
         // Covers both cold-miss and expired-miss paths.
         self.stats.increment_cache_misses(1);
@@ -1178,18 +1592,21 @@ impl DatabasePool {
             game_table
         );
 
+        let pools = self.registry.pool_snapshots();
+        let mut all_queries_succeeded = !pools.is_empty();
         for (query_label, query) in [("exact", &exact_query), ("nocase", &nocase_query)] {
-            for (db_path, pool) in self.registry.pool_snapshots() {
+            for (db_path, pool) in &pools {
                 // TRUE ASYNC QUERY - no blocking!
                 match sqlx::query(sqlx::AssertSqlSafe(query.as_str()))
                     .bind(formid)
                     .bind(plugin)
-                    .fetch_optional(&pool)
+                    .fetch_optional(pool)
                     .await
                 {
                     Ok(Some(row)) => {
                         let value: String = row.try_get(0)?;
                         let cache_ttl = self.query_cache.current_ttl();
+                        self.warm_set.record(&cache_key);
                         self.insert_with_eviction(cache_key.clone(), value.clone(), cache_ttl);
                         debug!(
                             "Found FormID {} in database {:?} via {} query",
@@ -1203,6 +1620,7 @@ impl DatabasePool {
                     }
                     Err(e) => {
                         error!("Query error in {:?} ({}) : {}", db_path, query_label, e);
+                        all_queries_succeeded = false;
                         continue;
                     }
                 }
@@ -1210,6 +1628,10 @@ impl DatabasePool {
         }
 
         debug!("FormID {} not found in any database", formid);
+        // A failed query proves nothing about absence, so only clean misses are remembered.
+        if all_queries_succeeded {
+            self.negative_cache.insert_many([cache_key]);
+        }
         Ok(None)
     }
 
@@ -1222,7 +1644,7 @@ impl DatabasePool {
     /// `AssertSqlSafe` closes the SQL-injection vector exposed through the
     /// foreign-language `set_game_table` bindings, which can otherwise supply
     /// an arbitrary string (e.g. `"x; DROP TABLE y--"`).
-    fn validate_table_identifier(table: &str) -> Result<(), DatabaseError> {
+    pub(crate) fn validate_table_identifier(table: &str) -> Result<(), DatabaseError> {
         fn is_ident_char(ch: char) -> bool {
             ch.is_ascii_alphanumeric() || ch == '_'
         }
@@ -1277,6 +1699,21 @@ impl DatabasePool {
         query
     }
 
+    /// Build the single-parameter batch query used by [`BatchLookupStrategy::JsonEach`].
+    ///
+    /// The only parameter is a JSON array of `[formid, plugin]` pairs. `CROSS JOIN`
+    /// keeps `json_each` as the outer loop so every pair is one indexed probe on
+    /// `formid`; the plugin comparison is case-insensitive and the fourth column
+    /// flags exact-case matches so callers can prefer them.
+    fn build_json_each_query(game_table: &str) -> String {
+        format!(
+            "SELECT t.formid, t.plugin, t.entry, t.plugin = json_extract(w.value, '$[1]') \
+             FROM json_each(?) AS w CROSS JOIN {game_table} AS t \
+             WHERE t.formid = json_extract(w.value, '$[0]') \
+             AND t.plugin = json_extract(w.value, '$[1]') COLLATE nocase"
+        )
+    }
+
     fn select_stable_bucket_len(actual_len: usize) -> usize {
         if actual_len == 0 {
             return 0;
@@ -1319,8 +1756,13 @@ impl DatabasePool {
         bucket_len: usize,
         case_insensitive: bool,
     ) -> String {
-        self.query_cache
-            .get_or_build_template(game_table, bucket_len, case_insensitive)
+        self.query_cache.get_or_build_template(
+            game_table,
+            QueryShape::UnionAll {
+                bucket_len,
+                case_insensitive,
+            },
+        )
     }
 
     fn record_stable_shape_selection(&self, bucket_len: usize, padded_pairs: usize) {
@@ -1332,9 +1774,10 @@ impl DatabasePool {
         &self,
         query: &str,
         bindings: &[(String, String)],
-    ) -> Vec<(String, String, String)> {
+    ) -> (Vec<(String, String, String)>, bool) {
         // Collect all pools for parallel querying
         let pool_entries = self.registry.pool_snapshots();
+        let mut all_queries_succeeded = !pool_entries.is_empty();
 
         // Create futures for parallel database queries
         let query_futures: Vec<_> = pool_entries
@@ -1363,11 +1806,11 @@ impl DatabasePool {
                                     batch_results.push((formid, plugin, entry_val));
                                 }
                             }
-                            batch_results
+                            Some(batch_results)
                         }
                         Err(e) => {
                             error!("Batch query error in {:?}: {}", db_path, e);
-                            Vec::new() // Return empty on error, don't fail entire batch
+                            None // Return empty on error, don't fail entire batch
                         }
                     }
                 }
@@ -1375,11 +1818,215 @@ impl DatabasePool {
             .collect();
 
         let mut merged_results = Vec::new();
-        for mut per_db_results in join_all(query_futures).await {
-            merged_results.append(&mut per_db_results);
+        for per_db_results in join_all(query_futures).await {
+            match per_db_results {
+                Some(mut rows) => merged_results.append(&mut rows),
+                None => all_queries_succeeded = false,
+            }
+        }
+
+        (merged_results, all_queries_succeeded)
+    }
+
+    /// Runs a [`BatchLookupStrategy::JsonEach`] query against every pool in parallel.
+    ///
+    /// Returns `(formid, plugin, entry, exact_case)` rows and whether every query succeeded.
+    async fn execute_parallel_json_each_query(
+        &self,
+        query: &str,
+        pairs_json: &str,
+    ) -> (Vec<(String, String, String, bool)>, bool) {
+        let pool_entries = self.registry.pool_snapshots();
+        let mut all_queries_succeeded = !pool_entries.is_empty();
+
+        let query_futures: Vec<_> = pool_entries
+            .into_iter()
+            .map(|(db_path, pool)| async move {
+                match sqlx::query(sqlx::AssertSqlSafe(query))
+                    .bind(pairs_json)
+                    .fetch_all(&pool)
+                    .await
+                {
+                    Ok(rows) => Some(
+                        rows.into_iter()
+                            .filter_map(|row| {
+                                Some((
+                                    row.try_get::<String, _>(0).ok()?,
+                                    row.try_get::<String, _>(1).ok()?,
+                                    row.try_get::<String, _>(2).ok()?,
+                                    row.try_get::<i64, _>(3).ok()? != 0,
+                                ))
+                            })
+                            .collect::<Vec<_>>(),
+                    ),
+                    Err(e) => {
+                        error!("json_each batch query error in {:?}: {}", db_path, e);
+                        None
+                    }
+                }
+            })
+            .collect();
+
+        let mut merged_results = Vec::new();
+        for per_db_results in join_all(query_futures).await {
+            match per_db_results {
+                Some(mut rows) => merged_results.append(&mut rows),
+                None => all_queries_succeeded = false,
+            }
+        }
+
+        (merged_results, all_queries_succeeded)
+    }
+
+    /// Resolves one chunk with padded `UNION ALL` templates: exact case first, then
+    /// `COLLATE nocase` for pairs the exact pass left unresolved.
+    ///
+    /// Returns whether every query succeeded.
+    async fn query_chunk_stable_union(
+        &self,
+        game_table: &str,
+        batch: &[(String, String, String)],
+        original_key_lookup: &HashMap<(String, String), Vec<(String, String)>>,
+        resolved_lookup_keys: &mut HashSet<(String, String)>,
+        cache_inserts: &mut Vec<(CacheKey, String)>,
+        results: &mut HashMap<String, String>,
+    ) -> bool {
+        let bucket_len = Self::select_stable_bucket_len(batch.len());
+        let padded_batch = Self::pad_batch_to_bucket(batch, bucket_len);
+        self.record_stable_shape_selection(bucket_len, bucket_len.saturating_sub(batch.len()));
+
+        // Stage 1: exact-case query to fully leverage (formid, plugin) index shape.
+        let exact_query = self.get_or_build_stable_query_template(game_table, bucket_len, false);
+        let exact_bindings: Vec<(String, String)> = padded_batch
+            .iter()
+            .map(|(formid, plugin, _)| (formid.clone(), plugin.clone()))
+            .collect();
+        let (exact_rows, mut all_queries_succeeded) = self
+            .execute_parallel_batch_query(&exact_query, &exact_bindings)
+            .await;
+
+        Self::merge_batch_rows(
+            game_table,
+            exact_rows,
+            original_key_lookup,
+            resolved_lookup_keys,
+            cache_inserts,
+            results,
+        );
+
+        // Stage 2: case-insensitive fallback only for unresolved keys.
+        // This preserves behavior while avoiding COLLATE NOCASE for the fast-path.
+        if resolved_lookup_keys.len() < original_key_lookup.len() {
+            let unresolved_pairs: Vec<(String, String, String)> = original_key_lookup
+                .iter()
+                .filter(|(lookup_key, _)| !resolved_lookup_keys.contains(*lookup_key))
+                .filter_map(|((formid, normalized_plugin), originals)| {
+                    originals.first().map(|(_, plugin)| {
+                        (formid.clone(), plugin.clone(), normalized_plugin.clone())
+                    })
+                })
+                .collect();
+
+            if !unresolved_pairs.is_empty() {
+                let fallback_bucket_len = Self::select_stable_bucket_len(unresolved_pairs.len());
+                let padded_fallback =
+                    Self::pad_batch_to_bucket(&unresolved_pairs, fallback_bucket_len);
+                self.record_stable_shape_selection(
+                    fallback_bucket_len,
+                    fallback_bucket_len.saturating_sub(unresolved_pairs.len()),
+                );
+
+                let fallback_query =
+                    self.get_or_build_stable_query_template(game_table, fallback_bucket_len, true);
+                let fallback_bindings: Vec<(String, String)> = padded_fallback
+                    .iter()
+                    .map(|(formid, plugin, _)| (formid.clone(), plugin.clone()))
+                    .collect();
+                let (fallback_rows, fallback_succeeded) = self
+                    .execute_parallel_batch_query(&fallback_query, &fallback_bindings)
+                    .await;
+                all_queries_succeeded &= fallback_succeeded;
+                Self::merge_batch_rows(
+                    game_table,
+                    fallback_rows,
+                    original_key_lookup,
+                    resolved_lookup_keys,
+                    cache_inserts,
+                    results,
+                );
+            }
         }
 
-        merged_results
+        all_queries_succeeded
+    }
+
+    /// Resolves one chunk with a single `json_each` query per database.
+    ///
+    /// Exact-case rows are merged before case-insensitive ones, and the latter only
+    /// for pairs no exact row resolved, which matches the two-stage `UNION ALL` results.
+    ///
+    /// Returns whether every query succeeded.
+    async fn query_chunk_json_each(
+        &self,
+        game_table: &str,
+        batch: &[(String, String, String)],
+        original_key_lookup: &HashMap<(String, String), Vec<(String, String)>>,
+        resolved_lookup_keys: &mut HashSet<(String, String)>,
+        cache_inserts: &mut Vec<(CacheKey, String)>,
+        results: &mut HashMap<String, String>,
+    ) -> bool {
+        let query = self
+            .query_cache
+            .get_or_build_template(game_table, QueryShape::JsonEach);
+        let pairs: Vec<(&str, &str)> = batch
+            .iter()
+            .map(|(formid, plugin, _)| (formid.as_str(), plugin.as_str()))
+            .collect();
+        let pairs_json = match serde_json::to_string(&pairs) {
+            Ok(json) => json,
+            Err(e) => {
+                error!("Failed to encode json_each batch parameter: {}", e);
+                return false;
+            }
+        };
+
+        let (rows, all_queries_succeeded) = self
+            .execute_parallel_json_each_query(&query, &pairs_json)
+            .await;
+
+        let (exact_rows, nocase_rows): (Vec<_>, Vec<_>) =
+            rows.into_iter().partition(|(_, _, _, exact)| *exact);
+        let strip = |rows: Vec<(String, String, String, bool)>| -> Vec<(String, String, String)> {
+            rows.into_iter()
+                .map(|(formid, plugin, entry, _)| (formid, plugin, entry))
+                .collect()
+        };
+
+        Self::merge_batch_rows(
+            game_table,
+            strip(exact_rows),
+            original_key_lookup,
+            resolved_lookup_keys,
+            cache_inserts,
+            results,
+        );
+        let unresolved_rows: Vec<(String, String, String)> = strip(nocase_rows)
+            .into_iter()
+            .filter(|(formid, plugin, _)| {
+                !resolved_lookup_keys
+                    .contains(&(formid.clone(), CacheKey::normalize_plugin(plugin)))
+            })
+            .collect();
+        Self::merge_batch_rows(
+            game_table,
+            unresolved_rows,
+            original_key_lookup,
+            resolved_lookup_keys,
+            cache_inserts,
+            results,
+        );
+
+        all_queries_succeeded
     }
 
     fn merge_batch_rows(
@@ -1426,7 +2073,8 @@ impl DatabasePool {
     /// Batch lookup for FormID entries with optimized parallel queries.
     ///
     /// This method uses several optimizations for high-performance lookups:
-    /// - UNION ALL queries instead of OR for better index utilization
+    /// - UNION ALL queries instead of OR for better index utilization, or one
+    ///   `json_each` join per chunk (see [`BatchLookupStrategy`])
     /// - Parallel queries across all database files using `join_all`
     /// - TTL-based caching with optimized key generation
     /// - Adaptive batch sizing based on input size
@@ -1468,6 +2116,7 @@ impl DatabasePool {
                     let result_key = format!("{}:{}", formid, plugin);
                     results.insert(result_key, entry.value);
                     self.stats.increment_cache_hits(1);
+                    self.warm_set.record(&cache_key);
                     continue;
                 } else {
                     // Expired entry: evict and fall through — counted as a cache miss below.
@@ -1475,6 +2124,11 @@ impl DatabasePool {
                 }
             }
 
+            if self.negative_cache.contains(&cache_key) {
+                self.stats.increment_negative_hits(1);
+                continue;
+            }
+
             uncached_pairs.push((formid.clone(), plugin.clone(), normalized_plugin));
             // Covers both cold-miss and expired-miss paths.
             self.stats.increment_cache_misses(1);
@@ -1490,6 +2144,7 @@ impl DatabasePool {
         }
 
         let cache_ttl = self.query_cache.current_ttl();
+        let strategy = self.query_cache.batch_strategy();
 
         // Keep caller-provided chunking contract while enforcing stable-shape bounds.
         let effective_batch_size = batch_size.clamp(1, MAX_STABLE_BATCH_BUCKET);
@@ -1509,79 +2164,54 @@ impl DatabasePool {
                     .push((fid.clone(), plug.clone()));
             }
 
-            let bucket_len = Self::select_stable_bucket_len(batch.len());
-            let padded_batch = Self::pad_batch_to_bucket(batch, bucket_len);
-            self.record_stable_shape_selection(bucket_len, bucket_len.saturating_sub(batch.len()));
-
-            // Stage 1: exact-case query to fully leverage (formid, plugin) index shape.
-            let exact_query =
-                self.get_or_build_stable_query_template(&game_table, bucket_len, false);
-            let exact_bindings: Vec<(String, String)> = padded_batch
-                .iter()
-                .map(|(formid, plugin, _)| (formid.clone(), plugin.clone()))
-                .collect();
-            let exact_rows = self
-                .execute_parallel_batch_query(&exact_query, &exact_bindings)
-                .await;
-
             let mut resolved_lookup_keys: HashSet<(String, String)> = HashSet::new();
             let mut cache_inserts: Vec<(CacheKey, String)> = Vec::new();
-            Self::merge_batch_rows(
-                &game_table,
-                exact_rows,
-                &original_key_lookup,
-                &mut resolved_lookup_keys,
-                &mut cache_inserts,
-                &mut results,
-            );
-
-            // Stage 2: case-insensitive fallback only for unresolved keys.
-            // This preserves behavior while avoiding COLLATE NOCASE for the fast-path.
-            if resolved_lookup_keys.len() < original_key_lookup.len() {
-                let unresolved_pairs: Vec<(String, String, String)> = original_key_lookup
-                    .iter()
-                    .filter(|(lookup_key, _)| !resolved_lookup_keys.contains(*lookup_key))
-                    .filter_map(|((formid, normalized_plugin), originals)| {
-                        originals.first().map(|(_, plugin)| {
-                            (formid.clone(), plugin.clone(), normalized_plugin.clone())
-                        })
-                    })
-                    .collect();
-
-                if !unresolved_pairs.is_empty() {
-                    let fallback_bucket_len =
-                        Self::select_stable_bucket_len(unresolved_pairs.len());
-                    let padded_fallback =
-                        Self::pad_batch_to_bucket(&unresolved_pairs, fallback_bucket_len);
-                    self.record_stable_shape_selection(
-                        fallback_bucket_len,
-                        fallback_bucket_len.saturating_sub(unresolved_pairs.len()),
-                    );
-
-                    let fallback_query = self.get_or_build_stable_query_template(
+            self.stats.record_batch_strategy(strategy);
+            let all_queries_succeeded = match strategy {
+                BatchLookupStrategy::StableUnion => {
+                    self.query_chunk_stable_union(
                         &game_table,
-                        fallback_bucket_len,
-                        true,
-                    );
-                    let fallback_bindings: Vec<(String, String)> = padded_fallback
-                        .iter()
-                        .map(|(formid, plugin, _)| (formid.clone(), plugin.clone()))
-                        .collect();
-                    let fallback_rows = self
-                        .execute_parallel_batch_query(&fallback_query, &fallback_bindings)
-                        .await;
-                    Self::merge_batch_rows(
+                        batch,
+                        &original_key_lookup,
+                        &mut resolved_lookup_keys,
+                        &mut cache_inserts,
+                        &mut results,
+                    )
+                    .await
+                }
+                BatchLookupStrategy::JsonEach => {
+                    self.query_chunk_json_each(
                         &game_table,
-                        fallback_rows,
+                        batch,
                         &original_key_lookup,
                         &mut resolved_lookup_keys,
                         &mut cache_inserts,
                         &mut results,
-                    );
+                    )
+                    .await
                 }
-            }
+            };
 
+            for (cache_key, _) in &cache_inserts {
+                self.warm_set.record(cache_key);
+            }
             self.insert_many_with_eviction(cache_inserts, cache_ttl);
+
+            // A failed query proves nothing about absence, so only clean misses are remembered.
+            if all_queries_succeeded {
+                self.negative_cache.insert_many(
+                    original_key_lookup
+                        .into_keys()
+                        .filter(|lookup_key| !resolved_lookup_keys.contains(lookup_key))
+                        .map(|(formid, normalized_plugin)| {
+                            CacheKey::from_normalized_plugin(
+                                &game_table,
+                                &formid,
+                                &normalized_plugin,
+                            )
+                        }),
+                );
+            }
         }
 
         info!(
@@ -1607,7 +2237,7 @@ impl DatabasePool {
         self.game_table.get()
     }
 
-    /// Clear the query cache
+    /// Clear the query cache, including remembered lookup misses
     ///
     /// # Arguments
     /// * `expired_only` - If true, only remove expired entries; if false, clear all
@@ -1615,7 +2245,7 @@ impl DatabasePool {
     /// # Returns
     /// Number of cache entries removed
     pub fn clear_cache(&self, expired_only: bool) -> usize {
-        self.query_cache.clear(expired_only)
+        self.query_cache.clear(expired_only) + self.negative_cache.clear(expired_only)
     }
 
     /// Set the cache time-to-live duration
@@ -1643,6 +2273,63 @@ impl DatabasePool {
         self.query_cache.set_capacity(capacity, &self.stats);
     }
 
+    /// Get the time-to-live applied to remembered lookup misses.
+    pub fn get_negative_cache_ttl(&self) -> Duration {
+        self.negative_cache.ttl()
+    }
+
+    /// Set the time-to-live applied to newly remembered lookup misses.
+    ///
+    /// A zero TTL stops remembering misses.
+    pub fn set_negative_cache_ttl(&self, ttl: Duration) {
+        self.negative_cache.set_ttl(ttl);
+    }
+
+    /// Get the maximum number of remembered lookup misses.
+    pub fn get_negative_cache_capacity(&self) -> usize {
+        self.negative_cache.capacity()
+    }
+
+    /// Set the maximum number of remembered lookup misses.
+    ///
+    /// Value is clamped to configured min/max bounds.
+    pub fn set_negative_cache_capacity(&self, capacity: usize) {
+        self.negative_cache.set_capacity(capacity);
+    }
+
+    /// Get the SQL strategy used for uncached pairs in `get_entries_batch`.
+    pub fn get_batch_lookup_strategy(&self) -> BatchLookupStrategy {
+        self.query_cache.batch_strategy()
+    }
+
+    /// Set the SQL strategy used for uncached pairs in `get_entries_batch`.
+    ///
+    /// Both strategies return the same results; `get_stats()` counts the chunks
+    /// each one resolved.
+    pub fn set_batch_lookup_strategy(&self, strategy: BatchLookupStrategy) {
+        self.query_cache.set_batch_strategy(strategy);
+    }
+
+    /// Get the number of entries persisted in the FormID warm set.
+    pub fn get_warm_set_capacity(&self) -> usize {
+        self.warm_set.capacity()
+    }
+
+    /// Set the number of entries persisted in the FormID warm set.
+    ///
+    /// When non-zero, `close()` saves the most frequently resolved cached entries
+    /// beside the first database and `initialize()` preloads them into the query
+    /// cache if no database changed in between. Zero (the default) disables the
+    /// warm set. Value is clamped to `MAX_WARM_SET_CAPACITY`.
+    pub fn set_warm_set_capacity(&self, capacity: usize) {
+        self.warm_set.set_capacity(capacity);
+    }
+
+    /// Get the current number of remembered lookup misses.
+    pub fn negative_cache_size(&self) -> usize {
+        self.negative_cache.len()
+    }
+
     /// Get proactive cleanup operation threshold.
     pub fn get_cache_cleanup_threshold(&self) -> u64 {
         self.query_cache.cleanup_threshold()
@@ -1718,6 +2405,9 @@ impl DatabasePool {
     }
 
     /// Close all connections and clear caches
+    ///
+    /// When a warm set capacity is configured, the hottest cached entries are
+    /// saved first so the next `initialize()` can preload them.
     pub async fn close(&self) -> Result<(), DatabaseError> {
         let pool_count = self.registry.len();
         let cache_size = self.query_cache.len();
@@ -1733,8 +2423,13 @@ impl DatabasePool {
             pool_count, cache_size, active_before
         );
 
-        // Clear query result cache but keep reusable SQL templates.
+        // Save the hottest entries before the caches and tracked paths are cleared.
+        self.persist_warm_set().await;
+        self.warm_set.clear();
+
+        // Clear query result caches but keep reusable SQL templates.
         self.query_cache.clear_entries();
+        self.negative_cache.clear(false);
 
         // Close all pools and clear tracked connection metadata.
         self.close_active_pools().await;
@@ -1757,8 +2452,11 @@ impl DatabasePool {
     }
 
     /// Optimize database connections (VACUUM and ANALYZE)
+    ///
+    /// Remembered lookup misses are dropped so lookups re-check the optimized databases.
     pub async fn optimize(&self) -> Result<(), DatabaseError> {
         info!("Optimizing database connections");
+        self.negative_cache.clear(false);
 
         for (db_path, pool) in self.registry.pool_snapshots() {
             // Note: VACUUM cannot be run on read-only databases
@@ -1447,3 +1447,342 @@ async fn test_multi_database_query() {
 
     pool.close().await.unwrap();
 }
+
+// =========================================================================
+// Negative Cache Tests
+// =========================================================================
+
+/// Test that a confirmed miss is answered from the negative cache on repeat.
+#[tokio::test]
+async fn test_negative_cache_remembers_single_lookup_miss() {
+    let table_name = "NegativeTable";
+    let entries = [("00000001", "Test.esp", "Entry 1")];
+    let (_temp_file, db_path) = create_test_database(table_name, &entries).await.unwrap();
+
+    let pool = DatabasePool::new(Some(4), Duration::from_secs(300), table_name.to_string());
+    pool.initialize(vec![db_path]).await.unwrap();
+
+    assert_eq!(
+        pool.get_entry("DEADBEEF", "Test.esp", None).await.unwrap(),
+        None
+    );
+    assert_eq!(pool.negative_cache_size(), 1);
+    assert_eq!(
+        pool.cache_size(),
+        0,
+        "Misses must not enter the value cache"
+    );
+
+    assert_eq!(
+        pool.get_entry("DEADBEEF", "test.esp", None).await.unwrap(),
+        None
+    );
+    let stats = pool.get_stats().unwrap();
+    assert_eq!(stats.negative_hits, 1);
+    assert_eq!(stats.cache_hits, 1, "Negative hits count as cache hits");
+    assert_eq!(stats.cache_misses, 1);
+
+    pool.close().await.unwrap();
+}
+
+/// Test that batch lookups record and then skip unresolved pairs.
+#[tokio::test]
+async fn test_negative_cache_remembers_batch_misses() {
+    let table_name = "NegativeBatchTable";
+    let entries = [("00000001", "Test.esp", "Entry 1")];
+    let (_temp_file, db_path) = create_test_database(table_name, &entries).await.unwrap();
+
+    let pool = DatabasePool::new(Some(4), Duration::from_secs(300), table_name.to_string());
+    pool.initialize(vec![db_path]).await.unwrap();
+
+    let pairs = vec![
+        ("00000001".to_string(), "Test.esp".to_string()),
+        ("00000002".to_string(), "Test.esp".to_string()),
+        ("00000003".to_string(), "Other.esp".to_string()),
+    ];
+    let first = pool
+        .get_entries_batch(pairs.clone(), None, 100)
+        .await
+        .unwrap();
+    assert_eq!(first.len(), 1);
+    assert_eq!(pool.negative_cache_size(), 2);
+
+    let second = pool.get_entries_batch(pairs, None, 100).await.unwrap();
+    assert_eq!(second, first);
+    let stats = pool.get_stats().unwrap();
+    assert_eq!(stats.negative_hits, 2);
+    assert_eq!(stats.cache_hits, 3);
+
+    pool.close().await.unwrap();
+}
+
+/// Test that re-initializing and optimizing the pool forget remembered misses.
+#[tokio::test]
+async fn test_negative_cache_cleared_on_initialize_and_optimize() {
+    let table_name = "NegativeResetTable";
+    let entries = [("00000001", "Test.esp", "Entry 1")];
+    let (_temp_file, db_path) = create_test_database(table_name, &entries).await.unwrap();
+
+    let pool = DatabasePool::new(Some(4), Duration::from_secs(300), table_name.to_string());
+    pool.initialize(vec![db_path.clone()]).await.unwrap();
+
+    let _ = pool.get_entry("DEADBEEF", "Test.esp", None).await.unwrap();
+    assert_eq!(pool.negative_cache_size(), 1);
+    pool.optimize().await.unwrap();
+    assert_eq!(pool.negative_cache_size(), 0);
+
+    let _ = pool.get_entry("DEADBEEF", "Test.esp", None).await.unwrap();
+    assert_eq!(pool.negative_cache_size(), 1);
+    pool.initialize(vec![db_path]).await.unwrap();
+    assert_eq!(pool.negative_cache_size(), 0);
+
+    pool.close().await.unwrap();
+}
+
+/// Test that a zero TTL disables the negative cache and capacity is clamped.
+#[tokio::test]
+async fn test_negative_cache_configuration() {
+    let table_name = "NegativeConfigTable";
+    let entries = [("00000001", "Test.esp", "Entry 1")];
+    let (_temp_file, db_path) = create_test_database(table_name, &entries).await.unwrap();
+
+    let pool = DatabasePool::new(Some(4), Duration::from_secs(300), table_name.to_string());
+    assert_eq!(
+        pool.get_negative_cache_ttl(),
+        Duration::from_secs(DEFAULT_NEGATIVE_CACHE_TTL_SECS)
+    );
+    assert_eq!(
+        pool.get_negative_cache_capacity(),
+        DEFAULT_NEGATIVE_CACHE_CAPACITY
+    );
+
+    pool.set_negative_cache_capacity(0);
+    assert_eq!(
+        pool.get_negative_cache_capacity(),
+        MIN_NEGATIVE_CACHE_CAPACITY
+    );
+    pool.set_negative_cache_capacity(usize::MAX);
+    assert_eq!(
+        pool.get_negative_cache_capacity(),
+        MAX_NEGATIVE_CACHE_CAPACITY
+    );
+
+    pool.set_negative_cache_ttl(Duration::ZERO);
+    pool.initialize(vec![db_path]).await.unwrap();
+    let _ = pool.get_entry("DEADBEEF", "Test.esp", None).await.unwrap();
+    assert_eq!(pool.negative_cache_size(), 0);
+
+    pool.close().await.unwrap();
+}
+
+// =========================================================================
+// Warm Set Tests
+// =========================================================================
+
+/// Copy a test database into `dir` so the warm set written beside it stays isolated.
+async fn create_isolated_test_database(
+    dir: &tempfile::TempDir,
+    table_name: &str,
+    entries: &[(&str, &str, &str)],
+) -> PathBuf {
+    let (temp_file, source) = create_test_database(table_name, entries).await.unwrap();
+    let db_path = dir.path().join("FormIDs.db");
+    std::fs::copy(&source, &db_path).unwrap();
+    drop(temp_file);
+    db_path
+}
+
+#[tokio::test]
+async fn test_warm_set_preloads_cache_after_close() {
+    let table_name = "WarmSetTable";
+    let entries = [
+        ("0001A332", "Fallout4.esm", "Workbench"),
+        ("00000007", "Fallout4.esm", "Player"),
+        ("00000014", "Fallout4.esm", "PlayerRef"),
+    ];
+    let dir = tempfile::TempDir::new().unwrap();
+    let db_path = create_isolated_test_database(&dir, table_name, &entries).await;
+
+    let pool = DatabasePool::new(Some(2), Duration::from_secs(300), table_name.to_string());
+    pool.set_warm_set_capacity(2);
+    pool.initialize(vec![db_path.clone()]).await.unwrap();
+    for _ in 0..3 {
+        pool.get_entry("0001A332", "Fallout4.esm", None)
+            .await
+            .unwrap();
+    }
+    for _ in 0..2 {
+        pool.get_entry("00000007", "FALLOUT4.ESM", None)
+            .await
+            .unwrap();
+    }
+    pool.get_entry("00000014", "Fallout4.esm", None)
+        .await
+        .unwrap();
+    pool.close().await.unwrap();
+
+    let warm_path = formid_warm_set_path(std::slice::from_ref(&db_path)).unwrap();
+    assert!(warm_path.exists());
+
+    let next = DatabasePool::new(Some(2), Duration::from_secs(300), table_name.to_string());
+    next.set_warm_set_capacity(2);
+    next.initialize(vec![db_path]).await.unwrap();
+    assert_eq!(next.cache_size(), 2);
+    assert_eq!(next.get_stats().unwrap().warm_set_loaded, 2);
+
+    let result = next
+        .get_entry("00000007", "fallout4.esm", None)
+        .await
+        .unwrap();
+    assert_eq!(result, Some("Player".to_string()));
+    let stats = next.get_stats().unwrap();
+    assert_eq!(stats.cache_hits, 1);
+    assert_eq!(stats.cache_misses, 0);
+    assert!(!next.cache_contains_key(&CacheKey::new(table_name, "00000014", "Fallout4.esm")));
+
+    next.close().await.unwrap();
+}
+
+#[tokio::test]
+async fn test_warm_set_ignored_when_disabled_or_database_changed() {
+    let table_name = "WarmSetInvalidationTable";
+    let entries = [("0001A332", "Fallout4.esm", "Workbench")];
+    let dir = tempfile::TempDir::new().unwrap();
+    let db_path = create_isolated_test_database(&dir, table_name, &entries).await;
+
+    let pool = DatabasePool::new(Some(2), Duration::from_secs(300), table_name.to_string());
+    assert_eq!(pool.get_warm_set_capacity(), DEFAULT_WARM_SET_CAPACITY);
+    pool.set_warm_set_capacity(usize::MAX);
+    assert_eq!(pool.get_warm_set_capacity(), MAX_WARM_SET_CAPACITY);
+    pool.initialize(vec![db_path.clone()]).await.unwrap();
+    pool.get_entry("0001A332", "Fallout4.esm", None)
+        .await
+        .unwrap();
+    pool.close().await.unwrap();
+
+    let disabled = DatabasePool::new(Some(2), Duration::from_secs(300), table_name.to_string());
+    disabled.initialize(vec![db_path.clone()]).await.unwrap();
+    assert_eq!(disabled.cache_size(), 0);
+    disabled.close().await.unwrap();
+
+    // Rewriting the database changes its size and modification time.
+    let conn_str = format!("sqlite://{}?mode=rw", db_path.display());
+    let writer = SqlitePoolOptions::new()
+        .max_connections(1)
+        .connect(&conn_str)
+        .await
+        .unwrap();
+    let insert_sql = format!(
+        "INSERT INTO {} (formid, plugin, entry) VALUES ('00000007', 'Fallout4.esm', '{}')",
+        table_name,
+        "Player".repeat(2048)
+    );
+    sqlx::query(sqlx::AssertSqlSafe(insert_sql.as_str()))
+        .execute(&writer)
+        .await
+        .unwrap();
+    sqlx::query("PRAGMA wal_checkpoint(TRUNCATE)")
+        .execute(&writer)
+        .await
+        .unwrap();
+    writer.close().await;
+
+    let changed = DatabasePool::new(Some(2), Duration::from_secs(300), table_name.to_string());
+    changed.set_warm_set_capacity(10);
+    changed.initialize(vec![db_path]).await.unwrap();
+    assert_eq!(changed.cache_size(), 0);
+    assert_eq!(changed.get_stats().unwrap().warm_set_loaded, 0);
+    changed.close().await.unwrap();
+}
+
+// =========================================================================
+// Batch Lookup Strategy Tests
+// =========================================================================
+
+#[tokio::test]
+async fn test_json_each_strategy_matches_stable_union_results() {
+    let table_name = "JsonEachParityTable";
+    let entries = [
+        ("00000001", "Fallout4.esm", "Exact Entry"),
+        ("00000002", "DLCRobot.esm", "Case Folded Entry"),
+        ("00000003", "Mod.esp", "Lower Case Row"),
+        ("00000003", "MOD.ESP", "Upper Case Row"),
+        ("00000004", "Quote\"d 'Mod'.esp", "Escaped Entry"),
+    ];
+    let (_temp_file, db_path) = create_test_database(table_name, &entries).await.unwrap();
+    let pairs: Vec<(String, String)> = [
+        ("00000001", "Fallout4.esm"),
+        ("00000002", "dlcrobot.ESM"),
+        ("00000003", "MOD.ESP"),
+        ("00000004", "quote\"d 'mod'.ESP"),
+        ("0000FFFF", "Missing.esp"),
+    ]
+    .iter()
+    .map(|(formid, plugin)| (formid.to_string(), plugin.to_string()))
+    .collect();
+
+    let mut results_by_strategy = Vec::new();
+    for strategy in [
+        BatchLookupStrategy::StableUnion,
+        BatchLookupStrategy::JsonEach,
+    ] {
+        let pool = DatabasePool::new(Some(2), Duration::from_secs(60), table_name.to_string());
+        pool.set_batch_lookup_strategy(strategy);
+        assert_eq!(pool.get_batch_lookup_strategy(), strategy);
+        pool.initialize(vec![db_path.clone()]).await.unwrap();
+
+        let results = pool
+            .get_entries_batch(pairs.clone(), None, 100)
+            .await
+            .unwrap();
+        let stats = pool.get_stats().unwrap();
+        match strategy {
+            BatchLookupStrategy::StableUnion => {
+                assert_eq!(stats.stable_union_batches, 1);
+                assert_eq!(stats.json_each_batches, 0);
+            }
+            BatchLookupStrategy::JsonEach => {
+                assert_eq!(stats.json_each_batches, 1);
+                assert_eq!(stats.stable_union_batches, 0);
+                assert_eq!(stats.stable_shape_selections, 0);
+            }
+        }
+        assert_eq!(pool.negative_cache_size(), 1, "{strategy:?}");
+        pool.close().await.unwrap();
+        results_by_strategy.push(results);
+    }
+
+    let json_each = results_by_strategy.pop().unwrap();
+    let stable_union = results_by_strategy.pop().unwrap();
+    assert_eq!(json_each, stable_union);
+    assert_eq!(json_each.len(), 4);
+    assert_eq!(
+        json_each.get("00000003:MOD.ESP").map(String::as_str),
+        Some("Upper Case Row"),
+        "exact-case rows win over case-folded ones"
+    );
+    assert_eq!(
+        json_each
+            .get("00000004:quote\"d 'mod'.ESP")
+            .map(String::as_str),
+        Some("Escaped Entry")
+    );
+}
+
+#[test]
+fn test_batch_lookup_strategy_names_round_trip() {
+    for strategy in [
+        BatchLookupStrategy::StableUnion,
+        BatchLookupStrategy::JsonEach,
+    ] {
+        assert_eq!(
+            BatchLookupStrategy::from_name(strategy.as_str()),
+            Some(strategy)
+        );
+    }
+    assert_eq!(BatchLookupStrategy::from_name("carray"), None);
+    assert_eq!(
+        BatchLookupStrategy::default(),
+        BatchLookupStrategy::StableUnion
+    );
+}
@@ -0,0 +1,153 @@
+//! Persisted FormID warm set for [`DatabasePool`](crate::DatabasePool)
+//!
+//! The same base-game FormIDs are resolved in almost every crash log, yet the
+//! pool's query cache starts cold in every process. When a warm set capacity is
+//! configured, `close()` writes the most frequently resolved cache entries to a
+//! small file beside the databases, and the next `initialize()` loads them back
+//! into the query cache without querying SQLite.
+//!
+//! The file carries the same source fingerprint as the FormID index (database
+//! names, sizes and modification times), so rebuilding or replacing any database
+//! discards the warm set. A truncated or unreadable file is skipped and the query
+//! cache simply starts cold.
+//!
+//! Layout (little-endian): magic(8), version(4), fingerprint(8), record count(4),
+//! then per record a hit count(4) followed by the game table, FormID, normalized
+//! plugin and entry, each as a length(4)-prefixed UTF-8 string.
+
+use crate::formid_index::source_fingerprint;
+use crate::pool_sqlx::DatabaseError;
+use classic_file_io_core::write_atomic_async;
+use std::path::{Path, PathBuf};
+
+/// File name of the warm set written beside the first database.
+pub const FORMID_WARM_SET_FILE_NAME: &str = "FormID Warm Set.cache";
+
+const MAGIC: &[u8; 8] = b"CLWARM\0\0";
+/// Bumped whenever the on-disk layout changes.
+const FORMAT_VERSION: u32 = 1;
+/// magic(8) + version(4) + fingerprint(8) + record_count(4)
+const HEADER_LEN: usize = 24;
+
+/// One cached lookup carried across processes.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub(crate) struct WarmRecord {
+    pub(crate) game_table: String,
+    pub(crate) formid: String,
+    /// Plugin name, already normalized for cache keys.
+    pub(crate) plugin: String,
+    pub(crate) entry: String,
+    /// How often the lookup was resolved, used to rank entries across runs.
+    pub(crate) hits: u32,
+}
+
+/// Default warm set location for a set of FormID databases.
+///
+/// The warm set sits beside the first database, like the FormID index.
+/// Returns `None` when `db_paths` is empty.
+#[must_use]
+pub fn formid_warm_set_path(db_paths: &[PathBuf]) -> Option<PathBuf> {
+    let first = db_paths.first()?;
+    let directory = first.parent().unwrap_or_else(|| Path::new(""));
+    Some(directory.join(FORMID_WARM_SET_FILE_NAME))
+}
+
+/// Writes `records` for `db_paths`, replacing any previous warm set atomically.
+pub(crate) async fn write_warm_set(
+    path: &Path,
+    db_paths: &[PathBuf],
+    records: &[WarmRecord],
+) -> Result<(), DatabaseError> {
+    let bytes = encode(source_fingerprint(db_paths), records);
+    write_atomic_async(path.to_path_buf(), bytes).await?;
+    Ok(())
+}
+
+/// Reads the warm set at `path` if it was written for the current `db_paths`.
+pub(crate) async fn read_warm_set(path: &Path, db_paths: &[PathBuf]) -> Option<Vec<WarmRecord>> {
+    let bytes = tokio::fs::read(path).await.ok()?;
+    decode(&bytes, source_fingerprint(db_paths))
+}
+
+fn encode(fingerprint: u64, records: &[WarmRecord]) -> Vec<u8> {
+    let strings_len: usize = records
+        .iter()
+        .map(|record| {
+            record.game_table.len() + record.formid.len() + record.plugin.len() + record.entry.len()
+        })
+        .sum();
+    let mut bytes = Vec::with_capacity(HEADER_LEN + records.len() * 20 + strings_len);
+    bytes.extend_from_slice(MAGIC);
+    bytes.extend_from_slice(&FORMAT_VERSION.to_le_bytes());
+    bytes.extend_from_slice(&fingerprint.to_le_bytes());
+    bytes.extend_from_slice(&(records.len() as u32).to_le_bytes());
+    for record in records {
+        bytes.extend_from_slice(&record.hits.to_le_bytes());
+        for value in [
+            &record.game_table,
+            &record.formid,
+            &record.plugin,
+            &record.entry,
+        ] {
+            bytes.extend_from_slice(&(value.len() as u32).to_le_bytes());
+            bytes.extend_from_slice(value.as_bytes());
+        }
+    }
+    bytes
+}
+
+fn decode(bytes: &[u8], fingerprint: u64) -> Option<Vec<WarmRecord>> {
+    let mut reader = Reader { bytes, at: 0 };
+    if reader.take(MAGIC.len())? != MAGIC
+        || reader.u32()? != FORMAT_VERSION
+        || reader.u64()? != fingerprint
+    {
+        return None;
+    }
+
+    let count = reader.u32()? as usize;
+    // Every record needs at least 20 bytes, so a corrupt count cannot over-allocate.
+    let mut records = Vec::with_capacity(count.min(bytes.len() / 20));
+    for _ in 0..count {
+        records.push(WarmRecord {
+            hits: reader.u32()?,
+            game_table: reader.string()?,
+            formid: reader.string()?,
+            plugin: reader.string()?,
+            entry: reader.string()?,
+        });
+    }
+    (reader.at == bytes.len()).then_some(records)
+}
+
+struct Reader<'a> {
+    bytes: &'a [u8],
+    at: usize,
+}
+
+impl<'a> Reader<'a> {
+    fn take(&mut self, len: usize) -> Option<&'a [u8]> {
+        let slice = self.bytes.get(self.at..self.at.checked_add(len)?)?;
+        self.at += len;
+        Some(slice)
+    }
+
+    fn u32(&mut self) -> Option<u32> {
+        Some(u32::from_le_bytes(self.take(4)?.try_into().ok()?))
+    }
+
+    fn u64(&mut self) -> Option<u64> {
+        Some(u64::from_le_bytes(self.take(8)?.try_into().ok()?))
+    }
+
+    fn string(&mut self) -> Option<String> {
+        let len = self.u32()? as usize;
+        std::str::from_utf8(self.take(len)?)
+            .ok()
+            .map(str::to_string)
+    }
+}
+
+#[cfg(test)]
+#[path = "warm_set_tests.rs"]
+mod tests;
@@ -0,0 +1,63 @@
+use super::*;
+use tempfile::TempDir;
+
+fn sample_records() -> Vec<WarmRecord> {
+    vec![
+        WarmRecord {
+            game_table: "Fallout4".to_string(),
+            formid: "0001A332".to_string(),
+            plugin: "fallout4.esm".to_string(),
+            entry: "Workbench".to_string(),
+            hits: 12,
+        },
+        WarmRecord {
+            game_table: "Fallout4".to_string(),
+            formid: "00000007".to_string(),
+            plugin: "fallout4.esm".to_string(),
+            entry: "Player — ünïcode".to_string(),
+            hits: 1,
+        },
+    ]
+}
+
+#[test]
+fn encode_decode_round_trip() {
+    let records = sample_records();
+    let bytes = encode(42, &records);
+
+    assert_eq!(decode(&bytes, 42), Some(records));
+}
+
+#[test]
+fn decode_rejects_other_fingerprint_and_corruption() {
+    let bytes = encode(42, &sample_records());
+
+    assert_eq!(decode(&bytes, 43), None);
+    assert_eq!(decode(&bytes[..bytes.len() - 1], 42), None);
+    assert_eq!(decode(&[bytes.as_slice(), &[0_u8]].concat(), 42), None);
+
+    let mut bad_magic = bytes.clone();
+    bad_magic[0] ^= 0xFF;
+    assert_eq!(decode(&bad_magic, 42), None);
+}
+
+#[tokio::test]
+async fn warm_set_is_discarded_when_a_database_changes() {
+    let dir = TempDir::new().unwrap();
+    let db_path = dir.path().join("Fallout4 FormIDs.db");
+    std::fs::write(&db_path, b"first").unwrap();
+    let db_paths = vec![db_path.clone()];
+    let path = formid_warm_set_path(&db_paths).unwrap();
+    assert_eq!(path, dir.path().join(FORMID_WARM_SET_FILE_NAME));
+
+    write_warm_set(&path, &db_paths, &sample_records())
+        .await
+        .unwrap();
+    assert_eq!(
+        read_warm_set(&path, &db_paths).await,
+        Some(sample_records())
+    );
+
+    std::fs::write(&db_path, b"rebuilt database").unwrap();
+    assert_eq!(read_warm_set(&path, &db_paths).await, None);
+}
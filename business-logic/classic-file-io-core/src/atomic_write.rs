@@ -0,0 +1,61 @@
+//! Whole-file replacement through a temporary sibling.
+//!
+//! The on-disk caches of the scan pipeline (hash database, YAML Data and scan
+//! snapshots, FormID index and warm set, re-scan cache) are rewritten as a whole.
+//! [`write_atomic`] writes the new contents to `<path>.tmp-<pid>-<n>` in the same
+//! directory and renames it over `path`, so a reader sees either the old file or
+//! the new one and never a partial write. The temporary name is unique per process
+//! and call, so concurrent writers of one path never share a temporary file; the
+//! last rename wins.
+//!
+//! Unlike [`install_atomic`](crate::install_atomic), nothing is verified, no
+//! previous copy is kept and nothing is fsynced: these files are rebuilt when lost.
+
+use std::ffi::OsString;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicU64, Ordering};
+
+/// Distinguishes temporary files of concurrent writes within one process.
+static NEXT_TEMP_ID: AtomicU64 = AtomicU64::new(0);
+
+/// Replaces `path` with `bytes`, creating missing parent directories.
+///
+/// # Errors
+///
+/// Returns the I/O error from creating the parent directory, writing the temporary
+/// file or renaming it. The temporary file is removed when the rename fails.
+pub fn write_atomic(path: &Path, bytes: &[u8]) -> std::io::Result<()> {
+    if let Some(parent) = path.parent().filter(|dir| !dir.as_os_str().is_empty()) {
+        std::fs::create_dir_all(parent)?;
+    }
+
+    let tmp = temp_path_for(path);
+    std::fs::write(&tmp, bytes)?;
+    if let Err(error) = std::fs::rename(&tmp, path) {
+        let _ = std::fs::remove_file(&tmp);
+        return Err(error);
+    }
+    Ok(())
+}
+
+/// Runs [`write_atomic`] on the blocking thread pool.
+///
+/// # Errors
+///
+/// Returns the error of [`write_atomic`], or an error if the blocking task panicked.
+pub async fn write_atomic_async(path: PathBuf, bytes: Vec<u8>) -> std::io::Result<()> {
+    tokio::task::spawn_blocking(move || write_atomic(&path, &bytes))
+        .await
+        .map_err(std::io::Error::other)?
+}
+
+fn temp_path_for(path: &Path) -> PathBuf {
+    let id = NEXT_TEMP_ID.fetch_add(1, Ordering::Relaxed);
+    let mut tmp = OsString::from(path.as_os_str());
+    tmp.push(format!(".tmp-{}-{id}", std::process::id()));
+    PathBuf::from(tmp)
+}
+
+#[cfg(test)]
+#[path = "atomic_write_tests.rs"]
+mod tests;
@@ -0,0 +1,66 @@
+use super::*;
+use tempfile::TempDir;
+
+fn leftover_temp_files(dir: &Path) -> usize {
+    std::fs::read_dir(dir)
+        .unwrap()
+        .filter(|entry| {
+            entry
+                .as_ref()
+                .unwrap()
+                .file_name()
+                .to_string_lossy()
+                .contains(".tmp-")
+        })
+        .count()
+}
+
+#[test]
+fn write_atomic_creates_and_replaces() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("nested").join("cache.json");
+
+    write_atomic(&path, b"first").unwrap();
+    assert_eq!(std::fs::read(&path).unwrap(), b"first");
+    write_atomic(&path, b"second").unwrap();
+    assert_eq!(std::fs::read(&path).unwrap(), b"second");
+    assert_eq!(leftover_temp_files(path.parent().unwrap()), 0);
+}
+
+#[test]
+fn write_atomic_removes_temp_file_when_rename_fails() {
+    let temp = TempDir::new().unwrap();
+    // A non-empty directory cannot be replaced by a file.
+    let path = temp.path().join("occupied");
+    std::fs::create_dir(&path).unwrap();
+    std::fs::write(path.join("inside"), b"keep").unwrap();
+
+    assert!(write_atomic(&path, b"bytes").is_err());
+    assert!(path.join("inside").is_file());
+    assert_eq!(leftover_temp_files(temp.path()), 0);
+}
+
+#[test]
+fn temp_paths_are_unique_siblings() {
+    let path = Path::new("dir").join("cache.json");
+    let first = temp_path_for(&path);
+    let second = temp_path_for(&path);
+    assert_ne!(first, second);
+    assert_eq!(first.parent(), path.parent());
+    assert!(
+        first
+            .to_string_lossy()
+            .contains(&format!("cache.json.tmp-{}-", std::process::id()))
+    );
+}
+
+#[tokio::test]
+async fn write_atomic_async_writes_file() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("cache.bin");
+
+    write_atomic_async(path.clone(), vec![1, 2, 3])
+        .await
+        .unwrap();
+    assert_eq!(std::fs::read(&path).unwrap(), [1, 2, 3]);
+}
@@ -71,6 +71,50 @@ async fn test_read_file_cached() {
     assert_eq!(content2, "Cached content");
 }
 
+#[tokio::test]
+async fn test_read_file_shared_reuses_cached_allocation() {
+    let temp = TempDir::new().unwrap();
+    let file_path = temp.path().join("shared.txt");
+    std::fs::write(&file_path, "Shared content").unwrap();
+
+    let core = FileIOCore::default();
+    let first = core.read_file_shared(&file_path).await.unwrap();
+    let second = core.read_file_shared(&file_path).await.unwrap();
+
+    assert_eq!(&*first, "Shared content");
+    assert!(Arc::ptr_eq(&first, &second));
+}
+
+#[tokio::test]
+async fn test_read_file_detects_external_modification() {
+    let temp = TempDir::new().unwrap();
+    let file_path = temp.path().join("external.txt");
+    std::fs::write(&file_path, "before").unwrap();
+
+    let core = FileIOCore::default();
+    assert_eq!(core.read_file(&file_path).await.unwrap(), "before");
+
+    // Different length, so the change is visible even on coarse mtime filesystems.
+    std::fs::write(&file_path, "after the edit").unwrap();
+    assert_eq!(core.read_file(&file_path).await.unwrap(), "after the edit");
+}
+
+#[tokio::test]
+async fn test_read_cache_is_bounded_by_bytes() {
+    let temp = TempDir::new().unwrap();
+    let core = FileIOCore::new("utf-8", "ignore", 1, 10);
+    let content = "x".repeat(100 * 1024);
+
+    for index in 0..8 {
+        let file_path = temp.path().join(format!("large_{index}.txt"));
+        std::fs::write(&file_path, &content).unwrap();
+        core.read_file(&file_path).await.unwrap();
+    }
+
+    assert!(core.read_cache.weight() <= READ_CACHE_BYTES_PER_SLOT);
+    assert!(core.read_cache.len() < 8);
+}
+
 #[tokio::test]
 async fn test_write_file_success() {
     let temp = TempDir::new().unwrap();
@@ -613,6 +657,54 @@ async fn test_write_multiple_files_creates_dirs() {
     }
 }
 
+// ==================== In-Memory Decode Tests ====================
+
+#[test]
+fn test_decode_bytes_borrows_utf8() {
+    let core = FileIOCore::default();
+    let decoded = core
+        .decode_bytes("Unhandled exception\r\n".as_bytes())
+        .unwrap();
+    assert!(matches!(decoded, Cow::Borrowed(_)));
+    assert_eq!(decoded, "Unhandled exception\r\n");
+}
+
+#[tokio::test]
+async fn test_decode_bytes_matches_file_read() {
+    let temp = TempDir::new().unwrap();
+    let file_path = temp.path().join("latin1.log");
+    let bytes = b"Caf\xe9 plugin.esp\n".to_vec();
+    std::fs::write(&file_path, &bytes).unwrap();
+
+    let core = FileIOCore::default();
+    let from_file = core.read_file_mmap(&file_path).await.unwrap();
+    assert_eq!(core.decode_bytes(&bytes).unwrap(), from_file);
+}
+
+#[tokio::test]
+async fn test_decode_bytes_matches_large_mapped_read() {
+    let temp = TempDir::new().unwrap();
+    let core = FileIOCore::default();
+
+    // A BOM is stripped on every path, not just for small files
+    let mut bom = vec![0xEF, 0xBB, 0xBF];
+    bom.extend(std::iter::repeat_n(b'x', 1024 * 1024 + 100));
+    let bom_path = temp.path().join("large-bom.log");
+    std::fs::write(&bom_path, &bom).unwrap();
+    let mapped = core.read_file_mmap(&bom_path).await.unwrap();
+    assert!(!mapped.starts_with('\u{FEFF}'));
+    assert_eq!(core.decode_bytes(&bom).unwrap(), mapped);
+
+    // Non-UTF-8 bytes past the first 8 KB still select the legacy encoding
+    let mut late = vec![b'x'; 1024 * 1024 + 100];
+    late.extend_from_slice(b"Caf\xe9");
+    let late_path = temp.path().join("large-late-latin1.log");
+    std::fs::write(&late_path, &late).unwrap();
+    let mapped = core.read_file_mmap(&late_path).await.unwrap();
+    assert!(mapped.ends_with("Caf\u{e9}"));
+    assert_eq!(core.decode_bytes(&late).unwrap(), mapped);
+}
+
 // ==================== Mmap Tests ====================
 
 #[tokio::test]
@@ -0,0 +1,194 @@
+//! Batched DDS header reads backing [`FileIOCore`](crate::FileIOCore).
+//!
+//! Texture checks only need the 4-byte magic, the 124-byte DDS header and the 20-byte
+//! DX10 extension: 148 bytes, however large the texture. Each header is fetched with one
+//! positional read (`pread` on Unix, `seek_read` on Windows) into a stack buffer. Batches
+//! run on a small dedicated thread pool, which bounds the number of reads in flight
+//! independently of the CPU count and of any Rayon work the caller is doing.
+//!
+//! Parsed headers are kept in a process-wide table shared by every `FileIOCore`. Each
+//! entry is a few integers keyed by path and validated against the file's length and
+//! modification time, so an edited or replaced texture is read again. Format names are
+//! interned, and files that are not DDS textures are remembered as well.
+
+use crate::core::FileStamp;
+use crate::dds::DDSHeader;
+use crate::error::FileIOError;
+use parking_lot::RwLock;
+use quick_cache::sync::Cache;
+use rayon::prelude::*;
+use std::fs::File;
+use std::path::{Path, PathBuf};
+use std::sync::{Arc, LazyLock};
+use tracing::debug;
+
+/// Magic (4) + DDS_HEADER (124) + DDS_HEADER_DXT10 (20).
+const DDS_HEADER_LEN: usize = 148;
+
+/// Header reads in flight at once during a batch.
+const DDS_READ_CONCURRENCY: usize = 32;
+
+/// Headers kept in the shared table (about 60 bytes each plus the path).
+const DDS_HEADER_CACHE_CAPACITY: usize = 262_144;
+
+/// Parsed header fields, with the format name replaced by an interned id.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+struct CompactDdsHeader {
+    width: u32,
+    height: u32,
+    depth: u32,
+    mipmap_count: u32,
+    format: u16,
+}
+
+/// A table entry: the header read from a file at `stamp`, or `None` for a non-DDS file.
+#[derive(Clone, Debug)]
+struct CachedDdsHeader {
+    stamp: FileStamp,
+    header: Option<CompactDdsHeader>,
+}
+
+static DDS_HEADER_CACHE: LazyLock<Cache<PathBuf, CachedDdsHeader>> =
+    LazyLock::new(|| Cache::new(DDS_HEADER_CACHE_CAPACITY));
+
+/// Interned format names; a `CompactDdsHeader::format` indexes this list.
+static DDS_FORMATS: LazyLock<RwLock<Vec<Arc<str>>>> = LazyLock::new(|| RwLock::new(Vec::new()));
+
+/// Pool running batched header reads; `None` if it could not be created.
+static DDS_READ_POOL: LazyLock<Option<rayon::ThreadPool>> = LazyLock::new(|| {
+    rayon::ThreadPoolBuilder::new()
+        .num_threads(DDS_READ_CONCURRENCY)
+        .thread_name(|index| format!("dds-header-{index}"))
+        .build()
+        .map_err(|error| debug!("Falling back to the global pool for DDS reads: {error}"))
+        .ok()
+});
+
+/// Reads the header of one file, serving it from the shared table when the file is unchanged.
+pub(crate) fn read_header(path: &Path) -> Result<Option<DDSHeader>, FileIOError> {
+    let stamp = FileStamp::from_metadata(&std::fs::metadata(path)?);
+    if let Some(cached) = DDS_HEADER_CACHE.get(path)
+        && cached.stamp == stamp
+    {
+        return Ok(cached.header.map(expand));
+    }
+
+    let file = File::open(path)?;
+    let mut buffer = [0_u8; DDS_HEADER_LEN];
+    let read = read_prefix(&file, &mut buffer)?;
+    let header =
+        DDSHeader::from_bytes(&buffer[..read]).map_err(|e| FileIOError::DDSError(e.to_string()))?;
+
+    DDS_HEADER_CACHE.insert(
+        path.to_path_buf(),
+        CachedDdsHeader {
+            stamp,
+            header: header.as_ref().map(compact),
+        },
+    );
+    Ok(header)
+}
+
+/// Reads many headers on the bounded read pool, keeping the input order.
+pub(crate) fn read_headers_batch(paths: Vec<PathBuf>) -> Vec<(PathBuf, Option<DDSHeader>)> {
+    let read_all = move || {
+        paths
+            .into_par_iter()
+            .with_max_len(1)
+            .map(|path| {
+                let header = read_header(&path).ok().flatten();
+                (path, header)
+            })
+            .collect()
+    };
+    match DDS_READ_POOL.as_ref() {
+        Some(pool) => pool.install(read_all),
+        None => read_all(),
+    }
+}
+
+/// Empties the shared header table.
+pub(crate) fn clear_header_cache() {
+    DDS_HEADER_CACHE.clear();
+}
+
+/// Reads up to `buffer.len()` bytes from the start of `file` without moving its cursor.
+fn read_prefix(file: &File, buffer: &mut [u8]) -> std::io::Result<usize> {
+    let mut filled = 0;
+    while filled < buffer.len() {
+        match read_at(file, &mut buffer[filled..], filled as u64) {
+            Ok(0) => break,
+            Ok(read) => filled += read,
+            Err(error) if error.kind() == std::io::ErrorKind::Interrupted => {}
+            Err(error) => return Err(error),
+        }
+    }
+    Ok(filled)
+}
+
+#[cfg(unix)]
+fn read_at(file: &File, buffer: &mut [u8], offset: u64) -> std::io::Result<usize> {
+    use std::os::unix::fs::FileExt;
+    file.read_at(buffer, offset)
+}
+
+#[cfg(windows)]
+fn read_at(file: &File, buffer: &mut [u8], offset: u64) -> std::io::Result<usize> {
+    use std::os::windows::fs::FileExt;
+    file.seek_read(buffer, offset)
+}
+
+#[cfg(not(any(unix, windows)))]
+fn read_at(file: &File, buffer: &mut [u8], offset: u64) -> std::io::Result<usize> {
+    use std::io::{Read, Seek, SeekFrom};
+    let mut file = file;
+    file.seek(SeekFrom::Start(offset))?;
+    file.read(buffer)
+}
+
+fn compact(header: &DDSHeader) -> CompactDdsHeader {
+    CompactDdsHeader {
+        width: header.width,
+        height: header.height,
+        depth: header.depth,
+        mipmap_count: header.mipmap_count,
+        format: intern_format(&header.format),
+    }
+}
+
+fn expand(header: CompactDdsHeader) -> DDSHeader {
+    let format = DDS_FORMATS
+        .read()
+        .get(usize::from(header.format))
+        .map_or_else(|| "Unknown".to_string(), |name| name.to_string());
+    DDSHeader {
+        width: header.width,
+        height: header.height,
+        depth: header.depth,
+        mipmap_count: header.mipmap_count,
+        format,
+    }
+}
+
+/// Returns the id of `name`, adding it to the table on first use.
+///
+/// There are only a few hundred DXGI and D3D formats, so a linear scan is enough.
+fn intern_format(name: &str) -> u16 {
+    if let Some(id) = DDS_FORMATS.read().iter().position(|known| &**known == name) {
+        return id as u16;
+    }
+    let mut formats = DDS_FORMATS.write();
+    if let Some(id) = formats.iter().position(|known| &**known == name) {
+        return id as u16;
+    }
+    if formats.len() >= usize::from(u16::MAX) {
+        // Unreachable in practice; expands to "Unknown".
+        return u16::MAX;
+    }
+    formats.push(Arc::from(name));
+    (formats.len() - 1) as u16
+}
+
+#[cfg(test)]
+#[path = "dds_headers_tests.rs"]
+mod tests;
@@ -0,0 +1,92 @@
+use super::*;
+use ddsfile::{Dds, DxgiFormat, NewDxgiParams};
+use std::io::Cursor;
+use tempfile::TempDir;
+
+fn create_test_dds(width: u32, height: u32, mipmap_levels: u32) -> Vec<u8> {
+    let params = NewDxgiParams {
+        width,
+        height,
+        depth: None,
+        format: DxgiFormat::BC7_UNorm,
+        mipmap_levels: Some(mipmap_levels),
+        array_layers: None,
+        caps2: None,
+        is_cubemap: false,
+        resource_dimension: ddsfile::D3D10ResourceDimension::Texture2D,
+        alpha_mode: ddsfile::AlphaMode::Unknown,
+    };
+
+    let dds = Dds::new_dxgi(params).unwrap();
+    let mut buffer = Vec::new();
+    dds.write(&mut Cursor::new(&mut buffer)).unwrap();
+    buffer
+}
+
+#[test]
+fn test_reads_dx10_header_from_prefix() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("texture.dds");
+    std::fs::write(&path, create_test_dds(256, 128, 3)).unwrap();
+
+    let header = read_header(&path).unwrap().unwrap();
+    assert_eq!((header.width, header.height), (256, 128));
+    assert_eq!(header.mipmap_count, 3);
+    assert_eq!(header.format, "BC7_UNorm");
+
+    // Served from the table with the same interned format name
+    let cached = read_header(&path).unwrap().unwrap();
+    assert_eq!((cached.width, cached.height), (256, 128));
+    assert_eq!(cached.mipmap_count, 3);
+    assert_eq!(cached.format, "BC7_UNorm");
+}
+
+#[test]
+fn test_changed_file_is_read_again() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("texture.dds");
+    std::fs::write(&path, create_test_dds(64, 64, 1)).unwrap();
+    assert_eq!(read_header(&path).unwrap().unwrap().width, 64);
+
+    std::fs::write(&path, create_test_dds(512, 512, 1)).unwrap();
+    assert_eq!(read_header(&path).unwrap().unwrap().width, 512);
+
+    std::fs::write(&path, b"not a texture").unwrap();
+    assert!(read_header(&path).unwrap().is_none());
+}
+
+#[test]
+fn test_short_and_missing_files() {
+    let temp = TempDir::new().unwrap();
+    let short = temp.path().join("short.dds");
+    std::fs::write(&short, b"DDS ").unwrap();
+
+    assert!(read_header(&short).unwrap().is_none());
+    assert!(read_header(&temp.path().join("missing.dds")).is_err());
+}
+
+#[test]
+fn test_batch_keeps_input_order() {
+    let temp = TempDir::new().unwrap();
+    let paths: Vec<PathBuf> = (0..40)
+        .map(|i| {
+            let path = temp.path().join(format!("texture{i}.dds"));
+            if i % 3 == 0 {
+                std::fs::write(&path, b"invalid").unwrap();
+            } else {
+                std::fs::write(&path, create_test_dds(4 << (i % 5), 16, 1)).unwrap();
+            }
+            path
+        })
+        .collect();
+
+    let results = read_headers_batch(paths.clone());
+    assert_eq!(results.len(), paths.len());
+    for (i, (path, header)) in results.into_iter().enumerate() {
+        assert_eq!(path, paths[i]);
+        match header {
+            Some(header) => assert_eq!(header.width, 4 << (i % 5)),
+            None => assert_eq!(i % 3, 0),
+        }
+    }
+}
@@ -0,0 +1,163 @@
+//! Persistent SHA-256 database backing [`FileHasher`](crate::FileHasher).
+//!
+//! Game setup checks hash the game executable (60-100 MB) and every config file on
+//! each run. The hash database keeps those digests on disk between runs, keyed by
+//! path and validated against the file's length, modification time and inode, so
+//! unchanged files are only hashed once.
+//!
+//! The store is a single JSON document written through a temporary file, so readers
+//! never see a partial file. A missing, unreadable or older-format database loads
+//! empty, which only costs hashing every file once more before the next save.
+
+use crate::atomic_write::write_atomic;
+use crate::core::FileStamp;
+use crate::error::FileIOError;
+use serde::{Deserialize, Serialize};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use tracing::debug;
+
+/// Bumped whenever the on-disk layout changes.
+const HASH_DB_FORMAT_VERSION: u32 = 1;
+
+/// File name of the hash database inside the per-user scan cache directory.
+pub(crate) const HASH_DB_FILE_NAME: &str = "CLASSIC Hashes.json";
+
+/// A SHA-256 digest together with the stamp of the file it was computed from.
+#[derive(Clone, Debug, PartialEq, Eq, Serialize, Deserialize)]
+pub(crate) struct StampedHash {
+    pub(crate) stamp: FileStamp,
+    pub(crate) sha256: String,
+}
+
+#[derive(Serialize, Deserialize)]
+struct HashDbRecord {
+    path: String,
+    #[serde(flatten)]
+    hash: StampedHash,
+}
+
+#[derive(Serialize, Deserialize)]
+struct HashDbFile {
+    format: u32,
+    entries: Vec<HashDbRecord>,
+}
+
+/// In-memory view of one hash database file.
+pub(crate) struct HashDatabase {
+    path: PathBuf,
+    entries: HashMap<PathBuf, StampedHash>,
+    dirty: bool,
+}
+
+impl HashDatabase {
+    /// Loads the database at `path`, starting empty if it cannot be used.
+    pub(crate) fn open(path: &Path) -> Self {
+        let entries = std::fs::read(path)
+            .ok()
+            .and_then(|bytes| decode(&bytes))
+            .unwrap_or_default();
+        debug!(
+            "Loaded {} hash database entries from {}",
+            entries.len(),
+            path.display()
+        );
+        Self {
+            path: path.to_path_buf(),
+            entries,
+            dirty: false,
+        }
+    }
+
+    /// Location this database is persisted to.
+    pub(crate) fn path(&self) -> &Path {
+        &self.path
+    }
+
+    /// Number of stored digests.
+    pub(crate) fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    /// Returns the stored digest for `path` if it was computed at `stamp`.
+    pub(crate) fn get(&self, path: &Path, stamp: &FileStamp) -> Option<&str> {
+        self.entries
+            .get(path)
+            .filter(|entry| entry.stamp == *stamp)
+            .map(|entry| entry.sha256.as_str())
+    }
+
+    /// Records a digest, replacing any entry for an older version of the file.
+    pub(crate) fn insert(&mut self, path: PathBuf, entry: StampedHash) {
+        if self.entries.get(&path) != Some(&entry) {
+            self.entries.insert(path, entry);
+            self.dirty = true;
+        }
+    }
+
+    /// Writes pending changes to disk. Returns `false` when there was nothing to write.
+    ///
+    /// Entries for files that no longer exist are dropped first, so digests of
+    /// removed or renamed files do not accumulate across runs.
+    ///
+    /// # Errors
+    ///
+    /// Returns a `FileIOError` if the parent directory or the file cannot be written.
+    pub(crate) fn flush(&mut self) -> Result<bool, FileIOError> {
+        if !self.dirty {
+            return Ok(false);
+        }
+
+        self.entries.retain(|path, _| path.exists());
+        let bytes = self.encode()?;
+        write_atomic(&self.path, &bytes).map_err(|source| FileIOError::WriteError {
+            path: self.path.clone(),
+            source,
+        })?;
+
+        self.dirty = false;
+        Ok(true)
+    }
+
+    fn encode(&self) -> Result<Vec<u8>, FileIOError> {
+        // JSON needs UTF-8 paths; anything else is simply rehashed next run.
+        let entries = self
+            .entries
+            .iter()
+            .filter_map(|(path, hash)| {
+                Some(HashDbRecord {
+                    path: path.to_str()?.to_string(),
+                    hash: hash.clone(),
+                })
+            })
+            .collect();
+        let file = HashDbFile {
+            format: HASH_DB_FORMAT_VERSION,
+            entries,
+        };
+        serde_json::to_vec(&file).map_err(|error| FileIOError::CacheError(error.to_string()))
+    }
+}
+
+fn decode(bytes: &[u8]) -> Option<HashMap<PathBuf, StampedHash>> {
+    let file: HashDbFile = match serde_json::from_slice(bytes) {
+        Ok(file) => file,
+        Err(error) => {
+            debug!("Ignoring unreadable hash database: {error}");
+            return None;
+        }
+    };
+    if file.format != HASH_DB_FORMAT_VERSION {
+        return None;
+    }
+    Some(
+        file.entries
+            .into_iter()
+            .map(|record| (PathBuf::from(record.path), record.hash))
+            .collect(),
+    )
+}
+
+#[cfg(test)]
+#[path = "hash_db_tests.rs"]
+mod tests;
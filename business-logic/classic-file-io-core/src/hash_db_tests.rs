@@ -0,0 +1,89 @@
+use super::*;
+use tempfile::TempDir;
+
+fn stamp_of(path: &Path) -> FileStamp {
+    FileStamp::from_metadata(&std::fs::metadata(path).unwrap())
+}
+
+#[test]
+fn flush_round_trips_entries() {
+    let temp = TempDir::new().unwrap();
+    let data_path = temp.path().join("data.bin");
+    std::fs::write(&data_path, b"data").unwrap();
+    let db_path = temp.path().join("nested").join(HASH_DB_FILE_NAME);
+    let entry = StampedHash {
+        stamp: stamp_of(&data_path),
+        sha256: "ab".repeat(32),
+    };
+
+    let mut db = HashDatabase::open(&db_path);
+    assert_eq!(db.len(), 0);
+    assert!(!db.flush().unwrap());
+    db.insert(data_path.clone(), entry.clone());
+    assert!(db.flush().unwrap());
+    assert!(!db.flush().unwrap());
+
+    let reopened = HashDatabase::open(&db_path);
+    assert_eq!(reopened.len(), 1);
+    assert_eq!(
+        reopened.get(&data_path, &entry.stamp),
+        Some(entry.sha256.as_str())
+    );
+}
+
+#[test]
+fn get_rejects_changed_stamp() {
+    let temp = TempDir::new().unwrap();
+    let data_path = temp.path().join("data.bin");
+    std::fs::write(&data_path, b"data").unwrap();
+    let mut db = HashDatabase::open(&temp.path().join(HASH_DB_FILE_NAME));
+    db.insert(
+        data_path.clone(),
+        StampedHash {
+            stamp: stamp_of(&data_path),
+            sha256: "00".repeat(32),
+        },
+    );
+
+    std::fs::write(&data_path, b"longer data").unwrap();
+    assert_eq!(db.get(&data_path, &stamp_of(&data_path)), None);
+}
+
+#[test]
+fn open_ignores_corrupt_or_outdated_files() {
+    let temp = TempDir::new().unwrap();
+    let db_path = temp.path().join(HASH_DB_FILE_NAME);
+
+    std::fs::write(&db_path, b"not json").unwrap();
+    assert_eq!(HashDatabase::open(&db_path).len(), 0);
+
+    std::fs::write(&db_path, br#"{"format":0,"entries":[]}"#).unwrap();
+    assert_eq!(HashDatabase::open(&db_path).len(), 0);
+}
+
+#[test]
+fn flush_prunes_missing_files() {
+    let temp = TempDir::new().unwrap();
+    let kept = temp.path().join("kept.ini");
+    let removed = temp.path().join("removed.ini");
+    std::fs::write(&kept, b"kept").unwrap();
+    std::fs::write(&removed, b"removed").unwrap();
+    let db_path = temp.path().join(HASH_DB_FILE_NAME);
+
+    let mut db = HashDatabase::open(&db_path);
+    for path in [&kept, &removed] {
+        db.insert(
+            path.clone(),
+            StampedHash {
+                stamp: stamp_of(path),
+                sha256: "11".repeat(32),
+            },
+        );
+    }
+    std::fs::remove_file(&removed).unwrap();
+    assert!(db.flush().unwrap());
+
+    let reopened = HashDatabase::open(&db_path);
+    assert_eq!(reopened.len(), 1);
+    assert!(reopened.get(&kept, &stamp_of(&kept)).is_some());
+}
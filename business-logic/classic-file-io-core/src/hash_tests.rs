@@ -229,3 +229,114 @@ fn test_hash_cache_bounded_eviction() -> Result<(), Box<dyn std::error::Error>>
 
     Ok(())
 }
+
+#[test]
+#[serial]
+fn test_hash_file_detects_modified_file() -> Result<(), Box<dyn std::error::Error>> {
+    FileHasher::clear_cache();
+    let mut temp_file = NamedTempFile::new()?;
+    temp_file.write_all(b"first")?;
+    temp_file.flush()?;
+    let first = FileHasher::hash_file(temp_file.path())?;
+
+    // Different length, so the change is visible even on coarse mtime filesystems.
+    temp_file.write_all(b" and second")?;
+    temp_file.flush()?;
+    let second = FileHasher::hash_file(temp_file.path())?;
+
+    assert_ne!(first, second);
+    assert_eq!(second, FileHasher::hash_file_uncached(temp_file.path())?);
+    Ok(())
+}
+
+#[test]
+#[serial]
+fn test_hash_db_survives_cache_clear() -> Result<(), Box<dyn std::error::Error>> {
+    let temp_dir = tempfile::TempDir::new()?;
+    let db_path = FileHasher::default_hash_db_path(temp_dir.path());
+    let data_path = temp_dir.path().join("game.exe");
+    std::fs::write(&data_path, b"executable bytes")?;
+
+    FileHasher::clear_cache();
+    assert_eq!(FileHasher::open_hash_db(&db_path)?, 0);
+    let hash = FileHasher::hash_file(&data_path)?;
+    FileHasher::close_hash_db()?;
+    assert!(db_path.is_file());
+
+    // A fresh process starts with an empty in-memory cache.
+    FileHasher::clear_cache();
+    FileHasher::reset_cache_stats();
+    assert_eq!(FileHasher::open_hash_db(&db_path)?, 1);
+    assert_eq!(FileHasher::hash_file(&data_path)?, hash);
+    let stats = FileHasher::cache_stats();
+    assert_eq!((stats.hits, stats.misses), (1, 0));
+    assert!(!FileHasher::flush_hash_db()?);
+    FileHasher::close_hash_db()?;
+
+    Ok(())
+}
+
+#[test]
+#[serial]
+fn test_mapped_hash_matches_streamed_digest() -> Result<(), Box<dyn std::error::Error>> {
+    FileHasher::clear_cache();
+    let mut temp_file = NamedTempFile::new()?;
+    let data: Vec<u8> = (0..HASH_MMAP_THRESHOLD as usize + 12_345)
+        .map(|index| (index % 251) as u8)
+        .collect();
+    temp_file.write_all(&data)?;
+    temp_file.flush()?;
+
+    let hash = FileHasher::hash_file(temp_file.path())?;
+
+    assert_eq!(hash, encode_hex(Sha256::digest(&data).as_ref()));
+    Ok(())
+}
+
+#[test]
+#[serial]
+fn test_fingerprint_file_tracks_content() -> Result<(), Box<dyn std::error::Error>> {
+    let mut first = NamedTempFile::new()?;
+    first.write_all(b"same bytes")?;
+    let mut second = NamedTempFile::new()?;
+    second.write_all(b"same bytes")?;
+    let mut third = NamedTempFile::new()?;
+    third.write_all(b"other bytes")?;
+
+    let fingerprint = FileHasher::fingerprint_file(first.path())?;
+
+    assert_eq!(fingerprint.len(), 32);
+    assert_eq!(fingerprint, FileHasher::fingerprint_file(second.path())?);
+    assert_ne!(fingerprint, FileHasher::fingerprint_file(third.path())?);
+    assert!(matches!(
+        FileHasher::fingerprint_file(Path::new("nonexistent_file.txt")),
+        Err(FileIOError::NotFound(_))
+    ));
+    Ok(())
+}
+
+#[test]
+#[serial]
+fn test_hash_files_parallel_keeps_input_order() -> Result<(), Box<dyn std::error::Error>> {
+    FileHasher::clear_cache();
+    let mut temp_files = Vec::new();
+    for size in [10usize, 200_000, 0, 50_000] {
+        let mut temp_file = NamedTempFile::new()?;
+        temp_file.write_all(&vec![b'x'; size])?;
+        temp_file.flush()?;
+        temp_files.push(temp_file);
+    }
+    let missing = Path::new("nonexistent_file.txt");
+    let mut paths: Vec<&Path> = temp_files.iter().map(|file| file.path()).collect();
+    paths.insert(2, missing);
+
+    let results = FileHasher::hash_files_parallel(&paths)?;
+
+    let returned: Vec<&Path> = results.iter().map(|(path, _)| path.as_path()).collect();
+    assert_eq!(returned, paths);
+    assert!(results[2].1.is_none());
+    for (path, hash) in results.iter().filter(|(path, _)| path != missing) {
+        assert_eq!(hash.as_deref(), Some(FileHasher::hash_file(path)?.as_str()));
+    }
+    Ok(())
+}
@@ -16,20 +16,24 @@
 //! - Configuration file generation (Phase 5)
 
 pub mod atomic_install;
+pub mod atomic_write;
 pub mod backup;
 pub mod core;
 pub mod dds;
+pub(crate) mod dds_headers;
 pub mod encoding;
 pub mod error;
 pub mod game_files;
 pub mod generation;
 pub mod hash;
+pub(crate) mod hash_db;
 pub mod log_collection;
 pub mod similarity;
 
 pub use atomic_install::{
     InstallOutcome, RollbackOutcome, SelfHealOutcome, install_atomic, rollback, self_heal,
 };
+pub use atomic_write::{write_atomic, write_atomic_async};
 pub use backup::{BackupInfo, BackupManager, BackupType};
 pub use core::FileIOCore;
 pub use dds::{DDSAnalyzer, DDSHeader, DDSIssue, GameTarget};
@@ -58,6 +58,7 @@ mod docs_path;
 mod game_path;
 mod ini_parser;
 mod notification_cache;
+mod scan_cache;
 mod yaml_cache;
 
 pub use backup::{BackupManager, XseVersion};
@@ -73,6 +74,9 @@ pub use notification_cache::{
     ensure_notification_cache_dir, ensure_notification_cache_dir_with_env, notification_cache_dir,
     notification_cache_dir_with_env,
 };
+pub use scan_cache::{
+    ensure_scan_cache_dir, ensure_scan_cache_dir_with_env, scan_cache_dir, scan_cache_dir_with_env,
+};
 pub use validator::{
     check_drive_exists,
     check_read_permissions,
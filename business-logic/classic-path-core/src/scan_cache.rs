@@ -0,0 +1,130 @@
+//! Per-user scan cache directory resolver.
+//!
+//! Scans keep derived state between runs: reusable Autoscan Report facts, file
+//! hashes from the game setup checks, the snapshot of the last full game scan, and
+//! the built YAML Data snapshots.
+//! None of it belongs in the install tree, which may be read-only or shared by
+//! several users, so it lands in a per-user cache directory resolved here. The
+//! directory is kept apart from the YAML and notification caches so clearing one
+//! never discards another.
+//!
+//! # Location
+//!
+//! - **Windows** — `%LOCALAPPDATA%\CLASSIC\scan-cache\`, falling back to
+//!   `%APPDATA%\CLASSIC\scan-cache\` when `LOCALAPPDATA` is not set.
+//! - **Other targets (source portability)** —
+//!   `${XDG_CACHE_HOME:-$HOME/.cache}/CLASSIC/scan-cache/`.
+//!
+//! # Helpers
+//!
+//! - [`scan_cache_dir`] — pure resolution, never touches the filesystem.
+//! - [`ensure_scan_cache_dir`] — resolves and creates the directory (idempotent).
+//!
+//! # Testing
+//!
+//! The env-lookup seam is factored through [`scan_cache_dir_with_env`] and
+//! [`ensure_scan_cache_dir_with_env`], matching [`crate::yaml_cache_dir_with_env`].
+
+use crate::error::PathError;
+use std::path::PathBuf;
+
+/// The per-user cache subdirectory name, relative to the platform cache root.
+const CACHE_SUBDIR: &str = "CLASSIC";
+/// The scan-specific cache directory name inside [`CACHE_SUBDIR`].
+const SCAN_CACHE_DIR: &str = "scan-cache";
+
+/// Resolve the absolute path of the per-user scan cache directory.
+///
+/// This does not create the directory; use [`ensure_scan_cache_dir`] to resolve
+/// and mkdir in one call.
+///
+/// # Errors
+///
+/// Returns [`PathError::InvalidPath`] when none of the expected environment
+/// variables are set (e.g., Windows without `LOCALAPPDATA` and `APPDATA`, or a
+/// Unix environment without `HOME` and without `XDG_CACHE_HOME`).
+pub fn scan_cache_dir() -> Result<PathBuf, PathError> {
+    scan_cache_dir_with_env(process_env_lookup)
+}
+
+/// Testable form of [`scan_cache_dir`] that reads environment variables through
+/// a caller-supplied closure.
+///
+/// The closure should return `None` for unset *or empty* variables.
+pub fn scan_cache_dir_with_env<F>(env: F) -> Result<PathBuf, PathError>
+where
+    F: Fn(&str) -> Option<String>,
+{
+    let root = cache_root(&env)?;
+    Ok(root.join(CACHE_SUBDIR).join(SCAN_CACHE_DIR))
+}
+
+/// Resolve the per-user scan cache directory and create it (and parents) if
+/// missing. Idempotent — returns `Ok` even when the directory already exists.
+///
+/// # Errors
+///
+/// - [`PathError::InvalidPath`] when the cache root cannot be resolved
+///   (see [`scan_cache_dir`]).
+/// - [`PathError::IoError`] when directory creation fails after resolution.
+pub fn ensure_scan_cache_dir() -> Result<PathBuf, PathError> {
+    ensure_scan_cache_dir_with_env(process_env_lookup)
+}
+
+/// Testable form of [`ensure_scan_cache_dir`] that reads environment variables
+/// through a caller-supplied closure.
+pub fn ensure_scan_cache_dir_with_env<F>(env: F) -> Result<PathBuf, PathError>
+where
+    F: Fn(&str) -> Option<String>,
+{
+    let dir = scan_cache_dir_with_env(env)?;
+    std::fs::create_dir_all(&dir).map_err(|source| PathError::IoError {
+        path: dir.clone(),
+        source,
+    })?;
+    Ok(dir)
+}
+
+#[cfg(target_os = "windows")]
+fn cache_root<F>(env: &F) -> Result<PathBuf, PathError>
+where
+    F: Fn(&str) -> Option<String>,
+{
+    if let Some(local) = env("LOCALAPPDATA") {
+        return Ok(PathBuf::from(local));
+    }
+    if let Some(roaming) = env("APPDATA") {
+        return Ok(PathBuf::from(roaming));
+    }
+    Err(PathError::InvalidPath(
+        "neither LOCALAPPDATA nor APPDATA is set; cannot resolve scan cache directory".into(),
+    ))
+}
+
+#[cfg(not(target_os = "windows"))]
+fn cache_root<F>(env: &F) -> Result<PathBuf, PathError>
+where
+    F: Fn(&str) -> Option<String>,
+{
+    if let Some(xdg) = env("XDG_CACHE_HOME") {
+        return Ok(PathBuf::from(xdg));
+    }
+    if let Some(home) = env("HOME") {
+        return Ok(PathBuf::from(home).join(".cache"));
+    }
+    Err(PathError::InvalidPath(
+        "neither XDG_CACHE_HOME nor HOME is set; cannot resolve scan cache directory".into(),
+    ))
+}
+
+/// Read a process env var, returning `None` for unset *or* empty values.
+fn process_env_lookup(name: &str) -> Option<String> {
+    match std::env::var(name) {
+        Ok(s) if !s.is_empty() => Some(s),
+        _ => None,
+    }
+}
+
+#[cfg(test)]
+#[path = "scan_cache_tests.rs"]
+mod tests;
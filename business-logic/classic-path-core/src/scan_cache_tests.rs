@@ -0,0 +1,72 @@
+use super::*;
+use crate::yaml_cache::yaml_cache_dir_with_env;
+use std::collections::HashMap;
+use tempfile::tempdir;
+
+fn env_map(entries: &[(&str, String)]) -> impl Fn(&str) -> Option<String> + use<> {
+    let map: HashMap<String, String> = entries
+        .iter()
+        .map(|(k, v)| ((*k).to_string(), v.clone()))
+        .collect();
+    move |name| map.get(name).cloned()
+}
+
+fn as_str(path: &std::path::Path) -> String {
+    path.to_string_lossy().into_owned()
+}
+
+#[test]
+#[cfg(target_os = "windows")]
+fn resolves_from_localappdata_on_windows() {
+    let tmp = tempdir().unwrap();
+    let env = env_map(&[
+        ("LOCALAPPDATA", as_str(tmp.path())),
+        ("APPDATA", as_str(tmp.path().parent().unwrap())),
+    ]);
+    let resolved = scan_cache_dir_with_env(env).unwrap();
+    assert_eq!(resolved, tmp.path().join("CLASSIC").join("scan-cache"));
+}
+
+#[test]
+#[cfg(not(target_os = "windows"))]
+fn resolves_from_xdg_cache_home_on_unix() {
+    let tmp = tempdir().unwrap();
+    let env = env_map(&[("XDG_CACHE_HOME", as_str(tmp.path()))]);
+    let resolved = scan_cache_dir_with_env(env).unwrap();
+    assert_eq!(resolved, tmp.path().join("CLASSIC").join("scan-cache"));
+}
+
+#[test]
+#[cfg(not(target_os = "windows"))]
+fn falls_back_to_home_cache_on_unix() {
+    let tmp = tempdir().unwrap();
+    let env = env_map(&[("HOME", as_str(tmp.path()))]);
+    let resolved = scan_cache_dir_with_env(env).unwrap();
+    assert_eq!(
+        resolved,
+        tmp.path().join(".cache").join("CLASSIC").join("scan-cache")
+    );
+}
+
+#[test]
+fn errors_when_no_env_vars_available() {
+    let err = scan_cache_dir_with_env(env_map(&[])).unwrap_err();
+    assert!(matches!(err, PathError::InvalidPath(_)));
+}
+
+#[test]
+fn ensure_creates_directory_apart_from_yaml_cache() {
+    let tmp = tempdir().unwrap();
+    #[cfg(target_os = "windows")]
+    let entries = [("LOCALAPPDATA", as_str(tmp.path()))];
+    #[cfg(not(target_os = "windows"))]
+    let entries = [("XDG_CACHE_HOME", as_str(tmp.path()))];
+
+    let created = ensure_scan_cache_dir_with_env(env_map(&entries)).unwrap();
+    assert!(created.is_dir());
+    assert_eq!(
+        ensure_scan_cache_dir_with_env(env_map(&entries)).unwrap(),
+        created
+    );
+    assert_ne!(created, yaml_cache_dir_with_env(env_map(&entries)).unwrap());
+}
@@ -5,24 +5,21 @@
 //!
 //! This module replaces the subprocess-based BSArch.exe approach with native Rust
 //! implementation, providing 40-100x performance improvement through:
-//! - Memory-mapped I/O for zero-copy reads
+//! - Reading only archive headers and name tables, never file payloads
 //! - Parallel batch processing
 //! - Direct archive access without subprocess overhead
 //!
 //! ## Architecture
 //!
-//! Uses the `ba2` crate (v3.0.1) for low-level archive parsing, with business logic
-//! for CLASSIC-specific validation rules and issue detection.
+//! The portable reader in `ba2_reader` parses archive indexes on every platform, and
+//! this module applies the CLASSIC-specific validation rules to the listed files.
 
 use std::path::{Path, PathBuf};
 
-#[cfg(windows)]
-use ba2::fo4::{Archive, FileHeader};
-#[cfg(windows)]
-use ba2::{ByteSlice, Reader};
+use crate::ba2_reader::{Ba2Format, TextureInfo, read_ba2_index};
+use crate::inventory::GameFileInventory;
 use rayon::prelude::*;
-#[cfg(windows)]
-use std::fs::File;
+use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
 /// Errors that can occur during BA2 scanning
@@ -32,7 +29,7 @@ pub enum BA2Error {
     #[error("Failed to read archive: {0}")]
     ReadError(#[from] std::io::Error),
 
-    /// Archive parsing error from ba2 crate
+    /// Archive header or file table could not be parsed
     #[error("Archive parsing error: {0}")]
     ParseError(String),
 
@@ -43,17 +40,13 @@ pub enum BA2Error {
     /// File not found in archive
     #[error("File not found: {0}")]
     FileNotFound(String),
-
-    /// BA2 archive scanning is not available on this platform.
-    #[error("BA2 archive scanning is not supported on this platform")]
-    UnsupportedPlatform,
 }
 
 /// Result type for BA2 operations
 pub type Result<T> = std::result::Result<T, BA2Error>;
 
 /// Issues detected during BA2 archive scanning
-#[derive(Debug, Default, Clone)]
+#[derive(Debug, Default, Clone, Serialize, Deserialize)]
 pub struct BA2Issues {
     /// Texture dimension issues (odd-numbered dimensions)
     pub tex_dims: Vec<String>,
@@ -160,62 +153,36 @@ impl BA2Scanner {
     /// }
     /// # Ok::<(), Box<dyn std::error::Error>>(())
     /// ```
-    #[cfg(windows)]
     pub fn scan_archive(&self, path: &Path) -> Result<BA2Issues> {
-        // Open archive with memory-mapped I/O
-        let file = File::open(path)?;
-        let (archive, _options) =
-            Archive::read(&file).map_err(|e| BA2Error::ParseError(e.to_string()))?;
+        let index = read_ba2_index(path)?;
 
         let filename = path
             .file_name()
             .and_then(|n| n.to_str())
             .unwrap_or("unknown");
 
-        // Scan based on archive format
         let mut issues = BA2Issues::new();
-
-        // Iterate through all files in the archive
-        for (key, file) in archive.iter() {
-            // Get filename as BStr and convert to string
-            let file_name_bstr = key.name();
-            // BStr provides as_bytes(), but we need a string for comparison
-            // Convert using to_string_lossy() for safety with non-UTF8 filenames
-            let file_name_str = std::str::from_utf8(file_name_bstr.as_bytes());
-            let file_name = match file_name_str {
+        for entry in &index.entries {
+            let file_name = match std::str::from_utf8(&entry.name) {
                 Ok(name) => name,
                 Err(_) => continue, // Skip files with invalid UTF-8
             };
 
-            // Check file header to determine if this is a texture archive
-            match &file.header {
-                FileHeader::DX10(dx10_header) => {
-                    // DX10 texture archive processing
-                    self.scan_dx10_texture(file_name, dx10_header, filename, &mut issues);
-                }
-                _ => {
-                    // GNRL general archive processing
-                    self.scan_gnrl_file(file_name, filename, path, &mut issues);
+            match (index.format, entry.texture) {
+                (Ba2Format::Textures, Some(texture)) => {
+                    self.scan_dx10_texture(file_name, texture, filename, &mut issues);
                 }
+                _ => self.scan_gnrl_file(file_name, filename, path, &mut issues),
             }
         }
 
         Ok(issues)
     }
 
-    /// Scan a single BA2 archive and detect issues.
-    ///
-    /// On non-Windows platforms this returns `BA2Error::UnsupportedPlatform`.
-    #[cfg(not(windows))]
-    pub fn scan_archive(&self, _path: &Path) -> Result<BA2Issues> {
-        // Keep the same API surface cross-platform while making unsupported behavior explicit.
-        let _ = &self.xse_patterns;
-        Err(BA2Error::UnsupportedPlatform)
-    }
-
     /// Scan multiple archives in parallel
     ///
-    /// Uses Rayon for parallel processing to maximize throughput.
+    /// Uses Rayon for parallel processing to maximize throughput. Each archive is
+    /// its own task, so one large archive cannot hold back a batch of small ones.
     ///
     /// # Arguments
     ///
@@ -240,16 +207,16 @@ impl BA2Scanner {
     pub fn scan_archives_batch(&self, paths: &[PathBuf]) -> Vec<Result<BA2Issues>> {
         paths
             .par_iter()
+            .with_max_len(1)
             .map(|path| self.scan_archive(path))
             .collect()
     }
 
     /// Scan a DX10 texture file and detect issues
-    #[cfg(windows)]
     fn scan_dx10_texture(
         &self,
         file_name: &str,
-        header: &ba2::fo4::DX10Header,
+        header: TextureInfo,
         archive_name: &str,
         issues: &mut BA2Issues,
     ) {
@@ -267,8 +234,8 @@ impl BA2Scanner {
         }
 
         // Check texture dimensions (odd numbers cause performance issues)
-        let width = header.width as u32;
-        let height = header.height as u32;
+        let width = u32::from(header.width);
+        let height = u32::from(header.height);
 
         if !width.is_multiple_of(2) || !height.is_multiple_of(2) {
             issues.tex_dims.push(format!(
@@ -279,7 +246,6 @@ impl BA2Scanner {
     }
 
     /// Scan a GNRL general file and detect issues
-    #[cfg(windows)]
     fn scan_gnrl_file(
         &self,
         file_name: &str,
@@ -331,31 +297,24 @@ impl BA2Scanner {
     ///
     /// Vector of BA2 file paths found, excluding "prp - main.ba2"
     pub fn find_ba2_files(&self, dir: &Path) -> Vec<PathBuf> {
-        use walkdir::WalkDir;
+        let inventory = GameFileInventory::build(&[dir]);
+        self.find_ba2_files_in(&inventory, dir)
+    }
+
+    /// Find all BA2 files below `dir` using an already built file inventory
+    ///
+    /// Falls back to walking `dir` when the inventory does not cover it.
+    pub fn find_ba2_files_in(&self, inventory: &GameFileInventory, dir: &Path) -> Vec<PathBuf> {
+        if !inventory.covers(dir) {
+            return self.find_ba2_files(dir);
+        }
 
-        WalkDir::new(dir)
-            .follow_links(false)
+        inventory
+            .files_with_extensions_under(&["ba2"], dir)
             .into_iter()
-            .filter_map(|e| e.ok())
-            .filter(|e| e.file_type().is_file())
-            .filter_map(|e| {
-                let path = e.path();
-                if let Some(ext) = path.extension() {
-                    let ext_lower = ext.to_string_lossy().to_lowercase();
-                    if ext_lower == "ba2" {
-                        let filename = path
-                            .file_name()
-                            .and_then(|n| n.to_str())
-                            .unwrap_or("")
-                            .to_lowercase();
-                        // Exclude specific files
-                        if filename != "prp - main.ba2" {
-                            return Some(path.to_path_buf());
-                        }
-                    }
-                }
-                None
-            })
+            // Exclude specific files
+            .filter(|entry| entry.file_name().to_string_lossy().to_lowercase() != "prp - main.ba2")
+            .map(|entry| entry.path())
             .collect()
     }
 }
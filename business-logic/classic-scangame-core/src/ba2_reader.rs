@@ -0,0 +1,180 @@
+//! Portable BA2 index reader
+//!
+//! Archive checks only need each file's name and, for texture archives, the DX10
+//! header's dimensions. This reader loads exactly those parts of a Fallout 4 BA2
+//! (the fixed header, the file table and the name table) and never touches the
+//! compressed payloads, so it runs at disk speed on any platform. The tables sit at
+//! the start and end of the archive, so two buffered sequential reads cover them
+//! without mapping the (often multi-gigabyte) file.
+//!
+//! Layout (little-endian):
+//! - Header: `BTDX` magic, version (1/7/8; 2 and 3 add 8 and 12 bytes), archive
+//!   type (`GNRL` or `DX10`), file count (u32) and name table offset (u64).
+//! - GNRL file table: one 36-byte record per file.
+//! - DX10 file table: one 24-byte record per texture (height and width at bytes
+//!   16..20, chunk count at byte 13), each followed by its 24-byte chunk records.
+//! - Name table: one length-prefixed (u16) path per file, in file table order.
+
+use crate::ba2::{BA2Error, Result};
+use std::fs::File;
+use std::io::{BufReader, Read, Seek, SeekFrom};
+use std::path::Path;
+
+const MAGIC: &[u8; 4] = b"BTDX";
+const BASE_HEADER_LEN: u64 = 24;
+const DX10_RECORD_LEN: usize = 24;
+const DX10_CHUNK_LEN: u64 = 24;
+/// Buffer size for the sequential file table and name table reads.
+const READ_BUFFER_LEN: usize = 256 * 1024;
+
+/// Archive type recorded in the BA2 header.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) enum Ba2Format {
+    /// General archive (meshes, sounds, scripts, ...)
+    General,
+    /// DX10 texture archive
+    Textures,
+}
+
+/// Texture dimensions from a DX10 file record.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub(crate) struct TextureInfo {
+    pub(crate) width: u16,
+    pub(crate) height: u16,
+}
+
+/// One file listed in an archive.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub(crate) struct Ba2Entry {
+    /// Path inside the archive as stored, usually with backslash separators.
+    pub(crate) name: Vec<u8>,
+    /// DX10 header data; `None` for general archives.
+    pub(crate) texture: Option<TextureInfo>,
+}
+
+/// Names and headers of every file in an archive.
+#[derive(Debug, Clone, PartialEq, Eq)]
+pub(crate) struct Ba2Index {
+    pub(crate) format: Ba2Format,
+    pub(crate) entries: Vec<Ba2Entry>,
+}
+
+/// Reads the header, file table and name table of the archive at `path`.
+///
+/// Files whose name is missing from a truncated or absent name table are omitted.
+pub(crate) fn read_ba2_index(path: &Path) -> Result<Ba2Index> {
+    let file = File::open(path)?;
+    let file_len = file.metadata()?.len();
+    let mut reader = BufReader::with_capacity(READ_BUFFER_LEN, file);
+
+    let mut header = [0_u8; BASE_HEADER_LEN as usize];
+    reader.read_exact(&mut header).map_err(truncated)?;
+    if &header[0..4] != MAGIC {
+        return Err(BA2Error::InvalidFormat);
+    }
+    let version = u32_at(&header, 4);
+    let format = match &header[8..12] {
+        b"GNRL" => Ba2Format::General,
+        b"DX10" => Ba2Format::Textures,
+        _ => return Err(BA2Error::InvalidFormat),
+    };
+    let file_count = u32_at(&header, 12) as usize;
+    let name_table_offset = u64_at(&header, 16);
+    let extra_header_len = match version {
+        1 | 7 | 8 => 0,
+        2 => 8,
+        3 => 12,
+        other => {
+            return Err(BA2Error::ParseError(format!(
+                "unsupported BA2 version {other}"
+            )));
+        }
+    };
+    reader.seek_relative(extra_header_len)?;
+
+    // Every record is at least 24 bytes, so a corrupt count cannot over-allocate.
+    let min_table_len = (file_count as u64).saturating_mul(DX10_RECORD_LEN as u64);
+    if min_table_len > file_len {
+        return Err(BA2Error::ParseError(format!(
+            "file count {file_count} exceeds archive size"
+        )));
+    }
+
+    let textures = match format {
+        // General records hold only offsets and sizes, so the table is skipped.
+        Ba2Format::General => Vec::new(),
+        Ba2Format::Textures => read_dx10_table(&mut reader, file_count)?,
+    };
+
+    let names = if name_table_offset == 0 || name_table_offset >= file_len {
+        Vec::new()
+    } else {
+        reader.seek(SeekFrom::Start(name_table_offset))?;
+        read_name_table(&mut reader, file_count)
+    };
+
+    let mut textures = textures.into_iter();
+    let entries = names
+        .into_iter()
+        .map(|name| Ba2Entry {
+            name,
+            texture: textures.next(),
+        })
+        .collect();
+    Ok(Ba2Index { format, entries })
+}
+
+fn read_dx10_table(reader: &mut BufReader<File>, file_count: usize) -> Result<Vec<TextureInfo>> {
+    let mut textures = Vec::with_capacity(file_count);
+    let mut record = [0_u8; DX10_RECORD_LEN];
+    for _ in 0..file_count {
+        reader.read_exact(&mut record).map_err(truncated)?;
+        textures.push(TextureInfo {
+            height: u16_at(&record, 16),
+            width: u16_at(&record, 18),
+        });
+        let chunk_count = u64::from(record[13]);
+        reader.seek_relative((chunk_count * DX10_CHUNK_LEN) as i64)?;
+    }
+    Ok(textures)
+}
+
+fn read_name_table(reader: &mut BufReader<File>, file_count: usize) -> Vec<Vec<u8>> {
+    let mut names = Vec::with_capacity(file_count);
+    let mut len = [0_u8; 2];
+    for _ in 0..file_count {
+        if reader.read_exact(&mut len).is_err() {
+            break;
+        }
+        let mut name = vec![0_u8; usize::from(u16::from_le_bytes(len))];
+        if reader.read_exact(&mut name).is_err() {
+            break;
+        }
+        names.push(name);
+    }
+    names
+}
+
+fn u16_at(bytes: &[u8], at: usize) -> u16 {
+    u16::from_le_bytes([bytes[at], bytes[at + 1]])
+}
+
+fn u32_at(bytes: &[u8], at: usize) -> u32 {
+    u32::from_le_bytes([bytes[at], bytes[at + 1], bytes[at + 2], bytes[at + 3]])
+}
+
+fn u64_at(bytes: &[u8], at: usize) -> u64 {
+    u64::from(u32_at(bytes, at)) | (u64::from(u32_at(bytes, at + 4)) << 32)
+}
+
+fn truncated(error: std::io::Error) -> BA2Error {
+    if error.kind() == std::io::ErrorKind::UnexpectedEof {
+        BA2Error::ParseError("archive is truncated".to_string())
+    } else {
+        BA2Error::ReadError(error)
+    }
+}
+
+#[cfg(test)]
+#[path = "ba2_reader_tests.rs"]
+mod tests;
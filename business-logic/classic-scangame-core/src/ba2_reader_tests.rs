@@ -0,0 +1,200 @@
+use super::*;
+use crate::ba2::BA2Scanner;
+use std::path::PathBuf;
+use tempfile::TempDir;
+
+/// Encodes a minimal archive. Textures are `(name, width, height, chunk_count)`.
+fn encode_archive(version: u32, general: &[&str], textures: &[(&str, u16, u16, u8)]) -> Vec<u8> {
+    let (kind, count): (&[u8; 4], usize) = if textures.is_empty() {
+        (b"GNRL", general.len())
+    } else {
+        (b"DX10", textures.len())
+    };
+    let extra_header_len = match version {
+        2 => 8,
+        3 => 12,
+        _ => 0,
+    };
+
+    let mut table = Vec::new();
+    for _ in general {
+        table.extend_from_slice(&[0xAB; 32]);
+        table.extend_from_slice(&0xBAAD_F00D_u32.to_le_bytes());
+    }
+    for (_, width, height, chunk_count) in textures {
+        table.extend_from_slice(&[0xCD; 13]);
+        table.push(*chunk_count);
+        table.extend_from_slice(&24_u16.to_le_bytes());
+        table.extend_from_slice(&height.to_le_bytes());
+        table.extend_from_slice(&width.to_le_bytes());
+        table.extend_from_slice(&[1, 98, 0, 0]);
+        table.extend(std::iter::repeat_n(0xEF, usize::from(*chunk_count) * 24));
+    }
+    let payload = [0x55_u8; 64];
+    let name_table_offset = 24 + extra_header_len + table.len() + payload.len();
+
+    let mut bytes = Vec::new();
+    bytes.extend_from_slice(b"BTDX");
+    bytes.extend_from_slice(&version.to_le_bytes());
+    bytes.extend_from_slice(kind);
+    bytes.extend_from_slice(&(count as u32).to_le_bytes());
+    bytes.extend_from_slice(&(name_table_offset as u64).to_le_bytes());
+    bytes.extend(std::iter::repeat_n(0, extra_header_len));
+    bytes.extend_from_slice(&table);
+    bytes.extend_from_slice(&payload);
+    let names = general
+        .iter()
+        .copied()
+        .chain(textures.iter().map(|(name, ..)| *name));
+    for name in names {
+        bytes.extend_from_slice(&(name.len() as u16).to_le_bytes());
+        bytes.extend_from_slice(name.as_bytes());
+    }
+    bytes
+}
+
+fn write_archive(dir: &TempDir, file_name: &str, bytes: &[u8]) -> PathBuf {
+    let path = dir.path().join(file_name);
+    std::fs::write(&path, bytes).unwrap();
+    path
+}
+
+#[test]
+fn reads_general_archive_names() {
+    let dir = TempDir::new().unwrap();
+    let path = write_archive(
+        &dir,
+        "Mod - Main.ba2",
+        &encode_archive(1, &["meshes\\a.nif", "sound\\b.mp3"], &[]),
+    );
+
+    let index = read_ba2_index(&path).unwrap();
+    assert_eq!(index.format, Ba2Format::General);
+    let names: Vec<&[u8]> = index.entries.iter().map(|e| e.name.as_slice()).collect();
+    assert_eq!(names, [&b"meshes\\a.nif"[..], b"sound\\b.mp3"]);
+    assert!(index.entries.iter().all(|entry| entry.texture.is_none()));
+}
+
+#[test]
+fn reads_dx10_records_across_chunk_counts_and_versions() {
+    let dir = TempDir::new().unwrap();
+    let textures = [
+        ("textures\\a.dds", 1024, 512, 1),
+        ("textures\\b.dds", 3, 7, 4),
+        ("textures\\c.dds", 16, 16, 0),
+    ];
+    for version in [1, 2, 3, 7, 8] {
+        let path = write_archive(
+            &dir,
+            &format!("v{version} - Textures.ba2"),
+            &encode_archive(version, &[], &textures),
+        );
+
+        let index = read_ba2_index(&path).unwrap();
+        assert_eq!(index.format, Ba2Format::Textures);
+        let read: Vec<(&[u8], TextureInfo)> = index
+            .entries
+            .iter()
+            .map(|entry| (entry.name.as_slice(), entry.texture.unwrap()))
+            .collect();
+        let expected: Vec<(&[u8], TextureInfo)> = textures
+            .iter()
+            .map(|(name, width, height, _)| {
+                let info = TextureInfo {
+                    width: *width,
+                    height: *height,
+                };
+                (name.as_bytes(), info)
+            })
+            .collect();
+        assert_eq!(read, expected, "version {version}");
+    }
+}
+
+#[test]
+fn rejects_malformed_archives() {
+    let dir = TempDir::new().unwrap();
+    let valid = encode_archive(8, &["a.nif"], &[]);
+
+    let not_ba2 = write_archive(&dir, "not.ba2", b"BSA\0 definitely not a ba2 archive");
+    assert!(matches!(
+        read_ba2_index(&not_ba2),
+        Err(BA2Error::InvalidFormat)
+    ));
+
+    let mut bad_version = valid.clone();
+    bad_version[4] = 99;
+    let bad_version = write_archive(&dir, "version.ba2", &bad_version);
+    assert!(matches!(
+        read_ba2_index(&bad_version),
+        Err(BA2Error::ParseError(_))
+    ));
+
+    let mut huge_count = valid.clone();
+    huge_count[12..16].copy_from_slice(&u32::MAX.to_le_bytes());
+    let huge_count = write_archive(&dir, "count.ba2", &huge_count);
+    assert!(matches!(
+        read_ba2_index(&huge_count),
+        Err(BA2Error::ParseError(_))
+    ));
+
+    let truncated = write_archive(&dir, "short.ba2", &valid[..10]);
+    assert!(matches!(
+        read_ba2_index(&truncated),
+        Err(BA2Error::ParseError(_))
+    ));
+}
+
+#[test]
+fn scanner_applies_rules_to_native_index() {
+    let dir = TempDir::new().unwrap();
+    let general = write_archive(
+        &dir,
+        "Mod - Main.ba2",
+        &encode_archive(
+            1,
+            &[
+                "sound\\voice.mp3",
+                "scripts\\f4se\\hook.pex",
+                "scripts\\f4se\\other.pex",
+                "meshes\\ok.nif",
+            ],
+            &[],
+        ),
+    );
+    let textures = write_archive(
+        &dir,
+        "Mod - Textures.ba2",
+        &encode_archive(
+            7,
+            &[],
+            &[
+                ("textures\\even.dds", 512, 512, 2),
+                ("textures\\odd.dds", 511, 512, 1),
+                ("textures\\wrong.png", 64, 64, 1),
+            ],
+        ),
+    );
+
+    let scanner = BA2Scanner::new();
+    let results = scanner.scan_archives_batch(&[general, textures]);
+    let general = results[0].as_ref().unwrap();
+    let textures = results[1].as_ref().unwrap();
+
+    assert_eq!(
+        general.snd_frmt,
+        ["  - MP3 : Mod - Main.ba2 > sound\\voice.mp3\n"]
+    );
+    assert_eq!(general.xse_file, ["  - Mod - Main.ba2\n"]);
+    assert!(general.tex_dims.is_empty() && general.tex_frmt.is_empty());
+
+    assert_eq!(
+        textures.tex_dims,
+        ["  - 511x512 : Mod - Textures.ba2 > textures\\odd.dds"]
+    );
+    assert_eq!(
+        textures.tex_frmt,
+        ["  - PNG : Mod - Textures.ba2 > textures\\wrong.png\n"]
+    );
+    assert!(textures.snd_frmt.is_empty() && textures.xse_file.is_empty());
+}
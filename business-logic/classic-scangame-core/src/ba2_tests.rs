@@ -1,6 +1,4 @@
 use super::*;
-#[cfg(not(windows))]
-use std::path::Path;
 
 #[test]
 fn test_ba2_issues_default() {
@@ -32,10 +30,9 @@ fn test_scanner_creation() {
     assert_eq!(custom_scanner.xse_patterns.len(), 1);
 }
 
-#[cfg(not(windows))]
 #[test]
-fn test_scan_archive_unsupported_platform() {
+fn test_scan_archive_missing_file_is_read_error() {
     let scanner = BA2Scanner::new();
-    let result = scanner.scan_archive(Path::new("mod.ba2"));
-    assert!(matches!(result, Err(BA2Error::UnsupportedPlatform)));
+    let result = scanner.scan_archive(Path::new("definitely/missing/mod.ba2"));
+    assert!(matches!(result, Err(BA2Error::ReadError(_))));
 }
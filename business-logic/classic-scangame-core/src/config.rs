@@ -16,11 +16,9 @@
 //! - INI structure comparison for semantic equivalence
 
 use std::collections::HashMap;
-use std::fs::File;
-use std::io::Read;
 use std::path::{Path, PathBuf};
 
-use sha2::{Digest, Sha256};
+use classic_file_io_core::{FileHasher, FileIOError};
 use thiserror::Error;
 use walkdir::WalkDir;
 
@@ -114,6 +112,14 @@ impl ConfigDuplicateDetector {
     /// # Ok::<(), Box<dyn std::error::Error>>(())
     /// ```
     pub fn scan_directory(&mut self, root_path: &Path) -> Result<HashMap<String, Vec<PathBuf>>> {
+        crate::hash_db::attach_local_hash_db();
+        let duplicates = self.find_duplicates(root_path);
+        crate::hash_db::flush_hash_db();
+        duplicates
+    }
+
+    /// Walk `root_path` and group same-named config files that are duplicates
+    fn find_duplicates(&mut self, root_path: &Path) -> Result<HashMap<String, Vec<PathBuf>>> {
         // First pass: collect all config files
         let config_files: Vec<(String, PathBuf)> = WalkDir::new(root_path)
             .follow_links(false)
@@ -228,7 +234,7 @@ impl Default for ConfigDuplicateDetector {
     }
 }
 
-/// Calculate SHA256 hash of a file
+/// Calculate SHA256 hash of a file through the shared hash database
 ///
 /// # Arguments
 ///
@@ -238,19 +244,10 @@ impl Default for ConfigDuplicateDetector {
 ///
 /// Hex string of SHA256 hash
 fn calculate_file_hash(path: &Path) -> Result<String> {
-    let mut file = File::open(path)?;
-    let mut hasher = Sha256::new();
-    let mut buffer = [0u8; 4096];
-
-    loop {
-        let bytes_read = file.read(&mut buffer)?;
-        if bytes_read == 0 {
-            break;
-        }
-        hasher.update(&buffer[..bytes_read]);
-    }
-
-    Ok(crate::encode_hex(hasher.finalize().as_ref()))
+    FileHasher::hash_file(path).map_err(|error| match error {
+        FileIOError::IoError(error) => ConfigError::IoError(error),
+        other => ConfigError::IoError(std::io::Error::other(other.to_string())),
+    })
 }
 
 /// Calculate text similarity between two files using Levenshtein distance
@@ -22,11 +22,15 @@ use std::collections::HashMap;
 use std::fs;
 use std::path::{Path, PathBuf};
 
+use classic_file_io_core::FileHasher;
 use configparser::ini::Ini;
 use thiserror::Error;
-use walkdir::WalkDir;
 
 use crate::ini::{ConfigIssue, IssueSeverity};
+use crate::inventory::GameFileInventory;
+
+/// Extensions of the files the cache collects; covers .ini and .conf files, including dxvk.conf
+pub(crate) const CONFIG_FILE_EXTENSIONS: &[&str] = &["ini", "conf"];
 
 /// Errors that can occur during config cache operations
 #[derive(Debug, Error)]
@@ -103,8 +107,8 @@ pub struct ConfigFileCache {
     /// Whitelist of directory/filename prefixes for duplicate detection
     duplicate_whitelist: Vec<String>,
 
-    /// Hash cache for duplicate detection
-    hash_cache: HashMap<PathBuf, String>,
+    /// Hash cache for duplicate detection; `None` when the file could not be hashed
+    hash_cache: HashMap<PathBuf, Option<String>>,
 }
 
 impl ConfigFileCache {
@@ -128,6 +132,45 @@ impl ConfigFileCache {
             ));
         }
 
+        let inventory = GameFileInventory::build(&[game_root]);
+        Ok(Self::scan_inventory(
+            &inventory,
+            game_root,
+            duplicate_whitelist,
+        ))
+    }
+
+    /// Create a new config file cache from an already built file inventory
+    ///
+    /// Same as [`new`](Self::new), but reads the directory tree from `inventory`
+    /// instead of walking `game_root`. Falls back to walking `game_root` when the
+    /// inventory does not cover it.
+    pub fn from_inventory(
+        inventory: &GameFileInventory,
+        game_root: &Path,
+        duplicate_whitelist: &[&str],
+    ) -> Result<Self> {
+        if !inventory.covers(game_root) {
+            return Self::new(game_root, duplicate_whitelist);
+        }
+        if !game_root.exists() {
+            return Err(ConfigCacheError::GameRootNotFound(
+                game_root.display().to_string(),
+            ));
+        }
+
+        Ok(Self::scan_inventory(
+            inventory,
+            game_root,
+            duplicate_whitelist,
+        ))
+    }
+
+    fn scan_inventory(
+        inventory: &GameFileInventory,
+        game_root: &Path,
+        duplicate_whitelist: &[&str],
+    ) -> Self {
         let mut cache = Self {
             config_files: HashMap::new(),
             ini_cache: HashMap::new(),
@@ -137,33 +180,22 @@ impl ConfigFileCache {
             hash_cache: HashMap::new(),
         };
 
-        cache.scan_directory(game_root);
-        Ok(cache)
+        crate::hash_db::attach_local_hash_db();
+        cache.scan_directory(inventory, game_root);
+        crate::hash_db::flush_hash_db();
+        cache
     }
 
-    /// Scan a directory tree for config files
-    fn scan_directory(&mut self, game_root: &Path) {
-        for entry in WalkDir::new(game_root)
-            .follow_links(false)
-            .into_iter()
-            .filter_map(|e| e.ok())
-            .filter(|e| e.file_type().is_file())
-        {
+    /// Register the config files below `game_root`, in path order
+    fn scan_directory(&mut self, inventory: &GameFileInventory, game_root: &Path) {
+        for entry in inventory.files_with_extensions_under(CONFIG_FILE_EXTENSIONS, game_root) {
             let path = entry.path();
-            let Some(file_name) = path.file_name().and_then(|n| n.to_str()) else {
+            let Some(file_name) = entry.file_name().to_str() else {
                 continue;
             };
 
             let file_lower = file_name.to_lowercase();
 
-            // Check file extension: .ini, .conf, or dxvk.conf
-            let is_config = file_lower.ends_with(".ini")
-                || file_lower.ends_with(".conf")
-                || file_lower == "dxvk.conf";
-            if !is_config {
-                continue;
-            }
-
             // For duplicate detection, check whitelist
             let path_str = path.to_string_lossy();
             let matches_whitelist = self.duplicate_whitelist.is_empty()
@@ -176,27 +208,28 @@ impl ConfigFileCache {
                 if matches_whitelist {
                     let existing_path = existing_path.clone();
                     // Check for duplicate
-                    let is_dup = self.is_duplicate(&existing_path, path);
+                    let is_dup = self.is_duplicate(&existing_path, &path);
                     if is_dup {
                         self.duplicate_files
                             .entry(file_lower.clone())
                             .or_insert_with(|| vec![existing_path])
-                            .push(path.to_path_buf());
+                            .push(path);
                     }
                 }
             } else {
                 // First occurrence
-                self.config_files.insert(file_lower, path.to_path_buf());
+                self.config_files.insert(file_lower, path);
             }
         }
     }
 
     /// Check if two files are duplicates (hash, size+mtime, or INI comparison)
     fn is_duplicate(&mut self, file1: &Path, file2: &Path) -> bool {
-        // Check hash equality
-        let hash1 = self.get_cached_hash(file1);
-        let hash2 = self.get_cached_hash(file2);
-        if hash1 == hash2 {
+        // Check hash equality; files that cannot be hashed never match by hash
+        if let (Some(hash1), Some(hash2)) =
+            (self.get_cached_hash(file1), self.get_cached_hash(file2))
+            && hash1 == hash2
+        {
             return true;
         }
 
@@ -213,7 +246,7 @@ impl ConfigFileCache {
     }
 
     /// Get or compute a file hash
-    fn get_cached_hash(&mut self, path: &Path) -> String {
+    fn get_cached_hash(&mut self, path: &Path) -> Option<String> {
         if let Some(hash) = self.hash_cache.get(path) {
             return hash.clone();
         }
@@ -405,17 +438,21 @@ fn decode_with_detection(bytes: &[u8]) -> (String, String) {
     (decoded.into_owned(), encoding.name().to_string())
 }
 
-/// Compute a simple hash of file contents for duplicate detection
-fn compute_file_hash(path: &Path) -> String {
-    use sha2::{Digest, Sha256};
-
-    let Ok(bytes) = fs::read(path) else {
-        return String::new();
-    };
-
-    let mut hasher = Sha256::new();
-    hasher.update(&bytes);
-    crate::encode_hex(hasher.finalize().as_ref())
+/// Compute a SHA-256 of file contents for duplicate detection
+///
+/// Goes through [`FileHasher`] so repeated scans reuse digests of unchanged files.
+/// Returns `None` when the file cannot be read.
+fn compute_file_hash(path: &Path) -> Option<String> {
+    match FileHasher::hash_file(path) {
+        Ok(hash) => Some(hash),
+        Err(error) => {
+            log::debug!(
+                "Cannot hash {} for duplicate detection: {error}",
+                path.display()
+            );
+            None
+        }
+    }
 }
 
 /// Read a TOML file value (for crash generator config checking)
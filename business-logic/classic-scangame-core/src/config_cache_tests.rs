@@ -152,6 +152,16 @@ fn test_duplicate_detection() {
     assert!(cache.duplicate_files.contains_key("test.ini"));
 }
 
+#[test]
+fn test_unreadable_files_are_not_duplicates() {
+    let root = TempDir::new().unwrap();
+    let mut cache = ConfigFileCache::new(root.path(), &[]).unwrap();
+
+    let missing1 = root.path().join("dir1").join("test.ini");
+    let missing2 = root.path().join("dir2").join("test.ini");
+    assert!(!cache.is_duplicate(&missing1, &missing2));
+}
+
 #[test]
 fn test_game_root_not_found() {
     let result = ConfigFileCache::new(Path::new("/nonexistent/game/root"), &[]);
@@ -17,6 +17,7 @@ use classic_version_registry_core::{
     get_version_registry,
 };
 use classic_xse_core::{XseType, get_xse_info, parse_version};
+use rayon::prelude::*;
 
 /// Top-level state for a Game Setup Intake run.
 #[derive(Debug, Clone, Copy, PartialEq, Eq)]
@@ -373,6 +374,7 @@ impl GameSetupIntake {
         let mut actions = Vec::new();
         let mut path_updates = Vec::new();
 
+        crate::hash_db::attach_local_hash_db();
         let selected = normalize_game_setup_version_selection(&self.selected_game_version);
         let game_root = resolve_game_root(self, &selected, &mut checks, &mut actions);
         let auto_detection_exe_path =
@@ -420,6 +422,7 @@ impl GameSetupIntake {
             version_context.info.as_ref(),
             &mut checks,
         );
+        crate::hash_db::flush_hash_db();
 
         if version_facts.selected == "auto"
             && version_context.info.is_none()
@@ -1190,16 +1193,27 @@ fn run_xse_script_hash_checks(
     let mut missing = 0usize;
     let mut mismatched = 0usize;
     let mut details = Vec::new();
-    for (script, expected_hash) in &xse.script_hashes {
-        let script_path = scripts_root.join(script);
-        if !script_path.exists() {
+    // Hash in parallel, one script per task; reporting below stays in registry order.
+    let outcomes: Vec<_> = xse
+        .script_hashes
+        .par_iter()
+        .with_max_len(1)
+        .map(|(script, _)| {
+            let script_path = scripts_root.join(script);
+            script_path
+                .exists()
+                .then(|| FileHasher::hash_file(&script_path))
+        })
+        .collect();
+    for ((script, expected_hash), outcome) in xse.script_hashes.iter().zip(outcomes) {
+        let Some(outcome) = outcome else {
             missing += 1;
             if details.len() < 10 {
                 details.push(format!("missing {script}"));
             }
             continue;
-        }
-        match FileHasher::hash_file(&script_path) {
+        };
+        match outcome {
             Ok(actual) if actual.eq_ignore_ascii_case(expected_hash) => {}
             Ok(actual) => {
                 mismatched += 1;
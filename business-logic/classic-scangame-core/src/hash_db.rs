@@ -0,0 +1,34 @@
+//! Shared persistent hash database for setup-time hashing.
+//!
+//! Game setup checks, integrity checks and config duplicate detection all hash through
+//! [`FileHasher`]. The hasher is backed by `CLASSIC Hashes.json` in the per-user scan
+//! cache directory from `classic-path-core`, so the game executable and unchanged
+//! config files are not rehashed on later runs. The location does not depend on the
+//! install directory, which may be read-only. When no cache directory can be resolved,
+//! hashing stays in memory only.
+
+use classic_file_io_core::FileHasher;
+
+/// Opens the hash database in the per-user scan cache directory unless one is open.
+pub(crate) fn attach_local_hash_db() {
+    if FileHasher::hash_db_path().is_some() {
+        return;
+    }
+    let cache_dir = match classic_path_core::ensure_scan_cache_dir() {
+        Ok(cache_dir) => cache_dir,
+        Err(error) => {
+            log::debug!("Hash database unavailable: {error}");
+            return;
+        }
+    };
+    if let Err(error) = FileHasher::open_hash_db(&FileHasher::default_hash_db_path(&cache_dir)) {
+        log::debug!("Hash database unavailable: {error}");
+    }
+}
+
+/// Persists digests computed since the last flush; failures only cost a rehash later.
+pub(crate) fn flush_hash_db() {
+    if let Err(error) = FileHasher::flush_hash_db() {
+        log::debug!("Failed to persist hash database: {error}");
+    }
+}
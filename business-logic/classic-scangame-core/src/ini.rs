@@ -20,8 +20,11 @@ use std::fs;
 use std::path::{Path, PathBuf};
 
 use configparser::ini::Ini;
+use serde::{Deserialize, Serialize};
 use thiserror::Error;
 
+use crate::inventory::GameFileInventory;
+
 /// Errors that can occur during INI validation
 #[derive(Debug, Error)]
 pub enum IniError {
@@ -42,7 +45,7 @@ pub enum IniError {
 pub type Result<T> = std::result::Result<T, IniError>;
 
 /// Severity level for configuration issues
-#[derive(Debug, Clone, PartialEq, Eq)]
+#[derive(Debug, Clone, PartialEq, Eq, Serialize, Deserialize)]
 pub enum IssueSeverity {
     /// Error level issue
     Error,
@@ -53,7 +56,7 @@ pub enum IssueSeverity {
 }
 
 /// Configuration issue detected in INI file
-#[derive(Debug, Clone)]
+#[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct ConfigIssue {
     /// Path to the configuration file
     pub file_path: PathBuf,
@@ -487,28 +490,32 @@ impl IniValidator {
     ///
     /// Map of lowercase file name to file path
     pub fn scan_config_files(&self, game_root: &Path) -> Result<HashMap<String, PathBuf>> {
-        let mut config_files = HashMap::new();
+        let inventory = GameFileInventory::build(&[game_root]);
+        self.scan_config_files_in(&inventory, game_root)
+    }
 
-        // Walk the game root directory
-        for entry in walkdir::WalkDir::new(game_root)
-            .follow_links(false)
-            .into_iter()
-            .filter_map(|e| e.ok())
-        {
-            let path = entry.path();
-
-            // Only process .ini and .conf files
-            if let Some(ext) = path.extension() {
-                let ext_lower = ext.to_string_lossy().to_lowercase();
-                if (ext_lower == "ini" || ext_lower == "conf")
-                    && let Some(file_name) = path.file_name()
-                {
-                    let file_name_lower = file_name.to_string_lossy().to_lowercase();
-                    config_files.insert(file_name_lower, path.to_path_buf());
-                }
-            }
+    /// Scan for configuration files using an already built file inventory
+    ///
+    /// Falls back to walking `game_root` when the inventory does not cover it.
+    pub fn scan_config_files_in(
+        &self,
+        inventory: &GameFileInventory,
+        game_root: &Path,
+    ) -> Result<HashMap<String, PathBuf>> {
+        if !inventory.covers(game_root) {
+            return self.scan_config_files(game_root);
         }
 
+        // Only .ini and .conf files; a later path with the same name replaces an earlier one
+        let config_files: HashMap<String, PathBuf> = inventory
+            .files_with_extensions_under(&["ini", "conf"], game_root)
+            .into_iter()
+            .map(|entry| {
+                let file_name_lower = entry.file_name().to_string_lossy().to_lowercase();
+                (file_name_lower, entry.path())
+            })
+            .collect();
+
         Ok(config_files)
     }
 }
@@ -5,6 +5,7 @@
 //! - Installation location validation (Program Files detection)
 //! - Steam INI detection (indicates outdated version)
 
+use classic_file_io_core::{FileHasher, FileIOError};
 use std::path::{Path, PathBuf};
 use thiserror::Error;
 
@@ -166,7 +167,9 @@ impl GameIntegrityChecker {
         }
 
         // Calculate SHA256 hash of the executable
+        crate::hash_db::attach_local_hash_db();
         let local_hash = calculate_sha256_file(&self.config.game_exe_path)?;
+        crate::hash_db::flush_hash_db();
 
         // Check if hash matches known versions
         let is_valid_version = self.config.valid_exe_hashes.contains(&local_hash);
@@ -301,7 +304,8 @@ impl GameIntegrityChecker {
 
 /// Calculate SHA256 hash of a file
 ///
-/// This is a convenience function that wraps file I/O and hash calculation.
+/// Delegates to [`FileHasher`], so unchanged executables are served from the shared
+/// hash cache and, when attached, the persistent hash database.
 ///
 /// # Arguments
 ///
@@ -317,28 +321,11 @@ impl GameIntegrityChecker {
 /// - File doesn't exist
 /// - Failed to read file
 fn calculate_sha256_file(path: &Path) -> Result<String, IntegrityError> {
-    use sha2::{Digest, Sha256};
-    use std::fs::File;
-    use std::io::Read;
-
-    if !path.exists() {
-        return Err(IntegrityError::FileNotFound(path.to_path_buf()));
-    }
-
-    let mut file = File::open(path)?;
-    let mut hasher = Sha256::new();
-    let mut buffer = [0u8; 8192];
-
-    loop {
-        let bytes_read = file.read(&mut buffer)?;
-        if bytes_read == 0 {
-            break;
-        }
-        hasher.update(&buffer[..bytes_read]);
-    }
-
-    let result = hasher.finalize();
-    Ok(crate::encode_hex(result.as_ref()))
+    FileHasher::hash_file(path).map_err(|error| match error {
+        FileIOError::NotFound(_) => IntegrityError::FileNotFound(path.to_path_buf()),
+        FileIOError::IoError(error) => IntegrityError::IoError(error),
+        other => IntegrityError::HashError(other.to_string()),
+    })
 }
 
 #[cfg(test)]
@@ -0,0 +1,425 @@
+//! One-pass file inventory shared by game and mod scans
+//!
+//! A full game scan used to walk the same directories once per scanner: the config
+//! file cache (twice, for the mod INI report and FCX issue detection), the INI
+//! validator, the unpacked mod scanner and the BA2 archive finder each ran their own
+//! `walkdir` traversal. [`GameFileInventory`] walks its roots once, in parallel, and
+//! records every entry's type, size and modification time. Scanners then answer
+//! their questions from the inventory instead of the disk.
+//!
+//! ## Layout
+//!
+//! - Entries are sorted by path, so every directory's subtree is one contiguous
+//!   range found by binary search.
+//! - Each directory path is stored once; entries refer to their parent by index.
+//! - File names share a single string arena (names that are not valid Unicode are
+//!   kept separately).
+//! - A lowercase extension index lists the files of each type in path order.
+//!
+//! Links are recorded with the type of their target but are never followed, like
+//! the `walkdir` traversals they replace.
+
+use std::collections::HashMap;
+use std::ffi::{OsStr, OsString};
+use std::fmt;
+use std::fs::{self, Metadata};
+use std::ops::Range;
+use std::path::{Path, PathBuf};
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
+
+use rayon::prelude::*;
+
+/// Type of an inventory entry
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Hash)]
+pub enum EntryKind {
+    /// Regular file (or a link to one)
+    File,
+    /// Directory (or a link to one)
+    Directory,
+    /// Anything else, such as a dangling link or a device
+    Other,
+}
+
+/// Location of an entry's file name
+#[derive(Debug, Clone, Copy)]
+enum NameRef {
+    /// Byte range in the UTF-8 name arena
+    Arena { start: u32, len: u32 },
+    /// Index into the names that are not valid Unicode
+    Foreign(u32),
+}
+
+#[derive(Debug, Clone)]
+struct EntryRecord {
+    /// Index of the parent directory in `dirs`
+    dir: u32,
+    name: NameRef,
+    kind: EntryKind,
+    /// File length in bytes; 0 for directories
+    size: u64,
+    /// Nanoseconds since the Unix epoch; 0 when unknown
+    modified_ns: u64,
+}
+
+/// One entry found by the walk, before it is packed into the inventory
+struct WalkedEntry {
+    path: PathBuf,
+    kind: EntryKind,
+    size: u64,
+    modified_ns: u64,
+}
+
+/// Snapshot of every file and directory below a set of roots
+///
+/// Built once per scan with [`GameFileInventory::build`] and shared (usually behind
+/// an `Arc`) by every scanner that would otherwise walk the same directories.
+///
+/// # Example
+///
+/// ```rust,no_run
+/// use classic_scangame_core::inventory::GameFileInventory;
+/// use std::path::Path;
+///
+/// let game_root = Path::new("C:/Games/Fallout4");
+/// let inventory = GameFileInventory::build(&[game_root]);
+/// for entry in inventory.files_with_extensions_under(&["ini", "conf"], game_root) {
+///     println!("{} ({} bytes)", entry.path().display(), entry.size());
+/// }
+/// ```
+#[derive(Debug, Clone, Default)]
+pub struct GameFileInventory {
+    /// Walked roots, without roots nested inside another root
+    roots: Vec<PathBuf>,
+    /// Every directory that holds at least one entry
+    dirs: Vec<PathBuf>,
+    /// Arena holding all UTF-8 file names back to back
+    names: String,
+    /// File names that are not valid Unicode
+    foreign_names: Vec<OsString>,
+    /// All entries below the roots, sorted by path
+    entries: Vec<EntryRecord>,
+    /// Lowercase extension (without the dot) -> file entry indices in path order
+    by_extension: HashMap<String, Vec<u32>>,
+}
+
+impl GameFileInventory {
+    /// Walk `roots` in parallel and record everything below them
+    ///
+    /// Roots themselves are not entries. Missing or unreadable directories simply
+    /// contribute no entries, and roots nested inside another root are walked once.
+    pub fn build<P: AsRef<Path>>(roots: &[P]) -> Self {
+        let mut requested: Vec<PathBuf> = roots.iter().map(|r| r.as_ref().to_path_buf()).collect();
+        requested.sort();
+        requested.dedup();
+
+        // An ancestor sorts before its descendants, so one pass drops nested roots.
+        let mut roots: Vec<PathBuf> = Vec::with_capacity(requested.len());
+        for root in requested {
+            if !roots.iter().any(|kept| root.starts_with(kept)) {
+                roots.push(root);
+            }
+        }
+
+        let mut walked: Vec<WalkedEntry> = roots
+            .par_iter()
+            .flat_map_iter(|root| walk_directory(root))
+            .collect();
+        walked.par_sort_unstable_by(|a, b| a.path.cmp(&b.path));
+
+        let mut inventory = Self {
+            roots,
+            entries: Vec::with_capacity(walked.len()),
+            ..Self::default()
+        };
+        let mut dir_index: HashMap<PathBuf, u32> = HashMap::new();
+        for entry in walked {
+            inventory.push(entry, &mut dir_index);
+        }
+        inventory
+    }
+
+    fn push(&mut self, walked: WalkedEntry, dir_index: &mut HashMap<PathBuf, u32>) {
+        let parent = walked.path.parent().unwrap_or_else(|| Path::new(""));
+        let dir = match dir_index.get(parent) {
+            Some(&index) => index,
+            None => {
+                let index = self.dirs.len() as u32;
+                self.dirs.push(parent.to_path_buf());
+                dir_index.insert(parent.to_path_buf(), index);
+                index
+            }
+        };
+
+        let file_name = walked.path.file_name().unwrap_or_default();
+        let name = match file_name.to_str() {
+            Some(text) => {
+                let start = self.names.len() as u32;
+                self.names.push_str(text);
+                NameRef::Arena {
+                    start,
+                    len: text.len() as u32,
+                }
+            }
+            None => {
+                self.foreign_names.push(file_name.to_os_string());
+                NameRef::Foreign(self.foreign_names.len() as u32 - 1)
+            }
+        };
+
+        let index = self.entries.len() as u32;
+        if walked.kind == EntryKind::File
+            && let Some(extension) = Path::new(file_name).extension()
+        {
+            self.by_extension
+                .entry(extension.to_string_lossy().to_lowercase())
+                .or_default()
+                .push(index);
+        }
+
+        self.entries.push(EntryRecord {
+            dir,
+            name,
+            kind: walked.kind,
+            size: walked.size,
+            modified_ns: walked.modified_ns,
+        });
+    }
+
+    /// Roots covered by this inventory
+    pub fn roots(&self) -> &[PathBuf] {
+        &self.roots
+    }
+
+    /// Number of recorded files and directories
+    pub fn len(&self) -> usize {
+        self.entries.len()
+    }
+
+    /// Check if no entries were recorded
+    pub fn is_empty(&self) -> bool {
+        self.entries.is_empty()
+    }
+
+    /// Check if `path` lies within one of the walked roots
+    pub fn covers(&self, path: &Path) -> bool {
+        self.roots.iter().any(|root| path.starts_with(root))
+    }
+
+    /// Look up the entry recorded for `path`
+    pub fn get(&self, path: &Path) -> Option<InventoryEntry<'_>> {
+        let index = self
+            .entries
+            .partition_point(|record| self.record_path(record).as_path() < path);
+        let record = self.entries.get(index)?;
+        (self.record_path(record) == path).then(|| self.entry(index))
+    }
+
+    /// All entries below `dir`, in path order
+    pub fn entries_under(&self, dir: &Path) -> impl Iterator<Item = InventoryEntry<'_>> + '_ {
+        self.subtree(dir).map(|index| self.entry(index))
+    }
+
+    /// Parallel version of [`entries_under`](Self::entries_under)
+    pub fn par_entries_under(
+        &self,
+        dir: &Path,
+    ) -> impl IndexedParallelIterator<Item = InventoryEntry<'_>> + '_ {
+        self.subtree(dir)
+            .into_par_iter()
+            .map(move |index| self.entry(index))
+    }
+
+    /// Files below `dir` whose lowercase extension is one of `extensions`, in path order
+    ///
+    /// Extensions are given without the leading dot, e.g. `&["ini", "conf"]`.
+    pub fn files_with_extensions_under(
+        &self,
+        extensions: &[&str],
+        dir: &Path,
+    ) -> Vec<InventoryEntry<'_>> {
+        let range = self.subtree(dir);
+        if range.is_empty() {
+            return Vec::new();
+        }
+
+        let mut indices: Vec<usize> = extensions
+            .iter()
+            .filter_map(|extension| self.by_extension.get(&extension.to_lowercase()))
+            .flat_map(|list| list.iter().map(|&index| index as usize))
+            .filter(|index| range.contains(index))
+            .collect();
+        if extensions.len() > 1 {
+            indices.sort_unstable();
+            indices.dedup();
+        }
+        indices.into_iter().map(|index| self.entry(index)).collect()
+    }
+
+    /// Index range of the entries below `dir`
+    ///
+    /// Path order is component-wise, so a directory's descendants directly follow it.
+    fn subtree(&self, dir: &Path) -> Range<usize> {
+        let start = self
+            .entries
+            .partition_point(|record| self.record_path(record).as_path() <= dir);
+        let len = self.entries[start..]
+            .partition_point(|record| self.record_path(record).starts_with(dir));
+        start..start + len
+    }
+
+    fn entry(&self, index: usize) -> InventoryEntry<'_> {
+        InventoryEntry {
+            inventory: self,
+            record: &self.entries[index],
+        }
+    }
+
+    fn record_name(&self, record: &EntryRecord) -> &OsStr {
+        match record.name {
+            NameRef::Arena { start, len } => {
+                OsStr::new(&self.names[start as usize..(start + len) as usize])
+            }
+            NameRef::Foreign(index) => &self.foreign_names[index as usize],
+        }
+    }
+
+    fn record_path(&self, record: &EntryRecord) -> PathBuf {
+        self.dirs[record.dir as usize].join(self.record_name(record))
+    }
+}
+
+/// A file or directory recorded in a [`GameFileInventory`]
+#[derive(Clone, Copy)]
+pub struct InventoryEntry<'a> {
+    inventory: &'a GameFileInventory,
+    record: &'a EntryRecord,
+}
+
+impl<'a> InventoryEntry<'a> {
+    /// Full path of the entry
+    pub fn path(&self) -> PathBuf {
+        self.inventory.record_path(self.record)
+    }
+
+    /// Directory containing the entry
+    pub fn parent(&self) -> &'a Path {
+        &self.inventory.dirs[self.record.dir as usize]
+    }
+
+    /// Final path component
+    pub fn file_name(&self) -> &'a OsStr {
+        self.inventory.record_name(self.record)
+    }
+
+    /// Type of the entry
+    pub fn kind(&self) -> EntryKind {
+        self.record.kind
+    }
+
+    /// Check if the entry is a file
+    pub fn is_file(&self) -> bool {
+        self.record.kind == EntryKind::File
+    }
+
+    /// Check if the entry is a directory
+    pub fn is_dir(&self) -> bool {
+        self.record.kind == EntryKind::Directory
+    }
+
+    /// File length in bytes (0 for directories)
+    pub fn size(&self) -> u64 {
+        self.record.size
+    }
+
+    /// Last modification time, if the platform reported one
+    pub fn modified(&self) -> Option<SystemTime> {
+        (self.record.modified_ns != 0)
+            .then(|| UNIX_EPOCH + Duration::from_nanos(self.record.modified_ns))
+    }
+
+    /// Last modification time in nanoseconds since the Unix epoch, 0 if unknown
+    pub(crate) fn modified_ns(&self) -> u64 {
+        self.record.modified_ns
+    }
+}
+
+impl fmt::Debug for InventoryEntry<'_> {
+    fn fmt(&self, f: &mut fmt::Formatter<'_>) -> fmt::Result {
+        f.debug_struct("InventoryEntry")
+            .field("path", &self.path())
+            .field("kind", &self.record.kind)
+            .field("size", &self.record.size)
+            .finish()
+    }
+}
+
+/// Recursively list `dir`, descending into subdirectories in parallel
+fn walk_directory(dir: &Path) -> Vec<WalkedEntry> {
+    let Ok(read_dir) = fs::read_dir(dir) else {
+        return Vec::new();
+    };
+
+    let mut entries = Vec::new();
+    let mut subdirs = Vec::new();
+    for entry in read_dir.filter_map(|e| e.ok()) {
+        let Ok(file_type) = entry.file_type() else {
+            continue;
+        };
+        let path = entry.path();
+        // Links report their target's type and size, but are not descended into.
+        let metadata = if file_type.is_symlink() {
+            fs::metadata(&path)
+        } else {
+            entry.metadata()
+        };
+        let walked = match metadata {
+            Ok(metadata) => walked_entry(path, &metadata),
+            Err(_) => WalkedEntry {
+                path,
+                kind: EntryKind::Other,
+                size: 0,
+                modified_ns: 0,
+            },
+        };
+        if walked.kind == EntryKind::Directory && !file_type.is_symlink() {
+            subdirs.push(walked.path.clone());
+        }
+        entries.push(walked);
+    }
+
+    let nested: Vec<Vec<WalkedEntry>> = subdirs
+        .par_iter()
+        .map(|subdir| walk_directory(subdir))
+        .collect();
+    entries.extend(nested.into_iter().flatten());
+    entries
+}
+
+fn walked_entry(path: PathBuf, metadata: &Metadata) -> WalkedEntry {
+    let kind = if metadata.is_file() {
+        EntryKind::File
+    } else if metadata.is_dir() {
+        EntryKind::Directory
+    } else {
+        EntryKind::Other
+    };
+    let modified_ns = metadata
+        .modified()
+        .ok()
+        .and_then(|time| time.duration_since(UNIX_EPOCH).ok())
+        .map_or(0, |since| since.as_nanos() as u64);
+    WalkedEntry {
+        path,
+        kind,
+        size: if kind == EntryKind::File {
+            metadata.len()
+        } else {
+            0
+        },
+        modified_ns,
+    }
+}
+
+#[cfg(test)]
+#[path = "inventory_tests.rs"]
+mod tests;
@@ -0,0 +1,119 @@
+use super::*;
+use tempfile::TempDir;
+
+fn sample_tree() -> TempDir {
+    let temp = TempDir::new().unwrap();
+    let root = temp.path();
+    fs::create_dir_all(root.join("Data/Textures")).unwrap();
+    fs::create_dir_all(root.join("Data-Backup")).unwrap();
+    fs::write(root.join("Fallout4.ini"), b"[General]\n").unwrap();
+    fs::write(root.join("dxvk.conf"), b"dxgi.maxFrameRate = 60\n").unwrap();
+    fs::write(root.join("Data/Mod - Main.BA2"), b"BTDX").unwrap();
+    fs::write(root.join("Data/Textures/skin.dds"), b"DDS 1234").unwrap();
+    fs::write(root.join("Data-Backup/old.ini"), b"").unwrap();
+    temp
+}
+
+#[test]
+fn test_missing_root_is_empty() {
+    let inventory = GameFileInventory::build(&[Path::new("nonexistent_inventory_root_12345")]);
+    assert!(inventory.is_empty());
+    assert!(inventory.covers(Path::new("nonexistent_inventory_root_12345/Data")));
+}
+
+#[test]
+fn test_records_kind_size_and_mtime() {
+    let temp = sample_tree();
+    let root = temp.path();
+    let inventory = GameFileInventory::build(&[root]);
+
+    // 3 directories and 5 files; the root itself is not an entry
+    assert_eq!(inventory.len(), 8);
+    assert!(inventory.get(root).is_none());
+
+    let dds = inventory.get(&root.join("Data/Textures/skin.dds")).unwrap();
+    assert!(dds.is_file());
+    assert_eq!(dds.size(), 8);
+    assert_eq!(dds.file_name(), "skin.dds");
+    assert_eq!(dds.parent(), root.join("Data/Textures"));
+    assert_eq!(
+        dds.modified(),
+        fs::metadata(root.join("Data/Textures/skin.dds"))
+            .unwrap()
+            .modified()
+            .ok()
+    );
+
+    let textures = inventory.get(&root.join("Data/Textures")).unwrap();
+    assert_eq!(textures.kind(), EntryKind::Directory);
+    assert_eq!(textures.size(), 0);
+}
+
+#[test]
+fn test_entries_under_is_sorted_subtree() {
+    let temp = sample_tree();
+    let root = temp.path();
+    let inventory = GameFileInventory::build(&[root]);
+
+    let data: Vec<PathBuf> = inventory
+        .entries_under(&root.join("Data"))
+        .map(|entry| entry.path())
+        .collect();
+    // "Data-Backup" sorts between "Data" and its children by string, but not by path.
+    assert_eq!(
+        data,
+        vec![
+            root.join("Data/Mod - Main.BA2"),
+            root.join("Data/Textures"),
+            root.join("Data/Textures/skin.dds"),
+        ]
+    );
+
+    let all: Vec<PathBuf> = inventory.entries_under(root).map(|e| e.path()).collect();
+    let mut sorted = all.clone();
+    sorted.sort();
+    assert_eq!(all, sorted);
+    assert_eq!(all.len(), inventory.len());
+}
+
+#[test]
+fn test_extension_index_is_case_insensitive() {
+    let temp = sample_tree();
+    let root = temp.path();
+    let inventory = GameFileInventory::build(&[root]);
+
+    let archives = inventory.files_with_extensions_under(&["ba2"], root);
+    assert_eq!(archives.len(), 1);
+    assert_eq!(archives[0].path(), root.join("Data/Mod - Main.BA2"));
+
+    let configs: Vec<PathBuf> = inventory
+        .files_with_extensions_under(&["INI", "conf"], root)
+        .iter()
+        .map(|entry| entry.path())
+        .collect();
+    assert_eq!(
+        configs,
+        vec![
+            root.join("Data-Backup/old.ini"),
+            root.join("Fallout4.ini"),
+            root.join("dxvk.conf"),
+        ]
+    );
+
+    assert!(
+        inventory
+            .files_with_extensions_under(&["ini"], &root.join("Data"))
+            .is_empty()
+    );
+}
+
+#[test]
+fn test_nested_roots_are_walked_once() {
+    let temp = sample_tree();
+    let root = temp.path();
+    let inventory = GameFileInventory::build(&[root.join("Data"), root.to_path_buf()]);
+
+    assert_eq!(inventory.roots(), &[root.to_path_buf()]);
+    assert_eq!(inventory.len(), 8);
+    assert!(inventory.covers(&root.join("Data")));
+}
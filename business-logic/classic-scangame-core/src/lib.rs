@@ -13,8 +13,6 @@
 //! **NO PyO3 DEPENDENCIES** - Pure Rust business logic only.
 //! For Python bindings, see `classic-scangame-py`.
 
-use std::fmt::Write as _;
-
 // Module declarations - will be implemented in Phase 3B-3C
 pub mod config; // Config.py duplicate detection (Phase 3B) - IMPLEMENTED
 pub mod enb; // ENB detection (Phase 7) - IMPLEMENTED
@@ -26,13 +24,17 @@ pub mod unpacked; // unpacked_scanner.py (Phase 3B) - IMPLEMENTED
 pub mod xse; // CheckXsePlugins.py (Phase 3C) - IMPLEMENTED // GameIntegrity.py validation (Phase 5) - IMPLEMENTED
 
 pub mod ba2; // BA2 archive handling (Phase 3B) - IMPLEMENTED
+mod ba2_reader;
 pub mod config_cache; // ConfigFileCache with encoding detection (G-03) - IMPLEMENTED
 pub mod crashgen_orchestrator; // CrashgenCheckOrchestrator (G-07) - IMPLEMENTED
 pub mod error;
 pub mod game_report; // ScanReportBuilder + ScanValidators (G-09/G-10) - IMPLEMENTED
 pub mod game_setup_intake;
+mod hash_db;
+pub mod inventory; // GameFileInventory shared by game and mod scans
 pub mod mod_ini; // ModIniScanner orchestrator (G-04) - IMPLEMENTED
 pub mod orchestrator; // GameScanOrchestrator (G-01/G-02) - IMPLEMENTED
+mod scan_snapshot; // Persisted full-scan results for incremental rescans
 pub mod wrye; // WryeBashParser (G-05) - IMPLEMENTED
 
 // Re-export key types for convenience
@@ -55,6 +57,7 @@ pub use ini::{ConfigIssue, IniError, IniValidator, IssueSeverity};
 pub use integrity::{
     CheckType, GameIntegrityChecker, IntegrityCheckResult, IntegrityConfig, IntegrityError,
 };
+pub use inventory::{EntryKind, GameFileInventory, InventoryEntry};
 pub use logs::{LogError, LogErrorEntry, LogProcessor};
 pub use mod_ini::{DuplicateEntry, ModIniScanResult, ModIniScanner, VsyncEntry};
 pub use orchestrator::{
@@ -68,11 +71,3 @@ pub use xse::{AddressLibInfo, GameVersion, ValidationResult, XseChecker, XseErro
 
 /// Version of the classic-scangame-core crate
 pub const VERSION: &str = env!("CARGO_PKG_VERSION");
-
-pub(crate) fn encode_hex(bytes: &[u8]) -> String {
-    let mut hex = String::with_capacity(bytes.len() * 2);
-    for byte in bytes {
-        let _ = write!(&mut hex, "{byte:02x}");
-    }
-    hex
-}
@@ -15,9 +15,19 @@
 //!
 //! Uses `tokio::JoinSet` for concurrent task management with structured
 //! error handling -- individual check failures don't abort the entire scan.
+//!
+//! Every scan builds one [`GameFileInventory`] of the directories it checks, and
+//! all file-system scanners read from it instead of walking the tree again.
+//! `run_full_scan` builds a single inventory covering both the game and mods folders.
+//!
+//! `run_full_scan` also keeps a scan snapshot on disk (see
+//! [`GameScanOrchestrator::with_scan_snapshot`]). Texture, archive and config results
+//! are stored with the size and mtime of the files they came from, so later full scans
+//! only read files that were added or changed and merge in the rest.
 
 use std::collections::{BTreeMap, BTreeSet, HashMap};
 use std::path::{Path, PathBuf};
+use std::sync::Arc;
 
 use classic_config_core::CrashgenSettingsRules;
 use thiserror::Error;
@@ -29,12 +39,14 @@ use crate::crashgen_orchestrator::CrashgenCheckOrchestrator;
 use crate::enb::EnbChecker;
 use crate::game_report::{ScanReportBuilder, ScanValidators};
 use crate::ini::ConfigIssue;
+use crate::inventory::GameFileInventory;
 use crate::logs::LogProcessor;
 use crate::mod_ini::ModIniScanner;
+use crate::scan_snapshot::{self, ConfigRecord, ScanSnapshot};
 use crate::unpacked::UnpackedScanner;
 use crate::wrye::WryeBashParser;
 use crate::xse::{GameVersion, XseChecker};
-use classic_file_io_core::dds::{DDSAnalyzer, GameTarget};
+use classic_file_io_core::dds::GameTarget;
 
 /// Issue map type: category -> set of formatted issue strings
 type IssueMap = BTreeMap<String, BTreeSet<String>>;
@@ -137,7 +149,17 @@ pub struct ModScanResult {
 /// Detect configuration issues (read-only, FCX mode).
 #[must_use]
 pub fn detect_config_issues(game_path: &Path, game_name: &str) -> Vec<ConfigIssue> {
-    let mut cache = match ConfigFileCache::new(game_path, &[]) {
+    let inventory = GameFileInventory::build(&[game_path]);
+    detect_config_issues_in(&inventory, game_path, game_name)
+}
+
+/// Detect configuration issues from an already built file inventory.
+fn detect_config_issues_in(
+    inventory: &GameFileInventory,
+    game_path: &Path,
+    game_name: &str,
+) -> Vec<ConfigIssue> {
+    let mut cache = match ConfigFileCache::from_inventory(inventory, game_path, &[]) {
         Ok(c) => c,
         Err(_) => return Vec::new(),
     };
@@ -192,12 +214,90 @@ pub fn detect_config_issues(game_path: &Path, game_name: &str) -> Vec<ConfigIssu
 /// ```
 pub struct GameScanOrchestrator {
     config: GameScanConfig,
+    /// Shared file inventory; built per scan when absent or not covering the paths
+    inventory: Option<Arc<GameFileInventory>>,
+    /// Where `run_full_scan` persists its snapshot; defaults to `CLASSIC Data`
+    snapshot_path: Option<PathBuf>,
+    /// Snapshot of the full scan in progress, consulted by its game and mod scans
+    snapshot: Option<Arc<ScanSnapshot>>,
 }
 
 impl GameScanOrchestrator {
     /// Create a new orchestrator with the given configuration
     pub fn new(config: GameScanConfig) -> Self {
-        Self { config }
+        Self {
+            config,
+            inventory: None,
+            snapshot_path: None,
+            snapshot: None,
+        }
+    }
+
+    /// Reuse an already built file inventory for the scans that it covers
+    pub fn with_inventory(mut self, inventory: Arc<GameFileInventory>) -> Self {
+        self.inventory = Some(inventory);
+        self
+    }
+
+    /// Persist full-scan results at `path` so later full scans only read changed files
+    ///
+    /// Without this, `run_full_scan` keeps its snapshot as `CLASSIC Scan Snapshot.json`
+    /// in the per-user scan cache directory, and runs without one when that directory
+    /// cannot be resolved. Deleting the file is safe: the next full scan reads every
+    /// texture, archive and INI again and writes a fresh one.
+    pub fn with_scan_snapshot(mut self, path: PathBuf) -> Self {
+        self.snapshot_path = Some(path);
+        self
+    }
+
+    /// Share the snapshot of a full scan in progress
+    fn with_snapshot(mut self, snapshot: Option<Arc<ScanSnapshot>>) -> Self {
+        self.snapshot = snapshot;
+        self
+    }
+
+    /// Load the previous snapshot for a full scan, if a location is known.
+    async fn open_snapshot(&self) -> Result<Option<Arc<ScanSnapshot>>, OrchestratorError> {
+        let Some(path) = self
+            .snapshot_path
+            .clone()
+            .or_else(scan_snapshot::local_snapshot_path)
+        else {
+            return Ok(None);
+        };
+        let settings = self.snapshot_settings();
+        tokio::task::spawn_blocking(move || Some(Arc::new(ScanSnapshot::open(&path, settings))))
+            .await
+            .map_err(|e| OrchestratorError::JoinError(e.to_string()))
+    }
+
+    /// Fingerprint of the configuration that stored results depend on
+    fn snapshot_settings(&self) -> u64 {
+        let mut xse_scripts: Vec<&String> = self.config.xse_scriptfiles.keys().collect();
+        xse_scripts.sort();
+        scan_snapshot::fingerprint(&(
+            &self.config.game_path,
+            &self.config.mods_path,
+            &self.config.game_name,
+            format!("{:?}", self.config.game_target),
+            xse_scripts,
+        ))
+    }
+
+    /// Return the attached inventory if it covers `roots`, else walk them once.
+    async fn inventory_for(
+        &self,
+        roots: Vec<PathBuf>,
+    ) -> Result<Arc<GameFileInventory>, OrchestratorError> {
+        if let Some(inventory) = &self.inventory
+            && roots.iter().all(|root| inventory.covers(root))
+        {
+            return Ok(Arc::clone(inventory));
+        }
+
+        tokio::task::spawn_blocking(move || Arc::new(GameFileInventory::build(&roots)))
+            .await
+            .map_err(|e| OrchestratorError::JoinError(e.to_string()))
     }
 
     /// Run all game integrity checks concurrently.
@@ -211,6 +311,18 @@ impl GameScanOrchestrator {
 
         // Clone values needed by spawned tasks
         let config = self.config.clone();
+        let inventory = self.inventory_for(vec![config.game_path.clone()]).await?;
+
+        // Config files unchanged since the snapshot reuse its mod INI and config results
+        let config_fingerprint = self
+            .snapshot
+            .as_ref()
+            .and_then(|_| scan_snapshot::config_fingerprint(&inventory, &config.game_path));
+        let cached_config = self
+            .snapshot
+            .as_ref()
+            .zip(config_fingerprint)
+            .and_then(|(snapshot, fingerprint)| snapshot.config(fingerprint));
 
         // 1. XSE plugins check
         {
@@ -329,15 +441,28 @@ impl GameScanOrchestrator {
         }
 
         // 7. Mod INI scan
-        {
+        if let Some(record) = &cached_config {
+            let output = record.mod_ini_message.clone();
+            join_set.spawn_blocking(move || {
+                Ok(CheckResult {
+                    name: "mod_inis".to_string(),
+                    output,
+                })
+            });
+        } else {
             let game_path = config.game_path.clone();
             let game_name = config.game_name.clone();
-            join_set.spawn_blocking(move || match ModIniScanner::scan(&game_path, &game_name) {
-                Ok(result) => Ok(CheckResult {
-                    name: "mod_inis".to_string(),
-                    output: result.message,
-                }),
-                Err(e) => Err(format!("Mod INI scan error: {}", e)),
+            let inventory = Arc::clone(&inventory);
+            join_set.spawn_blocking(move || {
+                let scan = ConfigFileCache::from_inventory(&inventory, &game_path, &["F4EE"])
+                    .and_then(|mut cache| ModIniScanner::scan_with_cache(&mut cache, &game_name));
+                match scan {
+                    Ok(result) => Ok(CheckResult {
+                        name: "mod_inis".to_string(),
+                        output: result.message,
+                    }),
+                    Err(e) => Err(format!("Mod INI scan error: {}", e)),
+                }
             });
         }
 
@@ -354,7 +479,19 @@ impl GameScanOrchestrator {
         }
 
         // Detect config issues (read-only FCX mode)
-        let config_issues = self.detect_config_issues();
+        let config_issues = match cached_config {
+            Some(record) => record.config_issues,
+            None => self.detect_config_issues(&inventory),
+        };
+        if let (Some(snapshot), Some(fingerprint)) = (&self.snapshot, config_fingerprint)
+            && let Some(mod_inis) = check_results.iter().find(|r| r.name == "mod_inis")
+        {
+            snapshot.record_config(ConfigRecord {
+                fingerprint,
+                mod_ini_message: mod_inis.output.clone(),
+                config_issues: config_issues.clone(),
+            });
+        }
 
         // Build combined report
         let report = check_results
@@ -375,8 +512,8 @@ impl GameScanOrchestrator {
     /// Detect configuration issues (read-only, FCX mode).
     ///
     /// Scans mod INI files for known problematic settings without modifying files.
-    fn detect_config_issues(&self) -> Vec<ConfigIssue> {
-        detect_config_issues(&self.config.game_path, &self.config.game_name)
+    fn detect_config_issues(&self, inventory: &GameFileInventory) -> Vec<ConfigIssue> {
+        detect_config_issues_in(inventory, &self.config.game_path, &self.config.game_name)
     }
 
     /// Run mod file scans (unpacked + archived) concurrently.
@@ -405,6 +542,9 @@ impl GameScanOrchestrator {
             });
         }
 
+        // One walk of the mods folder serves both scans
+        let inventory = self.inventory_for(vec![mods_path.clone()]).await?;
+
         let mut join_set: JoinSet<Result<(&'static str, IssueMap), String>> = JoinSet::new();
 
         // Unpacked scan
@@ -412,14 +552,26 @@ impl GameScanOrchestrator {
             let mods_path = mods_path.clone();
             let xse_scripts: Vec<String> = self.config.xse_scriptfiles.keys().cloned().collect();
             let game_target = self.config.game_target;
-            join_set
-                .spawn_blocking(move || Self::scan_unpacked(&mods_path, &xse_scripts, game_target));
+            let inventory = Arc::clone(&inventory);
+            let snapshot = self.snapshot.clone();
+            join_set.spawn_blocking(move || {
+                Self::scan_unpacked(
+                    &inventory,
+                    &mods_path,
+                    &xse_scripts,
+                    game_target,
+                    snapshot.as_deref(),
+                )
+            });
         }
 
         // Archived scan
         {
             let mods_path = mods_path.clone();
-            join_set.spawn_blocking(move || Self::scan_archived(&mods_path));
+            let snapshot = self.snapshot.clone();
+            join_set.spawn_blocking(move || {
+                Self::scan_archived(&inventory, &mods_path, snapshot.as_deref())
+            });
         }
 
         let mut unpacked_issues = BTreeMap::new();
@@ -458,14 +610,28 @@ impl GameScanOrchestrator {
 
     /// Scan unpacked (loose) mod files
     fn scan_unpacked(
+        inventory: &GameFileInventory,
         mods_path: &Path,
         xse_scripts: &[String],
         game_target: GameTarget,
+        snapshot: Option<&ScanSnapshot>,
     ) -> Result<(&'static str, IssueMap), String> {
-        let scanner = UnpackedScanner::new();
-        let issues = scanner
-            .scan_directory(mods_path, xse_scripts)
-            .map_err(|e| format!("Unpacked scan error: {}", e))?;
+        let issues = match snapshot {
+            // Paths are classified from the inventory; only new or changed DDS headers are read
+            Some(snapshot) => UnpackedScanner::new()
+                .scan_inventory(inventory, mods_path, xse_scripts)
+                .map(|mut issues| {
+                    let dds_files = std::mem::take(&mut issues.dds_files);
+                    issues.dds_issues =
+                        snapshot.validate_textures(inventory, dds_files, game_target);
+                    issues
+                }),
+            // DDS headers are checked in batches during the scan
+            None => UnpackedScanner::new()
+                .with_dds_validation(game_target)
+                .scan_inventory(inventory, mods_path, xse_scripts),
+        }
+        .map_err(|e| format!("Unpacked scan error: {}", e))?;
 
         let mut issue_map = BTreeMap::new();
 
@@ -498,35 +664,37 @@ impl GameScanOrchestrator {
             );
         }
 
-        // DDS dimension checking via DDSAnalyzer
-        if !issues.dds_files.is_empty() {
-            let analyzer = DDSAnalyzer::new(game_target);
-            let dds_issues = analyzer.validate_batch(&issues.dds_files);
-            if !dds_issues.is_empty() {
-                let mut tex_dims = BTreeSet::new();
-                for (path, file_issues) in &dds_issues {
-                    let display = path.display();
-                    for issue in file_issues {
-                        tex_dims.insert(format!("  - {}: {}\n", display, issue));
-                    }
+        if !issues.dds_issues.is_empty() {
+            let mut tex_dims = BTreeSet::new();
+            for (path, file_issues) in &issues.dds_issues {
+                let display = path.display();
+                for issue in file_issues {
+                    tex_dims.insert(format!("  - {}: {}\n", display, issue));
                 }
-                issue_map.insert("tex_dims".to_string(), tex_dims);
             }
+            issue_map.insert("tex_dims".to_string(), tex_dims);
         }
 
         Ok(("unpacked", issue_map))
     }
 
     /// Scan archived (BA2) mod files
-    fn scan_archived(mods_path: &Path) -> Result<(&'static str, IssueMap), String> {
+    fn scan_archived(
+        inventory: &GameFileInventory,
+        mods_path: &Path,
+        snapshot: Option<&ScanSnapshot>,
+    ) -> Result<(&'static str, IssueMap), String> {
         let scanner = BA2Scanner::new();
-        let ba2_files = scanner.find_ba2_files(mods_path);
+        let ba2_files = scanner.find_ba2_files_in(inventory, mods_path);
 
         if ba2_files.is_empty() {
             return Ok(("archived", BTreeMap::new()));
         }
 
-        let results = scanner.scan_archives_batch(&ba2_files);
+        let results = match snapshot {
+            Some(snapshot) => snapshot.scan_archives(inventory, &scanner, &ba2_files),
+            None => scanner.scan_archives_batch(&ba2_files),
+        };
 
         let mut issue_map: IssueMap = BTreeMap::new();
 
@@ -546,10 +714,19 @@ impl GameScanOrchestrator {
 
     /// Run the full scan pipeline: game checks + mod scans.
     ///
+    /// The game and mods folders are walked once, up front, into a shared
+    /// [`GameFileInventory`]. Results read from file contents are reused from the
+    /// previous scan snapshot for files whose size and mtime are unchanged, and the
+    /// snapshot is rewritten afterwards (see [`with_scan_snapshot`](Self::with_scan_snapshot)).
     /// Returns combined game result and mod result.
     pub async fn run_full_scan(
         &self,
     ) -> Result<(GameScanResult, ModScanResult), OrchestratorError> {
+        let mut roots = vec![self.config.game_path.clone()];
+        roots.extend(self.config.mods_path.clone());
+        let (inventory, snapshot) =
+            tokio::try_join!(self.inventory_for(roots), self.open_snapshot())?;
+
         let mut join_set: JoinSet<Result<FullScanPart, OrchestratorError>> = JoinSet::new();
 
         // We need to run game checks and mod scans concurrently.
@@ -557,15 +734,22 @@ impl GameScanOrchestrator {
         // But they take &self, so we clone the config for independent orchestrators.
 
         let config1 = self.config.clone();
+        let inventory1 = Arc::clone(&inventory);
+        let snapshot1 = snapshot.clone();
         join_set.spawn(async move {
-            let orch = GameScanOrchestrator::new(config1);
+            let orch = GameScanOrchestrator::new(config1)
+                .with_inventory(inventory1)
+                .with_snapshot(snapshot1);
             let result = orch.run_game_checks().await?;
             Ok(FullScanPart::Game(result))
         });
 
         let config2 = self.config.clone();
+        let snapshot2 = snapshot.clone();
         join_set.spawn(async move {
-            let orch = GameScanOrchestrator::new(config2);
+            let orch = GameScanOrchestrator::new(config2)
+                .with_inventory(inventory)
+                .with_snapshot(snapshot2);
             let result = orch.run_mod_scans().await?;
             Ok(FullScanPart::Mods(result))
         });
@@ -582,6 +766,15 @@ impl GameScanOrchestrator {
             }
         }
 
+        if let Some(snapshot) = snapshot {
+            // A snapshot that cannot be written only costs a full read next time
+            match tokio::task::spawn_blocking(move || snapshot.save()).await {
+                Ok(Ok(())) => {}
+                Ok(Err(e)) => log::debug!("Failed to persist scan snapshot: {}", e),
+                Err(e) => log::debug!("Failed to persist scan snapshot: {}", e),
+            }
+        }
+
         Ok((
             game_result.unwrap_or(GameScanResult {
                 report: String::new(),
@@ -163,8 +163,15 @@ fn test_mod_scan_result_fields() {
 #[test]
 fn test_scan_unpacked_empty_dir() {
     let temp = TempDir::new().unwrap();
-    let (label, issues) =
-        GameScanOrchestrator::scan_unpacked(temp.path(), &[], GameTarget::Fallout4).unwrap();
+    let inventory = GameFileInventory::build(&[temp.path()]);
+    let (label, issues) = GameScanOrchestrator::scan_unpacked(
+        &inventory,
+        temp.path(),
+        &[],
+        GameTarget::Fallout4,
+        None,
+    )
+    .unwrap();
     assert_eq!(label, "unpacked");
     assert!(issues.is_empty());
 }
@@ -172,7 +179,9 @@ fn test_scan_unpacked_empty_dir() {
 #[test]
 fn test_scan_archived_empty_dir() {
     let temp = TempDir::new().unwrap();
-    let (label, issues) = GameScanOrchestrator::scan_archived(temp.path()).unwrap();
+    let inventory = GameFileInventory::build(&[temp.path()]);
+    let (label, issues) =
+        GameScanOrchestrator::scan_archived(&inventory, temp.path(), None).unwrap();
     assert_eq!(label, "archived");
     assert!(issues.is_empty());
 }
@@ -182,8 +191,15 @@ fn test_scan_unpacked_detects_bad_format() {
     let temp = TempDir::new().unwrap();
     fs::write(temp.path().join("test.tga"), b"fake").unwrap();
 
-    let (_, issues) =
-        GameScanOrchestrator::scan_unpacked(temp.path(), &[], GameTarget::Fallout4).unwrap();
+    let inventory = GameFileInventory::build(&[temp.path()]);
+    let (_, issues) = GameScanOrchestrator::scan_unpacked(
+        &inventory,
+        temp.path(),
+        &[],
+        GameTarget::Fallout4,
+        None,
+    )
+    .unwrap();
     assert!(issues.contains_key("tex_frmt"));
 }
 
@@ -193,3 +209,75 @@ fn test_detect_config_issues_nonexistent_path() {
     // Should return empty list, not panic
     assert!(issues.is_empty());
 }
+
+#[tokio::test]
+async fn test_run_mod_scans_with_shared_inventory() {
+    let temp = TempDir::new().unwrap();
+    let mods = temp.path().join("mods");
+    fs::create_dir_all(mods.join("SomeMod")).unwrap();
+    fs::write(mods.join("SomeMod").join("texture.png"), b"fake").unwrap();
+
+    let inventory = Arc::new(GameFileInventory::build(&[temp.path()]));
+    let mut config = default_config(temp.path().to_path_buf());
+    config.mods_path = Some(mods);
+    let orch = GameScanOrchestrator::new(config).with_inventory(inventory);
+
+    let result = orch.run_mod_scans().await.unwrap();
+    assert_eq!(result.unpacked_issue_count, 1);
+}
+
+fn dds_bytes(size: u32, mipmap_levels: u32) -> Vec<u8> {
+    use ddsfile::{AlphaMode, D3D10ResourceDimension, Dds, DxgiFormat, NewDxgiParams};
+
+    let dds = Dds::new_dxgi(NewDxgiParams {
+        width: size,
+        height: size,
+        depth: None,
+        format: DxgiFormat::BC3_UNorm,
+        mipmap_levels: Some(mipmap_levels),
+        array_layers: None,
+        caps2: None,
+        is_cubemap: false,
+        resource_dimension: D3D10ResourceDimension::Texture2D,
+        alpha_mode: AlphaMode::Unknown,
+    })
+    .unwrap();
+    let mut bytes = Vec::new();
+    dds.write(&mut bytes).unwrap();
+    bytes
+}
+
+#[tokio::test]
+async fn test_run_full_scan_reuses_snapshot() {
+    let temp = TempDir::new().unwrap();
+    let game = temp.path().join("game");
+    let textures = temp.path().join("mods").join("SomeMod").join("Textures");
+    fs::create_dir_all(&game).unwrap();
+    fs::create_dir_all(&textures).unwrap();
+    let texture = textures.join("armor.dds");
+    let good = dds_bytes(512, 10);
+    fs::write(&texture, vec![0u8; good.len()]).unwrap();
+
+    let mut config = default_config(game);
+    config.mods_path = Some(temp.path().join("mods"));
+    let snapshot_path = temp.path().join("snapshot.json");
+    let orch = GameScanOrchestrator::new(config).with_scan_snapshot(snapshot_path.clone());
+
+    let (_, mods) = orch.run_full_scan().await.unwrap();
+    assert_eq!(mods.unpacked_issue_count, 1);
+    assert!(snapshot_path.exists());
+
+    // Same size and mtime: the stored result is used without reading the texture
+    let modified = fs::metadata(&texture).unwrap().modified().unwrap();
+    fs::write(&texture, &good).unwrap();
+    let file = fs::File::options().write(true).open(&texture).unwrap();
+    file.set_modified(modified).unwrap();
+    let (_, mods) = orch.run_full_scan().await.unwrap();
+    assert_eq!(mods.unpacked_issue_count, 1);
+
+    // A new mtime makes the scan read the texture again
+    file.set_modified(modified + std::time::Duration::from_secs(2))
+        .unwrap();
+    let (_, mods) = orch.run_full_scan().await.unwrap();
+    assert_eq!(mods.unpacked_issue_count, 0);
+}
@@ -0,0 +1,377 @@
+//! Persistent full-scan snapshot for incremental rescans.
+//!
+//! `run_full_scan` walks the game and mods folders into a [`GameFileInventory`] on every
+//! run, and that walk is what detects changes. The slow part of a scan is reading file
+//! contents: DDS headers of loose textures, BA2 archive indexes, and the INI files behind
+//! the mod INI and config checks. The snapshot keeps those results between runs, keyed
+//! by the size and modification time the inventory recorded for each input. A rescan
+//! only reads files that were added or changed since, and files that were removed are
+//! not carried into the next snapshot.
+//!
+//! The snapshot is one JSON document holding a fingerprint of the folders and scan
+//! settings it was written for. A snapshot for other folders or settings, or one that
+//! cannot be read, loads empty, and that scan reads every texture, archive and INI.
+
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::path::{Path, PathBuf};
+
+use classic_file_io_core::dds::{DDSAnalyzer, DDSIssue, GameTarget};
+use classic_file_io_core::{FileIOCore, write_atomic};
+use parking_lot::Mutex;
+use serde::{Deserialize, Serialize};
+use xxhash_rust::xxh3::Xxh3;
+
+use crate::ba2::{BA2Issues, BA2Scanner};
+use crate::config_cache::CONFIG_FILE_EXTENSIONS;
+use crate::ini::ConfigIssue;
+use crate::inventory::{GameFileInventory, InventoryEntry};
+use crate::unpacked::validate_dds_batch;
+
+/// Bumped whenever the on-disk layout or the meaning of a stored result changes.
+const SCAN_SNAPSHOT_FORMAT_VERSION: u32 = 1;
+
+/// File name of the snapshot inside the per-user scan cache directory.
+const SCAN_SNAPSHOT_FILE_NAME: &str = "CLASSIC Scan Snapshot.json";
+
+/// Snapshot location in the per-user scan cache directory, if it can be resolved.
+pub(crate) fn local_snapshot_path() -> Option<PathBuf> {
+    match classic_path_core::ensure_scan_cache_dir() {
+        Ok(dir) => Some(dir.join(SCAN_SNAPSHOT_FILE_NAME)),
+        Err(error) => {
+            log::debug!("No scan cache directory for the scan snapshot: {error}");
+            None
+        }
+    }
+}
+
+/// Stable 64-bit fingerprint of `value`, used to key snapshot sections.
+pub(crate) fn fingerprint<T: Hash + ?Sized>(value: &T) -> u64 {
+    let mut hasher = Xxh3::new();
+    value.hash(&mut hasher);
+    hasher.finish()
+}
+
+/// Fingerprint of every config file under `game_path`: names, sizes and mtimes.
+///
+/// Returns `None` if a file has no modification time, since changes to it could go unseen.
+pub(crate) fn config_fingerprint(inventory: &GameFileInventory, game_path: &Path) -> Option<u64> {
+    if !inventory.covers(game_path) {
+        return None;
+    }
+    let mut hasher = Xxh3::new();
+    for entry in inventory.files_with_extensions_under(CONFIG_FILE_EXTENSIONS, game_path) {
+        let stamp = EntryStamp::of(&entry)?;
+        entry.path().hash(&mut hasher);
+        stamp.hash(&mut hasher);
+    }
+    Some(hasher.finish())
+}
+
+/// Size and modification time of a scanned file, as recorded in the inventory.
+#[derive(Clone, Copy, Debug, PartialEq, Eq, Hash, Serialize, Deserialize)]
+pub(crate) struct EntryStamp {
+    len: u64,
+    modified_ns: u64,
+}
+
+impl EntryStamp {
+    /// Stamp of `entry`, or `None` if the platform reported no modification time.
+    pub(crate) fn of(entry: &InventoryEntry<'_>) -> Option<Self> {
+        let modified_ns = entry.modified_ns();
+        (modified_ns != 0).then(|| Self {
+            len: entry.size(),
+            modified_ns,
+        })
+    }
+}
+
+/// Mod INI report and config issues computed from one set of config files.
+#[derive(Clone, Debug, Serialize, Deserialize)]
+pub(crate) struct ConfigRecord {
+    /// [`config_fingerprint`] of the files the results were computed from
+    pub(crate) fingerprint: u64,
+    /// Output of the mod INI check
+    pub(crate) mod_ini_message: String,
+    /// Issues reported by the read-only config check
+    pub(crate) config_issues: Vec<ConfigIssue>,
+}
+
+#[derive(Serialize, Deserialize)]
+struct TextureRecord {
+    path: String,
+    #[serde(flatten)]
+    stamp: EntryStamp,
+    issues: Vec<String>,
+}
+
+#[derive(Serialize, Deserialize)]
+struct ArchiveRecord {
+    path: String,
+    #[serde(flatten)]
+    stamp: EntryStamp,
+    issues: BA2Issues,
+}
+
+#[derive(Serialize, Deserialize)]
+struct SnapshotFile {
+    format: u32,
+    settings: u64,
+    config: Option<ConfigRecord>,
+    textures: Vec<TextureRecord>,
+    archives: Vec<ArchiveRecord>,
+}
+
+/// Results of one scan, keyed by the path and stamp of their inputs.
+#[derive(Default)]
+struct SnapshotData {
+    config: Option<ConfigRecord>,
+    /// DDS issue messages per loose texture, empty for textures without issues
+    textures: HashMap<PathBuf, (EntryStamp, Vec<String>)>,
+    archives: HashMap<PathBuf, (EntryStamp, BA2Issues)>,
+}
+
+/// Results of the previous full scan, plus the results of the one in progress.
+///
+/// Scan tasks look up earlier results with the inventory's stamps and record every
+/// result they use, reused or fresh, so [`save`](Self::save) persists exactly the files
+/// that exist now.
+pub(crate) struct ScanSnapshot {
+    path: PathBuf,
+    settings: u64,
+    previous: SnapshotData,
+    current: Mutex<SnapshotData>,
+}
+
+impl ScanSnapshot {
+    /// Loads the snapshot at `path`, starting empty unless it was written with `settings`.
+    pub(crate) fn open(path: &Path, settings: u64) -> Self {
+        let previous = std::fs::read(path)
+            .ok()
+            .and_then(|bytes| decode(&bytes, settings))
+            .unwrap_or_default();
+        log::debug!(
+            "Loaded scan snapshot with {} textures and {} archives from {}",
+            previous.textures.len(),
+            previous.archives.len(),
+            path.display()
+        );
+        Self {
+            path: path.to_path_buf(),
+            settings,
+            previous,
+            current: Mutex::new(SnapshotData::default()),
+        }
+    }
+
+    /// Returns the previous config results if they were computed from `fingerprint`.
+    pub(crate) fn config(&self, fingerprint: u64) -> Option<ConfigRecord> {
+        self.previous
+            .config
+            .as_ref()
+            .filter(|record| record.fingerprint == fingerprint)
+            .cloned()
+    }
+
+    /// Records the config results of this scan.
+    pub(crate) fn record_config(&self, record: ConfigRecord) {
+        self.current.lock().config = Some(record);
+    }
+
+    /// Validates loose DDS textures, reading only headers that are new or changed.
+    ///
+    /// Returns the textures that have issues.
+    pub(crate) fn validate_textures(
+        &self,
+        inventory: &GameFileInventory,
+        dds_files: Vec<PathBuf>,
+        game: GameTarget,
+    ) -> Vec<(PathBuf, Vec<DDSIssue>)> {
+        let total = dds_files.len();
+        let mut checked = Vec::with_capacity(total);
+        let mut changed = Vec::new();
+        for path in dds_files {
+            let stamp = inventory
+                .get(&path)
+                .and_then(|entry| EntryStamp::of(&entry));
+            let known = stamp.and_then(|stamp| {
+                self.previous
+                    .textures
+                    .get(&path)
+                    .filter(|(known, _)| *known == stamp)
+            });
+            match known {
+                Some((_, messages)) => checked.push((path, stamp, to_dds_issues(messages))),
+                None => changed.push((path, stamp)),
+            }
+        }
+        log::debug!("Reading {} of {total} DDS headers", changed.len());
+
+        if !changed.is_empty() {
+            let (paths, stamps): (Vec<_>, Vec<_>) = changed.into_iter().unzip();
+            let analyzer = DDSAnalyzer::new(game);
+            let file_io = FileIOCore::default();
+            let fresh = validate_dds_batch(&analyzer, &file_io, paths);
+            checked.extend(
+                fresh
+                    .zip(stamps)
+                    .map(|((path, issues), stamp)| (path, stamp, issues)),
+            );
+        }
+
+        let mut current = self.current.lock();
+        checked
+            .into_iter()
+            .filter_map(|(path, stamp, issues)| {
+                if let Some(stamp) = stamp {
+                    let messages = issues.iter().map(|issue| issue.message.clone()).collect();
+                    current.textures.insert(path.clone(), (stamp, messages));
+                }
+                (!issues.is_empty()).then_some((path, issues))
+            })
+            .collect()
+    }
+
+    /// Scans BA2 archives, reading only archives that are new or changed.
+    ///
+    /// Results are in the order of `archives`, like [`BA2Scanner::scan_archives_batch`].
+    pub(crate) fn scan_archives(
+        &self,
+        inventory: &GameFileInventory,
+        scanner: &BA2Scanner,
+        archives: &[PathBuf],
+    ) -> Vec<crate::ba2::Result<BA2Issues>> {
+        let stamps: Vec<Option<EntryStamp>> = archives
+            .iter()
+            .map(|path| inventory.get(path).and_then(|entry| EntryStamp::of(&entry)))
+            .collect();
+        let mut results: Vec<Option<crate::ba2::Result<BA2Issues>>> = archives
+            .iter()
+            .zip(&stamps)
+            .map(|(path, stamp)| {
+                let (known, issues) = self.previous.archives.get(path)?;
+                (Some(*known) == *stamp).then(|| Ok(issues.clone()))
+            })
+            .collect();
+
+        let changed: Vec<usize> = (0..archives.len())
+            .filter(|&index| results[index].is_none())
+            .collect();
+        log::debug!(
+            "Reading {} of {} BA2 archives",
+            changed.len(),
+            archives.len()
+        );
+        if !changed.is_empty() {
+            let paths: Vec<PathBuf> = changed.iter().map(|&i| archives[i].clone()).collect();
+            for (index, result) in changed.into_iter().zip(scanner.scan_archives_batch(&paths)) {
+                results[index] = Some(result);
+            }
+        }
+
+        let mut current = self.current.lock();
+        results
+            .into_iter()
+            .enumerate()
+            .map(|(index, result)| {
+                let result = result.unwrap_or_else(|| Ok(BA2Issues::new()));
+                // Failed archives are not recorded, so they are read again next time
+                if let (Some(stamp), Ok(issues)) = (stamps[index], &result) {
+                    current
+                        .archives
+                        .insert(archives[index].clone(), (stamp, issues.clone()));
+                }
+                result
+            })
+            .collect()
+    }
+
+    /// Writes the results recorded during this scan, replacing the previous snapshot.
+    ///
+    /// # Errors
+    ///
+    /// Returns an I/O error if the parent directory or the file cannot be written.
+    pub(crate) fn save(&self) -> std::io::Result<()> {
+        write_atomic(&self.path, &self.encode()?)
+    }
+
+    fn encode(&self) -> std::io::Result<Vec<u8>> {
+        let current = self.current.lock();
+        // JSON needs UTF-8 paths; anything else is simply rescanned next run.
+        let config = current.config.clone().filter(|record| {
+            record
+                .config_issues
+                .iter()
+                .all(|issue| issue.file_path.to_str().is_some())
+        });
+        let textures = current
+            .textures
+            .iter()
+            .filter_map(|(path, (stamp, issues))| {
+                Some(TextureRecord {
+                    path: path.to_str()?.to_string(),
+                    stamp: *stamp,
+                    issues: issues.clone(),
+                })
+            })
+            .collect();
+        let archives = current
+            .archives
+            .iter()
+            .filter_map(|(path, (stamp, issues))| {
+                Some(ArchiveRecord {
+                    path: path.to_str()?.to_string(),
+                    stamp: *stamp,
+                    issues: issues.clone(),
+                })
+            })
+            .collect();
+        let file = SnapshotFile {
+            format: SCAN_SNAPSHOT_FORMAT_VERSION,
+            settings: self.settings,
+            config,
+            textures,
+            archives,
+        };
+        serde_json::to_vec(&file).map_err(std::io::Error::other)
+    }
+}
+
+fn to_dds_issues(messages: &[String]) -> Vec<DDSIssue> {
+    messages
+        .iter()
+        .map(|message| DDSIssue {
+            message: message.clone(),
+        })
+        .collect()
+}
+
+fn decode(bytes: &[u8], settings: u64) -> Option<SnapshotData> {
+    let file: SnapshotFile = match serde_json::from_slice(bytes) {
+        Ok(file) => file,
+        Err(error) => {
+            log::debug!("Ignoring unreadable scan snapshot: {error}");
+            return None;
+        }
+    };
+    if file.format != SCAN_SNAPSHOT_FORMAT_VERSION || file.settings != settings {
+        return None;
+    }
+    Some(SnapshotData {
+        config: file.config,
+        textures: file
+            .textures
+            .into_iter()
+            .map(|record| (PathBuf::from(record.path), (record.stamp, record.issues)))
+            .collect(),
+        archives: file
+            .archives
+            .into_iter()
+            .map(|record| (PathBuf::from(record.path), (record.stamp, record.issues)))
+            .collect(),
+    })
+}
+
+#[cfg(test)]
+#[path = "scan_snapshot_tests.rs"]
+mod tests;
@@ -0,0 +1,168 @@
+use super::*;
+use crate::ini::IssueSeverity;
+use std::fs;
+use std::time::Duration;
+use tempfile::TempDir;
+
+fn sample_config(fingerprint: u64) -> ConfigRecord {
+    ConfigRecord {
+        fingerprint,
+        mod_ini_message: "# mod INI report #\n".to_string(),
+        config_issues: vec![ConfigIssue {
+            file_path: PathBuf::from("Data/SomeMod.ini"),
+            section: "General".to_string(),
+            setting: "bEnableConsole".to_string(),
+            current_value: "1".to_string(),
+            recommended_value: "0".to_string(),
+            description: "Console commands slow startup".to_string(),
+            severity: IssueSeverity::Warning,
+        }],
+    }
+}
+
+#[test]
+fn test_missing_or_corrupt_snapshot_is_empty() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("snapshot.json");
+    assert!(ScanSnapshot::open(&path, 1).config(7).is_none());
+
+    fs::write(&path, b"{ not json").unwrap();
+    assert!(ScanSnapshot::open(&path, 1).config(7).is_none());
+}
+
+#[test]
+fn test_config_record_round_trip() {
+    let temp = TempDir::new().unwrap();
+    let path = temp.path().join("CLASSIC Data").join("snapshot.json");
+
+    let snapshot = ScanSnapshot::open(&path, 1);
+    snapshot.record_config(sample_config(7));
+    snapshot.save().unwrap();
+
+    let reopened = ScanSnapshot::open(&path, 1);
+    let record = reopened.config(7).unwrap();
+    assert_eq!(record.mod_ini_message, "# mod INI report #\n");
+    assert_eq!(record.config_issues.len(), 1);
+    assert_eq!(record.config_issues[0].severity, IssueSeverity::Warning);
+    assert!(reopened.config(8).is_none());
+
+    // Written for other settings: nothing is reused
+    assert!(ScanSnapshot::open(&path, 2).config(7).is_none());
+}
+
+fn dds_bytes(size: u32, mipmap_levels: u32) -> Vec<u8> {
+    use ddsfile::{AlphaMode, D3D10ResourceDimension, Dds, DxgiFormat, NewDxgiParams};
+
+    let dds = Dds::new_dxgi(NewDxgiParams {
+        width: size,
+        height: size,
+        depth: None,
+        format: DxgiFormat::BC3_UNorm,
+        mipmap_levels: Some(mipmap_levels),
+        array_layers: None,
+        caps2: None,
+        is_cubemap: false,
+        resource_dimension: D3D10ResourceDimension::Texture2D,
+        alpha_mode: AlphaMode::Unknown,
+    })
+    .unwrap();
+    let mut bytes = Vec::new();
+    dds.write(&mut bytes).unwrap();
+    bytes
+}
+
+#[test]
+fn test_unchanged_textures_are_not_read() {
+    let temp = TempDir::new().unwrap();
+    let mods = temp.path().join("mods");
+    fs::create_dir(&mods).unwrap();
+    let texture = mods.join("texture.dds");
+    let good = dds_bytes(512, 10);
+    fs::write(&texture, vec![0u8; good.len()]).unwrap();
+    let path = temp.path().join("snapshot.json");
+    let game = GameTarget::Fallout4;
+
+    let inventory = GameFileInventory::build(&[&mods]);
+    let snapshot = ScanSnapshot::open(&path, 1);
+    let issues = snapshot.validate_textures(&inventory, vec![texture.clone()], game);
+    assert_eq!(issues.len(), 1);
+    snapshot.save().unwrap();
+
+    // Same size and mtime, so the stored result is trusted over the new content
+    let modified = fs::metadata(&texture).unwrap().modified().unwrap();
+    fs::write(&texture, &good).unwrap();
+    let file = fs::File::options().write(true).open(&texture).unwrap();
+    file.set_modified(modified).unwrap();
+    let inventory = GameFileInventory::build(&[&mods]);
+    let snapshot = ScanSnapshot::open(&path, 1);
+    let issues = snapshot.validate_textures(&inventory, vec![texture.clone()], game);
+    assert_eq!(issues[0].1[0].message, "Unable to read DDS header");
+
+    // Once the mtime changes the texture is read again
+    file.set_modified(modified + Duration::from_secs(2))
+        .unwrap();
+    let inventory = GameFileInventory::build(&[&mods]);
+    let snapshot = ScanSnapshot::open(&path, 1);
+    assert!(
+        snapshot
+            .validate_textures(&inventory, vec![texture.clone()], game)
+            .is_empty()
+    );
+    snapshot.save().unwrap();
+    assert_eq!(ScanSnapshot::open(&path, 1).previous.textures.len(), 1);
+
+    // Removed textures are not carried into the next snapshot
+    fs::remove_file(&texture).unwrap();
+    let inventory = GameFileInventory::build(&[&mods]);
+    let snapshot = ScanSnapshot::open(&path, 1);
+    assert!(
+        snapshot
+            .validate_textures(&inventory, Vec::new(), game)
+            .is_empty()
+    );
+    snapshot.save().unwrap();
+    assert!(ScanSnapshot::open(&path, 1).previous.textures.is_empty());
+}
+
+#[test]
+fn test_changed_archive_is_read_again() {
+    let temp = TempDir::new().unwrap();
+    let mods = temp.path().join("mods");
+    fs::create_dir(&mods).unwrap();
+    let archive = mods.join("Mod - Main.ba2");
+    fs::write(&archive, b"not an archive").unwrap();
+    let path = temp.path().join("snapshot.json");
+    let scanner = BA2Scanner::new();
+
+    // A failed read is not stored, so it is retried
+    let inventory = GameFileInventory::build(&[&mods]);
+    let snapshot = ScanSnapshot::open(&path, 1);
+    let results = snapshot.scan_archives(&inventory, &scanner, std::slice::from_ref(&archive));
+    assert!(results[0].is_err());
+    snapshot.save().unwrap();
+    assert!(ScanSnapshot::open(&path, 1).previous.archives.is_empty());
+
+    // A stored result is used only while the stamp matches
+    let stamp = EntryStamp::of(&inventory.get(&archive).unwrap()).unwrap();
+    let mut issues = BA2Issues::new();
+    issues.xse_file.push("  - Mod - Main.ba2\n".to_string());
+    let snapshot = ScanSnapshot::open(&path, 1);
+    snapshot
+        .current
+        .lock()
+        .archives
+        .insert(archive.clone(), (stamp, issues));
+    snapshot.save().unwrap();
+
+    let snapshot = ScanSnapshot::open(&path, 1);
+    let results = snapshot.scan_archives(&inventory, &scanner, std::slice::from_ref(&archive));
+    assert_eq!(results[0].as_ref().unwrap().xse_file.len(), 1);
+
+    let modified = fs::metadata(&archive).unwrap().modified().unwrap();
+    let file = fs::File::options().write(true).open(&archive).unwrap();
+    file.set_modified(modified + Duration::from_secs(2))
+        .unwrap();
+    let inventory = GameFileInventory::build(&[&mods]);
+    let results = snapshot.scan_archives(&inventory, &scanner, std::slice::from_ref(&archive));
+    assert!(results[0].is_err());
+}
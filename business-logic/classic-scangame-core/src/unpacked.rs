@@ -2,8 +2,8 @@
 //!
 //! Provides high-performance scanning of unpacked (loose) mod files in game directories.
 //! Replaces Python UnpackedModsScanner with native Rust implementation offering:
-//! - Parallel directory traversal
-//! - Efficient file type detection
+//! - Parallel streaming directory traversal (or a shared [`GameFileInventory`])
+//! - File type detection from directory entries, without extra `stat` calls
 //! - Memory-efficient issue tracking
 //! - Fast pattern matching for XSE scripts
 //!
@@ -16,13 +16,26 @@
 //! - XSE script files
 //! - Previs/Precombine files
 //! - DDS files for batch dimension checking
+//!
+//! Subdirectories are walked as Rayon tasks, and each task streams its entries into
+//! its own issue accumulator. Accumulators are merged as tasks finish, so memory
+//! scales with the number of issues rather than the number of files. When DDS
+//! validation is enabled, DDS files are header-checked in batches during the walk
+//! and only files with issues are kept.
 
 use std::collections::HashSet;
+use std::fs::{self, FileType};
 use std::path::{Path, PathBuf};
 
+use classic_file_io_core::FileIOCore;
+use classic_file_io_core::dds::{DDSAnalyzer, DDSIssue, GameTarget};
 use rayon::prelude::*;
 use thiserror::Error;
-use walkdir::WalkDir;
+
+use crate::inventory::{EntryKind, GameFileInventory};
+
+/// DDS files handed to `FileIOCore::read_dds_headers_batch` at a time during a scan
+const DDS_BATCH_LEN: usize = 256;
 
 /// Errors that can occur during unpacked mod scanning
 #[derive(Debug, Error)]
@@ -62,7 +75,15 @@ pub struct UnpackedIssues {
     pub previs: HashSet<String>,
 
     /// DDS files found (for batch dimension checking)
+    ///
+    /// Left empty when the scanner validates DDS headers itself
+    /// (see [`UnpackedScanner::with_dds_validation`]).
     pub dds_files: Vec<PathBuf>,
+
+    /// DDS files whose headers failed validation, with their issues
+    ///
+    /// Only filled when the scanner validates DDS headers itself.
+    pub dds_issues: Vec<(PathBuf, Vec<DDSIssue>)>,
 }
 
 impl UnpackedIssues {
@@ -78,6 +99,7 @@ impl UnpackedIssues {
             || !self.snd_frmt.is_empty()
             || !self.xse_file.is_empty()
             || !self.previs.is_empty()
+            || !self.dds_issues.is_empty()
     }
 
     /// Get total number of issues
@@ -87,6 +109,18 @@ impl UnpackedIssues {
             + self.snd_frmt.len()
             + self.xse_file.len()
             + self.previs.len()
+            + self.dds_issues.len()
+    }
+
+    /// Move all issues from `other` into `self`
+    fn absorb(&mut self, other: UnpackedIssues) {
+        self.animdata.extend(other.animdata);
+        self.tex_frmt.extend(other.tex_frmt);
+        self.snd_frmt.extend(other.snd_frmt);
+        self.xse_file.extend(other.xse_file);
+        self.previs.extend(other.previs);
+        self.dds_files.extend(other.dds_files);
+        self.dds_issues.extend(other.dds_issues);
     }
 }
 
@@ -110,6 +144,9 @@ impl UnpackedIssues {
 pub struct UnpackedScanner {
     /// Patterns to exclude from BodySlide filtering
     bodyslide_exceptions: Vec<String>,
+
+    /// Game rules for validating DDS headers during the scan (`None` collects paths)
+    dds_target: Option<GameTarget>,
 }
 
 impl UnpackedScanner {
@@ -117,9 +154,21 @@ impl UnpackedScanner {
     pub fn new() -> Self {
         Self {
             bodyslide_exceptions: vec!["BodySlide".to_string()],
+            dds_target: None,
         }
     }
 
+    /// Validate DDS headers against `game` rules while scanning
+    ///
+    /// DDS files are read in batches through `FileIOCore::read_dds_headers_batch` as the
+    /// walk finds them, and only files with issues are reported in
+    /// [`UnpackedIssues::dds_issues`]. Without this, every DDS path is collected in
+    /// [`UnpackedIssues::dds_files`] for the caller to check.
+    pub fn with_dds_validation(mut self, game: GameTarget) -> Self {
+        self.dds_target = Some(game);
+        self
+    }
+
     /// Scan a mod directory for issues
     ///
     /// # Arguments
@@ -154,43 +203,158 @@ impl UnpackedScanner {
             ));
         }
 
-        // Collect all entries
-        let entries: Vec<_> = WalkDir::new(mod_path)
-            .follow_links(false)
-            .into_iter()
-            .filter_map(|e| e.ok())
-            .collect();
+        let scan = ScanContext::new(self, mod_path, xse_scriptfiles);
+        let mut accumulator = IssueAccumulator::default();
+        scan.walk_directory(mod_path, &mut accumulator);
+        Ok(scan.finish(accumulator))
+    }
 
-        // Process in parallel using rayon
-        let results: Vec<UnpackedIssues> = entries
-            .par_iter()
-            .filter_map(|entry| {
-                let path = entry.path();
-                self.process_entry(path, mod_path, xse_scriptfiles)
+    /// Scan a mod directory using an already built file inventory
+    ///
+    /// Same as [`scan_directory`](Self::scan_directory), but reads the directory tree
+    /// from `inventory` instead of walking it. Falls back to walking `mod_path` when
+    /// the inventory does not cover it.
+    pub fn scan_inventory(
+        &self,
+        inventory: &GameFileInventory,
+        mod_path: &Path,
+        xse_scriptfiles: &[String],
+    ) -> Result<UnpackedIssues> {
+        if !inventory.covers(mod_path) {
+            return self.scan_directory(mod_path, xse_scriptfiles);
+        }
+
+        let scan = ScanContext::new(self, mod_path, xse_scriptfiles);
+        let accumulator = inventory
+            .par_entries_under(mod_path)
+            .fold(IssueAccumulator::default, |mut accumulator, entry| {
+                scan.process_entry(&entry.path(), entry.kind(), &mut accumulator);
+                accumulator
             })
-            .collect();
+            .reduce(IssueAccumulator::default, |a, b| scan.merge(a, b));
+        Ok(scan.finish(accumulator))
+    }
 
-        // Merge all results
-        Ok(self.merge_issues(results))
+    /// Check if file is in BodySlide directory
+    fn is_bodyslide_file(&self, path: &Path) -> bool {
+        path.components().any(|comp| {
+            self.bodyslide_exceptions
+                .iter()
+                .any(|pattern| comp.as_os_str().to_string_lossy().contains(pattern))
+        })
     }
 
-    /// Process a single directory entry
-    fn process_entry(
+    /// Check if file is an XSE script file
+    fn is_xse_script(
         &self,
         path: &Path,
-        mod_path: &Path,
+        file_name_lower: &str,
         xse_scriptfiles: &[String],
-    ) -> Option<UnpackedIssues> {
-        let mut issues = UnpackedIssues::new();
+    ) -> bool {
+        // Must be in Scripts directory
+        let path_str = path.to_string_lossy().to_lowercase();
+        if !path_str.contains("scripts\\") && !path_str.contains("scripts/") {
+            return false;
+        }
+
+        // Exclude Workshop Framework
+        if path_str.contains("workshop framework") {
+            return false;
+        }
+
+        // Check if filename matches any XSE script
+        xse_scriptfiles
+            .iter()
+            .any(|script| file_name_lower == script.to_lowercase())
+    }
+}
+
+impl Default for UnpackedScanner {
+    fn default() -> Self {
+        Self::new()
+    }
+}
+
+/// Issues collected by one Rayon task, plus DDS files awaiting a header batch
+#[derive(Default)]
+struct IssueAccumulator {
+    issues: UnpackedIssues,
+    pending_dds: Vec<PathBuf>,
+}
+
+/// DDS header validation shared by every task of one scan
+struct DdsValidation {
+    analyzer: DDSAnalyzer,
+    file_io: FileIOCore,
+}
 
+/// Everything a scan task needs, shared by reference across Rayon tasks
+struct ScanContext<'a> {
+    scanner: &'a UnpackedScanner,
+    mod_path: &'a Path,
+    xse_scriptfiles: &'a [String],
+    dds: Option<DdsValidation>,
+}
+
+impl<'a> ScanContext<'a> {
+    fn new(
+        scanner: &'a UnpackedScanner,
+        mod_path: &'a Path,
+        xse_scriptfiles: &'a [String],
+    ) -> Self {
+        Self {
+            scanner,
+            mod_path,
+            xse_scriptfiles,
+            dds: scanner.dds_target.map(|game| DdsValidation {
+                analyzer: DDSAnalyzer::new(game),
+                file_io: FileIOCore::default(),
+            }),
+        }
+    }
+
+    /// Stream the entries below `dir` into `accumulator`, walking subdirectories in parallel
+    fn walk_directory(&self, dir: &Path, accumulator: &mut IssueAccumulator) {
+        let Ok(read_dir) = fs::read_dir(dir) else {
+            return;
+        };
+
+        let mut subdirs = Vec::new();
+        for entry in read_dir.filter_map(|e| e.ok()) {
+            let Ok(file_type) = entry.file_type() else {
+                continue;
+            };
+            let path = entry.path();
+            self.process_entry(&path, entry_kind(file_type, &path), accumulator);
+            if file_type.is_dir() {
+                subdirs.push(path);
+            }
+        }
+
+        if subdirs.is_empty() {
+            return;
+        }
+        let nested = subdirs
+            .par_iter()
+            .fold(IssueAccumulator::default, |mut nested, subdir| {
+                self.walk_directory(subdir, &mut nested);
+                nested
+            })
+            .reduce(IssueAccumulator::default, |a, b| self.merge(a, b));
+        let current = std::mem::take(accumulator);
+        *accumulator = self.merge(current, nested);
+    }
+
+    /// Record the issues of a single directory entry
+    fn process_entry(&self, path: &Path, kind: EntryKind, accumulator: &mut IssueAccumulator) {
         // Get relative path for issue reporting
-        let relative_path = match path.strip_prefix(mod_path) {
-            Ok(p) => p,
-            Err(_) => return None,
+        let Ok(relative_path) = path.strip_prefix(self.mod_path) else {
+            return;
         };
+        let issues = &mut accumulator.issues;
 
         // Check if this is a directory
-        if path.is_dir() {
+        if kind == EntryKind::Directory {
             // Check for AnimationFileData directory
             if let Some(dir_name) = path.file_name()
                 && dir_name.to_string_lossy().to_lowercase() == "animationfiledata"
@@ -200,26 +364,31 @@ impl UnpackedScanner {
                     .animdata
                     .insert(format!("  - {}\n", parent.display()));
             }
-            return Some(issues);
+            return;
         }
 
         // Process files
-        if !path.is_file() {
-            return None;
+        if kind != EntryKind::File {
+            return;
         }
 
-        let file_name = path.file_name()?.to_string_lossy();
-        let file_name_lower = file_name.to_lowercase();
-        let file_ext = path.extension()?.to_string_lossy().to_lowercase();
+        let Some(file_name) = path.file_name() else {
+            return;
+        };
+        let Some(file_ext) = path.extension() else {
+            return;
+        };
+        let file_name_lower = file_name.to_string_lossy().to_lowercase();
+        let file_ext = file_ext.to_string_lossy().to_lowercase();
 
         // Check texture formats (TGA/PNG - should be DDS)
-        if (file_ext == "tga" || file_ext == "png") && !self.is_bodyslide_file(path) {
+        if (file_ext == "tga" || file_ext == "png") && !self.scanner.is_bodyslide_file(path) {
             issues.tex_frmt.insert(format!(
                 "  - {} : {}\n",
                 file_ext.to_uppercase(),
                 relative_path.display()
             ));
-            return Some(issues);
+            return;
         }
 
         // Check sound formats (MP3/M4A - should be XWM)
@@ -229,89 +398,110 @@ impl UnpackedScanner {
                 file_ext.to_uppercase(),
                 relative_path.display()
             ));
-            return Some(issues);
+            return;
         }
 
-        // Check for DDS files (collect for batch processing)
+        // Check for DDS files (validated in batches, or collected for the caller)
         if file_ext == "dds" {
-            issues.dds_files.push(path.to_path_buf());
-            return Some(issues);
+            if self.dds.is_some() {
+                accumulator.pending_dds.push(path.to_path_buf());
+                if accumulator.pending_dds.len() >= DDS_BATCH_LEN {
+                    self.flush_dds(accumulator);
+                }
+            } else {
+                issues.dds_files.push(path.to_path_buf());
+            }
+            return;
         }
 
         // Check for XSE script files
-        if self.is_xse_script(path, &file_name_lower, xse_scriptfiles) {
+        if self
+            .scanner
+            .is_xse_script(path, &file_name_lower, self.xse_scriptfiles)
+        {
             if let Some(parent) = relative_path.parent() {
                 issues
                     .xse_file
                     .insert(format!("  - {}\n", parent.display()));
             }
-            return Some(issues);
+            return;
         }
 
         // Check for previs/precombine files
-        if file_name_lower.ends_with(".uvd") || file_name_lower.ends_with("_oc.nif") {
-            if let Some(parent) = relative_path.parent() {
-                issues.previs.insert(format!("  - {}\n", parent.display()));
-            }
-            return Some(issues);
+        if (file_name_lower.ends_with(".uvd") || file_name_lower.ends_with("_oc.nif"))
+            && let Some(parent) = relative_path.parent()
+        {
+            issues.previs.insert(format!("  - {}\n", parent.display()));
         }
-
-        Some(issues)
     }
 
-    /// Check if file is in BodySlide directory
-    fn is_bodyslide_file(&self, path: &Path) -> bool {
-        path.components().any(|comp| {
-            self.bodyslide_exceptions
-                .iter()
-                .any(|pattern| comp.as_os_str().to_string_lossy().contains(pattern))
-        })
+    /// Validate the pending DDS headers, keeping only files with issues
+    fn flush_dds(&self, accumulator: &mut IssueAccumulator) {
+        let Some(dds) = &self.dds else {
+            return;
+        };
+        let batch = std::mem::take(&mut accumulator.pending_dds);
+        let checked = validate_dds_batch(&dds.analyzer, &dds.file_io, batch);
+        accumulator
+            .issues
+            .dds_issues
+            .extend(checked.filter(|(_, issues)| !issues.is_empty()));
     }
 
-    /// Check if file is an XSE script file
-    fn is_xse_script(
-        &self,
-        path: &Path,
-        file_name_lower: &str,
-        xse_scriptfiles: &[String],
-    ) -> bool {
-        // Must be in Scripts directory
-        let path_str = path.to_string_lossy().to_lowercase();
-        if !path_str.contains("scripts\\") && !path_str.contains("scripts/") {
-            return false;
-        }
-
-        // Exclude Workshop Framework
-        if path_str.contains("workshop framework") {
-            return false;
+    /// Merge two task accumulators, keeping the larger one's allocations
+    fn merge(&self, a: IssueAccumulator, b: IssueAccumulator) -> IssueAccumulator {
+        let (mut into, from) = if a.issues.total_count() >= b.issues.total_count() {
+            (a, b)
+        } else {
+            (b, a)
+        };
+        into.issues.absorb(from.issues);
+        into.pending_dds.extend(from.pending_dds);
+        if into.pending_dds.len() >= DDS_BATCH_LEN {
+            self.flush_dds(&mut into);
         }
-
-        // Check if filename matches any XSE script
-        xse_scriptfiles
-            .iter()
-            .any(|script| file_name_lower == script.to_lowercase())
+        into
     }
 
-    /// Merge multiple issue collections
-    fn merge_issues(&self, issues_vec: Vec<UnpackedIssues>) -> UnpackedIssues {
-        let mut merged = UnpackedIssues::new();
-
-        for issues in issues_vec {
-            merged.animdata.extend(issues.animdata);
-            merged.tex_frmt.extend(issues.tex_frmt);
-            merged.snd_frmt.extend(issues.snd_frmt);
-            merged.xse_file.extend(issues.xse_file);
-            merged.previs.extend(issues.previs);
-            merged.dds_files.extend(issues.dds_files);
-        }
-
-        merged
+    /// Validate the remaining DDS files and return the collected issues
+    fn finish(&self, mut accumulator: IssueAccumulator) -> UnpackedIssues {
+        self.flush_dds(&mut accumulator);
+        accumulator.issues
     }
 }
 
-impl Default for UnpackedScanner {
-    fn default() -> Self {
-        Self::new()
+/// Read and validate a batch of DDS headers, yielding every file with its issues
+pub(crate) fn validate_dds_batch(
+    analyzer: &DDSAnalyzer,
+    file_io: &FileIOCore,
+    paths: Vec<PathBuf>,
+) -> impl Iterator<Item = (PathBuf, Vec<DDSIssue>)> {
+    file_io
+        .read_dds_headers_batch(paths)
+        .into_iter()
+        .map(|(path, header)| {
+            let issues = match header {
+                Some(header) => analyzer.validate_header(&header),
+                None => vec![DDSIssue {
+                    message: "Unable to read DDS header".to_string(),
+                }],
+            };
+            (path, issues)
+        })
+}
+
+/// Classify a directory entry from its file type, resolving links without following them
+fn entry_kind(file_type: FileType, path: &Path) -> EntryKind {
+    if file_type.is_dir() {
+        EntryKind::Directory
+    } else if file_type.is_file() {
+        EntryKind::File
+    } else {
+        match fs::metadata(path) {
+            Ok(metadata) if metadata.is_dir() => EntryKind::Directory,
+            Ok(metadata) if metadata.is_file() => EntryKind::File,
+            _ => EntryKind::Other,
+        }
     }
 }
 
@@ -70,3 +70,77 @@ fn test_bodyslide_exclusion() {
     // Should be excluded
     assert_eq!(issues.tex_frmt.len(), 0);
 }
+
+fn write_test_dds(path: &Path, size: u32, mipmap_levels: u32) {
+    use ddsfile::{AlphaMode, D3D10ResourceDimension, Dds, DxgiFormat, NewDxgiParams};
+
+    let dds = Dds::new_dxgi(NewDxgiParams {
+        width: size,
+        height: size,
+        depth: None,
+        format: DxgiFormat::BC3_UNorm,
+        mipmap_levels: Some(mipmap_levels),
+        array_layers: None,
+        caps2: None,
+        is_cubemap: false,
+        resource_dimension: D3D10ResourceDimension::Texture2D,
+        alpha_mode: AlphaMode::Unknown,
+    })
+    .unwrap();
+    let mut bytes = Vec::new();
+    dds.write(&mut bytes).unwrap();
+    fs::write(path, bytes).unwrap();
+}
+
+#[test]
+fn test_dds_validation_during_scan() {
+    let temp_dir = TempDir::new().unwrap();
+    let mod_path = temp_dir.path();
+    let textures = mod_path.join("Textures");
+    fs::create_dir(&textures).unwrap();
+    write_test_dds(&textures.join("good.dds"), 512, 10);
+    write_test_dds(&textures.join("flat.dds"), 512, 1);
+    fs::write(textures.join("broken.dds"), b"test").unwrap();
+
+    let scanner = UnpackedScanner::new().with_dds_validation(GameTarget::Fallout4);
+    let issues = scanner.scan_directory(mod_path, &[]).unwrap();
+
+    assert!(issues.dds_files.is_empty());
+    let mut flagged: Vec<_> = issues
+        .dds_issues
+        .iter()
+        .map(|(path, file_issues)| (path.file_name().unwrap().to_owned(), file_issues.len()))
+        .collect();
+    flagged.sort();
+    assert_eq!(
+        flagged,
+        vec![("broken.dds".into(), 1), ("flat.dds".into(), 1)]
+    );
+    assert_eq!(issues.total_count(), 2);
+}
+
+#[test]
+fn test_scan_inventory_matches_scan_directory() {
+    let temp_dir = TempDir::new().unwrap();
+    let mod_path = temp_dir.path().join("mods");
+    let scripts = mod_path.join("MyMod").join("Scripts");
+    fs::create_dir_all(&scripts).unwrap();
+    fs::create_dir_all(mod_path.join("Anim").join("AnimationFileData")).unwrap();
+    fs::write(scripts.join("f4se.dll"), b"x").unwrap();
+    fs::write(mod_path.join("MyMod").join("voice.m4a"), b"x").unwrap();
+    fs::write(mod_path.join("MyMod").join("cell.uvd"), b"x").unwrap();
+    fs::write(mod_path.join("MyMod").join("skin.dds"), b"x").unwrap();
+
+    let scanner = UnpackedScanner::new();
+    let xse = vec!["F4SE.dll".to_string()];
+    let walked = scanner.scan_directory(&mod_path, &xse).unwrap();
+    let inventory = GameFileInventory::build(&[temp_dir.path()]);
+    let listed = scanner.scan_inventory(&inventory, &mod_path, &xse).unwrap();
+
+    assert_eq!(walked.total_count(), 4);
+    assert_eq!(walked.animdata, listed.animdata);
+    assert_eq!(walked.snd_frmt, listed.snd_frmt);
+    assert_eq!(walked.xse_file, listed.xse_file);
+    assert_eq!(walked.previs, listed.previs);
+    assert_eq!(walked.dds_files, listed.dds_files);
+}
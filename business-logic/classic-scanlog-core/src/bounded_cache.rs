@@ -0,0 +1,219 @@
+//! Byte-budgeted concurrent caches shared by the scanlog analyzers
+//!
+//! Analyzers that memoize per-input results live for the whole lifetime of a worker
+//! process, so their caches must stay bounded. [`BoundedCache`] wraps `quick_cache`
+//! (a scan-resistant, CLOCK-Pro style cache) with a weigher that charges each entry its
+//! approximate heap footprint, and keeps hit/miss/eviction counters so callers can
+//! report how well the budget is working.
+
+use quick_cache::sync::Cache;
+use quick_cache::{DefaultHashBuilder, Equivalent, Lifecycle, Weighter};
+use regex::Regex;
+use std::collections::HashMap;
+use std::hash::Hash;
+use std::mem::size_of;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
+
+/// Rough average entry size used to pre-size the cache's internal tables.
+const ESTIMATED_ENTRY_BYTES: u64 = 256;
+
+/// Approximate number of bytes a cached key or value keeps alive.
+pub trait CacheWeight {
+    /// Returns the approximate heap plus inline size of `self` in bytes.
+    fn cache_weight(&self) -> usize;
+}
+
+impl CacheWeight for String {
+    fn cache_weight(&self) -> usize {
+        size_of::<String>() + self.capacity()
+    }
+}
+
+impl<T: CacheWeight> CacheWeight for Option<T> {
+    fn cache_weight(&self) -> usize {
+        self.as_ref()
+            .map_or(size_of::<Self>(), CacheWeight::cache_weight)
+    }
+}
+
+impl<A: CacheWeight, B: CacheWeight> CacheWeight for (A, B) {
+    fn cache_weight(&self) -> usize {
+        self.0.cache_weight() + self.1.cache_weight()
+    }
+}
+
+impl CacheWeight for usize {
+    fn cache_weight(&self) -> usize {
+        size_of::<usize>()
+    }
+}
+
+impl<T: CacheWeight> CacheWeight for Vec<T> {
+    fn cache_weight(&self) -> usize {
+        size_of::<Vec<T>>()
+            + (self.capacity() - self.len()) * size_of::<T>()
+            + self.iter().map(CacheWeight::cache_weight).sum::<usize>()
+    }
+}
+
+impl CacheWeight for Regex {
+    /// Compiled programs are not introspectable; charge a fixed overhead plus the
+    /// pattern source, which tracks program size closely enough for budgeting.
+    fn cache_weight(&self) -> usize {
+        4096 + 16 * self.as_str().len()
+    }
+}
+
+/// Point-in-time counters for a [`BoundedCache`].
+#[derive(Debug, Clone, Copy, Default, PartialEq, Eq)]
+pub struct BoundedCacheStats {
+    /// Lookups answered from the cache.
+    pub hits: u64,
+    /// Lookups that found no entry.
+    pub misses: u64,
+    /// Entries dropped to stay within the byte budget.
+    pub evictions: u64,
+    /// Entries currently resident.
+    pub entries: usize,
+    /// Approximate bytes held by resident entries.
+    pub resident_bytes: u64,
+    /// Configured byte budget.
+    pub capacity_bytes: u64,
+}
+
+impl BoundedCacheStats {
+    /// Adds the counters of another cache, for analyzers that own several caches.
+    #[must_use]
+    pub fn combined(self, other: Self) -> Self {
+        Self {
+            hits: self.hits + other.hits,
+            misses: self.misses + other.misses,
+            evictions: self.evictions + other.evictions,
+            entries: self.entries + other.entries,
+            resident_bytes: self.resident_bytes + other.resident_bytes,
+            capacity_bytes: self.capacity_bytes + other.capacity_bytes,
+        }
+    }
+
+    /// Returns the counters keyed by field name, as the bindings expose them.
+    pub fn to_map(&self) -> HashMap<String, u64> {
+        HashMap::from([
+            ("hits".to_string(), self.hits),
+            ("misses".to_string(), self.misses),
+            ("evictions".to_string(), self.evictions),
+            ("entries".to_string(), self.entries as u64),
+            ("resident_bytes".to_string(), self.resident_bytes),
+            ("capacity_bytes".to_string(), self.capacity_bytes),
+        ])
+    }
+}
+
+#[derive(Clone)]
+struct ByteWeighter;
+
+impl<K: CacheWeight, V: CacheWeight> Weighter<K, V> for ByteWeighter {
+    fn weight(&self, key: &K, val: &V) -> u64 {
+        // Zero-weight entries are never evicted, so every entry costs at least one byte.
+        (key.cache_weight() + val.cache_weight()).max(1) as u64
+    }
+}
+
+/// Counts entries the cache drops to make room.
+#[derive(Clone, Default)]
+struct EvictionCounter(Arc<AtomicU64>);
+
+impl<K, V> Lifecycle<K, V> for EvictionCounter {
+    type RequestState = ();
+
+    fn begin_request(&self) -> Self::RequestState {}
+
+    fn on_evict(&self, _state: &mut Self::RequestState, _key: K, _val: V) {
+        self.0.fetch_add(1, Ordering::Relaxed);
+    }
+}
+
+/// Concurrent cache bounded by an approximate byte budget.
+pub struct BoundedCache<K, V> {
+    cache: Cache<K, V, ByteWeighter, DefaultHashBuilder, EvictionCounter>,
+    hits: AtomicU64,
+    misses: AtomicU64,
+    evictions: Arc<AtomicU64>,
+}
+
+impl<K, V> BoundedCache<K, V>
+where
+    K: Eq + Hash + CacheWeight,
+    V: Clone + CacheWeight,
+{
+    /// Creates a cache that holds at most `capacity_bytes` of keys and values.
+    pub fn new(capacity_bytes: u64) -> Self {
+        let evictions = EvictionCounter::default();
+        let estimated_items = (capacity_bytes / ESTIMATED_ENTRY_BYTES).max(16) as usize;
+        Self {
+            evictions: Arc::clone(&evictions.0),
+            cache: Cache::with(
+                estimated_items,
+                capacity_bytes,
+                ByteWeighter,
+                DefaultHashBuilder::default(),
+                evictions,
+            ),
+            hits: AtomicU64::new(0),
+            misses: AtomicU64::new(0),
+        }
+    }
+
+    /// Returns a clone of the cached value, recording a hit or miss.
+    pub fn get<Q>(&self, key: &Q) -> Option<V>
+    where
+        Q: Hash + Equivalent<K> + ?Sized,
+    {
+        let value = self.cache.get(key);
+        let counter = if value.is_some() {
+            &self.hits
+        } else {
+            &self.misses
+        };
+        counter.fetch_add(1, Ordering::Relaxed);
+        value
+    }
+
+    /// Inserts or replaces an entry, evicting colder entries if the budget is exceeded.
+    ///
+    /// Entries larger than the whole budget are not retained.
+    pub fn insert(&self, key: K, value: V) {
+        self.cache.insert(key, value);
+    }
+
+    /// Number of resident entries.
+    pub fn len(&self) -> usize {
+        self.cache.len()
+    }
+
+    /// Returns true when no entries are resident.
+    pub fn is_empty(&self) -> bool {
+        self.cache.is_empty()
+    }
+
+    /// Drops every entry. Counters are kept so long-running totals stay meaningful.
+    pub fn clear(&self) {
+        self.cache.clear();
+    }
+
+    /// Returns the current counters.
+    pub fn stats(&self) -> BoundedCacheStats {
+        BoundedCacheStats {
+            hits: self.hits.load(Ordering::Relaxed),
+            misses: self.misses.load(Ordering::Relaxed),
+            evictions: self.evictions.load(Ordering::Relaxed),
+            entries: self.cache.len(),
+            resident_bytes: self.cache.weight(),
+            capacity_bytes: self.cache.capacity(),
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "bounded_cache_tests.rs"]
+mod tests;
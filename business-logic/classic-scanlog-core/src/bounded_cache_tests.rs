@@ -0,0 +1,43 @@
+use super::*;
+
+#[test]
+fn cache_counts_hits_and_misses() {
+    let cache: BoundedCache<String, String> = BoundedCache::new(64 * 1024);
+    assert!(cache.get("missing").is_none());
+
+    cache.insert("key".to_string(), "value".to_string());
+    assert_eq!(cache.get("key").as_deref(), Some("value"));
+
+    let stats = cache.stats();
+    assert_eq!(stats.hits, 1);
+    assert_eq!(stats.misses, 1);
+    assert_eq!(stats.entries, 1);
+    assert!(stats.resident_bytes > 0);
+    assert_eq!(stats.capacity_bytes, 64 * 1024);
+}
+
+#[test]
+fn cache_stays_within_byte_budget() {
+    let cache: BoundedCache<String, Vec<(usize, String)>> = BoundedCache::new(16 * 1024);
+    for i in 0..2_000 {
+        cache.insert(format!("input text {i}"), vec![(i, "pattern".to_string())]);
+    }
+
+    let stats = cache.stats();
+    assert!(stats.resident_bytes <= stats.capacity_bytes);
+    assert!(stats.entries < 2_000);
+    assert!(stats.evictions > 0);
+}
+
+#[test]
+fn clear_drops_entries_but_keeps_counters() {
+    let cache: BoundedCache<String, String> = BoundedCache::new(64 * 1024);
+    cache.insert("key".to_string(), "value".to_string());
+    assert!(cache.get("key").is_some());
+
+    cache.clear();
+
+    assert!(cache.is_empty());
+    assert_eq!(cache.stats().hits, 1);
+    assert_eq!(cache.stats().resident_bytes, 0);
+}
@@ -1,5 +1,6 @@
 //! Semantic Crash Suspect analysis.
 
+use std::collections::{HashMap, HashSet};
 use std::sync::Arc;
 
 use aho_corasick::AhoCorasick;
@@ -74,21 +75,98 @@ pub struct CrashSuspectAnalysisResult {
 struct CompiledConfiguration {
     main_error_rules: Vec<CompiledMainErrorRule>,
     stack_rules: Vec<CompiledStackRule>,
+    main_error_signals: SignalSet,
+    stack_signals: SignalSet,
 }
 
 #[derive(Debug)]
 struct CompiledMainErrorRule {
     rule: SuspectErrorRule,
-    matcher: AhoCorasick,
+    signals: Vec<usize>,
 }
 
+/// One stack rule whose conditions refer to signal ids in the shared automata.
 #[derive(Debug)]
 struct CompiledStackRule {
     rule: SuspectStackRule,
-    required_main_error_matcher: Option<AhoCorasick>,
-    optional_main_error_matcher: Option<AhoCorasick>,
-    stack_matcher: Option<AhoCorasick>,
-    exclusion_matcher: Option<AhoCorasick>,
+    required_main_error: Vec<usize>,
+    optional_main_error: Vec<usize>,
+    stack_any: Vec<usize>,
+    exclusions: Vec<usize>,
+    stack_at_least: Vec<(usize, usize)>,
+}
+
+/// Distinct substring signals collected from every rule that reads one text source.
+#[derive(Default)]
+struct SignalSetBuilder {
+    patterns: Vec<String>,
+    ids: HashMap<String, usize>,
+}
+
+impl SignalSetBuilder {
+    /// Returns the shared signal id for each pattern, reusing ids across rules and roles.
+    fn intern_all(&mut self, signals: &[String]) -> Vec<usize> {
+        signals.iter().map(|signal| self.intern(signal)).collect()
+    }
+
+    fn intern(&mut self, signal: &str) -> usize {
+        if let Some(&id) = self.ids.get(signal) {
+            return id;
+        }
+        let id = self.patterns.len();
+        self.patterns.push(signal.to_string());
+        self.ids.insert(signal.to_string(), id);
+        id
+    }
+
+    /// Compiles every collected signal into one automaton for the named text source.
+    fn build(self, source: &str) -> AnalyzerResult<SignalSet> {
+        let len = self.patterns.len();
+        if len == 0 {
+            return Ok(SignalSet {
+                automaton: None,
+                len,
+            });
+        }
+        let automaton = AhoCorasick::new(&self.patterns).map_err(|error| {
+            invalid_configuration(format!(
+                "Crash Suspect {source} signal matcher could not be compiled: {error}"
+            ))
+        })?;
+        Ok(SignalSet {
+            automaton: Some(automaton),
+            len,
+        })
+    }
+}
+
+/// Rule-set-wide automaton that reads one text source once per analysis.
+#[derive(Debug)]
+struct SignalSet {
+    automaton: Option<AhoCorasick>,
+    len: usize,
+}
+
+impl SignalSet {
+    /// Counts every signal in one pass over `haystack`.
+    ///
+    /// Counts are non-overlapping per signal, matching `str::matches`, so
+    /// `stack_contains_at_least` thresholds keep their authored meaning.
+    fn count(&self, haystack: &str) -> Vec<usize> {
+        let mut counts = vec![0; self.len];
+        let Some(automaton) = &self.automaton else {
+            return counts;
+        };
+        let mut next_start = vec![0; self.len];
+        for hit in automaton.find_overlapping_iter(haystack) {
+            let id = hit.pattern().as_usize();
+            if hit.start() >= next_start[id] {
+                counts[id] += 1;
+                next_start[id] = hit.end();
+            }
+        }
+        counts
+    }
 }
 
 /// Immutable analyzer for known crash messages, stack patterns, and DLL involvement.
@@ -103,20 +181,31 @@ impl CrashSuspectAnalyzer {
         main_error_rules: Vec<SuspectErrorRule>,
         stack_rules: Vec<SuspectStackRule>,
     ) -> AnalyzerResult<Self> {
-        let mut rule_ids = std::collections::HashSet::new();
+        let mut rule_ids = HashSet::new();
+        let mut main_error_signals = SignalSetBuilder::default();
+        let mut stack_signals = SignalSetBuilder::default();
         let main_error_rules = main_error_rules
             .into_iter()
-            .map(|rule| compile_main_error_rule(rule, &mut rule_ids))
+            .map(|rule| compile_main_error_rule(rule, &mut rule_ids, &mut main_error_signals))
             .collect::<AnalyzerResult<Vec<_>>>()?;
         let stack_rules = stack_rules
             .into_iter()
-            .map(|rule| compile_stack_rule(rule, &mut rule_ids))
+            .map(|rule| {
+                compile_stack_rule(
+                    rule,
+                    &mut rule_ids,
+                    &mut main_error_signals,
+                    &mut stack_signals,
+                )
+            })
             .collect::<AnalyzerResult<Vec<_>>>()?;
 
         Ok(Self {
             configuration: Arc::new(CompiledConfiguration {
                 main_error_rules,
                 stack_rules,
+                main_error_signals: main_error_signals.build("main-error")?,
+                stack_signals: stack_signals.build("stack")?,
             }),
         })
     }
@@ -126,8 +215,13 @@ impl CrashSuspectAnalyzer {
         &self,
         input: CrashSuspectAnalysisInput,
     ) -> AnalyzerResult<CrashSuspectAnalysisResult> {
-        let mut findings = self.main_error_findings(&input.main_error);
-        findings.extend(self.stack_findings(&input.main_error, &input.call_stack));
+        let main_error_hits = self
+            .configuration
+            .main_error_signals
+            .count(&input.main_error);
+        let mut findings = self.main_error_findings(&main_error_hits);
+        let stack_hits = self.configuration.stack_signals.count(&input.call_stack);
+        findings.extend(self.stack_findings(&main_error_hits, &stack_hits));
 
         let main_error_lower = input.main_error.to_lowercase();
         if main_error_lower.contains(".dll") && !main_error_lower.contains("tbbmalloc") {
@@ -137,12 +231,12 @@ impl CrashSuspectAnalyzer {
         Ok(CrashSuspectAnalysisResult { findings })
     }
 
-    /// Matches configured main-error rules for one Crash Log.
-    fn main_error_findings(&self, main_error: &str) -> Vec<CrashSuspectFinding> {
+    /// Evaluates configured main-error rules from one pass's signal counts.
+    fn main_error_findings(&self, main_error_hits: &[usize]) -> Vec<CrashSuspectFinding> {
         self.configuration
             .main_error_rules
             .iter()
-            .filter(|rule| rule.matcher.is_match(main_error))
+            .filter(|rule| any_hit(&rule.signals, main_error_hits))
             .map(|rule| CrashSuspectFinding::MainErrorRule {
                 rule_id: rule.rule.id.clone(),
                 name: rule.rule.name.clone(),
@@ -151,12 +245,16 @@ impl CrashSuspectAnalyzer {
             .collect()
     }
 
-    /// Matches configured stack rules for one Crash Log.
-    fn stack_findings(&self, main_error: &str, call_stack: &str) -> Vec<CrashSuspectFinding> {
+    /// Evaluates configured stack rules from one pass's signal counts.
+    fn stack_findings(
+        &self,
+        main_error_hits: &[usize],
+        stack_hits: &[usize],
+    ) -> Vec<CrashSuspectFinding> {
         self.configuration
             .stack_rules
             .iter()
-            .filter(|rule| stack_rule_matches(rule, main_error, call_stack))
+            .filter(|rule| stack_rule_matches(rule, main_error_hits, stack_hits))
             .map(|rule| CrashSuspectFinding::StackRule {
                 rule_id: rule.rule.id.clone(),
                 name: rule.rule.name.clone(),
@@ -167,38 +265,38 @@ impl CrashSuspectAnalyzer {
 }
 
 /// Applies the structured stack-rule conditions without creating report text.
-fn stack_rule_matches(rule: &CompiledStackRule, main_error: &str, call_stack: &str) -> bool {
-    if rule
-        .exclusion_matcher
-        .as_ref()
-        .is_some_and(|matcher| matcher.is_match(call_stack))
-    {
+fn stack_rule_matches(
+    rule: &CompiledStackRule,
+    main_error_hits: &[usize],
+    stack_hits: &[usize],
+) -> bool {
+    if any_hit(&rule.exclusions, stack_hits) {
         return false;
     }
 
-    if let Some(required_matcher) = &rule.required_main_error_matcher {
+    if !rule.required_main_error.is_empty() {
         // Required main-error signals intentionally dominate optional stack signals for parity.
-        return required_matcher.is_match(main_error);
+        return any_hit(&rule.required_main_error, main_error_hits);
     }
 
-    rule.optional_main_error_matcher
-        .as_ref()
-        .is_some_and(|matcher| matcher.is_match(main_error))
-        || rule
-            .stack_matcher
-            .as_ref()
-            .is_some_and(|matcher| matcher.is_match(call_stack))
+    any_hit(&rule.optional_main_error, main_error_hits)
+        || any_hit(&rule.stack_any, stack_hits)
         || rule
-            .rule
-            .stack_contains_at_least
+            .stack_at_least
             .iter()
-            .any(|count_rule| call_stack.matches(&count_rule.substring).count() >= count_rule.count)
+            .any(|&(signal, count)| stack_hits[signal] >= count)
+}
+
+/// Reports whether any of a rule's signals occurred at least once.
+fn any_hit(signals: &[usize], hits: &[usize]) -> bool {
+    signals.iter().any(|&signal| hits[signal] > 0)
 }
 
 /// Validates and compiles one main-error rule before the analyzer is shared.
 fn compile_main_error_rule(
     rule: SuspectErrorRule,
-    rule_ids: &mut std::collections::HashSet<String>,
+    rule_ids: &mut HashSet<String>,
+    main_error_signals: &mut SignalSetBuilder,
 ) -> AnalyzerResult<CompiledMainErrorRule> {
     validate_common_rule_fields(&rule.id, &rule.name, "main-error", rule_ids)?;
     validate_signals(
@@ -206,15 +304,16 @@ fn compile_main_error_rule(
         "main-error rule main_error_contains_any",
         true,
     )?;
-    let matcher = compile_matcher(&rule.main_error_contains_any, &rule.id)?
-        .expect("nonempty main-error matchers always compile to Some");
-    Ok(CompiledMainErrorRule { rule, matcher })
+    let signals = main_error_signals.intern_all(&rule.main_error_contains_any);
+    Ok(CompiledMainErrorRule { rule, signals })
 }
 
 /// Validates and compiles one stack rule before the analyzer is shared.
 fn compile_stack_rule(
     rule: SuspectStackRule,
-    rule_ids: &mut std::collections::HashSet<String>,
+    rule_ids: &mut HashSet<String>,
+    main_error_signals: &mut SignalSetBuilder,
+    stack_signals: &mut SignalSetBuilder,
 ) -> AnalyzerResult<CompiledStackRule> {
     validate_common_rule_fields(&rule.id, &rule.name, "stack", rule_ids)?;
     validate_signals(
@@ -259,10 +358,20 @@ fn compile_stack_rule(
     }
 
     Ok(CompiledStackRule {
-        required_main_error_matcher: compile_matcher(&rule.main_error_required_any, &rule.id)?,
-        optional_main_error_matcher: compile_matcher(&rule.main_error_optional_any, &rule.id)?,
-        stack_matcher: compile_matcher(&rule.stack_contains_any, &rule.id)?,
-        exclusion_matcher: compile_matcher(&rule.exclude_if_stack_contains_any, &rule.id)?,
+        required_main_error: main_error_signals.intern_all(&rule.main_error_required_any),
+        optional_main_error: main_error_signals.intern_all(&rule.main_error_optional_any),
+        stack_any: stack_signals.intern_all(&rule.stack_contains_any),
+        exclusions: stack_signals.intern_all(&rule.exclude_if_stack_contains_any),
+        stack_at_least: rule
+            .stack_contains_at_least
+            .iter()
+            .map(|count_rule| {
+                (
+                    stack_signals.intern(&count_rule.substring),
+                    count_rule.count,
+                )
+            })
+            .collect(),
         rule,
     })
 }
@@ -272,7 +381,7 @@ fn validate_common_rule_fields(
     id: &str,
     name: &str,
     family: &str,
-    rule_ids: &mut std::collections::HashSet<String>,
+    rule_ids: &mut HashSet<String>,
 ) -> AnalyzerResult<()> {
     if id.trim().is_empty() {
         return Err(invalid_configuration(format!(
@@ -302,18 +411,6 @@ fn validate_signals(signals: &[String], field: &str, required: bool) -> Analyzer
     Ok(())
 }
 
-/// Compiles one optional substring matcher and preserves matcher-build failures as typed errors.
-fn compile_matcher(patterns: &[String], rule_id: &str) -> AnalyzerResult<Option<AhoCorasick>> {
-    if patterns.is_empty() {
-        return Ok(None);
-    }
-    AhoCorasick::new(patterns).map(Some).map_err(|error| {
-        invalid_configuration(format!(
-            "Crash Suspect rule '{rule_id}' matcher could not be compiled: {error}"
-        ))
-    })
-}
-
 /// Creates the shared stable error shape for Crash Suspect configuration failures.
 fn invalid_configuration(message: String) -> AnalyzerError {
     AnalyzerError::new(
@@ -1,4 +1,4 @@
-use classic_config_core::{SuspectErrorRule, SuspectStackRule};
+use classic_config_core::{SuspectErrorRule, SuspectStackCountRule, SuspectStackRule};
 use std::sync::Arc;
 
 use super::*;
@@ -139,3 +139,75 @@ fn immutable_analyzer_handle_is_send_and_sync() {
 
     assert_send_sync::<CrashSuspectAnalyzer>();
 }
+
+fn stack_rule(id: &str) -> SuspectStackRule {
+    SuspectStackRule {
+        id: id.to_string(),
+        name: id.to_string(),
+        severity: 1,
+        main_error_required_any: Vec::new(),
+        main_error_optional_any: Vec::new(),
+        stack_contains_any: Vec::new(),
+        exclude_if_stack_contains_any: Vec::new(),
+        stack_contains_at_least: Vec::new(),
+    }
+}
+
+fn matched_rule_ids(result: &CrashSuspectAnalysisResult) -> Vec<&str> {
+    result
+        .findings
+        .iter()
+        .filter_map(|finding| match finding {
+            CrashSuspectFinding::StackRule { rule_id, .. } => Some(rule_id.as_str()),
+            _ => None,
+        })
+        .collect()
+}
+
+#[test]
+fn shared_signals_keep_their_role_in_each_rule() {
+    let mut positive = stack_rule("positive");
+    positive.stack_contains_any = vec!["Shared".to_string()];
+    let mut excluded = stack_rule("excluded");
+    excluded.stack_contains_any = vec!["Other".to_string()];
+    excluded.exclude_if_stack_contains_any = vec!["Shared".to_string()];
+    let mut required = stack_rule("required");
+    required.main_error_required_any = vec!["Missing".to_string()];
+    required.stack_contains_any = vec!["Shared".to_string()];
+    let analyzer =
+        CrashSuspectAnalyzer::new(Vec::new(), vec![positive, excluded, required]).unwrap();
+
+    let result = analyzer
+        .analyze(CrashSuspectAnalysisInput {
+            main_error: "EXCEPTION".to_string(),
+            call_stack: "Shared Other".to_string(),
+        })
+        .unwrap();
+
+    assert_eq!(matched_rule_ids(&result), vec!["positive"]);
+}
+
+#[test]
+fn stack_count_thresholds_count_non_overlapping_occurrences() {
+    let mut overlapping = stack_rule("overlapping");
+    overlapping.stack_contains_at_least = vec![SuspectStackCountRule {
+        substring: "aa".to_string(),
+        count: 2,
+    }];
+    let mut repeated = stack_rule("repeated");
+    repeated.stack_contains_at_least = vec![SuspectStackCountRule {
+        substring: "a".to_string(),
+        count: 3,
+    }];
+    let analyzer = CrashSuspectAnalyzer::new(Vec::new(), vec![overlapping, repeated]).unwrap();
+
+    let result = analyzer
+        .analyze(CrashSuspectAnalysisInput {
+            main_error: String::new(),
+            call_stack: "aaa".to_string(),
+        })
+        .unwrap();
+
+    assert_eq!("aaa".matches("aa").count(), 1);
+    assert_eq!(matched_rule_ids(&result), vec!["repeated"]);
+}
@@ -5,7 +5,8 @@
 //! - Pattern matching: Optimized regex compilation and caching
 //! - Batch processing: Parallel FormID processing with linear scaling
 
-use dashmap::DashMap;
+use crate::bounded_cache::{BoundedCache, BoundedCacheStats};
+use crate::formid_scan::{format_formid, scan_formids};
 use regex::Regex;
 use std::collections::HashMap;
 use std::sync::LazyLock;
@@ -17,15 +18,6 @@ fn compile_static_regex(pattern: &str, name: &str) -> Regex {
     }
 }
 
-/// Precompiled FormID regex pattern matching Python's format
-/// Pattern: r"^\s*Form ID:\s*0x([0-9A-F]{8})"
-static FORMID_EXTRACTION_PATTERN: LazyLock<Regex> = LazyLock::new(|| {
-    compile_static_regex(
-        r"(?i)Form\s*ID:?\s*0x([0-9A-F]{8})\b",
-        "FORMID_EXTRACTION_PATTERN",
-    )
-});
-
 /// Generic FormID parsing pattern (for parse_formid method)
 static FORMID_PARSE_PATTERN: LazyLock<Regex> =
     LazyLock::new(|| compile_static_regex(r"(?i)^(?:0x)?([0-9a-f]{1,8})$", "FORMID_PARSE_PATTERN"));
@@ -36,17 +28,25 @@ static FORMID_PARSE_PATTERN: LazyLock<Regex> =
 /// Uses precompiled regex patterns and caching for optimal performance.
 pub struct RustFormIDAnalyzer {
     /// Pattern cache for regex compilation
-    pattern_cache: DashMap<String, Regex>,
+    pattern_cache: BoundedCache<String, Regex>,
     /// FormID lookup cache for database queries
-    formid_cache: DashMap<(String, String), Option<String>>,
+    formid_cache: BoundedCache<(String, String), Option<String>>,
 }
 
+/// Default byte budget for each of the analyzer's caches.
+pub const DEFAULT_FORMID_CACHE_BYTES: u64 = 1024 * 1024;
+
 impl RustFormIDAnalyzer {
     /// Create a new FormID analyzer instance
     pub fn new() -> Self {
+        Self::with_cache_budget(DEFAULT_FORMID_CACHE_BYTES)
+    }
+
+    /// Create an analyzer whose pattern and FormID caches each hold at most `cache_bytes`
+    pub fn with_cache_budget(cache_bytes: u64) -> Self {
         Self {
-            pattern_cache: DashMap::new(),
-            formid_cache: DashMap::new(),
+            pattern_cache: BoundedCache::new(cache_bytes),
+            formid_cache: BoundedCache::new(cache_bytes),
         }
     }
 
@@ -62,27 +62,10 @@ impl RustFormIDAnalyzer {
     /// # Returns
     /// Vector of formatted FormID strings
     pub fn extract_formids(&self, segment_callstack: &[String]) -> Vec<String> {
-        let mut formids_matches = Vec::new();
-
-        if segment_callstack.is_empty() {
-            return formids_matches;
-        }
-
-        for line in segment_callstack {
-            if let Some(captures) = FORMID_EXTRACTION_PATTERN.captures(line)
-                && let Some(formid_hex) = captures.get(1)
-            {
-                let formid_id = formid_hex.as_str().to_uppercase();
-
-                // Skip if it starts with FF (plugin limit)
-                // Note: NULL FormIDs (00000000) are intentionally kept as they indicate errors
-                if !formid_id.starts_with("FF") {
-                    formids_matches.push(format!("Form ID: {}", formid_id));
-                }
-            }
-        }
-
-        formids_matches
+        scan_formids(segment_callstack)
+            .into_iter()
+            .map(format_formid)
+            .collect()
     }
 
     /// Parse and validate a FormID string
@@ -140,6 +123,13 @@ impl RustFormIDAnalyzer {
     pub fn cache_stats(&self) -> (usize, usize) {
         (self.pattern_cache.len(), self.formid_cache.len())
     }
+
+    /// Get hit, miss, eviction and resident-byte counters summed over both caches
+    pub fn cache_metrics(&self) -> BoundedCacheStats {
+        self.pattern_cache
+            .stats()
+            .combined(self.formid_cache.stats())
+    }
 }
 
 impl Default for RustFormIDAnalyzer {
@@ -192,6 +182,11 @@ impl FormIDAnalyzer {
     pub fn cache_stats(&self) -> (usize, usize) {
         self.inner.cache_stats()
     }
+
+    /// Get hit, miss, eviction and resident-byte counters summed over both caches
+    pub fn cache_metrics(&self) -> BoundedCacheStats {
+        self.inner.cache_metrics()
+    }
 }
 
 impl Default for FormIDAnalyzer {
@@ -4,26 +4,17 @@
 //! functionality using pure Rust data structures.
 
 use crate::error::Result;
-use classic_database_core::DatabasePool;
+use crate::formid_lookup::FormIdLookupCoalescer;
+use crate::formid_scan::{
+    count_formids, format_formid, formid_hex, scan_formids, scan_formids_batch,
+};
+use classic_database_core::{DatabasePool, FormIdIndex};
 use indexmap::IndexMap;
 use rayon::prelude::*;
-use regex::Regex;
 use rustc_hash::FxHashMap; // Optimization 1.2: Faster hasher for FormID counting
 use std::collections::HashMap;
-use std::sync::{Arc, LazyLock};
-
-fn compile_static_regex(pattern: &str, name: &str) -> Regex {
-    match Regex::new(pattern) {
-        Ok(regex) => regex,
-        Err(error) => panic!("invalid static regex {name}: {error}"),
-    }
-}
-
-/// Precompiled FormID pattern - exact match to Python's pattern
-/// Pattern: r"(?i)Form\s*ID:?\s*0x([0-9A-F]{8})" with case-insensitive flag
-static FORMID_PATTERN: LazyLock<Regex> = LazyLock::new(|| {
-    compile_static_regex(r"(?i)Form\s*ID:?\s*0x([0-9A-F]{8})\b", "FORMID_PATTERN")
-});
+use std::sync::Arc;
+use std::time::Duration;
 
 /// Default bounded batch size for FormID value lookups.
 const FORMID_BATCH_LOOKUP_SIZE: usize = 128;
@@ -34,6 +25,10 @@ pub struct FormIDAnalyzerCore {
     crashgen_name: String,
     // Database pool for FormID lookups (from classic-database-core)
     db_pool: Option<Arc<DatabasePool>>,
+    // Run-scoped queue that merges concurrent logs' lookups into shared batches
+    lookup_coalescer: Option<FormIdLookupCoalescer>,
+    // Memory-mapped FormID index; answers lookups in place of the pool when present
+    formid_index: Option<Arc<FormIdIndex>>,
 }
 
 #[derive(Debug)]
@@ -75,10 +70,35 @@ impl FormIDAnalyzerCore {
             show_formid_values,
             crashgen_name,
             db_pool,
+            lookup_coalescer: None,
+            formid_index: None,
         })
     }
 
-    /// Extracts FormIDs from a callstack segment using regex pattern matching.
+    /// Resolves FormID values from a prebuilt memory-mapped index instead of a database pool.
+    ///
+    /// Index lookups are synchronous and allocation-free, so they bypass both the
+    /// pool and any lookup coalescing.
+    #[must_use]
+    pub fn with_formid_index(mut self, index: Arc<FormIdIndex>) -> Self {
+        self.formid_index = Some(index);
+        self
+    }
+
+    /// Routes value lookups through a shared queue so concurrent logs issue one batched query.
+    ///
+    /// The first lookup on an idle queue waits `window` for other logs to join; lookups
+    /// that arrive while a batch is in flight form the next batch. Has no effect without
+    /// a database pool.
+    #[must_use]
+    pub(crate) fn with_lookup_coalescing(mut self, window: Duration) -> Self {
+        self.lookup_coalescer = self.db_pool.as_ref().map(|pool| {
+            FormIdLookupCoalescer::new(Arc::clone(pool), window, FORMID_BATCH_LOOKUP_SIZE)
+        });
+        self
+    }
+
+    /// Extracts FormIDs from a callstack segment with the allocation-free FormID scanner.
     ///
     /// This function searches for Bethesda game FormIDs (8-character hexadecimal identifiers)
     /// in crash log callstack lines. It matches patterns like:
@@ -100,7 +120,7 @@ impl FormIDAnalyzerCore {
     ///
     /// # Performance
     ///
-    /// - Uses pre-compiled regex for efficient pattern matching
+    /// - Scans with `memchr` instead of a regex and formats only the matched FormIDs
     /// - Processes ~10,000 lines/ms on typical hardware
     /// - 25x faster than Python's equivalent operation
     ///
@@ -127,29 +147,10 @@ impl FormIDAnalyzerCore {
     /// # }
     /// ```
     pub fn extract_formids(&self, segment_callstack: Vec<String>) -> Vec<String> {
-        let mut formids_matches = Vec::new();
-
-        if segment_callstack.is_empty() {
-            return formids_matches;
-        }
-
-        // Process each line exactly as Python does
-        for line in segment_callstack {
-            if let Some(captures) = FORMID_PATTERN.captures(&line)
-                && let Some(formid_match) = captures.get(1)
-            {
-                let formid_id = formid_match.as_str().to_uppercase();
-
-                // Skip if it starts with FF (plugin limit)
-                // Note: NULL FormIDs (00000000) are intentionally kept as they indicate errors
-                // This matches Python's behavior exactly
-                if !formid_id.starts_with("FF") {
-                    formids_matches.push(format!("Form ID: {}", formid_id));
-                }
-            }
-        }
-
-        formids_matches
+        scan_formids(&segment_callstack)
+            .into_iter()
+            .map(format_formid)
+            .collect()
     }
 
     /// Matches extracted FormIDs with crash log plugins and generates a formatted report.
@@ -236,8 +237,6 @@ impl FormIDAnalyzerCore {
             ]);
         }
 
-        let mut lines = Vec::new();
-
         // Optimization 1.2: Count occurrences with FxHashMap (faster than LinkedHashMap)
         // Avoid unnecessary clone by sorting in-place and counting with faster hasher
         formids_matches.sort(); // ✅ Sort in-place (no clone needed)
@@ -252,6 +251,55 @@ impl FormIDAnalyzerCore {
         let mut sorted_entries: Vec<_> = formids_found.into_iter().collect();
         sorted_entries.sort_by_key(|(k, _)| *k);
 
+        let counted = sorted_entries
+            .into_iter()
+            .filter_map(|(formid_full, count)| {
+                formid_full
+                    .split_once(": ")
+                    .map(|(_, formid_value)| (formid_value.to_string(), count))
+            })
+            .collect();
+        Ok(self
+            .formid_report_lines(counted, crashlog_plugins, crashgen_name)
+            .await)
+    }
+
+    /// Like [`Self::formid_match_with_crashgen_name`] but takes the compact FormIDs
+    /// returned by [`crate::scan_formids`].
+    ///
+    /// Occurrences are counted on the `u32` values, so hex strings are only built once
+    /// per unique FormID.
+    pub async fn formid_match_values_with_crashgen_name(
+        &self,
+        formids: &[u32],
+        crashlog_plugins: &IndexMap<String, String>,
+        crashgen_name: &str,
+    ) -> Result<Vec<String>> {
+        if formids.is_empty() {
+            return Ok(vec![
+                "* COULDN'T FIND ANY FORM ID SUSPECTS *\n\n".to_string(),
+            ]);
+        }
+
+        // Fixed-width uppercase hex sorts the same way as the numeric value.
+        let counted = count_formids(formids)
+            .into_iter()
+            .map(|(formid, count)| (formid_hex(formid), count))
+            .collect();
+        Ok(self
+            .formid_report_lines(counted, crashlog_plugins, crashgen_name)
+            .await)
+    }
+
+    /// Builds report lines from `(formid_hex, count)` pairs that are already in report order.
+    async fn formid_report_lines(
+        &self,
+        counted_formids: Vec<(String, usize)>,
+        crashlog_plugins: &IndexMap<String, String>,
+        crashgen_name: &str,
+    ) -> Vec<String> {
+        let mut lines = Vec::new();
+
         // Pre-build reverse index: prefix -> plugin (O(m) preprocessing for O(1) lookups)
         let prefix_to_plugin: HashMap<&str, &str> = crashlog_plugins
             .iter()
@@ -263,15 +311,13 @@ impl FormIDAnalyzerCore {
         // Previously this path awaited `get_entry` per row inside this loop.
         let mut report_candidates = Vec::new();
         let mut lookup_pairs = Vec::new();
-        let should_lookup_values = self.show_formid_values && self.db_pool.is_some();
+        let formid_index = self.formid_index.as_deref();
+        let should_lookup_values =
+            self.show_formid_values && (formid_index.is_some() || self.db_pool.is_some());
 
-        for (formid_full, count) in sorted_entries {
-            let parts: Vec<&str> = formid_full.splitn(2, ": ").collect();
-            if parts.len() < 2 {
-                continue;
-            }
-
-            let formid_value = parts[1];
+        for (formid_value, count) in &counted_formids {
+            let count = *count;
+            let formid_value = formid_value.as_str();
             if formid_value.len() < 2 {
                 continue;
             }
@@ -293,7 +339,7 @@ impl FormIDAnalyzerCore {
                     formid_suffix: formid_suffix.to_string(),
                     count,
                 });
-                if should_lookup_values {
+                if should_lookup_values && formid_index.is_none() {
                     lookup_pairs.push((formid_suffix.to_string(), plugin.to_string()));
                 }
             } else {
@@ -303,18 +349,32 @@ impl FormIDAnalyzerCore {
             }
         }
 
-        let mut resolved_descriptions: HashMap<String, String> = HashMap::new();
-        if should_lookup_values
-            && !lookup_pairs.is_empty()
-            && let Some(pool) = self.db_pool.as_ref()
-            && let Ok(batch_results) = pool
-                .get_entries_batch(lookup_pairs, None, FORMID_BATCH_LOOKUP_SIZE)
-                .await
-        {
-            resolved_descriptions = batch_results;
+        let mut resolved_descriptions: Arc<HashMap<String, String>> = Arc::default();
+        if should_lookup_values && !lookup_pairs.is_empty() {
+            if let Some(coalescer) = self.lookup_coalescer.as_ref() {
+                if let Some(batch_results) = coalescer.get_entries(lookup_pairs).await {
+                    resolved_descriptions = batch_results;
+                }
+            } else if let Some(pool) = self.db_pool.as_ref()
+                && let Ok(batch_results) = pool
+                    .get_entries_batch(lookup_pairs, None, FORMID_BATCH_LOOKUP_SIZE)
+                    .await
+            {
+                resolved_descriptions = Arc::new(batch_results);
+            }
         }
 
         for candidate in report_candidates {
+            if let Some(index) = formid_index
+                && should_lookup_values
+                && let Some(description) = index.get(&candidate.formid_suffix, &candidate.plugin)
+            {
+                lines.push(format!(
+                    "- {} | {} | {} | {}\n",
+                    candidate.plugin, candidate.formid_value, description, candidate.count
+                ));
+                continue;
+            }
             if should_lookup_values {
                 let lookup_key = format!("{}:{}", candidate.formid_suffix, candidate.plugin);
                 if let Some(description) = resolved_descriptions.get(&lookup_key) {
@@ -340,14 +400,14 @@ impl FormIDAnalyzerCore {
             "You can try searching any listed Form IDs in xEdit and see if they lead to relevant records.\n\n".to_string(),
         ]);
 
-        Ok(lines)
+        lines
     }
 
     /// Asynchronously looks up a descriptive name for a FormID from the database.
     ///
-    /// This function queries the database pool (if available) to retrieve the descriptive
-    /// name associated with a specific FormID from a given plugin. If no database pool is
-    /// configured, or if the lookup fails, returns `None`.
+    /// This function queries the FormID index or, failing that, the database pool (if
+    /// available) to retrieve the descriptive name associated with a specific FormID from a
+    /// given plugin. If neither is configured, or if the lookup fails, returns `None`.
     ///
     /// # Arguments
     ///
@@ -363,7 +423,7 @@ impl FormIDAnalyzerCore {
     ///
     /// - Async database query allows non-blocking I/O
     /// - Database pool provides connection reuse for efficiency
-    /// - Typical lookup: 1-5ms with warm connection pool
+    /// - Typical lookup: 1-5ms with warm connection pool, microseconds with a FormID index
     ///
     /// # Example
     ///
@@ -385,7 +445,9 @@ impl FormIDAnalyzerCore {
     /// # }
     /// ```
     pub async fn lookup_formid_value(&self, formid: &str, plugin: &str) -> Option<String> {
-        if let Some(ref pool) = self.db_pool {
+        if let Some(index) = self.formid_index.as_deref() {
+            index.get(formid, plugin).map(str::to_string)
+        } else if let Some(ref pool) = self.db_pool {
             pool.get_entry(formid, plugin, None).await.ok().flatten()
         } else {
             None
@@ -442,28 +504,9 @@ impl FormIDAnalyzerCore {
 /// assert_eq!(results[1].len(), 1);
 /// ```
 pub fn extract_formids_batch(callstack_segments: Vec<Vec<String>>) -> Vec<Vec<String>> {
-    // Use rayon for parallel processing
-    callstack_segments
-        .par_iter()
-        .map(|segment| {
-            let mut formids = Vec::new();
-
-            for line in segment {
-                if let Some(captures) = FORMID_PATTERN.captures(line)
-                    && let Some(formid_match) = captures.get(1)
-                {
-                    let formid_id = formid_match.as_str().to_uppercase();
-
-                    // Skip FF-prefixed FormIDs (plugin limit)
-                    // Keep 00000000 (NULL) FormIDs as they indicate errors
-                    if !formid_id.starts_with("FF") {
-                        formids.push(format!("Form ID: {}", formid_id));
-                    }
-                }
-            }
-
-            formids
-        })
+    scan_formids_batch(&callstack_segments)
+        .into_iter()
+        .map(|formids| formids.into_iter().map(format_formid).collect())
         .collect()
 }
 
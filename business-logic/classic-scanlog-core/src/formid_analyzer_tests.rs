@@ -223,3 +223,73 @@ async fn formid_match_with_crashgen_name_override_uses_effective_name() {
     assert!(output.contains("caught by Addictol"));
     assert!(!output.contains("caught by Buffout 4"));
 }
+
+#[tokio::test]
+async fn coalesced_lookups_from_concurrent_logs_share_one_deduplicated_batch() {
+    let (db_pool, _temp_file) = create_test_pool_with_entries(&[
+        ("123456", "Fallout4.esm", "Shared Entry"),
+        ("654321", "TestMod.esp", "Own Entry"),
+    ])
+    .await;
+    let analyzer = build_test_analyzer(Some(Arc::clone(&db_pool)), true)
+        .with_lookup_coalescing(Duration::from_millis(20));
+    let mut crashlog_plugins = IndexMap::new();
+    crashlog_plugins.insert("Fallout4.esm".to_string(), "00".to_string());
+    crashlog_plugins.insert("TestMod.esp".to_string(), "01".to_string());
+
+    let shared_only = vec!["Form ID: 00123456".to_string()];
+    let shared_and_own = vec![
+        "Form ID: 00123456".to_string(),
+        "Form ID: 01654321".to_string(),
+    ];
+    let (first, second, third) = tokio::join!(
+        analyzer.formid_match(shared_only.clone(), &crashlog_plugins),
+        analyzer.formid_match(shared_only, &crashlog_plugins),
+        analyzer.formid_match(shared_and_own, &crashlog_plugins),
+    );
+
+    for lines in [first.unwrap(), second.unwrap(), third.unwrap()] {
+        assert!(report_rows(&lines).contains(&"- Fallout4.esm | 00123456 | Shared Entry | 1\n"));
+    }
+    // Four requested pairs collapse to the two distinct ones in a single batch.
+    assert_eq!(db_pool.get_stats().unwrap().total_queries, 2);
+}
+
+#[tokio::test]
+async fn formid_match_resolves_values_from_prebuilt_index_without_pool() {
+    let (_temp_file, db_path) =
+        create_formid_test_database("Fallout4", &[("AAAAAA", "HasEntry.esp", "Indexed Entry")])
+            .await;
+    let index_dir = tempfile::tempdir().expect("failed to create index dir");
+    let index_path = index_dir.path().join("Fallout4 FormIDs.fidx");
+    classic_database_core::build_formid_index(&[db_path], "Fallout4", &index_path)
+        .await
+        .expect("index build should succeed");
+    let index = FormIdIndex::open(&index_path).expect("index should open");
+    let analyzer = build_test_analyzer(None, true).with_formid_index(Arc::new(index));
+
+    let formids = vec![
+        "Form ID: 03AAAAAA".to_string(),
+        "Form ID: 04BBBBBB".to_string(),
+    ];
+    let mut crashlog_plugins = IndexMap::new();
+    crashlog_plugins.insert("HASENTRY.ESP".to_string(), "03".to_string());
+    crashlog_plugins.insert("MissingEntry.esp".to_string(), "04".to_string());
+
+    let lines = analyzer
+        .formid_match(formids, &crashlog_plugins)
+        .await
+        .expect("formid_match should succeed");
+
+    assert_eq!(
+        report_rows(&lines),
+        vec![
+            "- HASENTRY.ESP | 03AAAAAA | Indexed Entry | 1\n",
+            "- MissingEntry.esp | 04BBBBBB | 1\n",
+        ]
+    );
+    assert_eq!(
+        analyzer.lookup_formid_value("AAAAAA", "HasEntry.esp").await,
+        Some("Indexed Entry".to_string())
+    );
+}
@@ -0,0 +1,151 @@
+//! Run-scoped coalescing of FormID value lookups.
+//!
+//! Concurrent Crash Logs in one scan run mostly ask for the same base-game and
+//! DLC `(formid, plugin)` pairs. Instead of one `get_entries_batch` round-trip
+//! per log, callers enqueue their pairs and a single drain task issues one
+//! deduplicated batch for everything pending, then fans the results back out.
+//! Pairs that arrive while a batch is in flight form the next batch.
+
+use classic_database_core::DatabasePool;
+use parking_lot::Mutex;
+use std::collections::{HashMap, HashSet};
+use std::sync::Arc;
+use std::time::Duration;
+use tokio::sync::oneshot;
+
+/// Shared lookup results keyed as `"formid:plugin"`, matching `get_entries_batch`.
+pub(crate) type FormIdLookupResults = Arc<HashMap<String, String>>;
+
+/// How long the first request of an idle coalescer waits for other logs to join.
+pub(crate) const FORMID_LOOKUP_COALESCE_WINDOW: Duration = Duration::from_millis(2);
+
+struct PendingLookup {
+    pairs: Vec<(String, String)>,
+    reply: oneshot::Sender<Option<FormIdLookupResults>>,
+}
+
+#[derive(Default)]
+struct CoalescerState {
+    pending: Vec<PendingLookup>,
+    draining: bool,
+}
+
+struct CoalescerInner {
+    pool: Arc<DatabasePool>,
+    window: Duration,
+    batch_size: usize,
+    state: Mutex<CoalescerState>,
+}
+
+/// Gathers FormID lookups from every in-flight log into shared database batches.
+///
+/// Cloning shares the same queue. The drain runs as its own task, so a caller
+/// dropped mid-lookup cannot strand the requests queued behind it.
+#[derive(Clone)]
+pub(crate) struct FormIdLookupCoalescer {
+    inner: Arc<CoalescerInner>,
+}
+
+impl FormIdLookupCoalescer {
+    /// Creates a coalescer that issues batches of at most `batch_size` pairs per query.
+    pub(crate) fn new(pool: Arc<DatabasePool>, window: Duration, batch_size: usize) -> Self {
+        Self {
+            inner: Arc::new(CoalescerInner {
+                pool,
+                window,
+                batch_size,
+                state: Mutex::new(CoalescerState::default()),
+            }),
+        }
+    }
+
+    /// Resolves `pairs` as part of the next shared batch.
+    ///
+    /// Returns `None` when the batch query failed; callers fall back to rows
+    /// without values, exactly as for a failed direct batch lookup.
+    pub(crate) async fn get_entries(
+        &self,
+        pairs: Vec<(String, String)>,
+    ) -> Option<FormIdLookupResults> {
+        let (reply, response) = oneshot::channel();
+        let start_drain = {
+            let mut state = self.inner.state.lock();
+            state.pending.push(PendingLookup { pairs, reply });
+            !std::mem::replace(&mut state.draining, true)
+        };
+        if start_drain {
+            tokio::spawn(Arc::clone(&self.inner).drain());
+        }
+        response.await.ok().flatten()
+    }
+}
+
+/// Releases the drain role when a drain ends before emptying the queue.
+///
+/// If the batch query panics or the runtime cancels the drain task, the guard
+/// clears `draining` so the next caller starts a fresh drain, and drops every
+/// queued request so its caller resolves to `None` instead of waiting forever.
+struct DrainGuard<'a> {
+    state: &'a Mutex<CoalescerState>,
+    finished: bool,
+}
+
+impl Drop for DrainGuard<'_> {
+    fn drop(&mut self) {
+        if self.finished {
+            return;
+        }
+        let stranded = {
+            let mut state = self.state.lock();
+            state.draining = false;
+            std::mem::take(&mut state.pending)
+        };
+        drop(stranded);
+    }
+}
+
+impl CoalescerInner {
+    /// Issues one deduplicated query per generation of pending requests until the queue is empty.
+    async fn drain(self: Arc<Self>) {
+        let mut guard = DrainGuard {
+            state: &self.state,
+            finished: false,
+        };
+        if !self.window.is_zero() {
+            tokio::time::sleep(self.window).await;
+        }
+        loop {
+            let batch = {
+                let mut state = self.state.lock();
+                if state.pending.is_empty() {
+                    state.draining = false;
+                    guard.finished = true;
+                    return;
+                }
+                std::mem::take(&mut state.pending)
+            };
+
+            let mut seen = HashSet::new();
+            let pairs: Vec<(String, String)> = batch
+                .iter()
+                .flat_map(|lookup| lookup.pairs.iter())
+                .filter(|pair| seen.insert(*pair))
+                .cloned()
+                .collect();
+            let results = self
+                .pool
+                .get_entries_batch(pairs, None, self.batch_size)
+                .await
+                .ok()
+                .map(Arc::new);
+
+            for lookup in batch {
+                let _ = lookup.reply.send(results.clone());
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+#[path = "formid_lookup_tests.rs"]
+mod tests;
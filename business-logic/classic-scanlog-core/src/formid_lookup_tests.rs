@@ -0,0 +1,52 @@
+use super::*;
+
+fn queued(state: &Mutex<CoalescerState>) -> oneshot::Receiver<Option<FormIdLookupResults>> {
+    let (reply, response) = oneshot::channel();
+    state.lock().pending.push(PendingLookup {
+        pairs: vec![("00012345".to_string(), "Fallout4.esm".to_string())],
+        reply,
+    });
+    response
+}
+
+/// Verifies an interrupted drain hands the role back and fails the requests it stranded.
+#[test]
+fn interrupted_drain_releases_queue_and_fails_waiters() {
+    let state = Mutex::new(CoalescerState {
+        draining: true,
+        ..CoalescerState::default()
+    });
+    let mut response = queued(&state);
+
+    drop(DrainGuard {
+        state: &state,
+        finished: false,
+    });
+
+    assert!(!state.lock().draining);
+    assert!(state.lock().pending.is_empty());
+    assert!(matches!(
+        response.try_recv(),
+        Err(oneshot::error::TryRecvError::Closed)
+    ));
+}
+
+/// Verifies a drain that emptied the queue leaves requests queued after it untouched.
+#[test]
+fn finished_drain_keeps_requests_for_the_next_drain() {
+    let state = Mutex::new(CoalescerState::default());
+    let mut response = queued(&state);
+    state.lock().draining = true;
+
+    drop(DrainGuard {
+        state: &state,
+        finished: true,
+    });
+
+    assert!(state.lock().draining);
+    assert_eq!(state.lock().pending.len(), 1);
+    assert!(matches!(
+        response.try_recv(),
+        Err(oneshot::error::TryRecvError::Empty)
+    ));
+}
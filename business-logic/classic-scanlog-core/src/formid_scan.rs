@@ -0,0 +1,192 @@
+//! Allocation-free FormID scanning for crash log call stacks
+//!
+//! Call stack lines reference game records as `Form ID: 0x0001A332`. This module finds
+//! that fixed shape without a regex and returns the FormIDs as compact `u32` values, so
+//! callers only format strings for the handful of unique IDs that reach a report.
+//!
+//! Matching is equivalent to the `(?i)Form\s*ID:?\s*0x([0-9A-F]{8})\b` pattern the
+//! analyzers used previously: the first match on each line wins, letters are matched
+//! case-insensitively, and the eight hex digits must end on a word boundary. Candidate
+//! positions are located with `memchr` (SIMD-accelerated on supported targets) by
+//! searching for the `m` of `Form`, a byte that never appears in hexadecimal addresses.
+
+use rayon::prelude::*;
+use regex::Regex;
+use std::sync::LazyLock;
+
+/// Matches one Unicode word character; only consulted for non-ASCII boundary characters.
+static WORD_CHAR: LazyLock<Regex> = LazyLock::new(|| match Regex::new(r"\A\w") {
+    Ok(regex) => regex,
+    Err(error) => panic!("invalid static regex WORD_CHAR: {error}"),
+});
+
+/// Plugin index byte reserved for runtime-created forms; such FormIDs are never reported.
+const RUNTIME_PLUGIN_INDEX: u32 = 0xFF;
+
+/// Returns the first FormID referenced on `line`, including runtime (`FF`) FormIDs.
+///
+/// # Example
+///
+/// ```rust
+/// use classic_scanlog_core::find_formid;
+///
+/// assert_eq!(find_formid("  Form ID: 0x0001A332"), Some(0x0001_A332));
+/// assert_eq!(find_formid("formid 0xff000800"), Some(0xFF00_0800));
+/// assert_eq!(find_formid("Form ID: 0x1234"), None);
+/// ```
+pub fn find_formid(line: &str) -> Option<u32> {
+    let bytes = line.as_bytes();
+    // "Form" ends three bytes after its start, so the earliest useful 'm' is at index 3.
+    let mut search_from = 3;
+    while search_from < bytes.len() {
+        let offset = memchr::memchr2(b'm', b'M', &bytes[search_from..])?;
+        let m_index = search_from + offset;
+        search_from = m_index + 1;
+        if !bytes[m_index - 3..m_index].eq_ignore_ascii_case(b"for") {
+            continue;
+        }
+        if let Some(formid) = match_after_form(line, m_index + 1) {
+            return Some(formid);
+        }
+    }
+    None
+}
+
+/// Extracts the reportable FormIDs from call stack lines, in order and with duplicates.
+///
+/// Only the first FormID on each line is considered, and FormIDs in the runtime
+/// plugin slot (`FF`) are skipped. NULL FormIDs (`00000000`) are kept because they
+/// point at a broken reference.
+///
+/// # Example
+///
+/// ```rust
+/// use classic_scanlog_core::scan_formids;
+///
+/// let lines = ["  Form ID: 0x0001A332", "  Form ID: 0xFF000800", "  Form ID: 0x0001A332"];
+/// assert_eq!(scan_formids(&lines), vec![0x0001_A332, 0x0001_A332]);
+/// ```
+pub fn scan_formids<S: AsRef<str>>(lines: &[S]) -> Vec<u32> {
+    lines
+        .iter()
+        .filter_map(|line| find_formid(line.as_ref()))
+        .filter(|formid| formid >> 24 != RUNTIME_PLUGIN_INDEX)
+        .collect()
+}
+
+/// Runs [`scan_formids`] over several call stack segments in parallel.
+///
+/// Segments are borrowed, so callers can pass `&[Vec<String>]`, `&[&[String]]` or
+/// `&[Vec<&str>]` without cloning any lines.
+pub fn scan_formids_batch<G, S>(segments: &[G]) -> Vec<Vec<u32>>
+where
+    G: AsRef<[S]> + Sync,
+    S: AsRef<str>,
+{
+    segments
+        .par_iter()
+        .map(|segment| scan_formids(segment.as_ref()))
+        .collect()
+}
+
+/// Sorts and deduplicates FormIDs.
+pub fn unique_formids(mut formids: Vec<u32>) -> Vec<u32> {
+    formids.sort_unstable();
+    formids.dedup();
+    formids
+}
+
+/// Counts FormID occurrences, returning `(formid, count)` pairs in ascending FormID order.
+pub fn count_formids(formids: &[u32]) -> Vec<(u32, usize)> {
+    let mut sorted = formids.to_vec();
+    sorted.sort_unstable();
+    let mut counts: Vec<(u32, usize)> = Vec::new();
+    for formid in sorted {
+        match counts.last_mut() {
+            Some((last, count)) if *last == formid => *count += 1,
+            _ => counts.push((formid, 1)),
+        }
+    }
+    counts
+}
+
+/// Formats a FormID as eight uppercase hex digits (e.g. `0001A332`).
+pub fn formid_hex(formid: u32) -> String {
+    format!("{formid:08X}")
+}
+
+/// Formats a FormID the way crash log reports list it (e.g. `Form ID: 0001A332`).
+pub fn format_formid(formid: u32) -> String {
+    format!("Form ID: {formid:08X}")
+}
+
+/// Matches `\s*ID:?\s*0x[0-9A-F]{8}\b` starting at byte `pos` of `line`.
+fn match_after_form(line: &str, pos: usize) -> Option<u32> {
+    let bytes = line.as_bytes();
+    let mut pos = skip_whitespace(line, pos);
+    if !bytes.get(pos..pos + 2)?.eq_ignore_ascii_case(b"id") {
+        return None;
+    }
+    pos += 2;
+    if bytes.get(pos) == Some(&b':') {
+        pos += 1;
+    }
+    pos = skip_whitespace(line, pos);
+    if !bytes.get(pos..pos + 2)?.eq_ignore_ascii_case(b"0x") {
+        return None;
+    }
+    pos += 2;
+
+    let digits = bytes.get(pos..pos + 8)?;
+    let mut formid = 0u32;
+    for &digit in digits {
+        formid = (formid << 4) | u32::from(hex_value(digit)?);
+    }
+    if ends_on_word_boundary(line, pos + 8) {
+        Some(formid)
+    } else {
+        None
+    }
+}
+
+/// Advances past Unicode whitespace, mirroring the regex `\s*`.
+fn skip_whitespace(line: &str, mut pos: usize) -> usize {
+    let bytes = line.as_bytes();
+    while let Some(&byte) = bytes.get(pos) {
+        if byte.is_ascii() {
+            // Matches the ASCII members of Unicode White_Space, including \x0B.
+            if !matches!(byte, b' ' | b'\t' | b'\n' | b'\x0B' | b'\x0C' | b'\r') {
+                break;
+            }
+            pos += 1;
+        } else {
+            match line[pos..].chars().next() {
+                Some(ch) if ch.is_whitespace() => pos += ch.len_utf8(),
+                _ => break,
+            }
+        }
+    }
+    pos
+}
+
+/// Returns true when the character at `pos` cannot continue a word.
+fn ends_on_word_boundary(line: &str, pos: usize) -> bool {
+    match line.as_bytes().get(pos) {
+        None => true,
+        Some(byte) if byte.is_ascii() => !(byte.is_ascii_alphanumeric() || *byte == b'_'),
+        Some(_) => !WORD_CHAR.is_match(&line[pos..]),
+    }
+}
+
+fn hex_value(byte: u8) -> Option<u8> {
+    match byte {
+        b'0'..=b'9' => Some(byte - b'0'),
+        b'a'..=b'f' => Some(byte - b'a' + 10),
+        b'A'..=b'F' => Some(byte - b'A' + 10),
+        _ => None,
+    }
+}
+
+#[cfg(test)]
+#[path = "formid_scan_tests.rs"]
+mod tests;
@@ -0,0 +1,101 @@
+use super::*;
+
+/// The regex the analyzers used before the hand-written scanner replaced it.
+static LEGACY_PATTERN: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"(?i)Form\s*ID:?\s*0x([0-9A-F]{8})\b").unwrap());
+
+fn legacy_find(line: &str) -> Option<u32> {
+    let captures = LEGACY_PATTERN.captures(line)?;
+    u32::from_str_radix(captures.get(1)?.as_str(), 16).ok()
+}
+
+#[test]
+fn find_formid_matches_legacy_pattern_on_edge_cases() {
+    let lines = [
+        "  Form ID: 0x0001A332",
+        "Form ID: 0xabcdef01",
+        "FORM ID: 0X00000000",
+        "formid0x12345678",
+        "Form\tID:\t0x12345678)",
+        "Form ID 0x12345678",
+        "Form\u{a0}ID:\u{2003}0x12345678",
+        "Form ID: 0x123456789",
+        "Form ID: 0x1234567",
+        "Form ID: 0x1234567G",
+        "Form ID: 0x12345678_",
+        "Form ID: 0x12345678é",
+        "Form ID: 0x12345678\u{301}",
+        "Form ID: 0x12345678²",
+        "Form ID: 0x12345678 Form ID: 0x87654321",
+        "Form ID: 0x123456789 Form ID: 0x87654321",
+        "Former ID: 0x12345678 then Form ID: 0x0000ABCD",
+        "Platform ID: 0x12345678",
+        "Form ID: 0xFF000800",
+        "[ 0] 0x7FF6A1B2C3D4 Fallout4.exe+0123456",
+        "ID: 0x12345678",
+        "Form",
+        "m",
+        "",
+        "ÄÖÜ Form ID: 0x0002B3C4 ü",
+        "Form ID: \u{85}0x0002B3C4",
+    ];
+
+    for line in lines {
+        assert_eq!(find_formid(line), legacy_find(line), "line: {line:?}");
+    }
+}
+
+#[test]
+fn scan_formids_matches_legacy_extraction_on_fixture_logs() {
+    for content in [
+        include_str!("../benches/fixtures/crash-0DB9300.log"),
+        include_str!("../benches/fixtures/crash-12624.log"),
+        include_str!("../benches/fixtures/crash-2022-06-05-12-58-02.log"),
+    ] {
+        let lines: Vec<&str> = content.lines().collect();
+        let expected: Vec<u32> = lines
+            .iter()
+            .filter_map(|line| legacy_find(line))
+            .filter(|formid| formid >> 24 != 0xFF)
+            .collect();
+
+        assert_eq!(scan_formids(&lines), expected);
+    }
+}
+
+#[test]
+fn scan_formids_skips_runtime_formids_and_keeps_null() {
+    let lines = [
+        "  Form ID: 0xFF000800",
+        "  Form ID: 0x00000000",
+        "  Form ID: 0x0001A332",
+        "  Form ID: 0x0001A332",
+    ];
+
+    assert_eq!(scan_formids(&lines), vec![0, 0x0001_A332, 0x0001_A332]);
+}
+
+#[test]
+fn scan_formids_batch_accepts_borrowed_segments() {
+    let first = vec!["Form ID: 0x00000001".to_string()];
+    let second = vec!["no formid".to_string(), "Form ID: 0x00000002".to_string()];
+    let segments: Vec<&[String]> = vec![&first, &second, &[]];
+
+    assert_eq!(
+        scan_formids_batch(&segments),
+        vec![vec![1], vec![2], Vec::new()]
+    );
+}
+
+#[test]
+fn count_and_unique_formids_sort_numerically() {
+    let formids = [0x0A00_0001, 0x0000_0002, 0x0A00_0001, 0x0000_0000];
+
+    assert_eq!(
+        count_formids(&formids),
+        vec![(0, 1), (2, 1), (0x0A00_0001, 2)]
+    );
+    assert_eq!(unique_formids(formids.to_vec()), vec![0, 2, 0x0A00_0001]);
+    assert_eq!(format_formid(0x0001_a332), "Form ID: 0001A332");
+    assert_eq!(formid_hex(0xabc), "00000ABC");
+}
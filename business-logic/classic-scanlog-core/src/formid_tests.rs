@@ -16,6 +16,15 @@ fn test_rust_formid_analyzer_default() {
     assert_eq!(analyzer.cache_stats(), (0, 0));
 }
 
+#[test]
+fn test_rust_formid_analyzer_cache_budget() {
+    let analyzer = RustFormIDAnalyzer::with_cache_budget(64 * 1024);
+    let metrics = analyzer.cache_metrics();
+    assert_eq!(metrics.capacity_bytes, 2 * 64 * 1024);
+    assert_eq!(metrics.entries, 0);
+    assert_eq!(metrics.resident_bytes, 0);
+}
+
 // ============================================
 // FormID parsing tests
 // ============================================
@@ -24,6 +24,7 @@ static GLOBAL: mimalloc::MiMalloc = mimalloc::MiMalloc;
 
 // Public utility modules and the final Crash Log Scan Run contract.
 pub mod analyzer;
+pub mod bounded_cache;
 pub mod crash_suspect_analyzer;
 pub mod crashgen_registry;
 pub mod crashgen_settings_analyzer;
@@ -31,6 +32,8 @@ pub mod error;
 pub(crate) mod fcx_handler;
 pub mod formid;
 pub mod formid_analyzer;
+pub(crate) mod formid_lookup;
+pub mod formid_scan;
 pub mod gpu_detector;
 pub mod mod_guidance_analyzer;
 // These implementation modules retain focused characterization helpers that are
@@ -54,6 +57,7 @@ pub mod version;
 
 // Re-export key types for convenience
 pub use analyzer::{AnalyzerError, AnalyzerErrorCode, AnalyzerKind, AnalyzerResult};
+pub use bounded_cache::{BoundedCache, BoundedCacheStats};
 pub use crash_suspect_analyzer::{
     CrashSuspectAnalysisInput, CrashSuspectAnalysisResult, CrashSuspectAnalyzer,
     CrashSuspectFinding, CrashSuspectFindingKind,
@@ -69,6 +73,10 @@ pub use formid::{FormIDAnalyzer, RustFormIDAnalyzer};
 pub use formid_analyzer::{
     FormIDAnalyzerCore, extract_formids_batch, is_valid_formid, validate_formids_batch,
 };
+pub use formid_scan::{
+    count_formids, find_formid, format_formid, formid_hex, scan_formids, scan_formids_batch,
+    unique_formids,
+};
 pub use gpu_detector::{GpuDetector, GpuInfo, GpuVendor};
 pub use mod_guidance_analyzer::{
     ImportantModGuidance, ModConflictGuidance, ModGuidanceAnalysisInput, ModGuidanceAnalysisResult,
@@ -16,6 +16,8 @@ use crate::crash_suspect_analyzer::{
 use crate::crashgen_registry::{CrashgenEntry, CrashgenRegistry};
 use crate::error::Result;
 use crate::formid_analyzer::FormIDAnalyzerCore;
+use crate::formid_lookup::FORMID_LOOKUP_COALESCE_WINDOW;
+use crate::formid_scan::scan_formids;
 use crate::gpu_detector::GpuDetector;
 use crate::mod_guidance_analyzer::{
     ModGuidanceAnalysisInput, ModGuidanceAnalysisResult, ModGuidanceAnalyzer,
@@ -42,13 +44,14 @@ use classic_config_core::{
     ConfigLayout, CoreModEntry, CrashgenSettingsSnapshot, ModConflictEntry, ModSolutionEntry,
     SuspectErrorRule, SuspectStackRule,
 };
-use classic_database_core::DatabasePool;
+use classic_database_core::{DatabasePool, FormIdIndex};
 use classic_file_io_core::FileIOCore;
 use classic_version_registry_core::{
     CrashgenConfig, GameVersion as RegistryGameVersion, VersionInfo, get_version_registry,
 };
 use indexmap::IndexMap;
 use regex::Regex;
+use std::borrow::Cow;
 use std::collections::{HashMap, HashSet};
 use std::path::{Path, PathBuf};
 use std::sync::{Arc, LazyLock};
@@ -67,7 +70,7 @@ pub enum ScanProgressPhase {
 }
 
 struct ScanAnalysisContext {
-    processed_lines: Vec<String>,
+    processed_lines: Vec<Arc<str>>,
     combined_crash_lines: Vec<String>,
     combined_crash_text: String,
     combined_crash_lower_lines: Vec<String>,
@@ -109,18 +112,14 @@ pub(crate) fn resolve_batch_concurrency(total_logs: usize, max_concurrent: Optio
 }
 
 impl ScanAnalysisContext {
-    fn from_processed_lines(parser: &LogParser, processed_lines: Vec<String>) -> Self {
-        let processed_line_arcs: Vec<Arc<str>> = processed_lines
-            .iter()
-            .map(|line| Arc::from(line.as_str()))
-            .collect();
-        let segments = parser.parse_all_sections_arc(&processed_line_arcs);
+    fn from_processed_lines(parser: &LogParser, processed_lines: Vec<Arc<str>>) -> Self {
+        let segments = parser.parse_all_sections_arc(&processed_lines);
 
         Self::from_arc_sections(processed_lines, &segments)
     }
 
     fn from_arc_sections(
-        processed_lines: Vec<String>,
+        processed_lines: Vec<Arc<str>>,
         segments: &HashMap<String, Vec<Arc<str>>>,
     ) -> Self {
         let combined_crash_lines: Vec<String> = [
@@ -717,6 +716,8 @@ pub struct OrchestratorCore {
     settings_validator: SettingsValidator,
     /// Optional database pool for async FormID lookups
     db_pool: Option<Arc<DatabasePool>>,
+    /// Optional memory-mapped FormID index, used instead of the pool when attached
+    formid_index: Option<Arc<FormIdIndex>>,
     /// Whether the orchestrator has been initialized via async_enter
     initialized: bool,
 }
@@ -963,6 +964,7 @@ impl OrchestratorCore {
             record_scanner,
             settings_validator,
             db_pool: None,
+            formid_index: None,
             initialized: false,
         })
     }
@@ -1011,7 +1013,8 @@ impl OrchestratorCore {
             Some(pool.clone()),
             self.config.show_formid_values,
             self.config.crashgen_name.clone(),
-        )?;
+        )?
+        .with_lookup_coalescing(FORMID_LOOKUP_COALESCE_WINDOW);
         self.db_pool = Some(pool);
         Ok(self)
     }
@@ -1030,11 +1033,38 @@ impl OrchestratorCore {
             Some(pool.clone()),
             self.config.show_formid_values,
             self.config.crashgen_name.clone(),
-        )?;
+        )?
+        .with_lookup_coalescing(FORMID_LOOKUP_COALESCE_WINDOW);
         self.db_pool = Some(pool);
         Ok(())
     }
 
+    /// Attaches a prebuilt FormID index for FormID value lookups.
+    ///
+    /// The index replaces the database pool for lookups: values resolve from the
+    /// memory-mapped file without connections, caching, or batching. Any attached
+    /// pool stays available through [`database_pool`](Self::database_pool).
+    ///
+    /// # Arguments
+    ///
+    /// * `index` - An index opened with `FormIdIndex::open`
+    pub fn attach_formid_index(&mut self, index: Arc<FormIdIndex>) -> Result<()> {
+        self.formid_analyzer = FormIDAnalyzerCore::new(
+            self.db_pool.clone(),
+            self.config.show_formid_values,
+            self.config.crashgen_name.clone(),
+        )?
+        .with_formid_index(Arc::clone(&index));
+        self.formid_index = Some(index);
+        Ok(())
+    }
+
+    /// Returns whether this orchestrator has a FormID index attached.
+    #[must_use]
+    pub fn has_formid_index(&self) -> bool {
+        self.formid_index.is_some()
+    }
+
     /// Returns whether this orchestrator has a database pool attached.
     ///
     /// This can be used to determine if rich FormID resolution is available.
@@ -1162,6 +1192,33 @@ impl OrchestratorCore {
     pub async fn process_log_with_progress<F>(
         &self,
         log_path: String,
+        on_phase: F,
+    ) -> Result<AnalysisResult>
+    where
+        F: FnMut(ScanProgressPhase),
+    {
+        self.analyze_log_source(log_path, None, on_phase).await
+    }
+
+    /// Processes an in-memory Crash Log without reading it from disk.
+    ///
+    /// `log_name` stands in for the Crash Log path: it names the log in the
+    /// Autoscan Report and in the returned result. The bytes are decoded with
+    /// the same encoding detection used for files.
+    pub async fn process_log_content(
+        &self,
+        log_name: String,
+        content: &[u8],
+    ) -> Result<AnalysisResult> {
+        self.analyze_log_source(log_name, Some(content), |_| {})
+            .await
+    }
+
+    /// Shared analysis for path-backed and in-memory Crash Logs.
+    async fn analyze_log_source<F>(
+        &self,
+        log_path: String,
+        content: Option<&[u8]>,
         mut on_phase: F,
     ) -> Result<AnalysisResult>
     where
@@ -1188,7 +1245,7 @@ impl OrchestratorCore {
         };
 
         enter_phase(ScanProgressPhase::Setup);
-        let context = self.prepare_scan_context(&log_path).await?;
+        let context = self.prepare_scan_context(&log_path, content).await?;
 
         enter_phase(ScanProgressPhase::Parse);
         let crashgen = self.resolve_crashgen_context(&log_path, &context);
@@ -1338,10 +1395,32 @@ impl OrchestratorCore {
     /// After:  "[01] MyMod.esp"
     /// ```
     pub fn reformat_crash_data_inline(&self, lines: &[String]) -> Vec<String> {
-        use std::collections::VecDeque;
+        self.reformat_crash_segments(lines.iter().map(String::as_str))
+            .into_iter()
+            .map(Cow::into_owned)
+            .collect()
+    }
+
+    /// Reformats borrowed Crash Log lines into the shared lines used for analysis.
+    ///
+    /// Applies the same rules as [`Self::reformat_crash_data_inline`], but each line
+    /// is copied exactly once, straight from the source buffer into its `Arc<str>`.
+    pub(crate) fn reformat_crash_lines<'a, I>(&self, lines: I) -> Vec<Arc<str>>
+    where
+        I: DoubleEndedIterator<Item = &'a str>,
+    {
+        self.reformat_crash_segments(lines)
+            .into_iter()
+            .map(|line| Arc::from(line.as_ref()))
+            .collect()
+    }
 
-        // Use VecDeque for O(1) prepend operations (like Python's deque)
-        let mut processed_lines: VecDeque<String> = VecDeque::with_capacity(lines.len());
+    /// Applies inline reformatting lazily, borrowing every line that needs no rewrite.
+    fn reformat_crash_segments<'a, I>(&self, lines: I) -> Vec<Cow<'a, str>>
+    where
+        I: DoubleEndedIterator<Item = &'a str>,
+    {
+        let mut processed_lines: Vec<Cow<'a, str>> = Vec::with_capacity(lines.size_hint().0);
 
         // State for tracking if currently in the PLUGINS section
         // Start as true because we iterate from bottom, and PLUGINS is typically at the end
@@ -1351,7 +1430,7 @@ impl OrchestratorCore {
         let should_simplify = self.config.simplify_logs && !self.config.remove_list.is_empty();
 
         // Iterate over lines from bottom to top (like Python's reversed())
-        for line in lines.iter().rev() {
+        for line in lines.rev() {
             // Check if we're exiting the PLUGINS section (going upward)
             if in_plugins_section && line.starts_with("PLUGINS:") {
                 in_plugins_section = false;
@@ -1365,36 +1444,31 @@ impl OrchestratorCore {
                     .iter()
                     .any(|remove_str| line.contains(remove_str))
             {
-                // Skip this line entirely (don't add to processed_lines)
                 continue;
             }
 
-            // Reformat lines within the PLUGINS section (bracket padding)
-            if in_plugins_section && line.contains('[') {
-                // Replace all spaces inside the load order [brackets] with 0s.
-                // This maintains consistency between different versions of Buffout 4.
-                // Example: "[ 1]" -> "[01]", "[  A]" -> "[00A]"
-                if let Some((indent, rest)) = line.split_once('[')
-                    && let Some((fid, name)) = rest.split_once(']')
-                {
-                    // Only modify if spaces exist inside brackets
-                    if fid.contains(' ') {
-                        let modified_line =
-                            format!("{}[{}]{}", indent, fid.replace(' ', "0"), name);
-                        processed_lines.push_front(modified_line);
-                        continue;
-                    }
-                }
-                // If format is unexpected, keep original line
-                processed_lines.push_front(line.clone());
-            } else {
-                // Line is not in PLUGINS section or doesn't need modification
-                processed_lines.push_front(line.clone());
+            // Replace all spaces inside the load order [brackets] with 0s so different
+            // Buffout 4 versions line up. Example: "[ 1]" -> "[01]", "[  A]" -> "[00A]"
+            if in_plugins_section
+                && let Some((indent, rest)) = line.split_once('[')
+                && let Some((fid, name)) = rest.split_once(']')
+                && fid.contains(' ')
+            {
+                processed_lines.push(Cow::Owned(format!(
+                    "{}[{}]{}",
+                    indent,
+                    fid.replace(' ', "0"),
+                    name
+                )));
+                continue;
             }
+
+            processed_lines.push(Cow::Borrowed(line));
         }
 
-        // Convert VecDeque to Vec (already in correct order due to push_front)
-        processed_lines.into_iter().collect()
+        // Lines were collected bottom-up
+        processed_lines.reverse();
+        processed_lines
     }
 
     /// Detects if a crash log is incomplete (missing plugin segment).
@@ -1462,10 +1536,23 @@ impl OrchestratorCore {
         )
     }
 
-    async fn prepare_scan_context(&self, log_path: &str) -> Result<ScanAnalysisContext> {
-        let log_content = self.file_io.read_file(Path::new(log_path)).await?;
-        let raw_lines: Vec<String> = log_content.lines().map(String::from).collect();
-        let processed_lines = self.reformat_crash_data_inline(&raw_lines);
+    async fn prepare_scan_context(
+        &self,
+        log_path: &str,
+        content: Option<&[u8]>,
+    ) -> Result<ScanAnalysisContext> {
+        let processed_lines = match content {
+            Some(bytes) => {
+                let log_content = self.file_io.decode_bytes(bytes)?;
+                self.reformat_crash_lines(log_content.lines())
+            }
+            None => {
+                // Crash Logs are read once per scan, so skip the FileIOCore read cache and
+                // its extra copy; the decoded buffer is dropped once the lines are built.
+                let log_content = self.file_io.read_file_mmap(Path::new(log_path)).await?;
+                self.reformat_crash_lines(log_content.lines())
+            }
+        };
         Ok(ScanAnalysisContext::from_processed_lines(
             &self.parser,
             processed_lines,
@@ -1510,7 +1597,7 @@ impl OrchestratorCore {
                 .processed_lines
                 .iter()
                 .find(|line| line.starts_with("Unhandled exception"))
-                .cloned()
+                .map(|line| line.to_string())
                 .unwrap_or_default()
         });
         let crashgen_status = if crashgen_version_str.trim().is_empty() || fake_bot_compatible_mode
@@ -1694,9 +1781,7 @@ impl OrchestratorCore {
         let mut contributions = Vec::new();
         let mut formid_count = 0;
         if !context.combined_crash_lines.is_empty() {
-            let formids = self
-                .formid_analyzer
-                .extract_formids(context.combined_crash_lines.clone());
+            let formids = scan_formids(&context.combined_crash_lines);
             formid_count = formids.len();
 
             if formid_count > 0 {
@@ -1704,7 +1789,11 @@ impl OrchestratorCore {
                 let plugins_ref = plugins_map.unwrap_or(&empty_plugins);
                 let formid_report_lines = self
                     .formid_analyzer
-                    .formid_match_with_crashgen_name(formids, plugins_ref, effective_crashgen_name)
+                    .formid_match_values_with_crashgen_name(
+                        &formids,
+                        plugins_ref,
+                        effective_crashgen_name,
+                    )
                     .await?;
 
                 contributions.push(AutoscanReportContribution::FormIdFinding {
@@ -618,9 +618,9 @@ fn scan_analysis_context_builds_from_arc_sections() {
         .collect();
     let segments = parser.parse_all_sections_arc(&arc_lines);
 
-    let context = ScanAnalysisContext::from_arc_sections(processed_lines.clone(), &segments);
+    let context = ScanAnalysisContext::from_arc_sections(arc_lines.clone(), &segments);
 
-    assert_eq!(context.processed_lines, processed_lines);
+    assert_eq!(context.processed_lines, arc_lines);
     assert_eq!(
         context.combined_crash_lines,
         vec![
@@ -1178,8 +1178,7 @@ fn process_log_renders_structured_mods_solu_any_matches() {
         "      It causes crashes and stutter.\n"
     ));
     let log_contents = structured_mods_solu_log(&[("01", "DLCUltraHighResolution.esp")]);
-    let processed_lines = orchestrator
-        .reformat_crash_data_inline(&log_contents.lines().map(str::to_string).collect::<Vec<_>>());
+    let processed_lines = orchestrator.reformat_crash_lines(log_contents.lines());
     let context = ScanAnalysisContext::from_processed_lines(&orchestrator.parser, processed_lines);
     assert!(
         !context.plugin_lines.is_empty(),
@@ -1280,3 +1279,38 @@ fn process_log_suppresses_structured_mods_solu_exceptions() {
     assert!(!report_text.contains("Everyone's Best Friend"));
     assert!(!report_text.contains("### Checking For Mods That HAVE SOLUTIONS"));
 }
+
+#[test]
+fn shared_line_reformatting_matches_owned_reformatting() {
+    let mut config = AnalysisConfig::new("Fallout4".to_string(), "auto".to_string());
+    config.simplify_logs = true;
+    config.remove_list = vec!["REMOVE ME".to_string()];
+    let orchestrator = OrchestratorCore::new(config).expect("orchestrator should build");
+    let log = concat!(
+        "Unhandled exception at [ 1]\n",
+        "line to REMOVE ME\n",
+        "PLUGINS:\n",
+        "\t[ 0] Fallout4.esm\n",
+        "\t[FE:  1] Light.esl\n",
+        "\t[01] Padded.esp\n",
+    );
+
+    let shared = orchestrator.reformat_crash_lines(log.lines());
+    let owned = orchestrator
+        .reformat_crash_data_inline(&log.lines().map(str::to_string).collect::<Vec<_>>());
+
+    assert_eq!(
+        shared.iter().map(|line| line.as_ref()).collect::<Vec<_>>(),
+        owned.iter().map(String::as_str).collect::<Vec<_>>()
+    );
+    assert_eq!(
+        owned,
+        vec![
+            "Unhandled exception at [ 1]",
+            "PLUGINS:",
+            "\t[00] Fallout4.esm",
+            "\t[FE:001] Light.esl",
+            "\t[01] Padded.esp",
+        ]
+    );
+}
@@ -12,23 +12,28 @@ use dashmap::DashMap;
 use lru::LruCache;
 use parking_lot::RwLock;
 use rayon::prelude::*;
-use regex::Regex;
+use regex::{Regex, RegexSet};
 use std::collections::HashMap;
 use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Arc, LazyLock};
 
 // Type aliases for complex cache types (Clippy type_complexity fix)
 /// Cache for parsed named segments indexed by hash.
 ///
-/// Keys are the xxhash3 of the log (calculated from line count + sample lines).
+/// Keys are the full-content xxhash3 of the log (see `LogParser::calculate_hash`).
 /// Values are `HashMap<String, Vec<Arc<str>>>` as produced by `parse_all_sections_arc`.
 type SegmentCache = Arc<RwLock<LruCache<u64, HashMap<String, Vec<Arc<str>>>>>>;
 
-/// Cache for pattern matches indexed by cache key, containing tuples of (line_num, pattern_name, matched_text)
-type PatternCache = Arc<RwLock<LruCache<String, Vec<(usize, String, String)>>>>;
+/// Cache for pattern matches keyed by (content hash, pattern engine generation), containing
+/// tuples of (line_num, pattern_name, matched_text)
+type PatternCache = Arc<RwLock<LruCache<(u64, u64), Vec<(usize, String, String)>>>>;
 
-/// Snapshot of custom patterns as (name, compiled_regex) pairs for lock-free iteration
-type CustomPatternsSnapshot = Arc<RwLock<Vec<(Arc<str>, Arc<Regex>)>>>;
+/// Current multi-pattern engine, swapped wholesale when a custom pattern is added
+type PatternEngineSnapshot = Arc<RwLock<Arc<PatternEngine>>>;
+
+/// One (line_num, pattern_name, matched_text) hit reported by `find_patterns`
+type PatternHit = (usize, String, String);
 
 fn compile_static_regex(pattern: &str, name: &str) -> Regex {
     match Regex::new(pattern) {
@@ -94,6 +99,73 @@ static CRASHGEN_HEADER_PATTERN: LazyLock<Regex> = LazyLock::new(|| {
     )
 });
 
+/// Built-in and custom patterns compiled into one single-pass matcher.
+///
+/// `set` reports every pattern that hits a line in one scan; only those
+/// patterns then run `find` to recover the matched text. Built-in patterns
+/// come first, so hits keep the per-line order of the per-regex loop.
+struct PatternEngine {
+    set: RegexSet,
+    /// Report names and compiled regexes, indexed like `set`.
+    patterns: Vec<(Arc<str>, Regex)>,
+    /// Bumped on every rebuild so cached matches never outlive the pattern set.
+    generation: u64,
+}
+
+impl PatternEngine {
+    /// Compiles the engine. Built-in patterns are reported under their source text.
+    fn build<'a>(
+        generation: u64,
+        builtin: &[Regex],
+        custom: impl IntoIterator<Item = (&'a str, &'a Regex)>,
+    ) -> Result<Self> {
+        let patterns: Vec<(Arc<str>, Regex)> = builtin
+            .iter()
+            .map(|regex| (Arc::from(regex.as_str()), regex.clone()))
+            .chain(
+                custom
+                    .into_iter()
+                    .map(|(name, regex)| (Arc::from(name), regex.clone())),
+            )
+            .collect();
+        let set = RegexSet::new(patterns.iter().map(|(_, regex)| regex.as_str()))?;
+        Ok(Self {
+            set,
+            patterns,
+            generation,
+        })
+    }
+
+    /// Appends the hits for one line, running `find` only for patterns the set matched.
+    fn collect_matches(&self, line_num: usize, line: &str, hits: &mut Vec<PatternHit>) {
+        for index in self.set.matches(line).iter() {
+            let (name, regex) = &self.patterns[index];
+            if let Some(mat) = regex.find(line) {
+                hits.push((line_num, name.to_string(), mat.as_str().to_string()));
+            }
+        }
+    }
+
+    /// Appends the hits for one line by trying every pattern in turn.
+    ///
+    /// This is the pre-`RegexSet` matcher, kept as the `benchmark` baseline.
+    fn collect_matches_per_regex(&self, line_num: usize, line: &str, hits: &mut Vec<PatternHit>) {
+        for (name, regex) in &self.patterns {
+            if let Some(mat) = regex.find(line) {
+                hits.push((line_num, name.to_string(), mat.as_str().to_string()));
+            }
+        }
+    }
+}
+
+/// Lookup counters for the pattern cache, reported by `LogParser::get_stats`.
+#[derive(Default)]
+struct PatternCacheCounters {
+    hits: AtomicU64,
+    misses: AtomicU64,
+    evictions: AtomicU64,
+}
+
 /// High-performance log parser with parallel processing and SIMD optimizations
 pub struct LogParser {
     compiled_patterns: Arc<Vec<Regex>>,
@@ -101,12 +173,13 @@ pub struct LogParser {
     segment_cache: SegmentCache,
     /// Bounded LRU cache for pattern matches (prevents memory leaks)
     pattern_cache: PatternCache,
+    /// Hit/miss/eviction counters for `pattern_cache`, shared across threads
+    pattern_cache_counters: Arc<PatternCacheCounters>,
     /// Custom patterns added at runtime
     custom_patterns: Arc<DashMap<String, Regex>>,
-    /// Snapshot of custom patterns for fast iteration (Optimization 1.5)
-    /// Pre-compiled patterns cached as Arc<Vec<>> to avoid DashMap iteration overhead
-    /// in hot paths. Updated on pattern add (rare operation).
-    custom_patterns_snapshot: CustomPatternsSnapshot,
+    /// Single-pass engine over built-in and custom patterns.
+    /// Rebuilt on pattern add (rare operation) so matching never iterates the DashMap.
+    pattern_engine: PatternEngineSnapshot,
 }
 
 impl LogParser {
@@ -151,12 +224,15 @@ impl LogParser {
         let segment_cache_size = NonZeroUsize::new(100).unwrap_or(NonZeroUsize::MIN); // ~10-50MB typical
         let pattern_cache_size = NonZeroUsize::new(500).unwrap_or(NonZeroUsize::MIN); // ~5-20MB typical
 
+        let pattern_engine = PatternEngine::build(0, &patterns, std::iter::empty())?;
+
         Ok(Self {
             compiled_patterns: Arc::new(patterns),
             segment_cache: Arc::new(RwLock::new(LruCache::new(segment_cache_size))),
             pattern_cache: Arc::new(RwLock::new(LruCache::new(pattern_cache_size))),
+            pattern_cache_counters: Arc::new(PatternCacheCounters::default()),
             custom_patterns: Arc::new(DashMap::new()),
-            custom_patterns_snapshot: Arc::new(RwLock::new(Vec::new())),
+            pattern_engine: Arc::new(RwLock::new(Arc::new(pattern_engine))),
         })
     }
 
@@ -199,27 +275,32 @@ impl LogParser {
     ///
     /// # Performance
     ///
-    /// Patterns are compiled once and reused. Adding patterns is cheap, but searching
-    /// with many custom patterns will impact performance proportionally.
+    /// Patterns are compiled once and reused. Adding a pattern recompiles the shared
+    /// multi-pattern engine, so searching cost grows with the combined automaton rather
+    /// than with one full pass per pattern.
     ///
     /// Optimization 6.1: Changed to `&str` to avoid unnecessary allocations (5-10% reduction)
-    /// Optimization 1.5: Rebuilds pattern snapshot when patterns are added for lock-free iteration
     pub fn add_pattern(&self, name: &str, pattern: &str) -> Result<()> {
         let regex = Regex::new(pattern)?;
-        self.custom_patterns.insert(name.to_string(), regex);
 
-        // Optimization 1.5: Rebuild snapshot when patterns are added
-        // This allows find_patterns_chunked() to use lock-free iteration via RwLock
-        // instead of DashMap iteration (25-40% faster pattern matching)
-        let mut snapshot = self.custom_patterns_snapshot.write();
-        snapshot.clear();
-        for entry in self.custom_patterns.iter() {
-            snapshot.push((
-                Arc::from(entry.key().as_str()),
-                Arc::new(entry.value().clone()),
-            ));
-        }
+        // Hold the engine lock across the insert so concurrent adds rebuild in order.
+        let mut engine = self.pattern_engine.write();
+        // Build from a candidate set first so a failed build leaves the parser unchanged.
+        let mut candidate: Vec<(String, Regex)> = self
+            .custom_patterns
+            .iter()
+            .filter(|entry| entry.key() != name)
+            .map(|entry| (entry.key().clone(), entry.value().clone()))
+            .collect();
+        candidate.push((name.to_string(), regex.clone()));
+        let rebuilt = PatternEngine::build(
+            engine.generation + 1,
+            &self.compiled_patterns,
+            candidate.iter().map(|(name, regex)| (name.as_str(), regex)),
+        )?;
 
+        self.custom_patterns.insert(name.to_string(), regex);
+        *engine = Arc::new(rebuilt);
         Ok(())
     }
 
@@ -462,103 +543,88 @@ impl LogParser {
     ///
     /// # Performance
     ///
-    /// This function processes lines in parallel using Rayon, with typical speedups
-    /// of 5-10x on multi-core systems. Results are cached for repeated searches.
+    /// Each line is scanned once by a `RegexSet` over every pattern; only patterns that
+    /// hit run again to extract their text. Lines are processed in parallel using Rayon
+    /// and results are cached for repeated searches.
     pub fn find_patterns(&self, lines: &[String]) -> Vec<(usize, String, String)> {
-        // Generate cache key from first few lines (for performance)
-        let cache_key = lines
-            .iter()
-            .take(5)
-            .map(|s| s.as_str())
-            .collect::<Vec<_>>()
-            .join("|");
-
-        // Check cache with read lock
-        {
-            let cache = self.pattern_cache.read();
-            if let Some(cached) = cache.peek(&cache_key) {
-                return cached.clone();
-            }
-        }
-
-        // Use the chunked version for processing
         self.find_patterns_chunked(lines, None)
     }
 
     /// Find patterns in parallel chunks for better performance
-    /// Optimization 1.5: Uses pattern snapshot for lock-free iteration (25-40% faster)
+    ///
+    /// Chunks borrow `lines` directly, and each line is scanned once by the shared
+    /// multi-pattern engine. Results are cached under the full-content hash of
+    /// `lines` plus the pattern generation, so logs with identical headers never
+    /// share entries and adding a pattern invalidates earlier results.
     pub fn find_patterns_chunked(
         &self,
         lines: &[String],
         chunk_size: Option<usize>,
     ) -> Vec<(usize, String, String)> {
-        // Generate cache key for caching
-        let cache_key = lines
-            .iter()
-            .take(5)
-            .map(|s| s.as_str())
-            .collect::<Vec<_>>()
-            .join("|");
-        let patterns = self.compiled_patterns.clone();
-
-        // Optimization 1.5: Use pattern snapshot for lock-free iteration
-        // RwLock read is much faster than DashMap iteration under concurrent access
-        let custom_patterns_snapshot = self.custom_patterns_snapshot.read();
-        let custom_snapshot: Vec<_> = custom_patterns_snapshot.iter().cloned().collect();
-        drop(custom_patterns_snapshot); // Release read lock early
-
-        let chunk_size = chunk_size.unwrap_or(100);
-
-        // Process lines in parallel chunks
-        let chunks: Vec<_> = lines.chunks(chunk_size).map(|c| c.to_vec()).collect();
-        let results: Vec<_> = chunks
-            .par_iter()
-            .enumerate()
-            .flat_map(|(chunk_idx, chunk)| {
-                chunk
-                    .iter()
-                    .enumerate()
-                    .flat_map(|(idx, line)| {
-                        let line_num = chunk_idx * chunk_size + idx;
-                        let mut matches = Vec::new();
-
-                        // Check compiled patterns
-                        for pattern in patterns.iter() {
-                            if let Some(mat) = pattern.find(line) {
-                                matches.push((
-                                    line_num,
-                                    pattern.as_str().to_string(),
-                                    mat.as_str().to_string(),
-                                ));
-                            }
-                        }
-
-                        // Optimization 1.5: Check custom patterns using snapshot
-                        for (name, pattern) in custom_snapshot.iter() {
-                            if let Some(mat) = pattern.find(line) {
-                                matches.push((
-                                    line_num,
-                                    name.to_string(),
-                                    mat.as_str().to_string(),
-                                ));
-                            }
-                        }
+        // Key and matches come from one engine snapshot, even if a pattern is added meanwhile.
+        let engine = Arc::clone(&self.pattern_engine.read());
+        let cache_key = (self.calculate_hash(lines), engine.generation);
+        let counters = &self.pattern_cache_counters;
+
+        if let Some(cached) = self.pattern_cache.read().peek(&cache_key) {
+            counters.hits.fetch_add(1, Ordering::Relaxed);
+            return cached.clone();
+        }
+        counters.misses.fetch_add(1, Ordering::Relaxed);
 
-                        matches
-                    })
-                    .collect::<Vec<_>>()
-            })
-            .collect();
+        let results = Self::match_with_engine(&engine, lines, chunk_size.unwrap_or(100), false);
 
         // Cache for small results (avoid caching huge result sets)
         if results.len() < 1000 {
-            let mut cache = self.pattern_cache.write();
-            cache.put(cache_key, results.clone());
+            let evicted = self.pattern_cache.write().push(cache_key, results.clone());
+            if evicted.is_some_and(|(key, _)| key != cache_key) {
+                counters.evictions.fetch_add(1, Ordering::Relaxed);
+            }
         }
 
         results
     }
 
+    /// Matches every line against the current engine without consulting the cache.
+    ///
+    /// `per_regex` selects the baseline loop that tries each pattern separately.
+    fn match_patterns<S: AsRef<str> + Sync>(
+        &self,
+        lines: &[S],
+        chunk_size: usize,
+        per_regex: bool,
+    ) -> Vec<PatternHit> {
+        let engine = Arc::clone(&self.pattern_engine.read());
+        Self::match_with_engine(&engine, lines, chunk_size, per_regex)
+    }
+
+    /// Matches every line against `engine` in parallel, borrowed chunks.
+    fn match_with_engine<S: AsRef<str> + Sync>(
+        engine: &PatternEngine,
+        lines: &[S],
+        chunk_size: usize,
+        per_regex: bool,
+    ) -> Vec<PatternHit> {
+        let chunk_size = chunk_size.max(1);
+
+        lines
+            .par_chunks(chunk_size)
+            .enumerate()
+            .flat_map_iter(|(chunk_idx, chunk)| {
+                let mut hits = Vec::new();
+                for (idx, line) in chunk.iter().enumerate() {
+                    let line_num = chunk_idx * chunk_size + idx;
+                    if per_regex {
+                        engine.collect_matches_per_regex(line_num, line.as_ref(), &mut hits);
+                    } else {
+                        engine.collect_matches(line_num, line.as_ref(), &mut hits);
+                    }
+                }
+                hits
+            })
+            .collect()
+    }
+
     /// Extracts a section from the log between two boundary markers using parallel search.
     ///
     /// This function finds and extracts all lines between a start marker and an end marker.
@@ -878,6 +944,14 @@ impl LogParser {
             "pattern_cache_size".to_string(),
             self.pattern_cache.read().len(),
         );
+        let counters = &self.pattern_cache_counters;
+        for (name, counter) in [
+            ("pattern_cache_hits", &counters.hits),
+            ("pattern_cache_misses", &counters.misses),
+            ("pattern_cache_evictions", &counters.evictions),
+        ] {
+            stats.insert(name.to_string(), counter.load(Ordering::Relaxed) as usize);
+        }
         stats.insert("custom_patterns".to_string(), self.custom_patterns.len());
         stats.insert(
             "compiled_patterns".to_string(),
@@ -1023,6 +1097,10 @@ impl LogParser {
     }
 
     /// Benchmark parsing performance on given data
+    ///
+    /// Pattern timings are uncached: `find_patterns_avg_ms` uses the single-pass
+    /// engine and `find_patterns_per_regex_avg_ms` the one-regex-at-a-time baseline,
+    /// with their ratio in `find_patterns_speedup`.
     pub fn benchmark(&self, lines: &[Arc<str>], iterations: usize) -> HashMap<String, f64> {
         use std::time::Instant;
         let mut results = HashMap::new();
@@ -1035,14 +1113,25 @@ impl LogParser {
         let elapsed = start.elapsed().as_secs_f64() / iterations as f64;
         results.insert("parse_segments_avg_ms".to_string(), elapsed * 1000.0);
 
-        // Benchmark pattern finding (requires Vec<String> for now)
-        let string_lines: Vec<String> = lines.iter().map(|s| s.to_string()).collect();
+        // Benchmark pattern finding, bypassing the result cache so every iteration
+        // scans. The per-regex loop is the pre-RegexSet baseline for comparison.
+        let start = Instant::now();
+        for _ in 0..iterations {
+            let _ = self.match_patterns(lines, 100, true);
+        }
+        let baseline = start.elapsed().as_secs_f64() / iterations as f64;
+        results.insert(
+            "find_patterns_per_regex_avg_ms".to_string(),
+            baseline * 1000.0,
+        );
+
         let start = Instant::now();
         for _ in 0..iterations {
-            let _ = self.find_patterns(&string_lines);
+            let _ = self.match_patterns(lines, 100, false);
         }
         let elapsed = start.elapsed().as_secs_f64() / iterations as f64;
         results.insert("find_patterns_avg_ms".to_string(), elapsed * 1000.0);
+        results.insert("find_patterns_speedup".to_string(), baseline / elapsed);
 
         // Calculate throughput
         let lines_per_sec = lines.len() as f64 / elapsed;
@@ -1052,10 +1141,13 @@ impl LogParser {
     }
 
     /// Parse and analyze crash header information
-    pub fn parse_crash_header(&self, lines: &[String]) -> Result<HashMap<String, String>> {
+    pub fn parse_crash_header<S: AsRef<str>>(
+        &self,
+        lines: &[S],
+    ) -> Result<HashMap<String, String>> {
         let mut header_info = HashMap::new();
         for line in lines.iter().take(50) {
-            let trimmed = line.trim();
+            let trimmed = line.as_ref().trim();
             let normalized = Self::normalize_header_line(trimmed);
 
             // Game version
@@ -1173,35 +1265,18 @@ impl LogParser {
 
     /// Calculate hash for cache key
     ///
-    /// Optimization 4.1: Use xxhash3 with better sampling strategy for improved cache hit rate.
-    /// Expected impact: 90-95% better cache hit rate, 5-10% faster repeated parsing.
-    ///
-    /// Strategy: Hash file size, first 10 lines, last 10 lines, and middle sample
-    /// for large files to reduce collision rate from ~10% to <1%.
-    fn calculate_hash(&self, lines: &[Arc<str>]) -> u64 {
+    /// Optimization 4.1: xxhash3 over the full content. Every line is hashed with its
+    /// length prefixed, so logs that share headers, footers, or line counts still get
+    /// distinct keys; xxhash3 costs far less than the parsing it lets callers skip.
+    fn calculate_hash<S: AsRef<str>>(&self, lines: &[S]) -> u64 {
         use xxhash_rust::xxh3::Xxh3;
 
         let mut hasher = Xxh3::new();
-        let len = lines.len();
-
-        // Hash file size for better uniqueness
-        hasher.update(&len.to_le_bytes());
-
-        // First 10 lines (more samples than before)
-        for line in lines.iter().take(10) {
-            hasher.update(line.as_bytes());
-        }
-
-        // Middle sample for large files (reduces collisions significantly)
-        if len > 100 {
-            for line in lines.iter().skip(len / 2).take(5) {
-                hasher.update(line.as_bytes());
-            }
-        }
-
-        // Last 10 lines (more samples than before)
-        for line in lines.iter().rev().take(10) {
-            hasher.update(line.as_bytes());
+        hasher.update(&lines.len().to_le_bytes());
+        for line in lines {
+            let line = line.as_ref().as_bytes();
+            hasher.update(&line.len().to_le_bytes());
+            hasher.update(line);
         }
 
         hasher.digest()
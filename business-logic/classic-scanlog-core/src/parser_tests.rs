@@ -454,3 +454,92 @@ fn test_parse_crash_header_tolerates_leading_quote_noise() {
         Some(&"Addictol v1.0.0 Feb 16 2026 08:02:06".to_string())
     );
 }
+
+#[test]
+fn test_find_patterns_single_pass_matches_per_regex_baseline() {
+    let parser = LogParser::new(None).unwrap();
+    parser
+        .add_pattern("mod_error", r"MyMod: (ERROR|FATAL)")
+        .unwrap();
+    let mut lines: Vec<String> = include_str!("../benches/fixtures/crash-12624.log")
+        .lines()
+        .map(String::from)
+        .collect();
+    lines.push("MyMod: FATAL while loading FormID: 0x0001F00D".to_string());
+
+    let single_pass = parser.find_patterns_chunked(&lines, Some(7));
+    let baseline = parser.match_patterns(&lines, 7, true);
+
+    assert!(!single_pass.is_empty());
+    assert_eq!(single_pass, baseline);
+    assert!(single_pass.iter().any(|(line_num, name, text)| {
+        *line_num == lines.len() - 1 && name == "mod_error" && text == "MyMod: FATAL"
+    }));
+}
+
+#[test]
+fn test_benchmark_reports_single_pass_and_baseline_timings() {
+    let parser = LogParser::new(None).unwrap();
+    let results = parser.benchmark(&create_sample_log(), 2);
+
+    for key in [
+        "find_patterns_avg_ms",
+        "find_patterns_per_regex_avg_ms",
+        "find_patterns_speedup",
+    ] {
+        assert!(results.contains_key(key), "missing {key}");
+    }
+}
+
+#[test]
+fn test_pattern_cache_keys_on_full_content() {
+    let parser = LogParser::new(None).unwrap();
+    let header: Vec<String> = (0..5).map(|i| format!("Fallout 4 header {i}")).collect();
+    let mut first = header.clone();
+    first.push("[00] Fallout4.esm".to_string());
+    let mut second = header;
+    second.push("RAX: 0x0000000000000000".to_string());
+
+    let first_matches = parser.find_patterns(&first);
+    let second_matches = parser.find_patterns(&second);
+
+    assert_ne!(first_matches, second_matches);
+    assert_eq!(second_matches, parser.match_patterns(&second, 100, false));
+    let stats = parser.get_stats();
+    assert_eq!(stats["pattern_cache_misses"], 2);
+    assert_eq!(stats["pattern_cache_hits"], 0);
+
+    assert_eq!(parser.find_patterns(&first), first_matches);
+    assert_eq!(parser.get_stats()["pattern_cache_hits"], 1);
+}
+
+#[test]
+fn test_pattern_cache_invalidated_by_new_patterns() {
+    let parser = LogParser::new(None).unwrap();
+    let lines = vec!["MyMod: ERROR in script".to_string()];
+
+    let before = parser.find_patterns(&lines);
+    assert!(!before.iter().any(|(_, name, _)| name == "mod_error"));
+
+    parser
+        .add_pattern("mod_error", r"MyMod: (ERROR|FATAL)")
+        .unwrap();
+    let after = parser.find_patterns(&lines);
+    assert!(after.iter().any(|(_, name, _)| name == "mod_error"));
+    assert_eq!(parser.get_stats()["pattern_cache_hits"], 0);
+}
+
+#[test]
+fn test_pattern_cache_counts_evictions() {
+    let parser = LogParser::new(None).unwrap();
+    let capacity = parser.pattern_cache.read().cap().get();
+
+    for i in 0..capacity + 3 {
+        parser.find_patterns(&[format!("Unhandled exception {i}")]);
+    }
+
+    let stats = parser.get_stats();
+    assert_eq!(stats["pattern_cache_size"], capacity);
+    assert_eq!(stats["pattern_cache_evictions"], 3);
+    assert_eq!(stats["pattern_cache_misses"], capacity + 3);
+}
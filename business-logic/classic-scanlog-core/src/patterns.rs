@@ -1,15 +1,18 @@
 //! Pattern matching engine with multi-pattern optimization
 
+use crate::bounded_cache::{BoundedCache, BoundedCacheStats};
 use crate::error::Result;
 use aho_corasick::{AhoCorasick, Match};
-use dashmap::DashMap;
 use std::sync::Arc;
 
+/// Default byte budget for the `find_all` result cache.
+pub const DEFAULT_MATCH_CACHE_BYTES: u64 = 4 * 1024 * 1024;
+
 /// Multi-pattern matcher using Aho-Corasick algorithm
 pub struct PatternMatcher {
     patterns: Arc<Vec<String>>,
     matcher: Arc<AhoCorasick>,
-    match_cache: DashMap<String, Vec<(usize, String)>>,
+    match_cache: BoundedCache<String, Vec<(usize, String)>>,
 }
 
 impl PatternMatcher {
@@ -17,7 +20,8 @@ impl PatternMatcher {
     ///
     /// This constructor initializes a `PatternMatcher` using the Aho-Corasick algorithm
     /// for efficient multi-pattern matching. The matcher is configured for case-insensitive
-    /// ASCII matching and includes an internal cache for repeated matches.
+    /// ASCII matching and includes an internal cache for repeated matches, bounded to
+    /// [`DEFAULT_MATCH_CACHE_BYTES`].
     ///
     /// # Arguments
     ///
@@ -51,6 +55,15 @@ impl PatternMatcher {
     /// # Ok::<(), classic_scanlog_core::error::ScanLogError>(())
     /// ```
     pub fn new(patterns: Vec<String>) -> Result<Self> {
+        Self::with_cache_budget(patterns, DEFAULT_MATCH_CACHE_BYTES)
+    }
+
+    /// Creates a pattern matcher whose `find_all` cache holds at most `cache_bytes`.
+    ///
+    /// # Errors
+    ///
+    /// Returns `ScanLogError::PatternError` if the Aho-Corasick automaton cannot be built.
+    pub fn with_cache_budget(patterns: Vec<String>, cache_bytes: u64) -> Result<Self> {
         let matcher = AhoCorasick::builder()
             .ascii_case_insensitive(true)
             .build(&patterns)?;
@@ -58,7 +71,7 @@ impl PatternMatcher {
         Ok(Self {
             patterns: Arc::new(patterns),
             matcher: Arc::new(matcher),
-            match_cache: DashMap::new(),
+            match_cache: BoundedCache::new(cache_bytes),
         })
     }
 
@@ -66,7 +79,7 @@ impl PatternMatcher {
     pub fn find_all(&self, text: &str) -> Vec<(usize, String)> {
         // Check cache first
         if let Some(cached) = self.match_cache.get(text) {
-            return cached.clone();
+            return cached;
         }
 
         let matches: Vec<(usize, String)> = self
@@ -109,6 +122,11 @@ impl PatternMatcher {
         (self.patterns.len(), self.match_cache.len())
     }
 
+    /// Get hit, miss, eviction and resident-byte counters for the match cache
+    pub fn cache_metrics(&self) -> BoundedCacheStats {
+        self.match_cache.stats()
+    }
+
     /// Clear the match cache
     pub fn clear_cache(&self) {
         self.match_cache.clear();
@@ -264,3 +264,22 @@ fn test_long_text() {
     let long_text = format!("{}NEEDLE{}", "X".repeat(10000), "Y".repeat(10000));
     assert!(matcher.has_match(&long_text));
 }
+
+#[test]
+fn test_match_cache_is_bounded_and_reports_metrics() {
+    let patterns = vec!["error".to_string()];
+    let matcher = PatternMatcher::with_cache_budget(patterns, 8 * 1024).unwrap();
+
+    assert_eq!(matcher.find_all("an error here").len(), 1);
+    assert_eq!(matcher.find_all("an error here").len(), 1);
+    for i in 0..1_000 {
+        matcher.find_all(&format!("line {i} with an error"));
+    }
+
+    let metrics = matcher.cache_metrics();
+    assert_eq!(metrics.hits, 1);
+    assert_eq!(metrics.misses, 1_001);
+    assert!(metrics.evictions > 0);
+    assert!(metrics.resident_bytes <= metrics.capacity_bytes);
+    assert_eq!(matcher.get_stats().1, metrics.entries);
+}
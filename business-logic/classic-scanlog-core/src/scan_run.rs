@@ -5,6 +5,7 @@
 //! and optional Unsolved Logs relocation.
 
 pub mod contract;
+mod result_cache;
 
 use crate::error::{Result, ScanLogError};
 use crate::orchestrator::resolve_batch_concurrency;
@@ -13,7 +14,7 @@ use crate::{
     AnalysisResult, ConfigIssue, CrashLogScanFacts, CrashLogScanIntake, CrashLogScanOptions,
     OrchestratorCore, ScanProgressPhase, ScanReadyAnalysis,
 };
-use classic_database_core::DatabasePool;
+use classic_database_core::{DatabasePool, open_current_formid_index};
 use classic_file_io_core::{LogCollector, RejectedInput, resolve_targeted_inputs};
 use classic_operation_context::scope_cancellation;
 use classic_scangame_core::{
@@ -26,15 +27,20 @@ use std::future::Future;
 use std::path::{Path, PathBuf};
 use std::pin::Pin;
 use std::sync::Arc;
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::time::Duration;
+use std::sync::atomic::{AtomicBool, AtomicU64, AtomicUsize, Ordering};
+use std::time::{Duration, Instant};
 use tokio::sync::mpsc;
 
+use self::result_cache::{CachedScanResult, ScanResultCache, report_lines_hash};
 #[cfg(test)]
 use self::test_support::{InfrastructureFault, ScanRunTestHooks};
 
 const CANCELLED_BY_USER_MESSAGE: &str = "Cancelled by user";
 
+/// Receiver for terminal outcomes streamed out of the scheduler instead of retained.
+pub(super) type CrashLogScanRunOutcomeSink<'a> =
+    &'a mut (dyn FnMut(CrashLogScanRunLogOutcome) + Send);
+
 /// Internal lifecycle events used to stream engine state into the final contract.
 pub(super) enum CrashLogScanRunServiceEvent {
     /// Discovery completed with a retainable result.
@@ -68,9 +74,13 @@ impl CrashLogScanRunServiceError {
 }
 
 /// Executes the internal engine while exposing complete lifecycle hooks to the final contract.
+///
+/// When `on_outcome` is supplied, scheduled outcomes are handed to it as each log
+/// finalizes and the returned result carries counts without retaining them.
 pub(super) async fn execute_service<F>(
     request: CrashLogScanRunServiceRequest,
     mut on_event: F,
+    on_outcome: Option<CrashLogScanRunOutcomeSink<'_>>,
 ) -> std::result::Result<CrashLogScanRunResult, CrashLogScanRunServiceError>
 where
     F: FnMut(CrashLogScanRunServiceEvent),
@@ -210,8 +220,16 @@ where
         request.move_unsolved_logs,
         configured_unsolved_logs_destination,
     );
+    let result_cache = if request.incremental {
+        ScanResultCache::open(&ready, &request.game_version)
+            .await
+            .map(Arc::new)
+    } else {
+        None
+    };
     let setup_snapshot = setup.map(Arc::new);
-    let run = CrashLogScanRun::with_setup(ready, setup_snapshot.clone());
+    let run =
+        CrashLogScanRun::with_setup(ready, setup_snapshot.clone()).with_result_cache(result_cache);
     #[cfg(test)]
     let run = run.with_test_hooks(request.test_hooks.clone());
     let mut result = run
@@ -219,9 +237,11 @@ where
             discovery.accepted_logs.clone(),
             intent,
             effective_concurrency,
+            request.scheduling,
             request.cancellation.clone(),
             request.preserve_order,
             |event| on_event(CrashLogScanRunServiceEvent::Log(event)),
+            on_outcome,
         )
         .await
         .map_err(|error| service_execution_error(error, database_path.clone()))?;
@@ -238,6 +258,100 @@ where
     Ok(result)
 }
 
+/// Analyzes in-memory Crash Logs over one orchestrator built for the whole batch.
+///
+/// There is no discovery, FCX setup, Autoscan Report persistence, or Unsolved Logs
+/// handling: payloads are decoded and analyzed on blocking workers, and results are
+/// returned in input order.
+pub(super) async fn analyze_contents_service(
+    configuration: contract::Configuration,
+    logs: Vec<contract::LogContent>,
+) -> std::result::Result<Vec<AnalysisResult>, CrashLogScanRunServiceError> {
+    let intake_path = Some(configuration.yaml_dir_data.clone());
+    let mut scan_facts = configuration.scan_facts;
+    // Nothing is relocated, so a configured destination must not fail intake.
+    scan_facts.unsolved_logs_destination = None;
+    let ready = CrashLogScanIntake::from_yaml_paths(
+        configuration.yaml_dir_root,
+        configuration.yaml_dir_data,
+        configuration.game.as_str().to_string(),
+        configuration.game_version,
+        CrashLogScanOptions::new(
+            configuration.options.show_formid_values,
+            false,
+            configuration.options.simplify_logs,
+        ),
+    )
+    .with_scan_facts(scan_facts)
+    .prepare()
+    .await
+    .map_err(|error| {
+        CrashLogScanRunServiceError::new(
+            contract::InfrastructureErrorStage::Intake,
+            intake_path,
+            error,
+        )
+    })?;
+
+    let database_path = ready.formid_readiness().database_paths().first().cloned();
+    let concurrency = resolve_batch_concurrency(
+        logs.len(),
+        normalize_scan_run_concurrency(configuration.max_concurrent),
+    );
+    let orchestrator = Arc::new(
+        CrashLogScanRun::with_setup(ready, None)
+            .build_orchestrator()
+            .await
+            .map_err(|error| service_execution_error(error, database_path.clone()))?,
+    );
+
+    let runtime = tokio::runtime::Handle::current();
+    let results = futures::stream::iter(logs.into_iter().map(|log| {
+        let orchestrator = Arc::clone(&orchestrator);
+        let runtime = runtime.clone();
+        async move {
+            let log_name = log.name.clone();
+            let worker = tokio::task::spawn_blocking(move || {
+                runtime.block_on(orchestrator.process_log_content(log.name, &log.bytes))
+            });
+            match worker.await {
+                Ok(Ok(result)) => result,
+                Ok(Err(error)) => AnalysisResult::failure(log_name, error.to_string()),
+                Err(error) => AnalysisResult::failure(
+                    log_name,
+                    format!("Crash Log analysis worker failed: {error}"),
+                ),
+            }
+        }
+    }))
+    .buffered(concurrency)
+    .collect::<Vec<_>>()
+    .await;
+
+    exit_shared_orchestrator(orchestrator)
+        .await
+        .map_err(|error| service_execution_error(error, database_path))?;
+    Ok(results)
+}
+
+/// Runs [`OrchestratorCore::async_exit`] once every worker has released its handle.
+///
+/// Workers drop their clone when their log resolves, so a handle that is still shared
+/// here means one outlived the run. Cleanup is skipped in that case and logged rather
+/// than silently ignored.
+async fn exit_shared_orchestrator(orchestrator: Arc<OrchestratorCore>) -> Result<()> {
+    match Arc::try_unwrap(orchestrator) {
+        Ok(mut orchestrator) => orchestrator.async_exit().await,
+        Err(orchestrator) => {
+            log::error!(
+                "Skipping orchestrator cleanup: {} handles are still held after the run",
+                Arc::strong_count(&orchestrator)
+            );
+            Ok(())
+        }
+    }
+}
+
 /// Returns the most useful path for a failure while discovering the requested source.
 fn discovery_relevant_path(source: &CrashLogScanSource) -> Option<PathBuf> {
     match source {
@@ -296,6 +410,10 @@ pub(crate) struct CrashLogScanRunServiceRequest {
     pub scan_facts: CrashLogScanFacts,
     /// Optional maximum number of concurrently processed Crash Logs.
     pub max_concurrent: Option<usize>,
+    /// Where admitted Crash Logs execute once scheduling begins.
+    pub scheduling: contract::SchedulingMode,
+    /// Whether unchanged Crash Logs reuse their existing Autoscan Report.
+    pub incremental: bool,
     /// Optional cooperative cancellation flag.
     pub cancellation: Option<Arc<AtomicBool>>,
     /// Return log outcomes in input order instead of completion order.
@@ -473,6 +591,7 @@ pub struct CrashLogScanSetupPathUpdate {
 pub(crate) struct CrashLogScanRun {
     ready: ScanReadyAnalysis,
     setup: Option<Arc<CrashLogScanSetupResult>>,
+    result_cache: Option<Arc<ScanResultCache>>,
     #[cfg(test)]
     test_hooks: ScanRunTestHooks,
 }
@@ -484,23 +603,137 @@ struct ScheduledLogPhase {
     phase: ScanProgressPhase,
 }
 
+/// Number of coarse phases tracked by [`PhaseOccupancy`].
+const PHASE_COUNT: usize = 4;
+
+/// Coarse phases in pipeline order, matching [`phase_slot`].
+const PHASES: [ScanProgressPhase; PHASE_COUNT] = [
+    ScanProgressPhase::Setup,
+    ScanProgressPhase::Parse,
+    ScanProgressPhase::Analyze,
+    ScanProgressPhase::Finalize,
+];
+
+/// Maps a coarse phase onto its [`PhaseOccupancy`] counter slot.
+const fn phase_slot(phase: ScanProgressPhase) -> usize {
+    match phase {
+        ScanProgressPhase::Setup => 0,
+        ScanProgressPhase::Parse => 1,
+        ScanProgressPhase::Analyze => 2,
+        ScanProgressPhase::Finalize => 3,
+    }
+}
+
+/// Run-scoped per-phase occupancy counters shared by every admitted log.
+///
+/// Counters are updated from whichever thread executes a log, so the measured
+/// peaks reflect real overlap rather than the order the pump observes events in.
+#[derive(Default)]
+struct PhaseOccupancy {
+    active: [AtomicUsize; PHASE_COUNT],
+    peak: [AtomicUsize; PHASE_COUNT],
+    busy_us: [AtomicU64; PHASE_COUNT],
+}
+
+impl PhaseOccupancy {
+    fn enter(&self, phase: ScanProgressPhase) {
+        let slot = phase_slot(phase);
+        let active = self.active[slot].fetch_add(1, Ordering::AcqRel) + 1;
+        self.peak[slot].fetch_max(active, Ordering::AcqRel);
+    }
+
+    fn leave(&self, phase: ScanProgressPhase, elapsed: Duration) {
+        let slot = phase_slot(phase);
+        self.active[slot].fetch_sub(1, Ordering::AcqRel);
+        self.busy_us[slot].fetch_add(elapsed.as_micros() as u64, Ordering::Relaxed);
+    }
+
+    /// Builds the contract-facing measurements once every admitted log has finished.
+    fn snapshot(
+        &self,
+        scheduling: contract::SchedulingMode,
+        workers: usize,
+        wall_time: Duration,
+    ) -> contract::Utilization {
+        contract::Utilization {
+            scheduling,
+            workers,
+            wall_time_us: wall_time.as_micros() as u64,
+            phases: PHASES
+                .into_iter()
+                .map(|phase| {
+                    let slot = phase_slot(phase);
+                    contract::PhaseUtilization {
+                        phase,
+                        peak_parallelism: self.peak[slot].load(Ordering::Acquire),
+                        busy_time_us: self.busy_us[slot].load(Ordering::Acquire),
+                    }
+                })
+                .collect(),
+        }
+    }
+}
+
+/// Tracks the phase one admitted log currently occupies.
+struct LogPhaseClock<'a> {
+    occupancy: &'a PhaseOccupancy,
+    current: Option<(ScanProgressPhase, Instant)>,
+}
+
+impl<'a> LogPhaseClock<'a> {
+    fn new(occupancy: &'a PhaseOccupancy) -> Self {
+        Self {
+            occupancy,
+            current: None,
+        }
+    }
+
+    /// Moves this log into `phase`, closing the previous phase's busy interval.
+    fn advance(&mut self, phase: ScanProgressPhase) {
+        if self.current.is_some_and(|(current, _)| current == phase) {
+            return;
+        }
+        self.finish();
+        self.occupancy.enter(phase);
+        self.current = Some((phase, Instant::now()));
+    }
+
+    /// Closes the current phase once the log reaches its terminal outcome.
+    fn finish(&mut self) {
+        if let Some((phase, started)) = self.current.take() {
+            self.occupancy.leave(phase, started.elapsed());
+        }
+    }
+}
+
 /// Internal engine for one admitted log's analysis and durable finalization.
-struct SingleLogAnalysisEngine<'a> {
-    orchestrator: &'a OrchestratorCore,
-    unsolved_logs_destination: Option<&'a Path>,
+///
+/// The engine owns shared handles so [`contract::SchedulingMode::Parallel`] can move
+/// a clone onto a blocking worker while the cooperative mode borrows it in place.
+#[derive(Clone)]
+struct SingleLogAnalysisEngine {
+    orchestrator: Arc<OrchestratorCore>,
+    unsolved_logs_destination: Option<PathBuf>,
+    occupancy: Arc<PhaseOccupancy>,
+    result_cache: Option<Arc<ScanResultCache>>,
     #[cfg(test)]
-    test_hooks: &'a ScanRunTestHooks,
+    test_hooks: ScanRunTestHooks,
 }
 
-impl SingleLogAnalysisEngine<'_> {
+impl SingleLogAnalysisEngine {
     /// Analyzes and finalizes one admitted Crash Log without consulting cancellation again.
+    ///
+    /// With a re-scan cache attached, an unchanged log whose Autoscan Report is still
+    /// on disk skips analysis and finalization and reuses that report.
     async fn analyze_and_finalize(
         &self,
         input_index: usize,
         crash_log: PathBuf,
         phase_tx: mpsc::UnboundedSender<ScheduledLogPhase>,
     ) -> CrashLogScanRunLogOutcome {
+        let started_at = Instant::now();
         let log_path = crash_log.to_string_lossy().to_string();
+        let mut clock = LogPhaseClock::new(&self.occupancy);
         #[cfg(test)]
         if let Some(delay) = self.test_hooks.analysis_delay(input_index) {
             tokio::time::sleep(delay).await;
@@ -512,12 +745,31 @@ impl SingleLogAnalysisEngine<'_> {
             .map(|message| AnalysisResult::failure(log_path.clone(), message.to_string()));
         #[cfg(not(test))]
         let injected_result: Option<AnalysisResult> = None;
+        let mut log_hash = None;
+        if injected_result.is_none()
+            && let Some(cache) = self.result_cache.as_deref()
+            && let Some(probe) = cache.probe(&crash_log).await
+        {
+            if let Some((autoscan_report, cached)) = probe.reusable {
+                clock.advance(ScanProgressPhase::Finalize);
+                clock.finish();
+                return reused_report_outcome(
+                    input_index,
+                    crash_log,
+                    autoscan_report,
+                    cached,
+                    started_at.elapsed(),
+                );
+            }
+            log_hash = Some(probe.log_hash);
+        }
         let result = if let Some(result) = injected_result {
             result
         } else {
             match self
                 .orchestrator
                 .process_log_with_progress(log_path.clone(), |phase| {
+                    clock.advance(phase);
                     let _ = phase_tx.send(ScheduledLogPhase {
                         input_index,
                         crash_log: crash_log.clone(),
@@ -531,15 +783,63 @@ impl SingleLogAnalysisEngine<'_> {
             }
         };
 
-        finalize_log_outcome(
+        let fresh_entry = log_hash.filter(|_| result.success).map(|log_hash| {
+            (
+                log_hash,
+                CachedScanResult {
+                    report_hash: report_lines_hash(&result.report_lines),
+                    formid_count: result.formid_count,
+                    plugin_count: result.plugin_count,
+                    suspect_count: result.suspect_count,
+                },
+            )
+        });
+
+        // Durable finalization belongs to Finalize even when analysis failed early.
+        clock.advance(ScanProgressPhase::Finalize);
+        let outcome = finalize_log_outcome(
             input_index,
             result,
-            self.unsolved_logs_destination,
-            self.orchestrator,
+            self.unsolved_logs_destination.as_deref(),
+            &self.orchestrator,
             #[cfg(test)]
-            self.test_hooks,
+            &self.test_hooks,
         )
-        .await
+        .await;
+        if let Some(cache) = self.result_cache.as_deref()
+            && let Some((log_hash, entry)) = fresh_entry
+            && outcome.outcome == CrashLogScanOutcome::Succeeded
+            && outcome.autoscan_report.is_some()
+        {
+            cache.record(log_hash, entry);
+        }
+        clock.finish();
+        outcome
+    }
+}
+
+/// Runs one admitted log on a blocking worker so its CPU-bound phases leave the pump task.
+///
+/// The worker drives the log's async I/O through the current runtime handle. Admission
+/// still bounds the number of live workers to the run's effective concurrency.
+async fn analyze_on_worker(
+    engine: SingleLogAnalysisEngine,
+    input_index: usize,
+    crash_log: PathBuf,
+    phase_tx: mpsc::UnboundedSender<ScheduledLogPhase>,
+) -> CrashLogScanRunLogOutcome {
+    let runtime = tokio::runtime::Handle::current();
+    let worker_log = crash_log.clone();
+    let worker = tokio::task::spawn_blocking(move || {
+        runtime.block_on(engine.analyze_and_finalize(input_index, worker_log, phase_tx))
+    });
+    match worker.await {
+        Ok(outcome) => outcome,
+        Err(error) => worker_failure_outcome(
+            input_index,
+            crash_log,
+            format!("Crash Log analysis worker failed: {error}"),
+        ),
     }
 }
 
@@ -549,11 +849,18 @@ impl CrashLogScanRun {
         Self {
             ready,
             setup,
+            result_cache: None,
             #[cfg(test)]
             test_hooks: ScanRunTestHooks::default(),
         }
     }
 
+    /// Attaches the persistent re-scan cache consulted before each log's analysis.
+    fn with_result_cache(mut self, result_cache: Option<Arc<ScanResultCache>>) -> Self {
+        self.result_cache = result_cache;
+        self
+    }
+
     #[cfg(test)]
     /// Attaches request-scoped deterministic hooks without exposing them publicly.
     fn with_test_hooks(mut self, test_hooks: ScanRunTestHooks) -> Self {
@@ -566,14 +873,17 @@ impl CrashLogScanRun {
     /// Effective concurrency is selected by the caller exactly once. Cancellation is
     /// checked only before admission; once `Started` is published, the engine runs
     /// through report persistence and applicable Unsolved Logs finalization.
+    #[allow(clippy::too_many_arguments)]
     async fn run_scheduled<F>(
         &self,
         logs: Vec<PathBuf>,
         intent: CrashLogScanRunIntent,
         effective_concurrency: usize,
+        scheduling: contract::SchedulingMode,
         cancellation: Option<Arc<AtomicBool>>,
         preserve_order: bool,
         mut on_event: F,
+        on_outcome: Option<CrashLogScanRunOutcomeSink<'_>>,
     ) -> Result<CrashLogScanRunResult>
     where
         F: FnMut(CrashLogScanRunEvent),
@@ -586,24 +896,39 @@ impl CrashLogScanRun {
         }
 
         let unsolved_logs_destination = resolve_unsolved_logs_destination(&self.ready, &intent)?;
-        let mut orchestrator = self.build_orchestrator().await?;
-        let mut outcomes = schedule_logs(
-            &orchestrator,
+        let orchestrator = Arc::new(self.build_orchestrator().await?);
+        let (collected, utilization) = schedule_logs(
+            Arc::clone(&orchestrator),
             logs,
-            unsolved_logs_destination.as_deref(),
+            unsolved_logs_destination,
             effective_concurrency,
+            scheduling,
+            self.result_cache.clone(),
             cancellation.as_ref(),
             &mut on_event,
+            OutcomeCollector::new(total, on_outcome),
             #[cfg(test)]
-            &self.test_hooks,
+            self.test_hooks.clone(),
         )
         .await;
-        orchestrator.async_exit().await?;
+        exit_shared_orchestrator(orchestrator).await?;
+        if let Some(cache) = &self.result_cache
+            && let Err(error) = cache.persist().await
+        {
+            log::warn!("Failed to persist scan result cache: {error}");
+        }
 
+        let OutcomeCollector {
+            counts,
+            mut retained,
+            ..
+        } = collected;
         if preserve_order {
-            outcomes.sort_by_key(|outcome| outcome.input_index);
+            retained.sort_by_key(|outcome| outcome.input_index);
         }
-        Ok(CrashLogScanRunResult::from_outcomes(outcomes))
+        let mut result = CrashLogScanRunResult::from_outcomes(counts, retained);
+        result.utilization = Some(utilization);
+        Ok(result)
     }
 
     /// Rejects FCX execution when no immutable run-owned setup snapshot is attached.
@@ -622,17 +947,24 @@ impl CrashLogScanRun {
         orchestrator.set_scan_run_setup(self.setup.clone());
 
         if self.ready.should_initialize_formid_database() {
-            let cache_profile = self.ready.cache_profile();
-            let pool = Arc::new(DatabasePool::new(
-                None,
-                Duration::from_secs(cache_profile.cache_ttl_secs),
-                self.ready.analysis_config().game.clone(),
-            ));
-            cache_profile.apply_to_pool(&pool);
-            pool.initialize(self.ready.formid_readiness().database_paths.clone())
-                .await
-                .map_err(|error| ScanLogError::DatabaseError(error.to_string()))?;
-            orchestrator.attach_database_pool(pool)?;
+            let database_paths = self.ready.formid_readiness().database_paths();
+            let game_table = self.ready.analysis_config().game.as_str();
+            // A current prebuilt index is mapped instead of opening one pool per database.
+            if let Some(index) = open_current_formid_index(database_paths, game_table) {
+                orchestrator.attach_formid_index(Arc::new(index))?;
+            } else {
+                let cache_profile = self.ready.cache_profile();
+                let pool = Arc::new(DatabasePool::new(
+                    None,
+                    Duration::from_secs(cache_profile.cache_ttl_secs),
+                    game_table.to_string(),
+                ));
+                cache_profile.apply_to_pool(&pool);
+                pool.initialize(database_paths.to_vec())
+                    .await
+                    .map_err(|error| ScanLogError::DatabaseError(error.to_string()))?;
+                orchestrator.attach_database_pool(pool)?;
+            }
         }
 
         orchestrator.async_enter(None).await?;
@@ -641,22 +973,32 @@ impl CrashLogScanRun {
 }
 
 /// Schedules discovered logs and serializes every observer call from one execution pump.
-async fn schedule_logs<F>(
-    orchestrator: &OrchestratorCore,
+///
+/// Under [`contract::SchedulingMode::Parallel`] admitted logs execute on blocking
+/// workers, but phase and terminal events still flow back through this pump only.
+#[allow(clippy::too_many_arguments)]
+async fn schedule_logs<'s, F>(
+    orchestrator: Arc<OrchestratorCore>,
     logs: Vec<PathBuf>,
-    unsolved_logs_destination: Option<&Path>,
+    unsolved_logs_destination: Option<PathBuf>,
     effective_concurrency: usize,
+    scheduling: contract::SchedulingMode,
+    result_cache: Option<Arc<ScanResultCache>>,
     cancellation: Option<&Arc<AtomicBool>>,
     on_event: &mut F,
-    #[cfg(test)] test_hooks: &ScanRunTestHooks,
-) -> Vec<CrashLogScanRunLogOutcome>
+    mut collected: OutcomeCollector<'s>,
+    #[cfg(test)] test_hooks: ScanRunTestHooks,
+) -> (OutcomeCollector<'s>, contract::Utilization)
 where
     F: FnMut(CrashLogScanRunEvent),
 {
     let total = logs.len();
+    let occupancy = Arc::new(PhaseOccupancy::default());
     let engine = SingleLogAnalysisEngine {
         orchestrator,
         unsolved_logs_destination,
+        occupancy: Arc::clone(&occupancy),
+        result_cache,
         #[cfg(test)]
         test_hooks,
     };
@@ -678,8 +1020,8 @@ where
     let (phase_tx, mut phase_rx) = mpsc::unbounded_channel::<ScheduledLogPhase>();
     let mut pending = logs.into_iter().enumerate().collect::<VecDeque<_>>();
     let mut admitted = FuturesUnordered::<AdmittedLogFuture<'_>>::new();
-    let mut outcomes = Vec::with_capacity(total);
     let mut completed = 0usize;
+    let started_at = Instant::now();
 
     loop {
         while admitted.len() < effective_concurrency {
@@ -702,11 +1044,18 @@ where
                 total,
                 disposition: None,
             });
-            admitted.push(Box::pin(engine.analyze_and_finalize(
-                input_index,
-                crash_log,
-                phase_tx.clone(),
-            )));
+            let admitted_log: AdmittedLogFuture<'_> = match scheduling {
+                contract::SchedulingMode::Cooperative => {
+                    Box::pin(engine.analyze_and_finalize(input_index, crash_log, phase_tx.clone()))
+                }
+                contract::SchedulingMode::Parallel => Box::pin(analyze_on_worker(
+                    engine.clone(),
+                    input_index,
+                    crash_log,
+                    phase_tx.clone(),
+                )),
+            };
+            admitted.push(admitted_log);
         }
 
         if admitted.is_empty() {
@@ -729,11 +1078,12 @@ where
                 }
                 completed += 1;
                 on_event(outcome.terminal_event(completed, total));
-                outcomes.push(outcome);
+                collected.push(outcome);
             }
         }
     }
 
+    let wall_time = started_at.elapsed();
     while let Ok(phase) = phase_rx.try_recv() {
         emit_scheduled_phase(on_event, phase, completed, total);
     }
@@ -741,10 +1091,63 @@ where
         let outcome = cancelled_log_outcome(input_index, crash_log);
         completed += 1;
         on_event(outcome.terminal_event(completed, total));
-        outcomes.push(outcome);
+        collected.push(outcome);
     }
 
-    outcomes
+    let utilization = occupancy.snapshot(scheduling, effective_concurrency, wall_time);
+    (collected, utilization)
+}
+
+/// Per-disposition tallies for a run whose outcomes may not all be retained.
+#[derive(Clone, Copy, Debug, Default, Eq, PartialEq)]
+struct OutcomeCounts {
+    total: usize,
+    succeeded: usize,
+    failed: usize,
+    cancelled: usize,
+}
+
+impl OutcomeCounts {
+    fn record(&mut self, outcome: CrashLogScanOutcome) {
+        self.total += 1;
+        match outcome {
+            CrashLogScanOutcome::Succeeded => self.succeeded += 1,
+            CrashLogScanOutcome::Failed => self.failed += 1,
+            CrashLogScanOutcome::CancelledBeforeStart => self.cancelled += 1,
+        }
+    }
+}
+
+/// Routes each terminal outcome to the streaming sink, or retains it for the result.
+///
+/// Counts are always kept, so a streamed run still reports complete totals while
+/// holding no more outcomes than are in flight.
+struct OutcomeCollector<'a> {
+    counts: OutcomeCounts,
+    retained: Vec<CrashLogScanRunLogOutcome>,
+    sink: Option<CrashLogScanRunOutcomeSink<'a>>,
+}
+
+impl<'a> OutcomeCollector<'a> {
+    fn new(total: usize, sink: Option<CrashLogScanRunOutcomeSink<'a>>) -> Self {
+        Self {
+            counts: OutcomeCounts::default(),
+            retained: if sink.is_some() {
+                Vec::new()
+            } else {
+                Vec::with_capacity(total)
+            },
+            sink,
+        }
+    }
+
+    fn push(&mut self, outcome: CrashLogScanRunLogOutcome) {
+        self.counts.record(outcome.outcome);
+        match self.sink.as_deref_mut() {
+            Some(sink) => sink(outcome),
+            None => self.retained.push(outcome),
+        }
+    }
 }
 
 /// Internal normalized Crash Log Scan Run intent.
@@ -827,6 +1230,8 @@ pub(crate) struct CrashLogScanRunResult {
     pub cancelled: usize,
     /// Per-log outcomes.
     pub logs: Vec<CrashLogScanRunLogOutcome>,
+    /// Measured per-phase parallelism once scheduling admitted work.
+    pub utilization: Option<contract::Utilization>,
 }
 
 impl CrashLogScanRunResult {
@@ -841,20 +1246,18 @@ impl CrashLogScanRunResult {
             failed: 0,
             cancelled: 0,
             logs: Vec::new(),
+            utilization: None,
         }
     }
 
-    fn from_outcomes(logs: Vec<CrashLogScanRunLogOutcome>) -> Self {
-        let total = logs.len();
-        let succeeded = logs
-            .iter()
-            .filter(|outcome| outcome.outcome == CrashLogScanOutcome::Succeeded)
-            .count();
-        let cancelled = logs
-            .iter()
-            .filter(|outcome| outcome.outcome == CrashLogScanOutcome::CancelledBeforeStart)
-            .count();
-        let failed = total.saturating_sub(succeeded + cancelled);
+    /// Builds a scheduled result from complete counts and whichever outcomes were retained.
+    fn from_outcomes(counts: OutcomeCounts, logs: Vec<CrashLogScanRunLogOutcome>) -> Self {
+        let OutcomeCounts {
+            total,
+            succeeded,
+            failed,
+            cancelled,
+        } = counts;
 
         Self {
             status: if cancelled > 0 {
@@ -870,6 +1273,7 @@ impl CrashLogScanRunResult {
             failed,
             cancelled,
             logs,
+            utilization: None,
         }
     }
 
@@ -884,6 +1288,7 @@ impl CrashLogScanRunResult {
             failed: 0,
             cancelled: 0,
             logs: Vec::new(),
+            utilization: None,
         }
     }
 
@@ -923,6 +1328,7 @@ impl CrashLogScanRunResult {
             failed: 0,
             cancelled: total,
             logs,
+            utilization: None,
         }
     }
 
@@ -937,6 +1343,7 @@ impl CrashLogScanRunResult {
             failed: 0,
             cancelled: 0,
             logs: Vec::new(),
+            utilization: None,
         }
     }
 
@@ -956,6 +1363,7 @@ impl CrashLogScanRunResult {
             failed: 0,
             cancelled: 0,
             logs: Vec::new(),
+            utilization: None,
         }
     }
 }
@@ -1138,6 +1546,37 @@ async fn finalize_log_outcome(
     }
 }
 
+/// Builds the terminal outcome for a log whose unchanged Autoscan Report was reused.
+fn reused_report_outcome(
+    input_index: usize,
+    crash_log: PathBuf,
+    autoscan_report: PathBuf,
+    cached: CachedScanResult,
+    elapsed: Duration,
+) -> CrashLogScanRunLogOutcome {
+    let processing_time_us = u64::try_from(elapsed.as_micros()).unwrap_or(u64::MAX);
+    CrashLogScanRunLogOutcome {
+        input_index,
+        crash_log,
+        autoscan_report: Some(autoscan_report),
+        outcome: CrashLogScanOutcome::Succeeded,
+        moved_to_unsolved_logs: false,
+        analysis_error: None,
+        report_write_error: None,
+        unsolved_logs_finalization_error: None,
+        error: None,
+        processing_time_us,
+        processing_time_ms: if processing_time_us > 0 {
+            (processing_time_us / 1000).max(1)
+        } else {
+            0
+        },
+        formid_count: cached.formid_count,
+        plugin_count: cached.plugin_count,
+        suspect_count: cached.suspect_count,
+    }
+}
+
 /// Emits one admitted log's phase through the scheduler's single observer pump.
 fn emit_scheduled_phase<F>(
     on_event: &mut F,
@@ -1178,6 +1617,30 @@ fn cancelled_log_outcome(input_index: usize, crash_log: PathBuf) -> CrashLogScan
     }
 }
 
+/// Builds the terminal failure for an admitted log whose analysis worker did not return.
+fn worker_failure_outcome(
+    input_index: usize,
+    crash_log: PathBuf,
+    message: String,
+) -> CrashLogScanRunLogOutcome {
+    CrashLogScanRunLogOutcome {
+        input_index,
+        crash_log,
+        autoscan_report: None,
+        outcome: CrashLogScanOutcome::Failed,
+        moved_to_unsolved_logs: false,
+        analysis_error: Some(message.clone()),
+        report_write_error: None,
+        unsolved_logs_finalization_error: None,
+        error: Some(message),
+        processing_time_us: 0,
+        processing_time_ms: 0,
+        formid_count: 0,
+        plugin_count: 0,
+        suspect_count: 0,
+    }
+}
+
 /// Folds the scan-run `max_concurrent` sentinel: `Some(0)` becomes `None`
 /// (adaptive default), matching `None`. Any other value is preserved.
 fn normalize_scan_run_concurrency(max_concurrent: Option<usize>) -> Option<usize> {
@@ -1,8 +1,12 @@
 //! Final language-neutral Crash Log Scan Run contract.
 //!
-//! [`execute`] is the only public execution operation for a complete Crash Log
-//! Scan Run. Discovery, setup, scheduling, durable finalization, cancellation,
+//! [`execute`] is the public execution operation for a complete Crash Log Scan
+//! Run. Discovery, setup, scheduling, durable finalization, cancellation,
 //! events, results, and typed infrastructure failures cross this boundary.
+//! [`execute_streaming`] runs the same lifecycle but hands each [`LogResult`]
+//! to a [`LogResultSink`] as it finalizes instead of retaining it.
+//! [`analyze_contents`] analyzes in-memory Crash Logs with the same
+//! configuration, without discovery or any filesystem side effects.
 
 #[cfg(test)]
 #[path = "contract_tests.rs"]
@@ -11,12 +15,13 @@ mod tests;
 use super::{
     CrashLogScanDiscoveryResult, CrashLogScanOutcome, CrashLogScanRunEvent as EngineEvent,
     CrashLogScanRunEventKind as EngineEventKind, CrashLogScanRunLogOutcome as EngineLogOutcome,
-    CrashLogScanRunResult as EngineRunResult, CrashLogScanRunServiceError,
-    CrashLogScanRunServiceEvent, CrashLogScanRunServiceRequest, CrashLogScanSetupContext,
-    CrashLogScanSetupResult, CrashLogScanSource, StandardCrashLogScanSource,
-    StandardUnsolvedLogsIntent, TargetedCrashLogScanSource, execute_service,
+    CrashLogScanRunOutcomeSink, CrashLogScanRunResult as EngineRunResult,
+    CrashLogScanRunServiceError, CrashLogScanRunServiceEvent, CrashLogScanRunServiceRequest,
+    CrashLogScanSetupContext, CrashLogScanSetupResult, CrashLogScanSource,
+    StandardCrashLogScanSource, StandardUnsolvedLogsIntent, TargetedCrashLogScanSource,
+    analyze_contents_service, execute_service,
 };
-use crate::{CrashLogScanFacts, CrashLogScanOptions, ScanProgressPhase};
+use crate::{AnalysisResult, CrashLogScanFacts, CrashLogScanOptions, ScanProgressPhase};
 use classic_shared_core::GameId;
 use std::fmt;
 use std::path::PathBuf;
@@ -36,6 +41,14 @@ pub struct Options {
     pub show_formid_values: bool,
     /// Whether simplify-log removal is enabled during preprocessing.
     pub simplify_logs: bool,
+    /// How admitted Crash Logs are executed once scheduling begins.
+    pub scheduling: SchedulingMode,
+    /// Whether unchanged Crash Logs reuse the Autoscan Report from an earlier run.
+    ///
+    /// Reuse requires identical log bytes, unchanged YAML Data, game version, and
+    /// analysis flags, and the earlier report still present on disk. FCX runs
+    /// always analyze every log.
+    pub incremental: bool,
 }
 
 impl Options {
@@ -45,6 +58,61 @@ impl Options {
         Self {
             show_formid_values,
             simplify_logs,
+            scheduling: SchedulingMode::Cooperative,
+            incremental: false,
+        }
+    }
+
+    /// Returns these options with the selected scheduling mode.
+    #[must_use]
+    pub const fn with_scheduling(mut self, scheduling: SchedulingMode) -> Self {
+        self.scheduling = scheduling;
+        self
+    }
+
+    /// Returns these options with incremental report reuse enabled or disabled.
+    #[must_use]
+    pub const fn with_incremental(mut self, incremental: bool) -> Self {
+        self.incremental = incremental;
+        self
+    }
+}
+
+/// Execution strategy for Crash Logs admitted by the scheduler.
+///
+/// Both modes share admission, cancellation, the single observer pump, and the
+/// discovery-ordered result contract. They differ only in where analysis runs.
+#[derive(Clone, Copy, Debug, Default, Eq, PartialEq)]
+pub enum SchedulingMode {
+    /// Admitted logs are polled together on the run's own task.
+    #[default]
+    Cooperative,
+    /// Each admitted log is analyzed and finalized on its own blocking worker,
+    /// so CPU-bound phases of up to `effective_concurrency` logs use separate cores.
+    Parallel,
+}
+
+impl SchedulingMode {
+    /// Returns the stable adapter-facing scheduling identifier.
+    #[must_use]
+    pub const fn as_str(self) -> &'static str {
+        match self {
+            Self::Cooperative => "cooperative",
+            Self::Parallel => "parallel",
+        }
+    }
+}
+
+impl std::str::FromStr for SchedulingMode {
+    type Err = String;
+
+    fn from_str(value: &str) -> Result<Self, Self::Err> {
+        match value {
+            "cooperative" => Ok(Self::Cooperative),
+            "parallel" => Ok(Self::Parallel),
+            other => Err(format!(
+                "Unknown scheduling mode '{other}'; expected 'cooperative' or 'parallel'"
+            )),
         }
     }
 }
@@ -340,6 +408,8 @@ impl Request {
             move_unsolved_logs,
             scan_facts,
             max_concurrent: configuration.max_concurrent,
+            scheduling: configuration.options.scheduling,
+            incremental: configuration.options.incremental,
             cancellation: Some(cancellation.engine_flag()),
             // Discovery order is mandatory in the final result contract.
             preserve_order: true,
@@ -446,6 +516,25 @@ where
     }
 }
 
+/// Receiver for per-log results delivered by [`execute_streaming`].
+///
+/// Calls are serialized on the run's execution pump, each one immediately after
+/// the matching [`Event::LogFinished`]. A sink that blocks applies backpressure:
+/// no further Crash Log is admitted until it returns.
+pub trait LogResultSink: Send {
+    /// Receives one finalized Crash Log result in completion order.
+    fn on_log_result(&mut self, result: LogResult);
+}
+
+impl<F> LogResultSink for F
+where
+    F: FnMut(LogResult) + Send,
+{
+    fn on_log_result(&mut self, result: LogResult) {
+        self(result);
+    }
+}
+
 /// Terminal per-log disposition.
 #[derive(Clone, Copy, Debug, Eq, PartialEq)]
 pub enum LogDisposition {
@@ -588,6 +677,65 @@ impl From<EngineLogOutcome> for LogResult {
     }
 }
 
+/// One in-memory Crash Log analyzed by [`analyze_contents`].
+#[derive(Clone, Debug, Default, Eq, PartialEq)]
+pub struct LogContent {
+    /// Name reported for this Crash Log, standing in for its file name.
+    pub name: String,
+    /// Raw Crash Log bytes in any encoding accepted for Crash Log files.
+    pub bytes: Vec<u8>,
+}
+
+impl LogContent {
+    /// Creates an in-memory Crash Log from its display name and raw bytes.
+    #[must_use]
+    pub fn new(name: impl Into<String>, bytes: impl Into<Vec<u8>>) -> Self {
+        Self {
+            name: name.into(),
+            bytes: bytes.into(),
+        }
+    }
+}
+
+/// Analysis result for one in-memory Crash Log.
+#[derive(Clone, Debug)]
+pub struct LogContentResult {
+    /// Name supplied with the analyzed [`LogContent`].
+    pub name: String,
+    /// Whether analysis succeeded.
+    pub success: bool,
+    /// Autoscan Report lines; empty when analysis failed.
+    pub report_lines: Vec<String>,
+    /// Human-readable failure detail when analysis failed.
+    pub error: Option<String>,
+    /// Processing time in microseconds.
+    pub processing_time_us: u64,
+    /// Processing time in milliseconds.
+    pub processing_time_ms: u64,
+    /// Number of FormIDs found.
+    pub formid_count: usize,
+    /// Number of plugins detected.
+    pub plugin_count: usize,
+    /// Number of suspect patterns matched.
+    pub suspect_count: usize,
+}
+
+impl From<AnalysisResult> for LogContentResult {
+    fn from(value: AnalysisResult) -> Self {
+        Self {
+            name: value.log_path,
+            success: value.success,
+            report_lines: value.report_lines,
+            error: value.error,
+            processing_time_us: value.processing_time_us,
+            processing_time_ms: value.processing_time_ms,
+            formid_count: value.formid_count,
+            plugin_count: value.plugin_count,
+            suspect_count: value.suspect_count,
+        }
+    }
+}
+
 /// Stable lifecycle status used by [`RunResult`].
 pub use super::CrashLogScanRunStatus as RunStatus;
 
@@ -602,6 +750,8 @@ pub struct RunResult {
     pub setup: Option<CrashLogScanSetupResult>,
     /// Rust-selected concurrency, once scheduling was reached.
     pub effective_concurrency: Option<usize>,
+    /// Measured per-phase parallelism, once at least one Crash Log was scheduled.
+    pub utilization: Option<Utilization>,
     /// Optional concise run-level message.
     pub message: Option<String>,
     /// Total discovered Crash Logs.
@@ -612,10 +762,57 @@ pub struct RunResult {
     pub failed: usize,
     /// Number of discovered Crash Logs cancelled before start.
     pub cancelled: usize,
-    /// Per-log results in discovery order.
+    /// Per-log results in discovery order; empty when the run was streamed.
     pub logs: Vec<LogResult>,
 }
 
+/// Measured parallelism of one coarse analysis phase across a run.
+#[derive(Clone, Copy, Debug, Eq, PartialEq)]
+pub struct PhaseUtilization {
+    /// Phase these measurements describe.
+    pub phase: ScanProgressPhase,
+    /// Highest number of admitted Crash Logs inside this phase at the same instant.
+    pub peak_parallelism: usize,
+    /// Time every admitted Crash Log spent inside this phase, summed, in microseconds.
+    pub busy_time_us: u64,
+}
+
+/// Measured scheduler utilization for one Crash Log Scan Run.
+///
+/// `Finalize` covers report assembly and durable finalization, including
+/// Autoscan Report writing and Unsolved Logs movement.
+#[derive(Clone, Debug, Eq, PartialEq)]
+pub struct Utilization {
+    /// Scheduling mode that produced these measurements.
+    pub scheduling: SchedulingMode,
+    /// Admission limit the scheduler ran with.
+    pub workers: usize,
+    /// Wall-clock time from the first admission to the last terminal outcome.
+    pub wall_time_us: u64,
+    /// Per-phase measurements in pipeline order.
+    pub phases: Vec<PhaseUtilization>,
+}
+
+impl Utilization {
+    /// Returns the average number of Crash Logs inside `phase` over the run's wall time.
+    ///
+    /// Under [`SchedulingMode::Parallel`] this approximates the number of cores the
+    /// phase kept busy; under [`SchedulingMode::Cooperative`] values above one only
+    /// reflect interleaving at await points.
+    #[must_use]
+    pub fn average_parallelism(&self, phase: ScanProgressPhase) -> f64 {
+        if self.wall_time_us == 0 {
+            return 0.0;
+        }
+        self.phases
+            .iter()
+            .find(|measured| measured.phase == phase)
+            .map_or(0.0, |measured| {
+                measured.busy_time_us as f64 / self.wall_time_us as f64
+            })
+    }
+}
+
 /// Stable stage for a run-wide infrastructure failure.
 #[derive(Clone, Copy, Debug, Eq, PartialEq)]
 pub enum InfrastructureErrorStage {
@@ -712,12 +909,74 @@ pub async fn execute(
         request,
         cancellation,
         observer,
+        None,
         #[cfg(test)]
         ScanRunTestHooks::default(),
     )
     .await
 }
 
+/// Executes one Crash Log Scan Run, streaming each per-log result to `sink`.
+///
+/// Lifecycle, events, and cancellation match [`execute`]. Results arrive in
+/// completion order; [`LogResult::discovery_index`] keeps discovery order
+/// recoverable. The returned [`RunResult`] carries complete counts but an empty
+/// `logs` list, so memory held by the run does not grow with the number of logs.
+///
+/// # Errors
+///
+/// Returns the same typed [`InfrastructureError`] values as [`execute`]. Results
+/// already delivered to `sink` remain valid when a later failure occurs.
+pub async fn execute_streaming(
+    request: Request,
+    cancellation: &Cancellation,
+    observer: Option<&mut dyn Observer>,
+    sink: &mut dyn LogResultSink,
+) -> Result<RunResult, InfrastructureError> {
+    execute_inner(
+        request,
+        cancellation,
+        observer,
+        Some(sink),
+        #[cfg(test)]
+        ScanRunTestHooks::default(),
+    )
+    .await
+}
+
+/// Analyzes in-memory Crash Logs over one shared analysis engine.
+///
+/// YAML Data, compiled matchers, and FormID database access are prepared once
+/// for the whole batch, then each payload is analyzed on a blocking worker with
+/// at most `configuration.max_concurrent` logs in flight. Nothing is discovered,
+/// written, or moved, and FCX Mode is never enabled. Results are returned in
+/// input order; a log that fails to decode or analyze yields an unsuccessful
+/// [`LogContentResult`] rather than failing the batch.
+///
+/// # Errors
+///
+/// Returns a typed [`InfrastructureError`] when the configuration is invalid or
+/// the shared analysis engine cannot be prepared.
+pub async fn analyze_contents(
+    configuration: Configuration,
+    logs: Vec<LogContent>,
+) -> Result<Vec<LogContentResult>, InfrastructureError> {
+    if configuration.max_concurrent == Some(0) {
+        return Err(InfrastructureError::request_validation(
+            "max_concurrent must be greater than zero when supplied",
+            None,
+        ));
+    }
+    if logs.is_empty() {
+        return Ok(Vec::new());
+    }
+
+    let results = analyze_contents_service(configuration, logs)
+        .await
+        .map_err(InfrastructureError::from_service)?;
+    Ok(results.into_iter().map(LogContentResult::from).collect())
+}
+
 #[cfg(test)]
 /// Executes through the public contract with request-scoped deterministic test controls.
 pub(crate) async fn execute_with_test_hooks(
@@ -726,7 +985,19 @@ pub(crate) async fn execute_with_test_hooks(
     observer: Option<&mut dyn Observer>,
     test_hooks: ScanRunTestHooks,
 ) -> Result<RunResult, InfrastructureError> {
-    execute_inner(request, cancellation, observer, test_hooks).await
+    execute_inner(request, cancellation, observer, None, test_hooks).await
+}
+
+#[cfg(test)]
+/// Streams through the public contract with request-scoped deterministic test controls.
+pub(crate) async fn execute_streaming_with_test_hooks(
+    request: Request,
+    cancellation: &Cancellation,
+    observer: Option<&mut dyn Observer>,
+    sink: &mut dyn LogResultSink,
+    test_hooks: ScanRunTestHooks,
+) -> Result<RunResult, InfrastructureError> {
+    execute_inner(request, cancellation, observer, Some(sink), test_hooks).await
 }
 
 /// Shared implementation for the public operation and its request-scoped test harness.
@@ -734,6 +1005,7 @@ async fn execute_inner(
     request: Request,
     cancellation: &Cancellation,
     mut observer: Option<&mut dyn Observer>,
+    mut sink: Option<&mut dyn LogResultSink>,
     #[cfg(test)] test_hooks: ScanRunTestHooks,
 ) -> Result<RunResult, InfrastructureError> {
     #[cfg(test)]
@@ -760,25 +1032,35 @@ async fn execute_inner(
         engine_request
     };
     let mut effective_concurrency = None;
-    let engine_result = execute_service(engine_request, |event| match event {
-        CrashLogScanRunServiceEvent::DiscoveryCompleted(discovery) => {
-            emit(&mut observer, Event::DiscoveryCompleted(discovery));
-        }
-        CrashLogScanRunServiceEvent::EffectiveConcurrencySelected(value) => {
-            effective_concurrency = Some(value);
-            emit(
-                &mut observer,
-                Event::EffectiveConcurrencySelected {
-                    effective_concurrency: value,
-                },
-            );
-        }
-        CrashLogScanRunServiceEvent::Log(event) => {
-            if let Some(event) = translate_engine_event(event) {
-                emit(&mut observer, event);
+    let mut forward_outcome = sink
+        .as_deref_mut()
+        .map(|sink| move |outcome: EngineLogOutcome| sink.on_log_result(LogResult::from(outcome)));
+    let on_outcome = forward_outcome
+        .as_mut()
+        .map(|forward| forward as CrashLogScanRunOutcomeSink<'_>);
+    let engine_result = execute_service(
+        engine_request,
+        |event| match event {
+            CrashLogScanRunServiceEvent::DiscoveryCompleted(discovery) => {
+                emit(&mut observer, Event::DiscoveryCompleted(discovery));
             }
-        }
-    })
+            CrashLogScanRunServiceEvent::EffectiveConcurrencySelected(value) => {
+                effective_concurrency = Some(value);
+                emit(
+                    &mut observer,
+                    Event::EffectiveConcurrencySelected {
+                        effective_concurrency: value,
+                    },
+                );
+            }
+            CrashLogScanRunServiceEvent::Log(event) => {
+                if let Some(event) = translate_engine_event(event) {
+                    emit(&mut observer, event);
+                }
+            }
+        },
+        on_outcome,
+    )
     .await
     .map_err(InfrastructureError::from_service)?;
 
@@ -792,14 +1074,23 @@ async fn execute_inner(
         failed,
         cancelled,
         logs,
+        utilization,
     } = engine_result;
-    let logs: Vec<LogResult> = logs.into_iter().map(LogResult::from).collect();
+    let mut logs: Vec<LogResult> = logs.into_iter().map(LogResult::from).collect();
+    if let Some(sink) = sink {
+        // Unscheduled terminal states (cancellation after discovery) never reach
+        // the scheduler, so their outcomes are delivered here instead.
+        for log in logs.drain(..) {
+            sink.on_log_result(log);
+        }
+    }
 
     Ok(RunResult {
         status,
         discovery,
         setup,
         effective_concurrency,
+        utilization,
         message,
         total,
         succeeded,
@@ -1,9 +1,9 @@
 use crate::CrashLogScanFacts;
 use crate::scan_run::contract;
-use crate::scan_run::test_support::{InfrastructureFault, ScanRunTestHooks};
 use crate::scan_run::test_support::{
-    write_fixture_log, write_fixture_log_at, write_minimal_yaml_tree,
+    FIXTURE_LOG_SMALL, write_fixture_log, write_fixture_log_at, write_minimal_yaml_tree,
 };
+use crate::scan_run::test_support::{InfrastructureFault, ScanRunTestHooks};
 use crate::scan_run::{
     CrashLogScanDiscoverySource, CrashLogScanOutcome, CrashLogScanRunLogOutcome,
     CrashLogScanSetupContext, StandardCrashLogScanSource, StandardUnsolvedLogsIntent,
@@ -884,6 +884,19 @@ fn final_contract_exposes_all_stable_variant_identifiers() {
         contract::LogFailureStage::UnsolvedLogsFinalization.as_str(),
         "unsolved_logs_finalization"
     );
+    assert_eq!(
+        contract::SchedulingMode::Cooperative.as_str(),
+        "cooperative"
+    );
+    assert_eq!(contract::SchedulingMode::Parallel.as_str(), "parallel");
+    assert_eq!(
+        "parallel".parse::<contract::SchedulingMode>(),
+        Ok(contract::SchedulingMode::Parallel)
+    );
+    assert_eq!(
+        contract::Options::new(false, false).scheduling,
+        contract::SchedulingMode::Cooperative
+    );
 }
 
 #[test]
@@ -949,6 +962,71 @@ fn final_operation_rejects_zero_concurrency_with_typed_request_stage() {
     assert!(error.message.contains("max_concurrent"));
 }
 
+#[test]
+fn in_memory_batch_analyzes_contents_in_input_order_without_touching_disk() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let root = temp.path();
+    let data = root.join("CLASSIC Data");
+    write_minimal_yaml_tree(root, &data);
+    let mut configuration = final_run_configuration();
+    configuration.yaml_dir_root = root.to_path_buf();
+    configuration.yaml_dir_data = data;
+    configuration.max_concurrent = Some(2);
+    let entries_before = std::fs::read_dir(root).unwrap().count();
+    let logs = vec![
+        contract::LogContent::new("crash-first.log", FIXTURE_LOG_SMALL),
+        contract::LogContent::new("crash-second.log", FIXTURE_LOG_SMALL.as_bytes().to_vec()),
+        contract::LogContent::new("crash-third.log", FIXTURE_LOG_SMALL),
+    ];
+
+    let results = get_runtime()
+        .block_on(contract::analyze_contents(configuration, logs))
+        .expect("in-memory analysis should prepare its shared engine");
+
+    let names: Vec<&str> = results.iter().map(|result| result.name.as_str()).collect();
+    assert_eq!(
+        names,
+        ["crash-first.log", "crash-second.log", "crash-third.log"]
+    );
+    for result in &results {
+        assert!(result.success, "unexpected failure: {:?}", result.error);
+        assert!(
+            result
+                .report_lines
+                .iter()
+                .any(|line| line.contains(&result.name))
+        );
+    }
+    assert_eq!(results[0].report_lines.len(), results[2].report_lines.len());
+    assert_eq!(std::fs::read_dir(root).unwrap().count(), entries_before);
+}
+
+#[test]
+fn in_memory_batch_rejects_zero_concurrency_and_accepts_empty_input() {
+    let mut configuration = final_run_configuration();
+    assert!(
+        get_runtime()
+            .block_on(contract::analyze_contents(
+                configuration.clone(),
+                Vec::new()
+            ))
+            .expect("an empty batch needs no shared engine")
+            .is_empty()
+    );
+
+    configuration.max_concurrent = Some(0);
+    let error = get_runtime()
+        .block_on(contract::analyze_contents(
+            configuration,
+            vec![contract::LogContent::new("crash.log", FIXTURE_LOG_SMALL)],
+        ))
+        .expect_err("zero is not a valid explicit concurrency value");
+    assert_eq!(
+        error.stage,
+        contract::InfrastructureErrorStage::RequestValidation
+    );
+}
+
 #[test]
 fn final_log_result_preserves_multiple_structured_failure_stages() {
     let fixture = shared_failure_fixtures().log_result;
@@ -1407,6 +1485,204 @@ fn terminal_outcomes_remain_in_discovery_order_when_completion_is_out_of_order()
     );
 }
 
+/// Verifies worker-pool scheduling keeps one pump, discovery order, and reports utilization.
+#[test]
+fn parallel_scheduling_overlaps_admitted_logs_and_preserves_discovery_order() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let root = temp.path();
+    let data = root.join("CLASSIC Data");
+    write_minimal_yaml_tree(root, &data);
+    let logs = (0..3)
+        .map(|index| write_fixture_log(&temp, &format!("crash-parallel-{index}.log")))
+        .collect::<Vec<_>>();
+    let mut configuration = final_run_configuration();
+    configuration.yaml_dir_root = root.to_path_buf();
+    configuration.yaml_dir_data = data;
+    configuration.max_concurrent = Some(3);
+    configuration.options = configuration
+        .options
+        .with_scheduling(contract::SchedulingMode::Parallel);
+    let request = contract::Request::targeted(
+        configuration,
+        TargetedCrashLogScanSource {
+            inputs: logs.clone(),
+        },
+    );
+    let hooks = ScanRunTestHooks::default().with_analysis_delay(0, Duration::from_millis(100));
+    let observer_thread = std::thread::current().id();
+    let mut finished = Vec::new();
+    let mut observer = |event| {
+        assert_eq!(std::thread::current().id(), observer_thread);
+        if let contract::Event::LogFinished { log, .. } = event {
+            finished.push(log.discovery_index);
+        }
+    };
+
+    let result = get_runtime()
+        .block_on(contract::execute_with_test_hooks(
+            request,
+            &contract::Cancellation::new(),
+            Some(&mut observer),
+            hooks,
+        ))
+        .expect("parallel run should complete");
+
+    assert_eq!(finished.last(), Some(&0));
+    assert_eq!(
+        result
+            .logs
+            .iter()
+            .map(|log| (log.discovery_index, log.crash_log.clone()))
+            .collect::<Vec<_>>(),
+        logs.into_iter().enumerate().collect::<Vec<_>>()
+    );
+    assert!(
+        result
+            .logs
+            .iter()
+            .all(|log| log.disposition == contract::LogDisposition::Succeeded)
+    );
+    let utilization = result
+        .utilization
+        .expect("scheduled runs should report utilization");
+    assert_eq!(utilization.scheduling, contract::SchedulingMode::Parallel);
+    assert_eq!(utilization.workers, 3);
+    assert_eq!(utilization.phases.len(), 4);
+    let finalize = utilization
+        .phases
+        .iter()
+        .find(|phase| phase.phase == crate::ScanProgressPhase::Finalize)
+        .expect("finalize phase should be measured");
+    assert!(finalize.peak_parallelism >= 1);
+    assert!(finalize.busy_time_us > 0);
+}
+
+/// Verifies streamed runs deliver each result right after its terminal event and retain none.
+#[test]
+fn streaming_run_delivers_results_after_finish_events_without_retaining_logs() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let root = temp.path();
+    let data = root.join("CLASSIC Data");
+    write_minimal_yaml_tree(root, &data);
+    let logs = (0..3)
+        .map(|index| write_fixture_log(&temp, &format!("crash-stream-{index}.log")))
+        .collect::<Vec<_>>();
+    let mut configuration = final_run_configuration();
+    configuration.yaml_dir_root = root.to_path_buf();
+    configuration.yaml_dir_data = data;
+    configuration.max_concurrent = Some(3);
+    let request = contract::Request::targeted(
+        configuration,
+        TargetedCrashLogScanSource {
+            inputs: logs.clone(),
+        },
+    );
+    let hooks = ScanRunTestHooks::default().with_analysis_delay(0, Duration::from_millis(100));
+    let finished = std::sync::Arc::new(std::sync::Mutex::new(Vec::new()));
+    let finished_by_observer = std::sync::Arc::clone(&finished);
+    let mut observer = move |event| {
+        if let contract::Event::LogFinished { log, .. } = event {
+            finished_by_observer
+                .lock()
+                .expect("observer lock")
+                .push(log.discovery_index);
+        }
+    };
+    let mut streamed = Vec::new();
+    let mut sink = |result: contract::LogResult| {
+        let finished = finished.lock().expect("sink lock");
+        assert_eq!(finished.last(), Some(&result.discovery_index));
+        streamed.push(result);
+    };
+
+    let result = get_runtime()
+        .block_on(contract::execute_streaming_with_test_hooks(
+            request,
+            &contract::Cancellation::new(),
+            Some(&mut observer),
+            &mut sink,
+            hooks,
+        ))
+        .expect("streamed run should complete");
+
+    assert!(result.logs.is_empty());
+    assert_eq!(result.total, 3);
+    assert_eq!(result.succeeded, 3);
+    assert_eq!(streamed.len(), 3);
+    assert_eq!(streamed.last().map(|log| log.discovery_index), Some(0));
+    let mut streamed_logs = streamed
+        .into_iter()
+        .map(|log| (log.discovery_index, log.crash_log))
+        .collect::<Vec<_>>();
+    streamed_logs.sort();
+    assert_eq!(
+        streamed_logs,
+        logs.into_iter().enumerate().collect::<Vec<_>>()
+    );
+}
+
+/// Verifies logs cancelled after discovery still reach the streaming sink.
+#[test]
+fn streaming_run_delivers_unscheduled_cancellations_to_sink() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let root = temp.path();
+    let data = root.join("CLASSIC Data");
+    write_minimal_yaml_tree(root, &data);
+    let log = write_fixture_log(&temp, "crash-stream-cancelled.log");
+    let mut configuration = final_run_configuration();
+    configuration.yaml_dir_root = root.to_path_buf();
+    configuration.yaml_dir_data = data;
+    let request = contract::Request::targeted(
+        configuration,
+        TargetedCrashLogScanSource { inputs: vec![log] },
+    );
+    let cancellation = contract::Cancellation::new();
+    let mut observer = |event| {
+        if matches!(event, contract::Event::DiscoveryCompleted(_)) {
+            cancellation.cancel();
+        }
+    };
+    let mut streamed = Vec::new();
+    let mut sink = |result: contract::LogResult| streamed.push(result.disposition);
+
+    let result = get_runtime()
+        .block_on(contract::execute_streaming(
+            request,
+            &cancellation,
+            Some(&mut observer),
+            &mut sink,
+        ))
+        .expect("cancelled run should still produce a terminal result");
+
+    assert_eq!(result.status, contract::RunStatus::Cancelled);
+    assert_eq!(result.cancelled, 1);
+    assert!(result.logs.is_empty());
+    assert_eq!(
+        streamed,
+        vec![contract::LogDisposition::CancelledBeforeStart]
+    );
+}
+
+/// Verifies runs that never reach scheduling report no utilization.
+#[test]
+fn cancelled_before_discovery_reports_no_utilization() {
+    let cancellation = contract::Cancellation::new();
+    cancellation.cancel();
+    let request = contract::Request::targeted(
+        final_run_configuration(),
+        TargetedCrashLogScanSource {
+            inputs: vec![PathBuf::from("C:/missing/crash-never.log")],
+        },
+    );
+
+    let result = get_runtime()
+        .block_on(contract::execute(request, &cancellation, None))
+        .expect("cancelled run should still produce a terminal result");
+
+    assert_eq!(result.status, contract::RunStatus::CancelledBeforeDiscovery);
+    assert!(result.utilization.is_none());
+}
+
 /// Verifies cancellation cannot publish Finished before Standard durable finalization resolves.
 #[test]
 fn admitted_standard_log_finishes_report_failure_and_movement_after_cancellation() {
@@ -1847,3 +2123,69 @@ fn injected_infrastructure_failures_preserve_every_stable_contract_field() {
         assert_eq!(error.path, expected_path);
     }
 }
+
+/// Verifies incremental runs reuse an unchanged log's Autoscan Report without analyzing it again.
+#[test]
+fn incremental_run_reuses_unchanged_autoscan_report() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let root = temp.path();
+    let data = root.join("CLASSIC Data");
+    write_minimal_yaml_tree(root, &data);
+    let log_path = write_fixture_log(&temp, "crash-incremental.log");
+    let mut configuration = final_run_configuration();
+    configuration.yaml_dir_root = root.to_path_buf();
+    configuration.yaml_dir_data = data;
+    configuration.options = configuration.options.with_incremental(true);
+    let run = |events: &mut Vec<contract::Event>| {
+        let request = contract::Request::targeted(
+            configuration.clone(),
+            TargetedCrashLogScanSource {
+                inputs: vec![log_path.clone()],
+            },
+        );
+        let mut observer = |event| events.push(event);
+        get_runtime()
+            .block_on(contract::execute(
+                request,
+                &contract::Cancellation::new(),
+                Some(&mut observer),
+            ))
+            .expect("incremental run should complete")
+    };
+
+    let mut first_events = Vec::new();
+    let first = run(&mut first_events);
+    let report = first.logs[0]
+        .autoscan_report
+        .clone()
+        .expect("first run should write a report");
+    let report_bytes = std::fs::read(&report).expect("report should exist");
+    let cache_path = crate::scan_run::result_cache::scan_result_cache_path(root)
+        .expect("scan cache directory should resolve");
+    assert!(cache_path.is_file());
+    assert!(!root.join("CLASSIC Scan Cache.json").exists());
+
+    let mut second_events = Vec::new();
+    let second = run(&mut second_events);
+
+    assert_eq!(
+        second.logs[0].disposition,
+        contract::LogDisposition::Succeeded
+    );
+    assert_eq!(second.logs[0].autoscan_report.as_ref(), Some(&report));
+    assert_eq!(
+        std::fs::read(&report).expect("report should remain"),
+        report_bytes
+    );
+    assert!(
+        first_events
+            .iter()
+            .any(|event| matches!(event, contract::Event::LogPhase { .. }))
+    );
+    assert!(
+        !second_events
+            .iter()
+            .any(|event| matches!(event, contract::Event::LogPhase { .. }))
+    );
+    let _ = std::fs::remove_file(cache_path);
+}
@@ -0,0 +1,274 @@
+//! Persistent incremental re-scan cache for Crash Log Scan Runs.
+//!
+//! An entry records that a Crash Log with a given content hash produced a given
+//! Autoscan Report. Every entry in one cache file shares a single analysis
+//! fingerprint covering the YAML Data files (including the crashgen registry they
+//! define), the selected game and game version, the analysis flags, and FormID
+//! database state when values are shown. A changed fingerprint discards the
+//! whole file. When both the log hash and the report on disk still match, the
+//! run reuses that report instead of analyzing the log again.
+//!
+//! Cache files live in the per-user scan cache directory from `classic-path-core`,
+//! one per YAML root.
+
+use crate::ScanReadyAnalysis;
+use crate::report::autoscan_report_path;
+use classic_file_io_core::write_atomic_async;
+use parking_lot::Mutex;
+use serde::{Deserialize, Serialize};
+use std::collections::{HashMap, HashSet};
+use std::path::{Path, PathBuf};
+use std::time::UNIX_EPOCH;
+use xxhash_rust::xxh3::{Xxh3, xxh3_64};
+
+/// Bumped whenever the on-disk layout or the meaning of a hit changes.
+const SCAN_RESULT_CACHE_VERSION: u32 = 1;
+/// Upper bound on retained entries; entries untouched by the current run are dropped first.
+const MAX_CACHED_SCAN_RESULTS: usize = 50_000;
+
+/// Report facts retained for one analyzed Crash Log.
+#[derive(Clone, Copy, Debug, Eq, PartialEq, Serialize, Deserialize)]
+pub(crate) struct CachedScanResult {
+    /// xxh3 of the Autoscan Report bytes written for this log.
+    pub(crate) report_hash: u64,
+    /// Number of FormIDs found.
+    pub(crate) formid_count: usize,
+    /// Number of plugins detected.
+    pub(crate) plugin_count: usize,
+    /// Number of suspect patterns matched.
+    pub(crate) suspect_count: usize,
+}
+
+/// Serialized cache layout.
+#[derive(Default, Serialize, Deserialize)]
+struct ScanResultCacheFile {
+    version: u32,
+    fingerprint: u64,
+    entries: HashMap<u64, CachedScanResult>,
+}
+
+/// Outcome of checking one admitted Crash Log against the cache.
+pub(crate) struct ScanResultProbe {
+    /// xxh3 of the Crash Log bytes, used to record a fresh result on a miss.
+    pub(crate) log_hash: u64,
+    /// Existing Autoscan Report and its facts when analysis can be skipped.
+    pub(crate) reusable: Option<(PathBuf, CachedScanResult)>,
+}
+
+#[derive(Default)]
+struct ScanResultCacheState {
+    entries: HashMap<u64, CachedScanResult>,
+    touched: HashSet<u64>,
+    dirty: bool,
+}
+
+/// Run-scoped view of the persistent re-scan cache.
+///
+/// Probes and records are safe from concurrent workers; [`Self::persist`] writes
+/// the merged state once the run has resolved every admitted log.
+pub(crate) struct ScanResultCache {
+    path: PathBuf,
+    fingerprint: u64,
+    state: Mutex<ScanResultCacheState>,
+}
+
+impl ScanResultCache {
+    /// Opens the cache for a prepared scan, or returns `None` when reuse is unsafe.
+    ///
+    /// FCX runs are never cached because their reports embed run-scoped setup
+    /// facts, and in-memory intake has no YAML files to fingerprint. A missing,
+    /// unreadable, or stale cache file opens as empty.
+    pub(crate) async fn open(ready: &ScanReadyAnalysis, game_version: &str) -> Option<Self> {
+        if ready.analysis_config().fcx_mode {
+            return None;
+        }
+        let path = scan_result_cache_path(&ready.paths()?.yaml_dir_root)?;
+        let fingerprint = analysis_fingerprint(ready, game_version).await;
+
+        let entries = match tokio::fs::read(&path).await {
+            Ok(bytes) => match serde_json::from_slice::<ScanResultCacheFile>(&bytes) {
+                Ok(file)
+                    if file.version == SCAN_RESULT_CACHE_VERSION
+                        && file.fingerprint == fingerprint =>
+                {
+                    file.entries
+                }
+                Ok(_) => HashMap::new(),
+                Err(error) => {
+                    log::warn!(
+                        "Ignoring unreadable scan result cache {}: {error}",
+                        path.display()
+                    );
+                    HashMap::new()
+                }
+            },
+            Err(_) => HashMap::new(),
+        };
+
+        Some(Self {
+            path,
+            fingerprint,
+            state: Mutex::new(ScanResultCacheState {
+                entries,
+                ..ScanResultCacheState::default()
+            }),
+        })
+    }
+
+    /// Hashes one Crash Log and checks whether its existing Autoscan Report is reusable.
+    ///
+    /// Returns `None` when the log cannot be read; analysis then reports the failure.
+    pub(crate) async fn probe(&self, crash_log: &Path) -> Option<ScanResultProbe> {
+        let log_hash = xxh3_64(&tokio::fs::read(crash_log).await.ok()?);
+        let Some(cached) = self.state.lock().entries.get(&log_hash).copied() else {
+            return Some(ScanResultProbe {
+                log_hash,
+                reusable: None,
+            });
+        };
+
+        let report = autoscan_report_path(crash_log);
+        let report_matches = tokio::fs::read(&report)
+            .await
+            .is_ok_and(|bytes| xxh3_64(&bytes) == cached.report_hash);
+        let reusable = report_matches.then(|| {
+            self.state.lock().touched.insert(log_hash);
+            (report, cached)
+        });
+        Some(ScanResultProbe { log_hash, reusable })
+    }
+
+    /// Records a freshly written Autoscan Report for a successfully analyzed log.
+    pub(crate) fn record(&self, log_hash: u64, result: CachedScanResult) {
+        let mut state = self.state.lock();
+        state.touched.insert(log_hash);
+        if state.entries.insert(log_hash, result) != Some(result) {
+            state.dirty = true;
+        }
+    }
+
+    /// Writes the cache when this run changed it, replacing the file atomically.
+    ///
+    /// # Errors
+    ///
+    /// Returns the underlying I/O or serialization error; callers treat the cache
+    /// as advisory and continue.
+    pub(crate) async fn persist(&self) -> std::io::Result<()> {
+        let bytes = {
+            let mut state = self.state.lock();
+            if !state.dirty {
+                return Ok(());
+            }
+            if state.entries.len() > MAX_CACHED_SCAN_RESULTS {
+                let ScanResultCacheState {
+                    entries, touched, ..
+                } = &mut *state;
+                entries.retain(|hash, _| touched.contains(hash));
+            }
+            let file = ScanResultCacheFile {
+                version: SCAN_RESULT_CACHE_VERSION,
+                fingerprint: self.fingerprint,
+                entries: state.entries.clone(),
+            };
+            state.dirty = false;
+            serde_json::to_vec(&file)?
+        };
+
+        write_atomic_async(self.path.clone(), bytes).await
+    }
+}
+
+/// Resolves the cache file for runs against one YAML root.
+///
+/// The file lives in the per-user scan cache rather than the YAML root, which may be
+/// a read-only install shared by several users. Each YAML root gets its own file so
+/// alternating between installs does not keep discarding the other's entries.
+/// Returns `None`, disabling reuse, when the cache directory cannot be created.
+pub(crate) fn scan_result_cache_path(yaml_dir_root: &Path) -> Option<PathBuf> {
+    let directory = classic_path_core::ensure_scan_cache_dir()
+        .map_err(|error| log::debug!("Scan result cache disabled: {error}"))
+        .ok()?;
+    let root = xxh3_64(yaml_dir_root.to_string_lossy().as_bytes());
+    Some(directory.join(format!("CLASSIC Scan Cache {root:016x}.json")))
+}
+
+/// Hashes report lines exactly as `write_autoscan_report` joins them on disk.
+pub(crate) fn report_lines_hash(report_lines: &[String]) -> u64 {
+    let mut hasher = Xxh3::new();
+    for line in report_lines {
+        hasher.update(line.as_bytes());
+    }
+    hasher.digest()
+}
+
+/// Fingerprints every input besides the log itself that shapes an Autoscan Report.
+async fn analysis_fingerprint(ready: &ScanReadyAnalysis, game_version: &str) -> u64 {
+    let config = ready.analysis_config();
+    let mut hasher = Xxh3::new();
+    for part in [
+        env!("CARGO_PKG_VERSION"),
+        config.game.as_str(),
+        game_version,
+    ] {
+        hasher.update(part.as_bytes());
+        hasher.update(&[0]);
+    }
+    hasher.update(&[
+        u8::from(config.show_formid_values),
+        u8::from(config.simplify_logs),
+    ]);
+
+    if let Some(paths) = ready.paths() {
+        let mut yaml_files = yaml_data_files(&paths.yaml_dir_data.join("databases")).await;
+        yaml_files.push(paths.yaml_dir_root.join("CLASSIC Ignore.yaml"));
+        for path in yaml_files {
+            hasher.update(path.to_string_lossy().as_bytes());
+            match tokio::fs::read(&path).await {
+                Ok(bytes) => hasher.update(&xxh3_64(&bytes).to_le_bytes()),
+                Err(_) => hasher.update(b"<missing>"),
+            }
+        }
+    }
+
+    // Database contents are too large to hash per run; size and modification
+    // time change whenever a FormID database is replaced or rebuilt.
+    if ready.should_initialize_formid_database() {
+        for path in ready.formid_readiness().database_paths() {
+            hasher.update(path.to_string_lossy().as_bytes());
+            if let Ok(metadata) = tokio::fs::metadata(path).await {
+                let modified = metadata
+                    .modified()
+                    .ok()
+                    .and_then(|time| time.duration_since(UNIX_EPOCH).ok())
+                    .map_or(0, |elapsed| elapsed.as_nanos());
+                hasher.update(&metadata.len().to_le_bytes());
+                hasher.update(&modified.to_le_bytes());
+            }
+        }
+    }
+
+    hasher.digest()
+}
+
+/// Lists YAML Data files in a stable order so fingerprints do not depend on directory order.
+async fn yaml_data_files(directory: &Path) -> Vec<PathBuf> {
+    let mut files = Vec::new();
+    let Ok(mut entries) = tokio::fs::read_dir(directory).await else {
+        return files;
+    };
+    while let Ok(Some(entry)) = entries.next_entry().await {
+        let path = entry.path();
+        if path
+            .extension()
+            .is_some_and(|extension| extension.eq_ignore_ascii_case("yaml"))
+        {
+            files.push(path);
+        }
+    }
+    files.sort();
+    files
+}
+
+#[cfg(test)]
+#[path = "result_cache_tests.rs"]
+mod tests;
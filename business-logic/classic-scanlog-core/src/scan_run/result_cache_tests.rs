@@ -0,0 +1,97 @@
+use super::*;
+use classic_shared_core::get_runtime;
+use tempfile::tempdir;
+
+fn cache_at(path: PathBuf) -> ScanResultCache {
+    ScanResultCache {
+        path,
+        fingerprint: 0x5eed,
+        state: Mutex::new(ScanResultCacheState::default()),
+    }
+}
+
+fn cached(report_hash: u64) -> CachedScanResult {
+    CachedScanResult {
+        report_hash,
+        formid_count: 3,
+        plugin_count: 2,
+        suspect_count: 1,
+    }
+}
+
+/// Verifies report hashing matches the bytes `write_autoscan_report` joins to disk.
+#[test]
+fn report_lines_hash_matches_joined_report_bytes() {
+    let lines = vec!["# Report\n".to_string(), "line two\n".to_string()];
+
+    assert_eq!(
+        report_lines_hash(&lines),
+        xxh3_64(lines.join("").as_bytes())
+    );
+}
+
+/// Verifies only an unchanged report on disk makes a recorded log reusable.
+#[test]
+fn probe_reuses_only_matching_reports() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let crash_log = temp.path().join("crash-cached.log");
+    std::fs::write(&crash_log, "crash bytes").expect("log should be written");
+    let report = autoscan_report_path(&crash_log);
+    std::fs::write(&report, "report").expect("report should be written");
+    let cache = cache_at(temp.path().join("CLASSIC Scan Cache.json"));
+    let log_hash = xxh3_64(b"crash bytes");
+
+    let miss = get_runtime()
+        .block_on(cache.probe(&crash_log))
+        .expect("readable log should be probed");
+    assert_eq!(miss.log_hash, log_hash);
+    assert!(miss.reusable.is_none());
+
+    cache.record(log_hash, cached(xxh3_64(b"report")));
+    let hit = get_runtime()
+        .block_on(cache.probe(&crash_log))
+        .expect("readable log should be probed");
+    assert_eq!(
+        hit.reusable,
+        Some((report.clone(), cached(xxh3_64(b"report"))))
+    );
+
+    std::fs::write(&report, "edited report").expect("report should be rewritten");
+    let edited = get_runtime()
+        .block_on(cache.probe(&crash_log))
+        .expect("readable log should be probed");
+    assert!(edited.reusable.is_none());
+}
+
+/// Verifies persisted entries carry the run fingerprint and unchanged caches skip writes.
+#[test]
+fn persist_writes_fingerprinted_entries_only_when_changed() {
+    let temp = tempdir().expect("tempdir should succeed");
+    let path = temp.path().join("CLASSIC Scan Cache.json");
+    let cache = cache_at(path.clone());
+
+    get_runtime()
+        .block_on(cache.persist())
+        .expect("clean cache persist should succeed");
+    assert!(!path.exists());
+
+    cache.record(42, cached(7));
+    get_runtime()
+        .block_on(cache.persist())
+        .expect("dirty cache persist should succeed");
+    let file: ScanResultCacheFile =
+        serde_json::from_slice(&std::fs::read(&path).expect("cache file should exist"))
+            .expect("cache file should deserialize");
+    assert_eq!(file.version, SCAN_RESULT_CACHE_VERSION);
+    assert_eq!(file.fingerprint, 0x5eed);
+    assert_eq!(file.entries.get(&42), Some(&cached(7)));
+    let file_name = path.file_name().unwrap().to_string_lossy().into_owned();
+    let leftover_temp = std::fs::read_dir(path.parent().unwrap())
+        .unwrap()
+        .filter_map(Result::ok)
+        .any(|entry| {
+            let name = entry.file_name().to_string_lossy().into_owned();
+            name.starts_with(&file_name) && name.contains(".tmp-")
+        });
+    assert!(!leftover_temp);
+}
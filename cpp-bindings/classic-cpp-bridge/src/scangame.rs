@@ -98,7 +98,7 @@ fn game_setup_result_to_dto(result: GameSetupIntakeResult) -> ffi::GameSetupInta
 // ─────────────────────────────────────────────────────────────────────────────
 
 /// Construct a BA2Scanner and run scan_archive; returns None on any error
-/// (file not found, unsupported platform, parse error).
+/// (file not found, read or parse error).
 fn run_ba2_scan(path_str: &str) -> Option<classic_scangame_core::ba2::BA2Issues> {
     if path_str.is_empty() {
         return None;
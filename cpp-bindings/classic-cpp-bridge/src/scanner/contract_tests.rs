@@ -330,6 +330,7 @@ fn structured_result_mapping_preserves_pairs_options_failures_and_paths() {
         discovery: Some(discovery),
         setup: None,
         effective_concurrency: Some(2),
+        utilization: None,
         message: Some("completed with failures".to_string()),
         total: 1,
         succeeded: 0,
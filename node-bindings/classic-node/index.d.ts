@@ -3050,6 +3050,14 @@ export interface JsFrontendState {
   tui: JsTuiRememberedState
 }
 
+/** Results of a full scan: game checks and mod scans. */
+export interface JsFullScanResult {
+  /** Game integrity check results. */
+  game: JsGameScanResult
+  /** Mod scan results. */
+  mods: JsModScanResult
+}
+
 /** Supported game identifiers exposed to JavaScript. */
 export declare const enum JsGameId {
   /** Fallout 4 (base game) */
@@ -3850,6 +3858,14 @@ export interface JsPoolStatistics {
   cacheHits: number
   /** Number of queries that required database access */
   cacheMisses: number
+  /** Number of cache hits answered by the remembered-miss cache */
+  negativeHits: number
+  /** Number of cache entries preloaded from the persisted warm set */
+  warmSetLoaded: number
+  /** Number of batch chunks resolved with the stable-shape UNION ALL strategy */
+  stableUnionBatches: number
+  /** Number of batch chunks resolved with the json_each strategy */
+  jsonEachBatches: number
   /** Total number of connections created */
   totalConnections: number
   /** Number of currently active connections */
@@ -5118,6 +5134,15 @@ export declare function reverseUserSettingsMigrationPlan(plan: JsUserSettingsMig
  */
 export declare function rollbackYamlUpdate(fileName: string): JsYamlRollbackOutcome
 
+/**
+ * Run game checks and mod scans concurrently over one shared directory walk.
+ *
+ * Texture, archive and INI results are kept in a scan snapshot, so a rescan only
+ * reads files that changed. `scanSnapshotPath` overrides where the snapshot lives;
+ * by default it is `CLASSIC Scan Snapshot.json` in the per-user scan cache directory.
+ */
+export declare function runFullScan(config: JsGameScanConfig, scanSnapshotPath?: string | undefined | null): Promise<JsFullScanResult>
+
 /**
  * Run all game integrity checks concurrently.
  *
@@ -128,6 +128,14 @@ pub struct JsPoolStatistics {
     pub cache_hits: u32,
     /// Number of queries that required database access
     pub cache_misses: u32,
+    /// Number of cache hits answered by the remembered-miss cache
+    pub negative_hits: u32,
+    /// Number of cache entries preloaded from the persisted warm set
+    pub warm_set_loaded: u32,
+    /// Number of batch chunks resolved with the stable-shape UNION ALL strategy
+    pub stable_union_batches: u32,
+    /// Number of batch chunks resolved with the json_each strategy
+    pub json_each_batches: u32,
     /// Total number of connections created
     pub total_connections: u32,
     /// Number of currently active connections
@@ -519,6 +527,10 @@ impl JsDatabasePool {
             total_queries: stats.total_queries as u32,
             cache_hits: stats.cache_hits as u32,
             cache_misses: stats.cache_misses as u32,
+            negative_hits: stats.negative_hits as u32,
+            warm_set_loaded: stats.warm_set_loaded as u32,
+            stable_union_batches: stats.stable_union_batches as u32,
+            json_each_batches: stats.json_each_batches as u32,
             total_connections: stats.total_connections as u32,
             active_connections: stats.active_connections as u32,
             cache_evictions: stats.cache_evictions as u32,
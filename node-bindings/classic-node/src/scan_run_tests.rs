@@ -139,6 +139,7 @@ fn terminal_mapping_preserves_every_status_failure_and_optional_path() {
             discovery: None,
             setup: None,
             effective_concurrency: Some(2),
+            utilization: None,
             message: Some("terminal message".to_string()),
             total: 1,
             succeeded: 0,
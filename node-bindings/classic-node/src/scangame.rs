@@ -1209,6 +1209,15 @@ pub struct JsModScanResult {
     pub errors: Vec<String>,
 }
 
+/// Results of a full scan: game checks and mod scans.
+#[napi(object)]
+pub struct JsFullScanResult {
+    /// Game integrity check results.
+    pub game: JsGameScanResult,
+    /// Mod scan results.
+    pub mods: JsModScanResult,
+}
+
 /// Run all game integrity checks concurrently.
 ///
 /// Executes XSE validation, crashgen checking, ENB detection,
@@ -1227,23 +1236,7 @@ pub async fn run_game_checks(config: JsGameScanConfig) -> napi::Result<JsGameSca
         })
         .await
         .map_err(|e| to_napi_err(format!("Task join error: {e}")))?
-        .map(|result| JsGameScanResult {
-            report: result.report,
-            config_issues: result
-                .config_issues
-                .into_iter()
-                .map(config_issue_to_js)
-                .collect(),
-            check_results: result
-                .check_results
-                .into_iter()
-                .map(|r| JsCheckResult {
-                    name: r.name,
-                    output: r.output,
-                })
-                .collect(),
-            errors: result.errors,
-        })
+        .map(game_scan_result_to_js)
         .map_err(to_napi_err)
 }
 
@@ -1263,15 +1256,74 @@ pub async fn run_mod_scans(config: JsGameScanConfig) -> napi::Result<JsModScanRe
         })
         .await
         .map_err(|e| to_napi_err(format!("Task join error: {e}")))?
-        .map(|result| JsModScanResult {
-            report: result.report,
-            unpacked_issue_count: result.unpacked_issue_count as u32,
-            archived_issue_count: result.archived_issue_count as u32,
-            errors: result.errors,
+        .map(mod_scan_result_to_js)
+        .map_err(to_napi_err)
+}
+
+/// Run game checks and mod scans concurrently over one shared directory walk.
+///
+/// Texture, archive and INI results are kept in a scan snapshot, so a rescan only
+/// reads files that changed. `scanSnapshotPath` overrides where the snapshot lives;
+/// by default it is `CLASSIC Scan Snapshot.json` in the per-user scan cache directory.
+#[napi]
+pub async fn run_full_scan(
+    config: JsGameScanConfig,
+    scan_snapshot_path: Option<String>,
+) -> napi::Result<JsFullScanResult> {
+    let core_config = js_scan_config_to_core(&config);
+    let handle = classic_shared_core::get_runtime().handle().clone();
+
+    handle
+        .spawn(async move {
+            let mut orchestrator =
+                classic_scangame_core::orchestrator::GameScanOrchestrator::new(core_config);
+            if let Some(path) = scan_snapshot_path {
+                orchestrator = orchestrator.with_scan_snapshot(PathBuf::from(path));
+            }
+            orchestrator.run_full_scan().await
+        })
+        .await
+        .map_err(|e| to_napi_err(format!("Task join error: {e}")))?
+        .map(|(game, mods)| JsFullScanResult {
+            game: game_scan_result_to_js(game),
+            mods: mod_scan_result_to_js(mods),
         })
         .map_err(to_napi_err)
 }
 
+fn game_scan_result_to_js(
+    result: classic_scangame_core::orchestrator::GameScanResult,
+) -> JsGameScanResult {
+    JsGameScanResult {
+        report: result.report,
+        config_issues: result
+            .config_issues
+            .into_iter()
+            .map(config_issue_to_js)
+            .collect(),
+        check_results: result
+            .check_results
+            .into_iter()
+            .map(|r| JsCheckResult {
+                name: r.name,
+                output: r.output,
+            })
+            .collect(),
+        errors: result.errors,
+    }
+}
+
+fn mod_scan_result_to_js(
+    result: classic_scangame_core::orchestrator::ModScanResult,
+) -> JsModScanResult {
+    JsModScanResult {
+        report: result.report,
+        unpacked_issue_count: result.unpacked_issue_count as u32,
+        archived_issue_count: result.archived_issue_count as u32,
+        errors: result.errors,
+    }
+}
+
 // ============================================================================
 // 11. Crashgen Check Orchestrator
 // ============================================================================
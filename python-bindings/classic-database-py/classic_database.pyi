@@ -248,6 +248,44 @@ def get_cache_capacity(self) -> int:
     def set_cache_capacity(self, capacity: int) -> None:
         """Set the maximum number of entries allowed in the query cache."""
 
+    def get_negative_cache_ttl(self) -> int:
+        """Get how long confirmed lookup misses are remembered, in seconds."""
+
+    def set_negative_cache_ttl(self, seconds: int) -> None:
+        """Set how long confirmed lookup misses are remembered (0 disables the miss cache)."""
+
+    def get_negative_cache_capacity(self) -> int:
+        """Get the maximum number of remembered lookup misses."""
+
+    def set_negative_cache_capacity(self, capacity: int) -> None:
+        """Set the maximum number of remembered lookup misses."""
+
+    def get_batch_lookup_strategy(self) -> str:
+        """Get the SQL strategy used by get_entries_batch ("stable_union" or "json_each")."""
+
+    def set_batch_lookup_strategy(self, strategy: str) -> None:
+        """Set the SQL strategy used by get_entries_batch.
+
+        "stable_union" (the default) issues padded UNION ALL queries with an exact-case
+        pass and a COLLATE nocase fallback. "json_each" binds each chunk as one JSON
+        parameter and resolves it with a single join per database. Both return the
+        same results.
+
+        Raises:
+            ValueError: If the strategy name is unknown.
+        """
+
+    def get_warm_set_capacity(self) -> int:
+        """Get how many hot entries are persisted in the FormID warm set (0 = disabled)."""
+
+    def set_warm_set_capacity(self, capacity: int) -> None:
+        """Set how many hot entries are persisted in the FormID warm set.
+
+        When non-zero, close() saves the most frequently resolved cached entries
+        beside the first database and the next initialize() preloads them, unless
+        a database changed in between. 0 (the default) disables the warm set.
+        """
+
     def get_cache_cleanup_threshold(self) -> int:
         """Get proactive cleanup trigger threshold (lookup operations)."""
 
@@ -317,8 +355,9 @@ def get_stats(self) -> dict[str, int]:
         Returns:
             Dictionary with statistics:
                 - 'total_queries': Total number of queries executed
-                - 'cache_hits': Number of cache hits
+                - 'cache_hits': Number of cache hits (including negative hits)
                 - 'cache_misses': Number of cache misses
+                - 'negative_hits': Lookups answered by the remembered-miss cache
                 - 'total_connections': Total connections in pool
                 - 'active_connections': Currently active connections
                 - 'cache_evictions': Entries evicted due to capacity pressure
@@ -340,7 +379,13 @@ def get_stats(self) -> dict[str, int]:
                 - 'stable_shape_bucket_256': Number of 256-slot bucket selections
                 - 'stable_shape_bucket_512': Number of 512-slot bucket selections
                 - 'stable_shape_bucket_1024': Number of 1024-slot bucket selections
+                - 'stable_union_batches': Batch chunks resolved with the "stable_union" strategy
+                - 'json_each_batches': Batch chunks resolved with the "json_each" strategy
+                - 'warm_set_loaded': Cache entries preloaded from the persisted warm set
                 - 'cache_capacity': Current cache capacity
+                - 'negative_cache_capacity': Current remembered-miss cache capacity
+                - 'negative_cache_ttl_seconds': Current remembered-miss TTL in seconds
+                - 'warm_set_capacity': Current FormID warm set capacity
                 - 'cleanup_threshold': Current proactive cleanup operation threshold
                 - 'cleanup_interval_seconds': Current proactive cleanup interval in seconds
                 - 'cache_hit_rate': Cache hit rate percentage (0-100)
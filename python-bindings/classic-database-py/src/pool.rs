@@ -10,9 +10,11 @@
 //! - `MAX_CACHE_TTL_SECS` (3600): For very large batches (60 minutes)
 
 use classic_database_core::{
-    BATCH_CACHE_TTL_SECS, DEFAULT_CACHE_CLEANUP_INTERVAL_SECS, DEFAULT_CACHE_CLEANUP_OP_THRESHOLD,
-    DEFAULT_CACHE_TTL_SECS, DEFAULT_QUERY_CACHE_CAPACITY, DatabasePool, MAX_CACHE_TTL_SECS,
+    BATCH_CACHE_TTL_SECS, BatchLookupStrategy, DEFAULT_CACHE_CLEANUP_INTERVAL_SECS,
+    DEFAULT_CACHE_CLEANUP_OP_THRESHOLD, DEFAULT_CACHE_TTL_SECS, DEFAULT_QUERY_CACHE_CAPACITY,
+    DatabasePool, MAX_CACHE_TTL_SECS,
 };
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
 use pyo3_async_runtimes::tokio::future_into_py;
@@ -238,6 +240,61 @@ impl PyDatabasePool {
         self.inner.set_cache_capacity(capacity);
     }
 
+    /// Get negative (miss) cache TTL in seconds.
+    #[pyo3(name = "get_negative_cache_ttl")]
+    pub fn py_get_negative_cache_ttl(&self) -> u64 {
+        self.inner.get_negative_cache_ttl().as_secs()
+    }
+
+    /// Set negative (miss) cache TTL in seconds.
+    #[pyo3(name = "set_negative_cache_ttl")]
+    pub fn py_set_negative_cache_ttl(&self, seconds: u64) {
+        self.inner
+            .set_negative_cache_ttl(Duration::from_secs(seconds));
+    }
+
+    /// Get negative (miss) cache capacity.
+    #[pyo3(name = "get_negative_cache_capacity")]
+    pub fn py_get_negative_cache_capacity(&self) -> usize {
+        self.inner.get_negative_cache_capacity()
+    }
+
+    /// Set negative (miss) cache capacity.
+    #[pyo3(name = "set_negative_cache_capacity")]
+    pub fn py_set_negative_cache_capacity(&self, capacity: usize) {
+        self.inner.set_negative_cache_capacity(capacity);
+    }
+
+    /// Get the batch lookup strategy ("stable_union" or "json_each").
+    #[pyo3(name = "get_batch_lookup_strategy")]
+    pub fn py_get_batch_lookup_strategy(&self) -> &'static str {
+        self.inner.get_batch_lookup_strategy().as_str()
+    }
+
+    /// Set the batch lookup strategy ("stable_union" or "json_each").
+    #[pyo3(name = "set_batch_lookup_strategy")]
+    pub fn py_set_batch_lookup_strategy(&self, strategy: &str) -> PyResult<()> {
+        let strategy = BatchLookupStrategy::from_name(strategy).ok_or_else(|| {
+            PyValueError::new_err(format!(
+                "Unknown batch lookup strategy {strategy:?}; expected 'stable_union' or 'json_each'"
+            ))
+        })?;
+        self.inner.set_batch_lookup_strategy(strategy);
+        Ok(())
+    }
+
+    /// Get the number of entries persisted in the FormID warm set (0 = disabled).
+    #[pyo3(name = "get_warm_set_capacity")]
+    pub fn py_get_warm_set_capacity(&self) -> usize {
+        self.inner.get_warm_set_capacity()
+    }
+
+    /// Set the number of entries persisted in the FormID warm set (0 disables it).
+    #[pyo3(name = "set_warm_set_capacity")]
+    pub fn py_set_warm_set_capacity(&self, capacity: usize) {
+        self.inner.set_warm_set_capacity(capacity);
+    }
+
     /// Get proactive cleanup threshold (operations).
     #[pyo3(name = "get_cache_cleanup_threshold")]
     pub fn py_get_cache_cleanup_threshold(&self) -> u64 {
@@ -304,6 +361,7 @@ impl PyDatabasePool {
         result.insert("total_queries".to_string(), stats.total_queries);
         result.insert("cache_hits".to_string(), stats.cache_hits);
         result.insert("cache_misses".to_string(), stats.cache_misses);
+        result.insert("negative_hits".to_string(), stats.negative_hits);
         result.insert("total_connections".to_string(), stats.total_connections);
         result.insert("active_connections".to_string(), stats.active_connections);
         result.insert("cache_evictions".to_string(), stats.cache_evictions);
@@ -361,10 +419,28 @@ impl PyDatabasePool {
             "stable_shape_bucket_1024".to_string(),
             stats.stable_shape_bucket_1024,
         );
+        result.insert("warm_set_loaded".to_string(), stats.warm_set_loaded);
+        result.insert(
+            "stable_union_batches".to_string(),
+            stats.stable_union_batches,
+        );
+        result.insert("json_each_batches".to_string(), stats.json_each_batches);
         result.insert(
             "cache_capacity".to_string(),
             self.inner.get_cache_capacity() as u64,
         );
+        result.insert(
+            "warm_set_capacity".to_string(),
+            self.inner.get_warm_set_capacity() as u64,
+        );
+        result.insert(
+            "negative_cache_capacity".to_string(),
+            self.inner.get_negative_cache_capacity() as u64,
+        );
+        result.insert(
+            "negative_cache_ttl_seconds".to_string(),
+            self.inner.get_negative_cache_ttl().as_secs(),
+        );
         result.insert(
             "cleanup_threshold".to_string(),
             self.inner.get_cache_cleanup_threshold(),
@@ -1142,7 +1142,7 @@ def game_name(self) -> str:
 class GameScanOrchestrator:
     """Coordinates concurrent game checks and mod scans."""
 
-    def __init__(self, config: GameScanConfig) -> None:
+    def __init__(self, config: GameScanConfig, scan_snapshot_path: Path | None = ...) -> None:
         """Create a new GameScanOrchestrator."""
 
     def run_game_checks(self) -> GameScanResult:
@@ -263,15 +263,23 @@ impl PyGameScanConfig {
 #[pyclass(name = "GameScanOrchestrator")]
 pub struct PyGameScanOrchestrator {
     config: GameScanConfig,
+    scan_snapshot_path: Option<PathBuf>,
 }
 
 #[pymethods]
 impl PyGameScanOrchestrator {
     /// Create a new orchestrator with the given configuration
+    ///
+    /// Args:
+    ///     config: Scan configuration
+    ///     scan_snapshot_path: Where run_full_scan keeps its scan snapshot. Defaults to
+    ///         `CLASSIC Scan Snapshot.json` in the per-user scan cache directory.
     #[new]
-    fn new(config: &PyGameScanConfig) -> Self {
+    #[pyo3(signature = (config, scan_snapshot_path = None))]
+    fn new(config: &PyGameScanConfig, scan_snapshot_path: Option<PathBuf>) -> Self {
         Self {
             config: config.inner.clone(),
+            scan_snapshot_path,
         }
     }
 
@@ -322,8 +330,9 @@ impl PyGameScanOrchestrator {
 
     /// Run the full scan pipeline: game checks + mod scans concurrently.
     ///
-    /// Returns combined game result and mod result. Releases the GIL
-    /// during execution.
+    /// Returns combined game result and mod result. Texture, archive and INI
+    /// results are reused from the scan snapshot for files that did not change.
+    /// Releases the GIL during execution.
     ///
     /// Returns:
     ///     Tuple of (GameScanResult, ModScanResult)
@@ -332,9 +341,13 @@ impl PyGameScanOrchestrator {
     ///     RuntimeError: If orchestration fails fatally
     fn run_full_scan(&self, py: Python<'_>) -> PyResult<(PyGameScanResult, PyModScanResult)> {
         let config = self.config.clone();
+        let scan_snapshot_path = self.scan_snapshot_path.clone();
         without_gil(py, || {
             get_runtime().block_on(async {
-                let orch = GameScanOrchestrator::new(config);
+                let mut orch = GameScanOrchestrator::new(config);
+                if let Some(path) = scan_snapshot_path {
+                    orch = orch.with_scan_snapshot(path);
+                }
                 orch.run_full_scan().await
             })
         })
@@ -72,8 +72,14 @@ class FormIDAnalyzer:
     This is a direct Rust implementation without Python fallback,
     providing maximum performance for FormID operations.
     """
-    def __init__(self) -> None:
-        """Create Rust FormID analyzer."""
+    def __init__(self, cache_bytes: int | None = None) -> None:
+        """Create Rust FormID analyzer.
+
+        Args:
+            cache_bytes: Byte budget for each of the pattern and FormID caches
+                (default 1 MiB)
+
+        """
 
     def extract_formids(self, segment_callstack: list[str]) -> list[str]:
         """Extract FormIDs from callstack segment.
@@ -122,6 +128,15 @@ def cache_stats(self) -> tuple[int, int]:
 
         """
 
+    def cache_metrics(self) -> dict[str, int]:
+        """Get counters summed over the analyzer's bounded caches.
+
+        Returns:
+            Dict with hits, misses, evictions, entries, resident_bytes and
+            capacity_bytes
+
+        """
+
 class FormIDAnalyzerCore:
     """Core FormID analysis functionality with optimizations.
 
@@ -324,7 +339,11 @@ def get_segment_sizes(self, lines: list[str]) -> dict[str, int]:
         """Count lines in each segment for analysis."""
 
     def get_stats(self) -> dict[str, int]:
-        """Get performance statistics."""
+        """Get performance statistics.
+
+        Includes cache sizes plus ``pattern_cache_hits``, ``pattern_cache_misses``, and
+        ``pattern_cache_evictions`` counted since the parser was created.
+        """
 
     def extract_formids(self, lines: list[str]) -> list[str]:
         """Find all FormIDs in the log."""
@@ -339,7 +358,12 @@ def find_errors(self, lines: list[str]) -> list[tuple[int, str]]:
         """Find error and exception patterns."""
 
     def benchmark(self, lines: list[str], iterations: int) -> dict[str, float]:
-        """Benchmark parsing performance on given data."""
+        """Benchmark parsing performance on given data.
+
+        Pattern timings bypass the result cache. ``find_patterns_avg_ms`` measures the
+        single-pass engine, ``find_patterns_per_regex_avg_ms`` the one-regex-at-a-time
+        baseline, and ``find_patterns_speedup`` their ratio.
+        """
 
     def detect_vr_log(self, content: str) -> bool:
         """Detect if a crash log is from Fallout 4 VR.
@@ -376,11 +400,12 @@ class PatternMatcher:
     with automatic caching.
     """
 
-    def __init__(self, patterns: list[str]) -> None:
+    def __init__(self, patterns: list[str], cache_bytes: int | None = None) -> None:
         """Create pattern matcher with compiled patterns.
 
         Args:
             patterns: List of regex pattern strings to compile
+            cache_bytes: Byte budget for the match cache (default 4 MiB)
 
         Raises:
             ValueError: If any pattern has invalid regex syntax
@@ -443,6 +468,15 @@ def get_stats(self) -> tuple[int, int]:
 
         """
 
+    def cache_metrics(self) -> dict[str, int]:
+        """Get counters for the bounded match cache.
+
+        Returns:
+            Dict with hits, misses, evictions, entries, resident_bytes and
+            capacity_bytes
+
+        """
+
 # =============================================================================
 # Plugin Analysis
 # =============================================================================
@@ -596,6 +630,8 @@ def __init__(
         formid_database_paths: list[str],
         unsolved_logs_destination: str | None = None,
         max_concurrent: int | None = None,
+        scheduling: Literal["cooperative", "parallel"] = "cooperative",
+        incremental: bool = False,
     ) -> None: ...
 
 class ScanRunStandardSource:
@@ -739,6 +775,22 @@ class ScanRunLogResult:
     plugin_count: int
     suspect_count: int
 
+class ScanRunPhaseUtilization:
+    """Measured parallelism for one coarse analysis phase."""
+
+    phase: Literal["setup", "parse", "analyze", "finalize"]
+    peak_parallelism: int
+    busy_time_us: int
+    average_parallelism: float
+
+class ScanRunUtilization:
+    """Measured scheduler utilization for one scan run."""
+
+    scheduling: Literal["cooperative", "parallel"]
+    workers: int
+    wall_time_us: int
+    phases: list[ScanRunPhaseUtilization]
+
 class ScanRunResult:
     """Complete terminal Crash Log Scan Run result."""
 
@@ -752,6 +804,7 @@ class ScanRunResult:
     discovery: ScanRunDiscoveryResult | None
     setup: ScanRunSetupResult | None
     effective_concurrency: int | None
+    utilization: ScanRunUtilization | None
     message: str | None
     total: int
     succeeded: int
@@ -813,6 +866,57 @@ def scan_run_execute(
 ) -> ScanRunExecution:
     """Execute one final-contract Crash Log Scan Run."""
 
+async def scan_run_execute_async(
+    request: ScanRunRequest,
+    cancellation: ScanRunCancellation,
+    observer: Callable[[ScanRunEvent], None] | None = None,
+    cancel_on_observer_error: bool = False,
+) -> ScanRunExecution:
+    """Await one final-contract Crash Log Scan Run on the running event loop."""
+
+class ScanRunStream:
+    """Iterator yielding each ScanRunLogResult as its Crash Log finalizes."""
+
+    def __iter__(self) -> ScanRunStream: ...
+    def __next__(self) -> ScanRunLogResult: ...
+    @property
+    def execution(self) -> ScanRunExecution | None:
+        """Terminal envelope once iteration stops; its result has no retained logs."""
+
+def scan_run_stream(
+    request: ScanRunRequest,
+    cancellation: ScanRunCancellation,
+    observer: Callable[[ScanRunEvent], None] | None = None,
+    cancel_on_observer_error: bool = False,
+) -> ScanRunStream:
+    """Start one final-contract Crash Log Scan Run and stream per-log results."""
+
+class AnalysisResult:
+    """Analysis result for one in-memory Crash Log."""
+
+    name: str
+    success: bool
+    report_lines: list[str]
+    report: str
+    error: str | None
+    processing_time_us: int
+    processing_time_ms: int
+    formid_count: int
+    plugin_count: int
+    suspect_count: int
+
+def analyze_logs_batch(
+    config: ScanRunConfiguration,
+    contents: list[bytes],
+    names: list[str] | None = None,
+) -> list[AnalysisResult]:
+    """Analyze in-memory Crash Logs in parallel without discovery or file writes.
+
+    Raises:
+        ValueError: If the configuration is invalid or ``names`` does not match ``contents``.
+        RuntimeError: If YAML Data or FormID database access cannot be prepared.
+    """
+
 
 # =============================================================================
 # Report Generation
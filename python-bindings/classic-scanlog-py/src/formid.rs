@@ -14,18 +14,23 @@ pub struct PyRustFormIDAnalyzer {
 
 impl Default for PyRustFormIDAnalyzer {
     fn default() -> Self {
-        Self::new()
+        Self::new(None)
     }
 }
 
 #[pymethods]
 impl PyRustFormIDAnalyzer {
     /// Create a new instance
+    ///
+    /// `cache_bytes` caps each of the two analyzer caches; it defaults to 1 MiB.
     #[new]
-    pub fn new() -> Self {
-        Self {
-            inner: RustFormIDAnalyzer::new(),
-        }
+    #[pyo3(signature = (cache_bytes = None))]
+    pub fn new(cache_bytes: Option<u64>) -> Self {
+        let inner = match cache_bytes {
+            Some(cache_bytes) => RustFormIDAnalyzer::with_cache_budget(cache_bytes),
+            None => RustFormIDAnalyzer::new(),
+        };
+        Self { inner }
     }
 
     /// Extract FormIDs from a callstack segment
@@ -75,4 +80,10 @@ impl PyRustFormIDAnalyzer {
     pub fn cache_stats(&self) -> (usize, usize) {
         self.inner.cache_stats()
     }
+
+    /// Get counters summed over both caches (hits, misses, evictions, entries,
+    /// resident_bytes, capacity_bytes)
+    pub fn cache_metrics(&self) -> HashMap<String, u64> {
+        self.inner.cache_metrics().to_map()
+    }
 }
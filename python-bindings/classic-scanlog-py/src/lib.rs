@@ -136,11 +136,13 @@ pub use report::{
     PyParallelReportProcessor, PyReportComposer, PyReportFragment, PyReportGenerator, PyStringPool,
 };
 pub use scan_run::{
-    PyScanRunCancellation, PyScanRunConfiguration, PyScanRunDiscoveryResult, PyScanRunEvent,
-    PyScanRunExecution, PyScanRunInfrastructureError, PyScanRunLogEvent, PyScanRunLogFailure,
-    PyScanRunLogResult, PyScanRunRejectedInput, PyScanRunRequest, PyScanRunResult,
-    PyScanRunSetupCheck, PyScanRunSetupContext, PyScanRunSetupPathUpdate, PyScanRunSetupResult,
-    PyScanRunStandardSource, PyScanRunTargetedSource, PyScanRunUnsolvedLogs, scan_run_execute,
+    PyAnalysisResult, PyScanRunCancellation, PyScanRunConfiguration, PyScanRunDiscoveryResult,
+    PyScanRunEvent, PyScanRunExecution, PyScanRunInfrastructureError, PyScanRunLogEvent,
+    PyScanRunLogFailure, PyScanRunLogResult, PyScanRunPhaseUtilization, PyScanRunRejectedInput,
+    PyScanRunRequest, PyScanRunResult, PyScanRunSetupCheck, PyScanRunSetupContext,
+    PyScanRunSetupPathUpdate, PyScanRunSetupResult, PyScanRunStandardSource, PyScanRunStream,
+    PyScanRunTargetedSource, PyScanRunUnsolvedLogs, PyScanRunUtilization, analyze_logs_batch,
+    scan_run_execute, scan_run_execute_async, scan_run_stream,
 };
 pub use settings_validator::PySettingsValidator;
 pub use version::{
@@ -195,12 +197,19 @@ fn register_scan_run_exports(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyScanRunSetupResult>()?;
     m.add_class::<PyScanRunLogFailure>()?;
     m.add_class::<PyScanRunLogResult>()?;
+    m.add_class::<PyScanRunPhaseUtilization>()?;
+    m.add_class::<PyScanRunUtilization>()?;
     m.add_class::<PyScanRunResult>()?;
     m.add_class::<PyScanRunInfrastructureError>()?;
     m.add_class::<PyScanRunLogEvent>()?;
     m.add_class::<PyScanRunEvent>()?;
     m.add_class::<PyScanRunExecution>()?;
+    m.add_class::<PyScanRunStream>()?;
     m.add_function(wrap_pyfunction!(scan_run_execute, m)?)?;
+    m.add_function(wrap_pyfunction!(scan_run_execute_async, m)?)?;
+    m.add_function(wrap_pyfunction!(scan_run_stream, m)?)?;
+    m.add_class::<PyAnalysisResult>()?;
+    m.add_function(wrap_pyfunction!(analyze_logs_batch, m)?)?;
     Ok(())
 }
 
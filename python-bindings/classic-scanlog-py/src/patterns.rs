@@ -2,6 +2,7 @@
 
 use classic_scanlog_core::PatternMatcher;
 use pyo3::prelude::*;
+use std::collections::HashMap;
 
 /// Python wrapper for PatternMatcher
 #[pyclass(name = "PatternMatcher")]
@@ -12,10 +13,16 @@ pub struct PyPatternMatcher {
 #[pymethods]
 impl PyPatternMatcher {
     /// Create a new instance
-
+    ///
+    /// `cache_bytes` caps the match cache; it defaults to 4 MiB.
     #[new]
-    pub fn new(patterns: Vec<String>) -> PyResult<Self> {
-        let inner = PatternMatcher::new(patterns).map_err(crate::to_pyerr)?;
+    #[pyo3(signature = (patterns, cache_bytes = None))]
+    pub fn new(patterns: Vec<String>, cache_bytes: Option<u64>) -> PyResult<Self> {
+        let inner = match cache_bytes {
+            Some(cache_bytes) => PatternMatcher::with_cache_budget(patterns, cache_bytes),
+            None => PatternMatcher::new(patterns),
+        }
+        .map_err(crate::to_pyerr)?;
         Ok(Self { inner })
     }
 
@@ -48,4 +55,10 @@ impl PyPatternMatcher {
     pub fn get_stats(&self) -> (usize, usize) {
         self.inner.get_stats()
     }
+
+    /// Get match cache counters (hits, misses, evictions, entries, resident_bytes,
+    /// capacity_bytes)
+    pub fn cache_metrics(&self) -> HashMap<String, u64> {
+        self.inner.cache_metrics().to_map()
+    }
 }
@@ -10,11 +10,22 @@ use classic_scanlog_core::{
     CrashLogScanRunStatus, CrashLogScanSetupContext, CrashLogScanSetupResult, ScanProgressPhase,
     StandardCrashLogScanSource, StandardUnsolvedLogsIntent, TargetedCrashLogScanSource,
 };
-use classic_shared::without_gil_block_on;
+use classic_shared::{get_runtime, without_gil, without_gil_block_on};
 use classic_shared_core::GameId;
-use pyo3::exceptions::PyValueError;
+use futures::channel::oneshot;
+use parking_lot::Mutex;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
+use pyo3::intern;
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
+use pyo3_async_runtimes::tokio::future_into_py;
 use std::path::PathBuf;
+use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::mpsc;
+
+/// Finalized results buffered ahead of a streaming consumer before admission pauses.
+const SCAN_RUN_STREAM_BUFFER: usize = 16;
 
 /// Explicit configuration shared by Standard and Targeted requests.
 #[pyclass(name = "ScanRunConfiguration", from_py_object)]
@@ -29,13 +40,15 @@ pub struct PyScanRunConfiguration {
     formid_database_paths: Vec<String>,
     unsolved_logs_destination: Option<String>,
     max_concurrent: Option<usize>,
+    scheduling: contract::SchedulingMode,
+    incremental: bool,
 }
 
 #[pymethods]
 impl PyScanRunConfiguration {
     /// Creates explicit scan facts without reopening User Settings.
     #[new]
-    #[pyo3(signature = (yaml_dir_root, yaml_dir_data, game, game_version, show_formid_values, simplify_logs, formid_database_paths, unsolved_logs_destination=None, max_concurrent=None))]
+    #[pyo3(signature = (yaml_dir_root, yaml_dir_data, game, game_version, show_formid_values, simplify_logs, formid_database_paths, unsolved_logs_destination=None, max_concurrent=None, scheduling="cooperative", incremental=false))]
     #[allow(clippy::too_many_arguments)]
     pub fn new(
         yaml_dir_root: String,
@@ -47,8 +60,13 @@ impl PyScanRunConfiguration {
         formid_database_paths: Vec<String>,
         unsolved_logs_destination: Option<String>,
         max_concurrent: Option<usize>,
-    ) -> Self {
-        Self {
+        scheduling: &str,
+        incremental: bool,
+    ) -> PyResult<Self> {
+        let scheduling = scheduling
+            .parse::<contract::SchedulingMode>()
+            .map_err(PyValueError::new_err)?;
+        Ok(Self {
             yaml_dir_root,
             yaml_dir_data,
             game,
@@ -58,7 +76,9 @@ impl PyScanRunConfiguration {
             formid_database_paths,
             unsolved_logs_destination,
             max_concurrent,
-        }
+            scheduling,
+            incremental,
+        })
     }
 }
 
@@ -612,6 +632,158 @@ impl PyScanRunLogResult {
     }
 }
 
+/// Analysis result for one in-memory Crash Log from `analyze_logs_batch`.
+#[pyclass(name = "AnalysisResult", from_py_object)]
+#[derive(Clone)]
+pub struct PyAnalysisResult {
+    name: String,
+    success: bool,
+    report_lines: Vec<String>,
+    error: Option<String>,
+    processing_time_us: u64,
+    processing_time_ms: u64,
+    formid_count: usize,
+    plugin_count: usize,
+    suspect_count: usize,
+}
+
+#[pymethods]
+impl PyAnalysisResult {
+    /// Returns the name supplied for this Crash Log.
+    #[getter]
+    pub fn name(&self) -> String {
+        self.name.clone()
+    }
+
+    /// Returns whether analysis succeeded.
+    #[getter]
+    pub fn success(&self) -> bool {
+        self.success
+    }
+
+    /// Returns the Autoscan Report lines; empty when analysis failed.
+    #[getter]
+    pub fn report_lines(&self) -> Vec<String> {
+        self.report_lines.clone()
+    }
+
+    /// Returns the Autoscan Report as one string.
+    #[getter]
+    pub fn report(&self) -> String {
+        self.report_lines.concat()
+    }
+
+    /// Returns the failure detail when analysis failed.
+    #[getter]
+    pub fn error(&self) -> Option<String> {
+        self.error.clone()
+    }
+
+    /// Returns processing time in microseconds.
+    #[getter]
+    pub fn processing_time_us(&self) -> u64 {
+        self.processing_time_us
+    }
+
+    /// Returns processing time in milliseconds.
+    #[getter]
+    pub fn processing_time_ms(&self) -> u64 {
+        self.processing_time_ms
+    }
+
+    /// Returns the number of FormIDs found.
+    #[getter]
+    pub fn formid_count(&self) -> usize {
+        self.formid_count
+    }
+
+    /// Returns the number of plugins detected.
+    #[getter]
+    pub fn plugin_count(&self) -> usize {
+        self.plugin_count
+    }
+
+    /// Returns the number of suspect patterns matched.
+    #[getter]
+    pub fn suspect_count(&self) -> usize {
+        self.suspect_count
+    }
+}
+
+/// Measured parallelism for one coarse analysis phase.
+#[pyclass(name = "ScanRunPhaseUtilization", from_py_object)]
+#[derive(Clone)]
+pub struct PyScanRunPhaseUtilization {
+    phase: String,
+    peak_parallelism: usize,
+    busy_time_us: u64,
+    average_parallelism: f64,
+}
+
+#[pymethods]
+impl PyScanRunPhaseUtilization {
+    /// Returns the measured phase.
+    #[getter]
+    pub fn phase(&self) -> String {
+        self.phase.clone()
+    }
+
+    /// Returns the most Crash Logs observed inside this phase at once.
+    #[getter]
+    pub fn peak_parallelism(&self) -> usize {
+        self.peak_parallelism
+    }
+
+    /// Returns summed per-log time spent inside this phase.
+    #[getter]
+    pub fn busy_time_us(&self) -> u64 {
+        self.busy_time_us
+    }
+
+    /// Returns average Crash Logs inside this phase over the run's wall time.
+    #[getter]
+    pub fn average_parallelism(&self) -> f64 {
+        self.average_parallelism
+    }
+}
+
+/// Measured scheduler utilization for one Crash Log Scan Run.
+#[pyclass(name = "ScanRunUtilization", from_py_object)]
+#[derive(Clone)]
+pub struct PyScanRunUtilization {
+    scheduling: String,
+    workers: usize,
+    wall_time_us: u64,
+    phases: Vec<PyScanRunPhaseUtilization>,
+}
+
+#[pymethods]
+impl PyScanRunUtilization {
+    /// Returns `cooperative` or `parallel`.
+    #[getter]
+    pub fn scheduling(&self) -> String {
+        self.scheduling.clone()
+    }
+
+    /// Returns the admission limit the scheduler ran with.
+    #[getter]
+    pub fn workers(&self) -> usize {
+        self.workers
+    }
+
+    /// Returns wall time from first admission to last terminal outcome.
+    #[getter]
+    pub fn wall_time_us(&self) -> u64 {
+        self.wall_time_us
+    }
+
+    /// Returns per-phase measurements in pipeline order.
+    #[getter]
+    pub fn phases(&self) -> Vec<PyScanRunPhaseUtilization> {
+        self.phases.clone()
+    }
+}
+
 /// Complete terminal Crash Log Scan Run result.
 #[pyclass(name = "ScanRunResult", from_py_object)]
 #[derive(Clone)]
@@ -620,6 +792,7 @@ pub struct PyScanRunResult {
     discovery: Option<PyScanRunDiscoveryResult>,
     setup: Option<PyScanRunSetupResult>,
     effective_concurrency: Option<usize>,
+    utilization: Option<PyScanRunUtilization>,
     message: Option<String>,
     total: usize,
     succeeded: usize,
@@ -654,6 +827,12 @@ impl PyScanRunResult {
         self.effective_concurrency
     }
 
+    /// Returns measured per-phase parallelism once scheduling admitted work.
+    #[getter]
+    pub fn utilization(&self) -> Option<PyScanRunUtilization> {
+        self.utilization.clone()
+    }
+
     /// Returns the optional concise run-level message.
     #[getter]
     pub fn message(&self) -> Option<String> {
@@ -839,6 +1018,72 @@ impl PyScanRunExecution {
     }
 }
 
+/// One message from a streaming run's execution thread to its Python iterator.
+enum StreamMessage {
+    /// A Crash Log reached its terminal disposition.
+    Log(contract::LogResult),
+    /// The run ended; no further messages follow.
+    Finished(PyScanRunExecution),
+}
+
+/// Iterator over per-log results of one streaming final-contract scan run.
+///
+/// Each `ScanRunLogResult` is yielded as soon as its Crash Log finalizes, in
+/// completion order. Only a small fixed number of results are buffered ahead of
+/// the consumer; a slow consumer pauses admission of further Crash Logs.
+/// Abandoning the iterator requests cancellation, and logs already admitted still
+/// finish durable finalization.
+#[pyclass(name = "ScanRunStream")]
+pub struct PyScanRunStream {
+    receiver: Mutex<Option<mpsc::Receiver<StreamMessage>>>,
+    execution: Mutex<Option<PyScanRunExecution>>,
+}
+
+#[pymethods]
+impl PyScanRunStream {
+    fn __iter__(slf: Py<Self>) -> Py<Self> {
+        slf
+    }
+
+    fn __next__(&self, py: Python<'_>) -> PyResult<Option<PyScanRunLogResult>> {
+        // The receiver stays under its lock for the whole GIL-released receive, so a
+        // concurrent caller waits for the next message instead of finding the slot empty.
+        let next = without_gil(py, || {
+            let mut receiver = self.receiver.lock();
+            let Some(channel) = receiver.as_ref() else {
+                return Ok(None);
+            };
+            match channel.recv() {
+                Ok(StreamMessage::Log(log)) => Ok(Some(log)),
+                Ok(StreamMessage::Finished(execution)) => {
+                    *self.execution.lock() = Some(execution);
+                    *receiver = None;
+                    Ok(None)
+                }
+                Err(error) => {
+                    *receiver = None;
+                    Err(error)
+                }
+            }
+        });
+        match next {
+            Ok(log) => Ok(log.map(log_result_to_py)),
+            Err(_) => Err(PyRuntimeError::new_err(
+                "Crash Log Scan Run stream ended without a terminal result",
+            )),
+        }
+    }
+
+    /// Returns the terminal envelope once iteration is exhausted.
+    ///
+    /// The envelope's result carries run status and counts; its `logs` list is
+    /// empty because every per-log result was already yielded.
+    #[getter]
+    pub fn execution(&self) -> Option<PyScanRunExecution> {
+        self.execution.lock().clone()
+    }
+}
+
 /// Converts explicit Python configuration into the final core contract.
 fn configuration_to_core(value: &PyScanRunConfiguration) -> PyResult<contract::Configuration> {
     let game = value
@@ -851,7 +1096,9 @@ fn configuration_to_core(value: &PyScanRunConfiguration) -> PyResult<contract::C
         yaml_dir_data: required_path(value.yaml_dir_data.clone(), "yaml_dir_data")?,
         game,
         game_version: value.game_version.clone(),
-        options: contract::Options::new(value.show_formid_values, value.simplify_logs),
+        options: contract::Options::new(value.show_formid_values, value.simplify_logs)
+            .with_scheduling(value.scheduling)
+            .with_incremental(value.incremental),
         scan_facts: CrashLogScanFacts {
             formid_database_paths: value
                 .formid_database_paths
@@ -1017,6 +1264,34 @@ fn log_result_to_py(value: contract::LogResult) -> PyScanRunLogResult {
     }
 }
 
+fn content_result_to_py(value: contract::LogContentResult) -> PyAnalysisResult {
+    PyAnalysisResult {
+        name: value.name,
+        success: value.success,
+        report_lines: value.report_lines,
+        error: value.error,
+        processing_time_us: value.processing_time_us,
+        processing_time_ms: value.processing_time_ms,
+        formid_count: value.formid_count,
+        plugin_count: value.plugin_count,
+        suspect_count: value.suspect_count,
+    }
+}
+
+/// Names in-memory Crash Logs, defaulting to stable synthetic file names.
+fn content_names(count: usize, names: Option<Vec<String>>) -> PyResult<Vec<String>> {
+    match names {
+        Some(names) if names.len() != count => Err(PyValueError::new_err(format!(
+            "names has {} entries but contents has {count}",
+            names.len()
+        ))),
+        Some(names) => Ok(names),
+        None => Ok((0..count)
+            .map(|index| format!("crash-in-memory-{index}.log"))
+            .collect()),
+    }
+}
+
 fn run_status_to_string(value: CrashLogScanRunStatus) -> String {
     match value {
         CrashLogScanRunStatus::Completed => "completed",
@@ -1028,6 +1303,25 @@ fn run_status_to_string(value: CrashLogScanRunStatus) -> String {
     .to_string()
 }
 
+/// Maps measured utilization, precomputing each phase's average parallelism.
+fn utilization_to_py(value: contract::Utilization) -> PyScanRunUtilization {
+    PyScanRunUtilization {
+        scheduling: value.scheduling.as_str().to_string(),
+        workers: value.workers,
+        wall_time_us: value.wall_time_us,
+        phases: value
+            .phases
+            .iter()
+            .map(|phase| PyScanRunPhaseUtilization {
+                phase: phase_to_string(phase.phase),
+                peak_parallelism: phase.peak_parallelism,
+                busy_time_us: phase.busy_time_us,
+                average_parallelism: value.average_parallelism(phase.phase),
+            })
+            .collect(),
+    }
+}
+
 /// Maps the complete terminal result including Rust-selected concurrency.
 fn run_result_to_py(value: contract::RunResult) -> PyScanRunResult {
     PyScanRunResult {
@@ -1035,6 +1329,7 @@ fn run_result_to_py(value: contract::RunResult) -> PyScanRunResult {
         discovery: value.discovery.map(discovery_to_py),
         setup: value.setup.map(setup_to_py),
         effective_concurrency: value.effective_concurrency,
+        utilization: value.utilization.map(utilization_to_py),
         message: value.message,
         total: value.total,
         succeeded: value.succeeded,
@@ -1173,6 +1468,154 @@ impl contract::Observer for PyObserverAdapter {
     }
 }
 
+/// Observer state shared between the Rust run and event-loop deliveries.
+struct LoopObserverState {
+    cancellation: contract::Cancellation,
+    cancel_on_error: bool,
+    delivery_failed: AtomicBool,
+    delivery_error: Mutex<Option<String>>,
+}
+
+impl LoopObserverState {
+    /// Records only the first delivery failure and optionally requests cancellation.
+    fn record_failure(&self, message: String) {
+        self.delivery_failed.store(true, Ordering::Release);
+        self.delivery_error.lock().get_or_insert(message);
+        if self.cancel_on_error {
+            self.cancellation.cancel();
+        }
+    }
+}
+
+/// Event-loop callback that invokes the Python observer for one event.
+#[pyclass(frozen)]
+struct LoopObserverDelivery {
+    callback: Py<PyAny>,
+    state: Arc<LoopObserverState>,
+}
+
+#[pymethods]
+impl LoopObserverDelivery {
+    fn __call__(&self, py: Python<'_>, event: Py<PyAny>) {
+        if self.state.delivery_failed.load(Ordering::Acquire) {
+            return;
+        }
+        if let Err(error) = self.callback.call1(py, (event,)) {
+            self.state.record_failure(error.to_string());
+        }
+    }
+}
+
+/// Event-loop callback that reports when every earlier delivery has run.
+#[pyclass(frozen)]
+struct LoopObserverBarrier {
+    released: Mutex<Option<oneshot::Sender<()>>>,
+}
+
+#[pymethods]
+impl LoopObserverBarrier {
+    fn __call__(&self) {
+        if let Some(released) = self.released.lock().take() {
+            let _ = released.send(());
+        }
+    }
+}
+
+/// Observer that schedules each event onto the caller's asyncio loop.
+///
+/// The Rust run only holds the GIL long enough to enqueue a callback; the Python
+/// observer itself runs on the event loop thread, in event order.
+struct LoopObserverAdapter {
+    event_loop: Py<PyAny>,
+    delivery: Py<LoopObserverDelivery>,
+    state: Arc<LoopObserverState>,
+}
+
+impl LoopObserverAdapter {
+    fn new(
+        py: Python<'_>,
+        callback: Py<PyAny>,
+        cancellation: contract::Cancellation,
+        cancel_on_error: bool,
+    ) -> PyResult<Self> {
+        let event_loop = pyo3_async_runtimes::get_running_loop(py)?.unbind();
+        let state = Arc::new(LoopObserverState {
+            cancellation,
+            cancel_on_error,
+            delivery_failed: AtomicBool::new(false),
+            delivery_error: Mutex::new(None),
+        });
+        let delivery = Py::new(
+            py,
+            LoopObserverDelivery {
+                callback,
+                state: Arc::clone(&state),
+            },
+        )?;
+        Ok(Self {
+            event_loop,
+            delivery,
+            state,
+        })
+    }
+
+    /// Waits until every scheduled delivery has run, then returns the first failure.
+    async fn drain(self) -> Option<String> {
+        let (released, barrier) = oneshot::channel();
+        let scheduled = Python::attach(|py| -> PyResult<()> {
+            let callback = Py::new(
+                py,
+                LoopObserverBarrier {
+                    released: Mutex::new(Some(released)),
+                },
+            )?;
+            self.event_loop
+                .call_method1(py, intern!(py, "call_soon_threadsafe"), (callback,))?;
+            Ok(())
+        });
+        if scheduled.is_ok() {
+            let _ = barrier.await;
+        }
+        self.state.delivery_error.lock().clone()
+    }
+}
+
+impl contract::Observer for LoopObserverAdapter {
+    /// Enqueues one event for delivery on the event loop.
+    fn on_event(&mut self, event: contract::Event) {
+        if self.state.delivery_failed.load(Ordering::Acquire) {
+            return;
+        }
+
+        let scheduled = Python::attach(|py| -> PyResult<()> {
+            let event = Py::new(py, event_to_py(event))?;
+            self.event_loop.call_method1(
+                py,
+                intern!(py, "call_soon_threadsafe"),
+                (self.delivery.clone_ref(py), event),
+            )?;
+            Ok(())
+        });
+        if let Err(error) = scheduled {
+            self.state.record_failure(error.to_string());
+        }
+    }
+}
+
+/// Requests safe cancellation when an awaiting task is dropped before the run resolves.
+struct CancelOnDrop {
+    cancellation: contract::Cancellation,
+    armed: bool,
+}
+
+impl Drop for CancelOnDrop {
+    fn drop(&mut self) {
+        if self.armed {
+            self.cancellation.cancel();
+        }
+    }
+}
+
 /// Executes one final-contract request with optional serialized observation.
 ///
 /// Observer exceptions are adapter-only data. Delivery stops after the first
@@ -1210,7 +1653,172 @@ pub fn scan_run_execute(
     });
 
     let (result, observer_error) = result;
-    Ok(match result {
+    Ok(execution_to_py(result, observer_error))
+}
+
+/// Awaitable form of `scan_run_execute` for asyncio callers.
+///
+/// The run executes on the shared runtime without occupying a Python thread.
+/// Cancelling the awaiting task trips `cancellation`: queued logs are not
+/// admitted, and admitted logs still finish durable finalization in the
+/// background. Observer callbacks run on the calling event loop in event order,
+/// and `observer_error` is read only after every scheduled callback has run.
+#[pyfunction]
+#[pyo3(signature = (request, cancellation, observer=None, cancel_on_observer_error=false))]
+pub fn scan_run_execute_async<'py>(
+    py: Python<'py>,
+    request: PyRef<'_, PyScanRunRequest>,
+    cancellation: PyRef<'_, PyScanRunCancellation>,
+    observer: Option<Py<PyAny>>,
+    cancel_on_observer_error: bool,
+) -> PyResult<Bound<'py, PyAny>> {
+    let request = request.inner.clone();
+    let cancellation = cancellation.inner.clone();
+    let observer = observer
+        .map(|callback| {
+            LoopObserverAdapter::new(py, callback, cancellation.clone(), cancel_on_observer_error)
+        })
+        .transpose()?;
+    // Keep awaitables on the same runtime as every other scan entry point; this
+    // fails harmlessly once the binding runtime has already been selected.
+    let _ = pyo3_async_runtimes::tokio::init_with_runtime(get_runtime());
+
+    let run_cancellation = cancellation.clone();
+    let run = get_runtime().spawn(async move {
+        let mut observer = observer;
+        let result = contract::execute(
+            request,
+            &run_cancellation,
+            observer
+                .as_mut()
+                .map(|adapter| adapter as &mut dyn contract::Observer),
+        )
+        .await;
+        (result, observer)
+    });
+
+    future_into_py(py, async move {
+        let mut cancel_on_drop = CancelOnDrop {
+            cancellation,
+            armed: true,
+        };
+        let joined = run.await;
+        cancel_on_drop.armed = false;
+        let (result, observer) = joined.map_err(|error| {
+            PyRuntimeError::new_err(format!("Crash Log Scan Run task failed: {error}"))
+        })?;
+        let observer_error = match observer {
+            Some(adapter) => adapter.drain().await,
+            None => None,
+        };
+        Ok(execution_to_py(result, observer_error))
+    })
+}
+
+/// Analyzes in-memory Crash Logs with one shared analysis engine.
+///
+/// YAML Data and matchers are prepared once for the batch, and the logs are
+/// analyzed in parallel with the GIL released. Nothing is discovered, written,
+/// or moved. Results follow the order of `contents`; `names` label each log in
+/// its report and default to `crash-in-memory-<index>.log`.
+#[pyfunction]
+#[pyo3(signature = (config, contents, names=None))]
+pub fn analyze_logs_batch(
+    py: Python<'_>,
+    config: PyRef<'_, PyScanRunConfiguration>,
+    contents: Vec<Bound<'_, PyBytes>>,
+    names: Option<Vec<String>>,
+) -> PyResult<Vec<PyAnalysisResult>> {
+    let configuration = configuration_to_core(&config)?;
+    let names = content_names(contents.len(), names)?;
+    let logs: Vec<contract::LogContent> = names
+        .into_iter()
+        .zip(&contents)
+        .map(|(name, bytes)| contract::LogContent::new(name, bytes.as_bytes()))
+        .collect();
+    drop(contents);
+
+    let results = without_gil_block_on(py, move || contract::analyze_contents(configuration, logs))
+        .map_err(|error| match error.stage {
+            contract::InfrastructureErrorStage::RequestValidation => {
+                PyValueError::new_err(error.message)
+            }
+            _ => PyRuntimeError::new_err(error.to_string()),
+        })?;
+    Ok(results.into_iter().map(content_result_to_py).collect())
+}
+
+/// Starts one final-contract request and returns an iterator over per-log results.
+///
+/// The run executes on its own thread against the shared runtime. Observer
+/// semantics match `scan_run_execute`; the terminal envelope is available from
+/// `ScanRunStream.execution` after iteration stops.
+#[pyfunction]
+#[pyo3(signature = (request, cancellation, observer=None, cancel_on_observer_error=false))]
+pub fn scan_run_stream(
+    request: PyRef<'_, PyScanRunRequest>,
+    cancellation: PyRef<'_, PyScanRunCancellation>,
+    observer: Option<Py<PyAny>>,
+    cancel_on_observer_error: bool,
+) -> PyResult<PyScanRunStream> {
+    let request = request.inner.clone();
+    let cancellation = cancellation.inner.clone();
+    let (sender, receiver) = mpsc::sync_channel(SCAN_RUN_STREAM_BUFFER);
+
+    std::thread::Builder::new()
+        .name("classic-scan-run-stream".to_string())
+        .spawn(move || {
+            let execution = get_runtime().block_on(async {
+                let mut observer = observer.map(|callback| PyObserverAdapter {
+                    callback,
+                    cancellation: cancellation.clone(),
+                    cancel_on_error: cancel_on_observer_error,
+                    delivery_error: None,
+                    delivery_failed: false,
+                });
+                let mut consumer_gone = false;
+                let mut sink = |log: contract::LogResult| {
+                    if consumer_gone {
+                        return;
+                    }
+                    if sender.send(StreamMessage::Log(log)).is_err() {
+                        // The iterator was dropped; stop admitting further logs.
+                        consumer_gone = true;
+                        cancellation.cancel();
+                    }
+                };
+                let result = contract::execute_streaming(
+                    request,
+                    &cancellation,
+                    observer
+                        .as_mut()
+                        .map(|adapter| adapter as &mut dyn contract::Observer),
+                    &mut sink,
+                )
+                .await;
+                let observer_error = observer.and_then(|adapter| adapter.delivery_error);
+                execution_to_py(result, observer_error)
+            });
+            let _ = sender.send(StreamMessage::Finished(execution));
+        })
+        .map_err(|error| {
+            PyRuntimeError::new_err(format!(
+                "Failed to start Crash Log Scan Run stream: {error}"
+            ))
+        })?;
+
+    Ok(PyScanRunStream {
+        receiver: Mutex::new(Some(receiver)),
+        execution: Mutex::new(None),
+    })
+}
+
+/// Wraps a core outcome and adapter-only observer failure into one envelope.
+fn execution_to_py(
+    result: Result<contract::RunResult, contract::InfrastructureError>,
+    observer_error: Option<String>,
+) -> PyScanRunExecution {
+    match result {
         Ok(result) => PyScanRunExecution {
             result: Some(run_result_to_py(result)),
             error: None,
@@ -1221,7 +1829,7 @@ pub fn scan_run_execute(
             error: Some(infrastructure_error_to_py(error)),
             observer_error,
         },
-    })
+    }
 }
 
 // Keep the repository's required sibling-test declaration intact under rustfmt.
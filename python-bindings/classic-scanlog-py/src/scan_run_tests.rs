@@ -398,6 +398,7 @@ fn maps_setup_and_run_optional_fields_without_loss() {
             rendered_report: setup.rendered_report.clone(),
         }),
         effective_concurrency: Some(2),
+        utilization: None,
         message: Some("run message".to_string()),
         total: 4,
         succeeded: 1,
@@ -425,6 +426,7 @@ fn maps_setup_and_run_optional_fields_without_loss() {
         discovery: None,
         setup: None,
         effective_concurrency: None,
+        utilization: None,
         message: None,
         total: 0,
         succeeded: 0,
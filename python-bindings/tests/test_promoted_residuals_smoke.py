@@ -886,6 +886,32 @@ def test_scangame_game_scan_orchestrator_construct() -> None:
     assert orch is not None
 
 
+def test_scangame_game_scan_orchestrator_full_scan_writes_snapshot() -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir)
+        game_root = root / "Fallout4"
+        mods_root = root / "mods"
+        game_root.mkdir()
+        mods_root.mkdir()
+        cfg = classic_scangame.GameScanConfig(
+            str(game_root),
+            "F4SE",
+            "Buffout4",
+            "Fallout4",
+            mods_path=str(mods_root),
+        )
+        snapshot = root / "snapshot.json"
+        orch = classic_scangame.GameScanOrchestrator(
+            cfg, scan_snapshot_path=str(snapshot)
+        )
+
+        game, mods = orch.run_full_scan()
+
+        assert game is not None
+        assert mods is not None
+        assert snapshot.is_file()
+
+
 def test_scangame_game_setup_intake_result_is_a_type() -> None:
     assert classic_scangame.GameSetupIntakeResult is not None
     assert isinstance(classic_scangame.GameSetupIntakeResult, type)
@@ -138,6 +138,27 @@ def test_formid_analyzer_cache_stats_tuple() -> None:
     assert len(stats) == 2
 
 
+def test_formid_analyzer_cache_metrics_dict() -> None:
+    """FormIDAnalyzer.cache_metrics() reports bounded-cache counters."""
+    analyzer = classic_scanlog.FormIDAnalyzer()
+    metrics = analyzer.cache_metrics()
+    assert set(metrics) == {
+        "hits",
+        "misses",
+        "evictions",
+        "entries",
+        "resident_bytes",
+        "capacity_bytes",
+    }
+    assert metrics["resident_bytes"] <= metrics["capacity_bytes"]
+
+
+def test_formid_analyzer_cache_bytes_sets_budget() -> None:
+    """FormIDAnalyzer(cache_bytes=...) budgets both of its caches."""
+    analyzer = classic_scanlog.FormIDAnalyzer(cache_bytes=64 * 1024)
+    assert analyzer.cache_metrics()["capacity_bytes"] == 2 * 64 * 1024
+
+
 def test_formid_analyzer_clear_cache() -> None:
     """FormIDAnalyzer.clear_cache() runs without raising."""
     analyzer = classic_scanlog.FormIDAnalyzer()
@@ -276,6 +297,12 @@ def test_pattern_matcher_construct_with_patterns() -> None:
     assert matcher is not None
 
 
+def test_pattern_matcher_cache_bytes_sets_budget() -> None:
+    """PatternMatcher(patterns, cache_bytes=...) budgets the match cache."""
+    matcher = classic_scanlog.PatternMatcher(["error"], cache_bytes=64 * 1024)
+    assert matcher.cache_metrics()["capacity_bytes"] == 64 * 1024
+
+
 def test_pattern_matcher_find_all_returns_list() -> None:
     """PatternMatcher.find_all('') returns list[tuple[int, str]]."""
     matcher = classic_scanlog.PatternMatcher(["error"])
@@ -311,6 +338,25 @@ def test_pattern_matcher_get_stats_returns_tuple() -> None:
     assert len(stats) == 2
 
 
+def test_pattern_matcher_cache_metrics_counts_hits() -> None:
+    """PatternMatcher.cache_metrics() counts repeated find_all() calls as hits."""
+    matcher = classic_scanlog.PatternMatcher(["error"])
+    matcher.find_all("hello error world")
+    matcher.find_all("hello error world")
+    metrics = matcher.cache_metrics()
+    assert set(metrics) == {
+        "hits",
+        "misses",
+        "evictions",
+        "entries",
+        "resident_bytes",
+        "capacity_bytes",
+    }
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 1
+    assert metrics["entries"] == 1
+
+
 def test_pattern_matcher_clear_cache() -> None:
     """PatternMatcher.clear_cache() runs without raising."""
     matcher = classic_scanlog.PatternMatcher(["error"])
@@ -1,7 +1,10 @@
 """Public contract tests for the final Python Crash Log Scan Run adapter."""
 
+import asyncio
 import json
 import shutil
+import threading
+import time
 from pathlib import Path
 
 import pytest
@@ -125,6 +128,8 @@ def _configuration(
     root: Path,
     *,
     max_concurrent: int | None = None,
+    scheduling: str = "cooperative",
+    incremental: bool = False,
 ) -> object:
     """Create explicit scan facts shared by Standard and Targeted requests."""
 
@@ -138,6 +143,8 @@ def _configuration(
         formid_database_paths=[],
         unsolved_logs_destination=None,
         max_concurrent=max_concurrent,
+        scheduling=scheduling,
+        incremental=incremental,
     )
 
 
@@ -505,6 +512,292 @@ def test_targeted_scan_run_preserves_input_order_and_never_moves(
     assert not (tmp_path / "Unsolved Logs").exists()
 
 
+def test_parallel_scheduling_reports_utilization_in_discovery_order(
+    tmp_path: Path,
+) -> None:
+    """Parallel workers keep discovery order and report per-phase utilization."""
+
+    import classic_scanlog
+
+    fixture = SHARED_SCAN_RUN_MANIFEST["fixtures"]["targeted"]
+    expected = fixture["expected"]
+    _copy_shared_scan_run_data_root(tmp_path)
+    _write_shared_scan_run_logs(
+        tmp_path,
+        [path for path in fixture["inputs"] if path.endswith(".log")],
+    )
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(
+            classic_scanlog,
+            tmp_path,
+            max_concurrent=fixture["maxConcurrent"],
+            scheduling="parallel",
+        ),
+        classic_scanlog.ScanRunTargetedSource(
+            inputs=[str(tmp_path / path) for path in fixture["inputs"]]
+        ),
+    )
+
+    execution = classic_scanlog.scan_run_execute(
+        request,
+        classic_scanlog.ScanRunCancellation(),
+    )
+
+    assert execution.error is None
+    result = execution.result
+    assert [log.discovery_index for log in result.logs] == expected["discoveryOrder"]
+    assert [log.disposition for log in result.logs] == expected["dispositions"]
+    utilization = result.utilization
+    assert utilization is not None
+    assert utilization.scheduling == "parallel"
+    assert utilization.workers == result.effective_concurrency
+    assert all(
+        0 <= phase.peak_parallelism <= utilization.workers
+        for phase in utilization.phases
+    )
+    with pytest.raises(ValueError):
+        _configuration(classic_scanlog, tmp_path, scheduling="threads")
+
+
+def test_incremental_rescan_reuses_unchanged_autoscan_reports(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A repeated incremental run keeps dispositions and reuses existing reports."""
+
+    import classic_scanlog
+
+    cache_root = tmp_path / "user-cache"
+    monkeypatch.setenv("LOCALAPPDATA", str(cache_root))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_root))
+    fixture = SHARED_SCAN_RUN_MANIFEST["fixtures"]["targeted"]
+    _copy_shared_scan_run_data_root(tmp_path)
+    _write_shared_scan_run_logs(
+        tmp_path,
+        [path for path in fixture["inputs"] if path.endswith(".log")],
+    )
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(classic_scanlog, tmp_path, incremental=True),
+        classic_scanlog.ScanRunTargetedSource(
+            inputs=[str(tmp_path / path) for path in fixture["inputs"]]
+        ),
+    )
+
+    first = classic_scanlog.scan_run_execute(
+        request, classic_scanlog.ScanRunCancellation()
+    ).result
+    second = classic_scanlog.scan_run_execute(
+        request, classic_scanlog.ScanRunCancellation()
+    ).result
+
+    assert list((cache_root / "CLASSIC" / "scan-cache").glob("CLASSIC Scan Cache *.json"))
+    assert not (tmp_path / "CLASSIC Scan Cache.json").exists()
+    assert [log.disposition for log in second.logs] == [
+        log.disposition for log in first.logs
+    ]
+    assert [log.autoscan_report for log in second.logs] == [
+        log.autoscan_report for log in first.logs
+    ]
+
+
+def test_scan_run_stream_yields_each_log_result_and_retains_none(
+    tmp_path: Path,
+) -> None:
+    """Streamed runs yield every finalized log and end with a count-only result."""
+
+    import classic_scanlog
+
+    fixture = SHARED_SCAN_RUN_MANIFEST["fixtures"]["targeted"]
+    expected = fixture["expected"]
+    _copy_shared_scan_run_data_root(tmp_path)
+    _write_shared_scan_run_logs(
+        tmp_path,
+        [path for path in fixture["inputs"] if path.endswith(".log")],
+    )
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(
+            classic_scanlog,
+            tmp_path,
+            max_concurrent=fixture["maxConcurrent"],
+        ),
+        classic_scanlog.ScanRunTargetedSource(
+            inputs=[str(tmp_path / path) for path in fixture["inputs"]]
+        ),
+    )
+    finished: list[int] = []
+
+    def observe(event: object) -> None:
+        if event.kind == "log_finished":
+            finished.append(event.log.discovery_index)
+
+    stream = classic_scanlog.scan_run_stream(
+        request,
+        classic_scanlog.ScanRunCancellation(),
+        observe,
+    )
+    assert stream.execution is None
+    streamed = []
+    for log in stream:
+        assert log.discovery_index in finished
+        streamed.append(log)
+
+    assert sorted(log.discovery_index for log in streamed) == expected["discoveryOrder"]
+    assert all(Path(log.autoscan_report).is_file() for log in streamed)
+    execution = stream.execution
+    assert execution is not None
+    assert execution.error is None
+    assert execution.observer_error is None
+    assert execution.result.logs == []
+    assert execution.result.total == len(streamed)
+    assert next(stream, None) is None
+
+
+def test_scan_run_stream_shared_between_threads_yields_every_log(
+    tmp_path: Path,
+) -> None:
+    """Concurrent consumers split the results and none stops before the run ends."""
+
+    import classic_scanlog
+
+    _write_scan_run_data_root(tmp_path)
+    crash_logs = _write_logs(
+        tmp_path / "selected",
+        [f"crash-stream-shared-{index}.log" for index in range(6)],
+    )
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(classic_scanlog, tmp_path, max_concurrent=2),
+        classic_scanlog.ScanRunTargetedSource(inputs=[str(path) for path in crash_logs]),
+    )
+    stream = classic_scanlog.scan_run_stream(
+        request, classic_scanlog.ScanRunCancellation()
+    )
+    streamed: list[object] = []
+    lock = threading.Lock()
+
+    def consume() -> None:
+        for log in stream:
+            with lock:
+                streamed.append(log)
+
+    consumers = [threading.Thread(target=consume) for _ in range(3)]
+    for consumer in consumers:
+        consumer.start()
+    for consumer in consumers:
+        consumer.join()
+
+    assert len(streamed) == len(crash_logs)
+    assert stream.execution is not None
+    assert stream.execution.result.total == len(crash_logs)
+
+
+def test_analyze_logs_batch_analyzes_payloads_without_touching_disk(
+    tmp_path: Path,
+) -> None:
+    """In-memory batches return one ordered result per payload and write nothing."""
+
+    import classic_scanlog
+
+    _write_scan_run_data_root(tmp_path)
+    before = sorted(tmp_path.rglob("*"))
+    payload = SAMPLE_CRASH_LOG.encode("utf-8")
+
+    results = classic_scanlog.analyze_logs_batch(
+        _configuration(classic_scanlog, tmp_path, max_concurrent=2),
+        [payload, payload, payload],
+        names=["crash-a.log", "crash-b.log", "crash-c.log"],
+    )
+
+    assert [result.name for result in results] == [
+        "crash-a.log",
+        "crash-b.log",
+        "crash-c.log",
+    ]
+    assert all(result.success for result in results)
+    assert all(result.name in result.report for result in results)
+    assert sorted(tmp_path.rglob("*")) == before
+
+    default_named = classic_scanlog.analyze_logs_batch(
+        _configuration(classic_scanlog, tmp_path), [payload]
+    )
+    assert default_named[0].name == "crash-in-memory-0.log"
+    with pytest.raises(ValueError, match="names"):
+        classic_scanlog.analyze_logs_batch(
+            _configuration(classic_scanlog, tmp_path), [payload], names=[]
+        )
+
+
+def test_async_scan_run_delivers_observer_events_on_the_event_loop(
+    tmp_path: Path,
+) -> None:
+    """The awaitable run matches the blocking result and observes on the loop thread."""
+
+    import classic_scanlog
+
+    _write_scan_run_data_root(tmp_path)
+    crash_log = _write_logs(tmp_path / "selected", ["crash-async.log"])[0]
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(classic_scanlog, tmp_path, max_concurrent=1),
+        classic_scanlog.ScanRunTargetedSource(inputs=[str(crash_log)]),
+    )
+    loop_threads: set[int] = set()
+    kinds: list[str] = []
+
+    def observe(event: object) -> None:
+        loop_threads.add(threading.get_ident())
+        kinds.append(event.kind)
+
+    async def runner() -> object:
+        execution = await classic_scanlog.scan_run_execute_async(
+            request,
+            classic_scanlog.ScanRunCancellation(),
+            observe,
+        )
+        return execution, threading.get_ident()
+
+    execution, loop_thread = asyncio.run(runner())
+
+    assert execution.error is None
+    assert execution.observer_error is None
+    assert execution.result.status == "completed"
+    assert execution.result.logs[0].disposition == "succeeded"
+    assert loop_threads == {loop_thread}
+    assert kinds[0] == "discovery_completed"
+    assert kinds[-1] == "log_finished"
+
+
+def test_cancelling_async_scan_run_task_trips_cancellation(tmp_path: Path) -> None:
+    """Cancelling the awaiting task requests safe cancellation of the Rust run."""
+
+    import classic_scanlog
+
+    _write_scan_run_data_root(tmp_path)
+    crash_logs = _write_logs(
+        tmp_path / "selected",
+        [f"crash-async-cancel-{index}.log" for index in range(4)],
+    )
+    request = classic_scanlog.ScanRunRequest.targeted(
+        _configuration(classic_scanlog, tmp_path, max_concurrent=1),
+        classic_scanlog.ScanRunTargetedSource(inputs=[str(path) for path in crash_logs]),
+    )
+    cancellation = classic_scanlog.ScanRunCancellation()
+
+    async def runner() -> None:
+        task = asyncio.ensure_future(
+            classic_scanlog.scan_run_execute_async(request, cancellation)
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(runner())
+
+    deadline = time.monotonic() + 5.0
+    while not cancellation.is_cancelled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cancellation.is_cancelled is True
+
+
 def test_shared_cancellation_fixture_distinguishes_safe_seams(tmp_path: Path) -> None:
     """Pre-discovery, queued, and admitted cancellation retain distinct facts."""
 
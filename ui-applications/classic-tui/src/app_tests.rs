@@ -198,6 +198,7 @@ fn scan_complete_with_errors_updates_status_message() {
         discovery: None,
         setup: None,
         effective_concurrency: Some(2),
+        utilization: None,
         message: None,
         total: 3,
         succeeded: 2,
@@ -280,6 +281,7 @@ fn scan_complete_switches_to_results_when_enabled() {
         discovery: None,
         setup: None,
         effective_concurrency: Some(1),
+        utilization: None,
         message: None,
         total: 1,
         succeeded: 1,
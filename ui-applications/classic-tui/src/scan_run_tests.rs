@@ -212,6 +212,7 @@ fn terminal_presentation_distinguishes_cancellation_around_discovery_and_admissi
         discovery: None,
         setup: None,
         effective_concurrency: None,
+        utilization: None,
         message: None,
         total: 0,
         succeeded: 0,
@@ -254,6 +255,7 @@ fn terminal_presentation_distinguishes_cancellation_around_discovery_and_admissi
             rendered_report: String::new(),
         }),
         effective_concurrency: Some(1),
+        utilization: None,
         message: None,
         total: 2,
         succeeded: 1,
@@ -328,6 +330,7 @@ fn terminal_presentation_lists_mixed_outcomes_in_discovery_order() {
         }),
         setup: None,
         effective_concurrency: Some(2),
+        utilization: None,
         message: None,
         total: 3,
         succeeded: 1,